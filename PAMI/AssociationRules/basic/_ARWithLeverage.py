@@ -55,7 +55,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.AssociationRules.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class _Leverage:
@@ -249,7 +249,7 @@ class ARWithLeverage:
         """
         self._frequentPatterns = {}
         k = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             pattern, sup = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -262,7 +262,7 @@ class ARWithLeverage:
                 s = '\t'.join(pattern[i])
                 self._frequentPattern[s] = support[i]
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line = line.strip()
@@ -344,7 +344,7 @@ class ARWithLeverage:
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
 
         Storing final frequent patterns in a dataframe
@@ -53,7 +53,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.AssociationRules.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class Lift:
@@ -244,7 +244,7 @@ class ARWithLift:
         """
         self._frequentPatterns = {}
         k = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             pattern, sup = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -257,7 +257,7 @@ class ARWithLift:
                 s = '\t'.join(pattern[i])
                 self._frequentPattern[s] = support[i]
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line = line.strip()
@@ -336,7 +336,7 @@ class ARWithLift:
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final frequent patterns in a dataframe
 
@@ -52,7 +52,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.AssociationRules.basic import abstract as _ab
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 class Confidence:
     """
@@ -386,7 +386,7 @@ class RuleMiner:
         """
         self._frequentPatterns = {}
         k = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             pattern, sup = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -399,7 +399,7 @@ class RuleMiner:
                 s = '\t'.join(pattern[i])
                 self._frequentPattern[s] = support[i]
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line = line.strip()
@@ -33,15 +33,17 @@ __copyright__ = """
 from abc import ABC as _ABC, abstractmethod as _abstractmethod
 import time as _time
 import csv as _csv
-import pandas as _pd
+from PAMI.extras.lazyImport import lazyModule as _lazyModule, isDataFrame as _isDataFrame, isURL as _isURL
+_pd = _lazyModule('pandas')
 from collections import defaultdict as _defaultdict
 from itertools import combinations as _c
 import os as _os
 import os.path as _ospath
-import psutil as _psutil
+_psutil = _lazyModule('psutil')
 import sys as _sys
-import validators as _validators
-from urllib.request import urlopen as _urlopen
+_validators = _lazyModule('validators')
+from PAMI.extras.lazyImport import urlopen as _urlopen
+from PAMI.extras.patternStore.PatternTrie import PatternTrie as _PatternTrie
 import functools as _functools
 
 
@@ -51,7 +51,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.AssociationRules.basic import abstract as _ab
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 # increase reucursion depth
 import os
 import sys
@@ -67,7 +67,7 @@ class lift:
 
     :**Reference**:
 
-    :**Parameters**:    - **iFile** (*str*) -- *Name of the Input file to mine complete set of association rules*
+    :**Parameters**:    - **iFile** (*str or DataFrame or PatternTrie*) -- *Name of the Input file to mine complete set of association rules, or the patterns returned by getPatternTrie() of a miner*
                         - **oFile** (*str*) -- *Name of the Output file to write association rules*
                         - **minLift** (*float*) -- *Minimum lift to mine all the satisfying association rules. The user can specify the minLift in float between the range of 0 to 1.*
                         - **sep** (*str*) -- *This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.*
@@ -147,8 +147,8 @@ class lift:
 
     def __init__(self, iFile, minLift, sep):
         """
-        :param iFile: input file name or path
-        :type iFile: str
+        :param iFile: input file name or path, or the PatternTrie of a miner
+        :type iFile: str or PatternTrie
         :param minLift: minimum lift
         :type minLift: float
         :param sep: Delimiter of input file
@@ -164,7 +164,7 @@ class lift:
         Reading the input file and storing all the frequent patterns and their support respectively in a frequentPatterns variable.
         """
         self._associationRules = {}
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             pattern, support = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -188,8 +188,11 @@ class lift:
                 s = pattern[i].split(self._sep)
                 s = tuple(sorted(s))
                 self._associationRules[s] = support[i]
+        if isinstance(self._iFile, _ab._PatternTrie):
+            for s, support in self._iFile.items():
+                self._associationRules[tuple(sorted(s))] = support
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 f = _ab._urlopen(self._iFile)
                 for line in f:
                     line = line.strip()
@@ -35,7 +35,7 @@ import pandas as pd
 import numpy as np
 import math
 from PAMI.contiguousFrequentPattern import abstract as _ab
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class Node:
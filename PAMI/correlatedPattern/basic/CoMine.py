@@ -58,7 +58,7 @@ Copyright (C)  2021 Rage Uday Kiran
 from PAMI.correlatedPattern.basic import abstract as _ab
 import pandas as _pd
 from typing import List, Dict, Tuple, Union
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 from collections import Counter
 
 
@@ -220,7 +220,7 @@ class CoMine(_ab._correlatedPatterns):
     _sep = "\t"
     _counter = 0
 
-    def __init__(self, iFile: Union[str, _pd.DataFrame], minSup: Union[int, float, str], minAllConf: float, sep: str="\t") ->None:
+    def __init__(self, iFile: 'Union[str, _pd.DataFrame]', minSup: Union[int, float, str], minAllConf: float, sep: str="\t") ->None:
         """
         param iFile: give the input file
         type iFile: str or DataFrame or url
@@ -237,7 +237,7 @@ class CoMine(_ab._correlatedPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -247,7 +247,7 @@ class CoMine(_ab._correlatedPatterns):
             else:
                 print("The column name should be Transactions and each line should be separated by tab space or a seperator specified by the user")
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -449,7 +449,7 @@ class CoMine(_ab._correlatedPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_pd.DataFrame':
         """
         Storing final correlated patterns in a dataframe
 
@@ -58,7 +58,9 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.coveragePattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
+
+_np = _ab._lazyModule('numpy')
 
 class CMine(_ab._coveragePatterns):
     """
@@ -84,6 +86,8 @@ class CMine(_ab._coveragePatterns):
 
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  engine: str :
+                   'int' (default) stores every tidset in one Python integer. 'numpy' packs the tidsets into rows of uint64 words and counts the overlap of a prefix with all the items that can extend it in one vectorized AND and popcount, skipping the blocks of words where the prefix has no transaction.
 
     :Attributes:
 
@@ -176,6 +180,11 @@ class CMine(_ab._coveragePatterns):
     _mapSupport = {}
     _lno = 0
 
+    def __init__(self, iFile, minRF, minCS, maxOR, sep='\t', engine='int') -> None:
+        super().__init__(iFile, minRF, minCS, maxOR, sep)
+        if engine not in ('int', 'numpy'):
+            raise ValueError("engine should be 'int' or 'numpy'")
+        self._engine = engine
 
     def _convert(self, value) -> Union[int, float]:
         """
@@ -202,7 +211,7 @@ class CMine(_ab._coveragePatterns):
         """
         self._Database = []
         self._mapSupport = {}
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -210,7 +219,7 @@ class CMine(_ab._coveragePatterns):
                 self._Database = self._iFile['Transactions'].tolist()
 
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -305,6 +314,57 @@ class CMine(_ab._coveragePatterns):
             #print(i,tidData[i][0])
             self.genPatterns(tidData[i],tidData[i+1:length])
 
+    def generatePackedPatterns(self, coverageItems: Dict[str, List[int]]) -> None:
+        """
+        Generates all coverage patterns with the numpy engine. The tidsets, with the leading bit of tidToBitset as
+        transaction 0, are packed into rows of uint64 words. The overlap of a prefix with all the items that can extend
+        it is counted in one vectorized pass, and its coverage follows as |prefix| + |item| - overlap.
+
+        :param coverageItems: coverage items and their tid lists
+        :return: None
+        """
+        packed = _ab._packedBitset
+        names = list(coverageItems)
+        rows = packed.pack([[0] + list(tids) for tids in coverageItems.values()], self._lno + 1, reverse=True)
+        supports = packed.popcount(rows)
+        total = len(self._Database)
+        # every bitset is in [2 ** lno, 2 ** (lno + 1)), so it has digits or digits + 1 decimal digits
+        low = 1 << self._lno
+        digits = max(1, int(self._lno * 0.30102))
+        while 10 ** digits <= low:
+            digits += 1
+        ten = 10 ** digits if 10 ** digits < 2 * low else None
+
+        def expand(itemSet, row, words, support, start):
+            if start == len(names):
+                return itemSet, iter(())
+            length = digits
+            if ten is not None:
+                value = row
+                if words is not None:
+                    value = _np.zeros(rows.shape[1], dtype=rows.dtype)
+                    value[words] = row
+                length += int.from_bytes(value.astype('<u8').tobytes(), 'little') >= ten
+            childWords, intersections, counts = packed.intersect(row, rows, select=range(start, len(names)), words=words)
+            andCounts = counts - 1
+            orCounts = support + supports[start:] - counts - 1
+            passing = ((orCounts / total >= self._minCS) & (andCounts / length <= self._maxOR)).nonzero()[0]
+            return itemSet, iter([(start + j, intersections[j], childWords, int(andCounts[j]), int(orCounts[j]),
+                                   int(counts[j])) for j in passing.tolist()])
+
+        for i in range(len(names)):
+            stack = [expand(names[i], rows[i], None, int(supports[i]), i + 1)]
+            while stack:
+                itemSet, children = stack[-1]
+                for k, row, words, andCount, orCount, support in children:
+                    coverageItem_set = itemSet + '\t' + names[k]
+                    if orCount / total >= self._minRF:
+                        self._finalPatterns[coverageItem_set] = andCount
+                    stack.append(expand(coverageItem_set, row, words, support, k + 1))
+                    break
+                else:
+                    stack.pop()
+
     @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
     def startMine(self) -> None:
         """ Main method to start """
@@ -323,8 +383,11 @@ class CMine(_ab._coveragePatterns):
         self._maxOR = self._convert(self._maxOR)
         coverageItems = self.creatingCoverageItems()
         self._finalPatterns = {k: len(v) for k, v in coverageItems.items()}
-        coverageItemsBitset = self.tidToBitset(coverageItems)
-        self.generateAllPatterns(coverageItemsBitset)
+        if self._engine == 'numpy':
+            self.generatePackedPatterns(coverageItems)
+        else:
+            coverageItemsBitset = self.tidToBitset(coverageItems)
+            self.generateAllPatterns(coverageItemsBitset)
         self.save('output.txt')
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
@@ -364,7 +427,7 @@ class CMine(_ab._coveragePatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final coverage patterns in a dataframe
 
@@ -56,7 +56,7 @@ Copyright (C)  2021 Rage Uday Kiran
 from PAMI.coveragePattern.basic import abstract as _ab
 import pandas as pd
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 _maxPer = float()
@@ -183,7 +183,7 @@ class CPPG(_ab._coveragePatterns):
             Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             data, ts = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -198,7 +198,7 @@ class CPPG(_ab._coveragePatterns):
                 self._Database.append(tr)
 
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -0,0 +1,410 @@
+# ProcessContext runs the RDD plans of the pyspark miners on a local pool of processes instead of a Spark cluster. It
+# implements the part of the SparkContext and RDD interface that the miners use (textFile, broadcast, map, flatMap,
+# filter, reduceByKey, groupByKey, aggregateByKey, foldByKey, sortBy, zipWithIndex, collect, ...), so the same plan runs
+# on either backend without a JVM.
+#
+#  **Importing this algorithm into a python program**
+#  --------------------------------------------------------
+#
+#             from PAMI.extras.backend.ProcessContext import ProcessContext, createContext
+#
+#             sc = ProcessContext(numWorkers=4)
+#
+#             counts = sc.textFile('sampleDB.txt', 4).flatMap(lambda line: line.split('\t')).map(lambda item: (item, 1))
+#
+#             print(counts.reduceByKey(lambda x, y: x + y).collect())
+#
+#             sc = createContext('spark', 'parallelFPGrowth', 'local[*]')     # a SparkContext, pyspark is imported here
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import copy
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+#: Backends accepted by createContext()
+BACKENDS = ('spark', 'process')
+
+#: Function and input partitions of the stage being run, inherited by the forked worker processes
+_stage = None
+
+
+def _runPartition(split: int) -> List[Any]:
+    """
+    Computes a partition of the current stage in a worker process
+    """
+    function, partitions = _stage
+    return list(function(split, iter(partitions[split])))
+
+
+def createContext(backend: str, appName: str, master: Optional[str] = None, numWorkers: Optional[int] = None) -> Any:
+    """
+    Creates the context a pyspark miner runs its plan on
+
+    :param backend: 'spark' for a SparkContext, 'process' for a ProcessContext
+    :type backend: str
+    :param appName: name of the Spark application
+    :type appName: str
+    :param master: Spark master, e.g. 'local[*]'. None keeps the master of the Spark configuration.
+    :type master: str
+    :param numWorkers: number of worker processes of a ProcessContext, every CPU by default
+    :type numWorkers: int
+    :return: the context
+    :rtype: SparkContext or ProcessContext
+    """
+    if backend == 'process':
+        return ProcessContext(numWorkers)
+    if backend != 'spark':
+        raise ValueError("backend should be one of " + ", ".join(BACKENDS))
+    from pyspark import SparkConf, SparkContext
+    conf = SparkConf().setAppName(appName)
+    if master is not None:
+        conf = conf.setMaster(master)
+    return SparkContext.getOrCreate(conf)
+
+
+class Broadcast:
+    """
+    :Description:   Read-only value shared with the tasks, like a Spark broadcast variable. The worker processes are
+                    forked, so they see the value without any copy.
+
+    :Attributes:
+
+        value : Any
+            The broadcast value
+    """
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def unpersist(self) -> None:
+        pass
+
+    def destroy(self) -> None:
+        pass
+
+
+class ProcessContext:
+    """
+    :Description:   ProcessContext is a local stand-in for a SparkContext. The RDDs it creates are lists of
+                    partitions; narrow transformations (map, flatMap, filter, ...) of an RDD are fused into one function
+                    per partition, and a stage computes all the partitions of an RDD in a pool of forked processes. The
+                    stage function and its input partitions are inherited by the workers, so lambdas and closures work
+                    as in Spark without being pickled, and only the computed partitions are sent back. Shuffles combine
+                    the values of every key in the map-side partitions before hash-partitioning them.
+
+                    Where fork is not available, or with a single worker, the stages run in the calling process.
+
+    :param  numWorkers: int :
+            Number of worker processes. None uses every CPU.
+
+    :Attributes:
+
+        defaultParallelism : int
+            Number of partitions of an RDD when the caller does not choose it
+    """
+
+    def __init__(self, numWorkers: Optional[int] = None) -> None:
+        if numWorkers is None:
+            numWorkers = os.cpu_count() or 1
+        if numWorkers < 1:
+            raise ValueError("numWorkers should be at least 1")
+        self._numWorkers = numWorkers
+        self.defaultParallelism = numWorkers
+
+    def getOrCreate(self) -> 'ProcessContext':
+        return self
+
+    def stop(self) -> None:
+        pass
+
+    def broadcast(self, value: Any) -> Broadcast:
+        """
+        :param value: a value to share with the tasks
+        :return: the broadcast variable
+        :rtype: Broadcast
+        """
+        return Broadcast(value)
+
+    def parallelize(self, data: Iterable[Any], numSlices: Optional[int] = None) -> 'ProcessRDD':
+        """
+        :param data: the elements of the RDD
+        :type data: Iterable
+        :param numSlices: number of partitions
+        :type numSlices: int
+        :return: an RDD of the elements, split into numSlices contiguous partitions, some of which may be empty
+        :rtype: ProcessRDD
+        """
+        data = list(data)
+        n = max(1, numSlices or self.defaultParallelism)
+        size, extra = divmod(len(data), n)
+        partitions, start = [], 0
+        for split in range(n):
+            end = start + size + (split < extra)
+            partitions.append(data[start:end])
+            start = end
+        return ProcessRDD(self, partitions)
+
+    def textFile(self, name: str, minPartitions: Optional[int] = None) -> 'ProcessRDD':
+        """
+        :param name: path of a text file
+        :type name: str
+        :param minPartitions: number of partitions
+        :type minPartitions: int
+        :return: an RDD of the lines of the file, without their line breaks
+        :rtype: ProcessRDD
+        """
+        with open(name, 'r', encoding='utf-8') as f:
+            return self.parallelize(f.read().splitlines(), minPartitions)
+
+    def _run(self, function: Callable, partitions: List[List[Any]]) -> List[List[Any]]:
+        """
+        Computes function on every partition, in the worker processes if there are several partitions and workers
+        """
+        global _stage
+        workers = min(self._numWorkers, len(partitions))
+        if workers <= 1 or 'fork' not in multiprocessing.get_all_start_methods():
+            return [list(function(split, iter(partition))) for split, partition in enumerate(partitions)]
+        _stage = (function, partitions)
+        try:
+            with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('fork')) as executor:
+                return list(executor.map(_runPartition, range(len(partitions))))
+        finally:
+            _stage = None
+
+
+class ProcessRDD:
+    """
+    :Description:   Lazily evaluated, partitioned collection of a ProcessContext. An RDD is computed from its source,
+                    i.e. a list of partitions, a parent RDD or a function giving the partitions of a shuffle, by its
+                    fused partition function. persist() keeps the partitions once they are computed.
+
+    :param  context: ProcessContext :
+            The context of the RDD
+    :param  source: list or ProcessRDD or Callable :
+            The input partitions
+    :param  function: Callable :
+            Computes a partition from (partition index, iterator over the input partition), None for the identity
+    :param  numPartitions: int :
+            Number of partitions, when the source is a function
+    """
+
+    def __init__(self, context: ProcessContext, source: Any, function: Optional[Callable] = None,
+                 numPartitions: Optional[int] = None) -> None:
+        self.context = context
+        self._source = source
+        self._function = function
+        self._numPartitions = numPartitions
+        self._persisted = False
+        self._cache = None
+
+    def getNumPartitions(self) -> int:
+        if self._numPartitions is not None:
+            return self._numPartitions
+        if isinstance(self._source, ProcessRDD):
+            return self._source.getNumPartitions()
+        return len(self._source)
+
+    def _partitions(self) -> List[List[Any]]:
+        """
+        :return: the computed partitions
+        :rtype: list
+        """
+        if self._cache is not None:
+            return self._cache
+        if isinstance(self._source, ProcessRDD):
+            partitions = self._source._partitions()
+        elif callable(self._source):
+            partitions = self._source()
+        else:
+            partitions = self._source
+        if self._function is not None:
+            partitions = self.context._run(self._function, partitions)
+        if self._persisted:
+            self._cache = partitions
+        return partitions
+
+    def persist(self, storageLevel: Any = None) -> 'ProcessRDD':
+        self._persisted = True
+        return self
+
+    def cache(self) -> 'ProcessRDD':
+        return self.persist()
+
+    def unpersist(self, blocking: bool = False) -> 'ProcessRDD':
+        self._persisted = False
+        self._cache = None
+        return self
+
+    # narrow transformations
+
+    def mapPartitionsWithIndex(self, f: Callable[[int, Iterator[Any]], Iterable[Any]]) -> 'ProcessRDD':
+        """
+        :param f: computes the elements of a partition from its index and its input elements
+        :type f: Callable
+        :return: the transformed RDD. f is fused with the partition function of this RDD unless it is persisted.
+        :rtype: ProcessRDD
+        """
+        if self._persisted or self._cache is not None:
+            return ProcessRDD(self.context, self, f)
+        if self._function is None:
+            return ProcessRDD(self.context, self._source, f, self._numPartitions)
+        previous = self._function
+        return ProcessRDD(self.context, self._source, lambda split, iterator: f(split, previous(split, iterator)),
+                          self._numPartitions)
+
+    def mapPartitions(self, f: Callable[[Iterator[Any]], Iterable[Any]]) -> 'ProcessRDD':
+        return self.mapPartitionsWithIndex(lambda split, iterator: f(iterator))
+
+    def map(self, f: Callable[[Any], Any]) -> 'ProcessRDD':
+        return self.mapPartitionsWithIndex(lambda split, iterator: map(f, iterator))
+
+    def flatMap(self, f: Callable[[Any], Iterable[Any]]) -> 'ProcessRDD':
+        return self.mapPartitionsWithIndex(lambda split, iterator: (y for x in iterator for y in f(x)))
+
+    def filter(self, f: Callable[[Any], bool]) -> 'ProcessRDD':
+        return self.mapPartitionsWithIndex(lambda split, iterator: filter(f, iterator))
+
+    def mapValues(self, f: Callable[[Any], Any]) -> 'ProcessRDD':
+        return self.map(lambda kv: (kv[0], f(kv[1])))
+
+    def keys(self) -> 'ProcessRDD':
+        return self.map(lambda kv: kv[0])
+
+    def values(self) -> 'ProcessRDD':
+        return self.map(lambda kv: kv[1])
+
+    def zipWithIndex(self) -> 'ProcessRDD':
+        """
+        :return: the (element, index) pairs, indexed in partition order
+        :rtype: ProcessRDD
+        """
+        def zipped():
+            partitions, start = [], 0
+            for partition in self._partitions():
+                partitions.append(list(zip(partition, range(start, start + len(partition)))))
+                start += len(partition)
+            return partitions
+        return ProcessRDD(self.context, zipped, None, self.getNumPartitions())
+
+    # shuffles
+
+    def combineByKey(self, createCombiner: Callable, mergeValue: Callable, mergeCombiners: Callable,
+                     numPartitions: Optional[int] = None) -> 'ProcessRDD':
+        """
+        Combines the values of every key of an RDD of (key, value) pairs. Every map-side partition combines its own
+        values and splits the combiners into numPartitions buckets by the hash of their key; a reduce-side partition
+        merges the combiners of its bucket.
+
+        :param createCombiner: turns the first value of a key into a combiner
+        :param mergeValue: adds a value to a combiner
+        :param mergeCombiners: merges two combiners
+        :param numPartitions: number of partitions of the result, that of this RDD by default
+        :return: the (key, combiner) pairs
+        :rtype: ProcessRDD
+        """
+        n = numPartitions or self.getNumPartitions()
+
+        def combine(split, iterator):
+            buckets = [{} for _ in range(n)]
+            for key, value in iterator:
+                bucket = buckets[hash(key) % n]
+                if key in bucket:
+                    bucket[key] = mergeValue(bucket[key], value)
+                else:
+                    bucket[key] = createCombiner(value)
+            return [buckets]
+
+        def merge(split, iterator):
+            merged = {}
+            for bucket in iterator:
+                for key, combiner in bucket.items():
+                    merged[key] = mergeCombiners(merged[key], combiner) if key in merged else combiner
+            return merged.items()
+
+        mapped = self.mapPartitionsWithIndex(combine)
+
+        def shuffle():
+            # the map side is computed once, then its buckets are transposed into the reduce-side partitions
+            buckets = [partition[0] for partition in mapped._partitions()]
+            return [[mapBuckets[split] for mapBuckets in buckets] for split in range(n)]
+        return ProcessRDD(self.context, shuffle, merge, n)
+
+    def reduceByKey(self, func: Callable[[Any, Any], Any], numPartitions: Optional[int] = None) -> 'ProcessRDD':
+        return self.combineByKey(lambda value: value, func, func, numPartitions)
+
+    def groupByKey(self, numPartitions: Optional[int] = None) -> 'ProcessRDD':
+        """
+        :return: the (key, list of values) pairs
+        :rtype: ProcessRDD
+        """
+        def append(values, value):
+            values.append(value)
+            return values
+
+        def extend(values, others):
+            values.extend(others)
+            return values
+        return self.combineByKey(lambda value: [value], append, extend, numPartitions)
+
+    def aggregateByKey(self, zeroValue: Any, seqFunc: Callable, combFunc: Callable,
+                       numPartitions: Optional[int] = None) -> 'ProcessRDD':
+        """
+        :param zeroValue: initial combiner of every key, copied for every key and partition
+        :param seqFunc: adds a value to a combiner
+        :param combFunc: merges two combiners
+        :param numPartitions: number of partitions of the result
+        :rtype: ProcessRDD
+        """
+        return self.combineByKey(lambda value: seqFunc(copy.deepcopy(zeroValue), value), seqFunc, combFunc,
+                                 numPartitions)
+
+    def foldByKey(self, zeroValue: Any, func: Callable, numPartitions: Optional[int] = None) -> 'ProcessRDD':
+        return self.aggregateByKey(zeroValue, func, func, numPartitions)
+
+    def sortBy(self, keyfunc: Callable[[Any], Any], ascending: bool = True,
+               numPartitions: Optional[int] = None) -> 'ProcessRDD':
+        """
+        :return: the elements sorted by keyfunc, split into contiguous partitions
+        :rtype: ProcessRDD
+        """
+        n = numPartitions or self.getNumPartitions()
+
+        def ranges():
+            data = sorted((x for partition in self._partitions() for x in partition), key=keyfunc,
+                          reverse=not ascending)
+            return self.context.parallelize(data, n)._source
+        return ProcessRDD(self.context, ranges, None, n)
+
+    # actions
+
+    def collect(self) -> List[Any]:
+        return [x for partition in self._partitions() for x in partition]
+
+    def count(self) -> int:
+        return sum([len(partition) for partition in self._partitions()])
+
+    def take(self, num: int) -> List[Any]:
+        return self.collect()[:num]
+
+    def first(self) -> Any:
+        return self.take(1)[0]
@@ -0,0 +1,186 @@
+# bitmapDevice selects the device the cuda miners run their bit-matrix algorithms on. With the 'cuda' backend the
+# arrays live on the GPU (cupy or pycuda) and the CUDA kernels are launched as before; with the 'cpu' backend the same
+# arrays are NumPy arrays and every kernel is replaced by a vectorized NumPy twin that computes the same result, so the
+# miners also run on machines without a GPU. The default 'auto' backend picks the GPU when one can be used.
+#
+#  **Importing this algorithm into a python program**
+#  --------------------------------------------------------
+#
+#             from PAMI.extras.backend import bitmapDevice as bd
+#
+#             backend = bd.selectBackend('auto')          # 'cuda' if cupy finds a GPU, 'cpu' otherwise
+#
+#             xp = bd.arrayModule(backend)                # cupy or numpy
+#
+#             bits = bd.unpackWords(xp.asarray([[2 ** 63 + 1]], dtype=xp.uint64), 64)      # timestamps 1 and 64
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import functools
+import importlib
+from typing import Any, Callable, Optional, Tuple
+
+import numpy as np
+
+#: Backends accepted by selectBackend()
+BACKENDS = ('auto', 'cuda', 'cpu')
+
+
+@functools.lru_cache(maxsize=None)
+def cudaAvailable(package: str = 'cupy') -> bool:
+    """
+    Checks whether the GPU package used by a miner is installed and sees at least one device
+
+    :param package: 'cupy' or 'pycuda'
+    :type package: str
+    :return: True if the miner can run on the GPU
+    :rtype: bool
+    """
+    try:
+        if package == 'cupy':
+            cupy = importlib.import_module('cupy')
+            return cupy.cuda.runtime.getDeviceCount() > 0
+        driver = importlib.import_module('pycuda.driver')
+        driver.init()
+        return driver.Device.count() > 0
+    except Exception:
+        return False
+
+
+def selectBackend(backend: str = 'auto', package: str = 'cupy') -> str:
+    """
+    Resolves the backend requested by the user
+
+    :param backend: 'cuda', 'cpu', or 'auto' to use the GPU when cudaAvailable(package)
+    :type backend: str
+    :param package: GPU package used by the miner, 'cupy' or 'pycuda'
+    :type package: str
+    :return: 'cuda' or 'cpu'
+    :rtype: str
+    """
+    if backend not in BACKENDS:
+        raise ValueError("backend should be one of " + ", ".join(BACKENDS))
+    if backend == 'auto':
+        return 'cuda' if cudaAvailable(package) else 'cpu'
+    return backend
+
+
+def arrayModule(backend: str) -> Any:
+    """
+    :param backend: 'cuda' or 'cpu', as returned by selectBackend()
+    :type backend: str
+    :return: cupy for the cuda backend, numpy for the cpu backend
+    :rtype: module
+    """
+    if backend == 'cuda':
+        return importlib.import_module('cupy')
+    return np
+
+
+class Kernel:
+    """
+    :Description:   A cupy RawKernel together with its NumPy twin. The kernel is launched like a RawKernel,
+                    kernel(grid, block, args); when the first argument is a NumPy array the twin is called with the same
+                    args instead, and the CUDA source is only compiled on the first launch with cupy arrays.
+
+    :param  source: str :
+                   CUDA source of the kernel
+    :param  name: str :
+                   Name of the kernel function in the source
+    :param  cpuFunction: Callable :
+                   NumPy function computing the same output as the kernel, in place, from the same arguments
+    """
+
+    def __init__(self, source: str, name: str, cpuFunction: Callable) -> None:
+        self.source = source
+        self.name = name
+        self.cpuFunction = cpuFunction
+        self._kernel = None
+
+    def __call__(self, grid: Tuple[int, ...], block: Tuple[int, ...], args: Tuple[Any, ...]) -> Any:
+        if isinstance(args[0], np.ndarray):
+            return self.cpuFunction(*args)
+        if self._kernel is None:
+            self._kernel = arrayModule('cuda').RawKernel(self.source, self.name)
+        return self._kernel(grid, block, args)
+
+
+def popcount(array: np.ndarray) -> int:
+    """
+    :param array: array of unsigned integers
+    :type array: numpy.ndarray
+    :return: number of bits set in the array
+    :rtype: int
+    """
+    if hasattr(np, 'bitwise_count'):
+        return int(np.bitwise_count(array).sum(dtype=np.uint64))
+    return int(np.unpackbits(np.ascontiguousarray(array).view(np.uint8)).sum(dtype=np.uint64))
+
+
+def sumBits(array: np.ndarray, total: np.ndarray, numElements: int) -> None:
+    """
+    NumPy twin of the sumKernel of the cuda miners: adds the number of bits set in the first numElements words of array
+    to total[0]
+
+    :param array: array of unsigned integers
+    :type array: numpy.ndarray
+    :param total: one-element output array
+    :type total: numpy.ndarray
+    :param numElements: number of words of array to count
+    :type numElements: int
+    """
+    total[0] += popcount(array[:int(numElements)])
+
+
+def unpackWords(words: np.ndarray, length: Optional[int] = None) -> np.ndarray:
+    """
+    Expands rows of 64-bit words into rows of bits. Bit j of a row is the (j % 64)-th most significant bit of word
+    j // 64, which is how the cuda miners store timestamp j + 1.
+
+    :param words: uint64 array of shape (rows, words)
+    :type words: numpy.ndarray
+    :param length: number of bits kept per row, every bit by default
+    :type length: int
+    :return: boolean array of shape (rows, length)
+    :rtype: numpy.ndarray
+    """
+    words = np.ascontiguousarray(words, dtype='>u8')
+    bits = np.unpackbits(words.view(np.uint8), axis=1).view(np.bool_)
+    return bits if length is None else bits[:, :length]
+
+
+def gaps(bits: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the periods of the timestamp bitmaps returned by unpackWords()
+
+    :param bits: boolean array of shape (rows, maxTimeStamp); bit j is set if timestamp j + 1 is in the row
+    :type bits: numpy.ndarray
+    :return: the gap between every set timestamp and the previous one (timestamp 0 before the first one), 0 where the
+             bit is not set, and the gap between the last set timestamp and maxTimeStamp of every row
+    :rtype: tuple
+    """
+    positions = np.arange(bits.shape[1], dtype=np.int64)
+    lastSet = np.maximum.accumulate(np.where(bits, positions, -1), axis=1)
+    previous = np.empty_like(lastSet)
+    previous[:, 0] = -1
+    previous[:, 1:] = lastSet[:, :-1]
+    periods = np.where(bits, positions - previous, 0)
+    trailing = bits.shape[1] - 1 - lastSet[:, -1] if bits.shape[1] else np.zeros(len(bits), dtype=np.int64)
+    return periods, trailing
@@ -0,0 +1,318 @@
+# Benchmark runs a matrix of algorithms x thresholds on synthetic databases generated with the classes of
+# PAMI.extras.syntheticDataGenerator. For every run it records the runtime, the peak RSS and the number of patterns, and
+# it checks that all the algorithms of a family return the same patterns. The report can be saved as CSV or JSON and
+# used as a baseline for later runs.
+#
+#  **Importing this algorithm into a python program**
+#  --------------------------------------------------------
+#
+#             from PAMI.extras.benchmark import Benchmark as bm
+#
+#             obj = bm.Benchmark('frequent', datasets=[{'databaseSize': 1000, 'avgItemsPerTransaction': 8, 'numItems': 40}],
+#
+#                                thresholds=[0.1, 0.05])
+#
+#             obj.run()
+#
+#             print(obj.getResults())
+#
+#             obj.save('report.csv')
+#
+#             print(obj.compare('baseline.csv'))
+#
+#             obj.close()
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import importlib
+import json
+import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional, Union
+import numpy as np
+import pandas as pd
+import psutil
+from PAMI.extras.profiler.Profiler import Profiler
+from PAMI.extras.syntheticDataGenerator.TransactionalDatabase import TransactionalDatabase
+from PAMI.extras.syntheticDataGenerator.TemporalDatabase import TemporalDatabase
+from PAMI.extras.syntheticDataGenerator.generateUtilityTransactional import generateUtilityTransactional
+
+
+#: For every family: the package of its miners, the default algorithms and the type of database they read
+families = {
+    'frequent': {'package': 'PAMI.frequentPattern.basic', 'database': 'transactional',
+                 'algorithms': ['Apriori', 'Aprioribitset', 'ECLAT', 'ECLATbitset', 'ECLATDiffset', 'ECLATHybrid', 'FPGrowth']},
+    'periodic': {'package': 'PAMI.periodicFrequentPattern.basic', 'database': 'temporal',
+                 'algorithms': ['PFPGrowth', 'PFECLAT', 'PSGrowth', 'PFPGrowthPlus']},
+    'utility': {'package': 'PAMI.highUtilityPattern.basic', 'database': 'utility',
+                'algorithms': ['EFIM', 'HMiner', 'UPGrowth']},
+}
+
+
+def _normalisePatterns(patterns: Dict[Any, Any]) -> Dict[tuple, Any]:
+    """
+    Brings the patterns of the different miners to a common form: a sorted tuple of items as key, and an int or a tuple
+    of ints as value.
+    """
+    result = {}
+    for key, value in patterns.items():
+        if isinstance(key, str):
+            key = re.split(r'[\t ,]+', key.strip())
+        key = tuple(sorted(str(x).strip() for x in key))
+        if isinstance(value, (list, tuple)):
+            value = tuple(int(v) for v in value[:2])
+        else:
+            value = int(value)
+        result[key] = value
+    return result
+
+
+class Benchmark:
+    """
+    :Description:   Benchmark compares the algorithms of one family on the same synthetic inputs. A dataset is described
+                    by a dictionary with the parameters of the generator of the family: databaseSize,
+                    avgItemsPerTransaction and numItems, and for temporal databases optionally
+                    occurrenceProbabilityAtSameTimestamp and occurrenceProbabilityToSkipSubsequentTimestamp (0 by
+                    default, i.e. one transaction per timestamp). Thresholds are minSup values for the frequent family,
+                    (minSup, maxPer) pairs for the periodic family and minUtil values for the utility family.
+                    The first algorithm that succeeds on a dataset and threshold is the reference of the
+                    agreement check.
+
+    :param  family: str :
+            'frequent', 'periodic' or 'utility'
+    :param  datasets: list :
+            Parameters of every synthetic database
+    :param  thresholds: list :
+            Thresholds given to every algorithm
+    :param  algorithms: list :
+            Names of the algorithms to run. The default is every algorithm of the family.
+    :param  seed: int :
+            Seed of the generators, so that the same parameters always give the same database
+    :param  workDir: str :
+            Directory of the generated databases. A temporary directory is used by default; it is removed by close(),
+            which also runs when Benchmark is used as a context manager.
+
+    :Attributes:
+
+        results : list
+            One dictionary per run with the dataset, algorithm, threshold, runtime, peakRSS, memoryIncrease, patterns,
+            agrees and error fields
+    """
+
+    def __init__(self, family: str, datasets: List[Dict[str, Any]], thresholds: List[Any],
+                 algorithms: Optional[List[str]] = None, seed: int = 1, workDir: Optional[str] = None) -> None:
+        if family not in families:
+            raise ValueError("family should be one of " + ", ".join(families))
+        self._family = family
+        self._datasets = datasets
+        self._thresholds = thresholds
+        self._algorithms = algorithms if algorithms is not None else list(families[family]['algorithms'])
+        self._seed = seed
+        self._ownsWorkDir = workDir is None
+        self._workDir = workDir if workDir is not None else tempfile.mkdtemp(prefix='pamiBenchmark')
+        self.results = []
+
+    def __enter__(self) -> 'Benchmark':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Removes the temporary directory of the generated databases. A workDir given by the caller is kept.
+        """
+        if self._ownsWorkDir:
+            shutil.rmtree(self._workDir, ignore_errors=True)
+            self._ownsWorkDir = False
+
+    def _datasetName(self, dataset: Dict[str, Any]) -> str:
+        return "_".join([families[self._family]['database']] + [str(dataset[key]) for key in sorted(dataset)])
+
+    def generate(self, dataset: Dict[str, Any]) -> str:
+        """
+        Generates the database of a dataset, unless it already exists in workDir. The generators draw from the global
+        random and numpy.random states, which are seeded for the generation and restored afterwards.
+
+        :param dataset: parameters of the generator
+        :type dataset: dict
+        :return: name of the database file
+        :rtype: str
+        """
+        fileName = os.path.join(self._workDir, self._datasetName(dataset) + ".txt")
+        if os.path.exists(fileName):
+            return fileName
+        size, avg, numItems = dataset['databaseSize'], dataset['avgItemsPerTransaction'], dataset['numItems']
+        if 2 * avg - 1 > numItems:
+            raise ValueError("avgItemsPerTransaction should be at most (numItems + 1) / 2")
+        states = np.random.get_state(), random.getstate()
+        np.random.seed(self._seed)
+        random.seed(self._seed)
+        try:
+            database = families[self._family]['database']
+            if database == 'transactional':
+                obj = TransactionalDatabase(size, avg, numItems)
+                obj.create()
+                obj.save(fileName)
+            elif database == 'temporal':
+                obj = TemporalDatabase(size, avg, numItems, fileName, percentage=100,
+                                       occurrenceProbabilityAtSameTimestamp=dataset.get('occurrenceProbabilityAtSameTimestamp', 0.0),
+                                       occurrenceProbabilityToSkipSubsequentTimestamp=dataset.get('occurrenceProbabilityToSkipSubsequentTimestamp', 0.0))
+                obj.create()
+            else:
+                obj = generateUtilityTransactional(size, numItems, avg, 1, 10, 1, 5)
+                obj.generate()
+                obj.save(fileName)
+        finally:
+            np.random.set_state(states[0])
+            random.setstate(states[1])
+        return fileName
+
+    def _create(self, algorithm: str, iFile: str, threshold: Any) -> Any:
+        module = importlib.import_module(families[self._family]['package'] + '.' + algorithm)
+        cls = getattr(module, algorithm)
+        if isinstance(threshold, (list, tuple)):
+            return cls(iFile, *threshold, sep='\t')
+        return cls(iFile, threshold, sep='\t')
+
+    def _runOne(self, algorithm: str, iFile: str, threshold: Any) -> Dict[str, Any]:
+        row = {'runtime': None, 'peakRSS': None, 'memoryIncrease': None, 'patterns': None, 'error': None}
+        profiler = Profiler()
+        baseline = psutil.Process(os.getpid()).memory_info().rss
+        try:
+            obj = self._create(algorithm, iFile, threshold)
+            profiler.start()
+            obj.mine()
+            profiler.stop()
+            patterns = _normalisePatterns(obj.getPatterns())
+        except Exception as error:
+            profiler.stop()
+            row['error'] = type(error).__name__ + ": " + str(error)
+            return row
+        row['runtime'] = obj.getRuntime()
+        row['peakRSS'] = profiler.peakRSS
+        row['memoryIncrease'] = max(0, profiler.peakRSS - baseline)
+        row['patterns'] = len(patterns)
+        row['_patterns'] = patterns
+        return row
+
+    def run(self) -> List[Dict[str, Any]]:
+        """
+        Runs every algorithm with every threshold on every dataset
+
+        :return: the results
+        :rtype: list
+        """
+        self.results = []
+        for dataset in self._datasets:
+            iFile = self.generate(dataset)
+            density = dataset['avgItemsPerTransaction'] / dataset['numItems']
+            for threshold in self._thresholds:
+                reference, referenceName = None, None
+                for algorithm in self._algorithms:
+                    row = {'family': self._family, 'dataset': self._datasetName(dataset),
+                           'databaseSize': dataset['databaseSize'],
+                           'avgItemsPerTransaction': dataset['avgItemsPerTransaction'],
+                           'numItems': dataset['numItems'], 'density': density, 'algorithm': algorithm,
+                           'threshold': json.dumps(threshold)}
+                    row.update(self._runOne(algorithm, iFile, threshold))
+                    patterns = row.pop('_patterns', None)
+                    if patterns is None:
+                        row['agrees'] = None
+                    elif reference is None:
+                        reference, referenceName = patterns, algorithm
+                        row['agrees'] = True
+                    else:
+                        row['agrees'] = patterns == reference
+                    row['reference'] = referenceName
+                    self.results.append(row)
+        return self.results
+
+    def getResults(self) -> pd.DataFrame:
+        """
+        :return: the results as a dataframe
+        :rtype: pd.DataFrame
+        """
+        return pd.DataFrame(self.results)
+
+    def getMismatches(self) -> pd.DataFrame:
+        """
+        :return: the runs that failed or whose patterns differ from the reference
+        :rtype: pd.DataFrame
+        """
+        df = self.getResults()
+        if df.empty:
+            return df
+        return df[(df['agrees'] != True) | df['error'].notnull()]
+
+    def save(self, oFile: str) -> None:
+        """
+        Saves the results as JSON if oFile ends with .json and as CSV otherwise
+
+        :param oFile: name of the output file
+        :type oFile: str
+        """
+        if oFile.endswith('.json'):
+            with open(oFile, 'w') as f:
+                json.dump(self.results, f, indent=2)
+        else:
+            self.getResults().to_csv(oFile, index=False)
+
+    def compare(self, baseline: Union[str, pd.DataFrame], runtimeTolerance: float = 1.5) -> pd.DataFrame:
+        """
+        Compares the results with a saved report. A run regresses if its number of patterns changed, if it fails while
+        the baseline succeeded, or if it is more than runtimeTolerance times slower.
+
+        :param baseline: a report written by save(), or its dataframe
+        :type baseline: str or pd.DataFrame
+        :param runtimeTolerance: allowed ratio between the new and the baseline runtime
+        :type runtimeTolerance: float
+        :return: the regressed runs with their baseline runtime and number of patterns
+        :rtype: pd.DataFrame
+        """
+        if isinstance(baseline, str):
+            baseline = pd.read_json(baseline) if baseline.endswith('.json') else pd.read_csv(baseline)
+        keys = ['family', 'dataset', 'algorithm', 'threshold']
+        baseline = baseline.astype({'threshold': str})
+        current = self.getResults().astype({'threshold': str})
+        merged = current.merge(baseline[keys + ['runtime', 'patterns']], on=keys, how='inner',
+                               suffixes=('', 'Baseline'))
+        regressed = (merged['patterns'] != merged['patternsBaseline']) | \
+                    (merged['runtime'] > merged['runtimeBaseline'] * runtimeTolerance)
+        regressed &= merged['patternsBaseline'].notnull()
+        return merged[regressed]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 7:
+        _thresholds = [json.loads(x) for x in sys.argv[5].split(';')]
+        with Benchmark(sys.argv[1], [{'databaseSize': int(sys.argv[2]), 'avgItemsPerTransaction': int(sys.argv[3]),
+                                     'numItems': int(sys.argv[4])}], _thresholds) as _ap:
+            _ap.run()
+            _ap.save(sys.argv[6])
+            print(_ap.getResults()[['algorithm', 'threshold', 'runtime', 'peakRSS', 'patterns', 'agrees']])
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
+        print("Format: python3 Benchmark.py <family> <databaseSize> <avgItemsPerTransaction> <numItems> "
+              "<thresholds separated by ;, e.g. 0.1;0.05 or [20,50];[30,50]> <report.csv or report.json>")
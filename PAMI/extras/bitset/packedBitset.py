@@ -0,0 +1,137 @@
+# packedBitset stores tidsets as rows of uint64 words in a NumPy matrix, one row per item or candidate, so that the
+# intersections and supports of a whole equivalence class are computed in one vectorized AND and popcount. The words
+# are grouped in blocks of _BLOCK words, and a row is only intersected on the blocks where it has a set bit.
+#
+#  **Importing this algorithm into a python program**
+#  --------------------------------------------------------
+#
+#             from PAMI.extras.bitset import packedBitset
+#
+#             rows = packedBitset.pack([[0, 2, 5], [2, 5], [1, 5]], size=6)
+#
+#             words, intersections, supports = packedBitset.intersect(rows[0], rows[1:])
+#
+#             print(supports)     # [2 1]
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Iterable, Optional, Sequence, Tuple
+from PAMI.extras.lazyImport import lazyModule
+
+np = lazyModule('numpy')
+
+#: Words per block of the sparsity index: 8 words are 512 transactions, one 64-byte cache line
+_BLOCK = 8
+
+#: A row is only restricted to its non-zero blocks when at most this fraction of its blocks is non-zero, otherwise the
+#: copy costs more than the AND of the zero blocks
+_DENSE = 0.75
+
+_TABLE = []
+
+
+def pack(tidLists: Sequence[Iterable[int]], size: int, reverse: bool = False) -> 'np.ndarray':
+    """
+    Packs tidsets into a matrix of uint64 words. Transaction t is bit t % 64 of word t // 64, and every row is padded
+    to a whole number of blocks.
+
+    :param tidLists: the transaction ids of every row, between 0 and size - 1
+    :type tidLists: list
+    :param size: number of transactions
+    :type size: int
+    :param reverse: store transaction t in bit size - 1 - t instead, so that a row read as a little-endian integer
+                    equals the bitset 1 << (size - 1 - t) | ... of Python integers
+    :type reverse: bool
+    :return: one row of words per tidset
+    :rtype: numpy.ndarray
+    """
+    words = -(-size // 64)
+    words = -(-words // _BLOCK) * _BLOCK
+    rows = np.zeros((len(tidLists), words), dtype=np.uint64)
+    bits = np.zeros(words * 64, dtype=bool)
+    for r, tids in enumerate(tidLists):
+        tids = np.fromiter(tids, dtype=np.int64)
+        if reverse:
+            tids = size - 1 - tids
+        bits[:] = False
+        bits[tids] = True
+        rows[r] = np.packbits(bits, bitorder='little').view('<u8')
+    return rows
+
+
+def popcount(rows: 'np.ndarray') -> 'np.ndarray':
+    """
+    :param rows: a matrix of uint64 words
+    :type rows: numpy.ndarray
+    :return: the number of set bits of every row
+    :rtype: numpy.ndarray
+    """
+    if hasattr(np, 'bitwise_count'):
+        bits = np.bitwise_count(rows)
+    else:
+        if not _TABLE:
+            _TABLE.append(np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8))
+        bits = _TABLE[0][np.ascontiguousarray(rows).view(np.uint8)]
+    return bits.sum(axis=1, dtype=np.int64)
+
+
+def nonzeroWords(row: 'np.ndarray') -> Optional['np.ndarray']:
+    """
+    Sparsity index of a row
+
+    :param row: a row of words, a whole number of blocks long
+    :type row: numpy.ndarray
+    :return: the indexes of the words of the blocks of row that have a set bit, or None if most blocks do
+    :rtype: numpy.ndarray
+    """
+    blocks = len(row) // _BLOCK
+    nonzero = np.flatnonzero(row.reshape(blocks, _BLOCK).any(axis=1))
+    if len(nonzero) > _DENSE * blocks:
+        return None
+    return (nonzero[:, None] * _BLOCK + np.arange(_BLOCK)).ravel()
+
+
+def intersect(row: 'np.ndarray', rows: 'np.ndarray', select: Optional[Sequence[int]] = None,
+              words: Optional['np.ndarray'] = None) -> Tuple[Optional['np.ndarray'], 'np.ndarray', 'np.ndarray']:
+    """
+    ANDs row with every row of rows in one pass, skipping the blocks where row has no set bit
+
+    :param row: a row of words
+    :type row: numpy.ndarray
+    :param rows: a matrix of words
+    :type rows: numpy.ndarray
+    :param select: the rows of rows to intersect, all of them by default
+    :type select: list
+    :param words: the words of rows that row holds, if row is a restricted intersection; all of them by default
+    :type words: numpy.ndarray
+    :return: the words of rows that were kept (None if all of them), the intersections restricted to these words, and
+             the number of set bits of every intersection
+    :rtype: tuple
+    """
+    nonzero = nonzeroWords(row)
+    if nonzero is not None:
+        row = row[nonzero]
+        words = nonzero if words is None else words[nonzero]
+    if words is None:
+        subset = rows if select is None else rows[select]
+    else:
+        subset = rows[:, words] if select is None else rows[np.ix_(select, words)]
+    intersections = np.bitwise_and(subset, row, out=subset if subset is not rows else None)
+    return words, intersections, popcount(intersections)
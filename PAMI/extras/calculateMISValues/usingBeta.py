@@ -137,7 +137,7 @@ class usingBeta():
                 else:
                     self._finalPatterns[x] = y
 
-    def getMISDataFrame(self) -> _pd.DataFrame:
+    def getMISDataFrame(self) -> '_pd.DataFrame':
         """
         Storing items and its respective minimum support in a dataframe
         :return: returning items and its respective minimum support in a dataframe
@@ -138,7 +138,7 @@ class usingSD():
             else:
                 self._finalPatterns[x] = y
 
-    def getDataFrame(self) -> _pd.DataFrame:
+    def getDataFrame(self) -> '_pd.DataFrame':
         """
         Storing Items and its respective calculated minimum support values in a dataframe
         :return: returning Items and its respective calculated minimum support values in a dataframe
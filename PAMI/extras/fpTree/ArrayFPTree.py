@@ -0,0 +1,264 @@
+# ArrayFPTree is an FP-tree stored in parallel arrays instead of one Python object per node. Node i is described by
+# item[i], count[i], parent[i], firstChild[i], nextSibling[i] and nodeLink[i], and the header table maps every item to
+# the first node of its node-link chain. Conditional pattern bases are extracted by walking the parent indices.
+#
+#  **Importing this algorithm into a python program**
+#  --------------------------------------------------------
+#
+#             from PAMI.extras.fpTree.ArrayFPTree import ArrayFPTree
+#
+#             tree = ArrayFPTree()
+#
+#             tree.insert([0, 1, 2])
+#
+#             tree.insert([0, 2], count=2)
+#
+#             conditional = tree.conditionalTree(2, minSup=2)
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from array import array
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+_WIDE = 16
+
+#: Conditional trees built from more prefix paths than this are stored in arrays, smaller ones in lists, which are
+#: faster to index and to append to
+_COMPACT = 50000
+
+
+class ArrayFPTree:
+    """
+    :Description:   ArrayFPTree is an FP-tree of integer items, such as the item ids of an ItemCodec. Node 0 is the
+                    root. The children of a node form a sibling list, and only nodes with more than _WIDE children get a
+                    dictionary index from item to child, so a compact tree takes about 30 bytes per node.
+                    The caller decides the order of the items of a transaction: insert() adds them along a single path
+                    in the given order.
+
+    :param  compact: bool :
+            Store the columns in arrays of machine integers (the default) rather than in lists
+
+    :Attributes:
+
+        item, count, parent, firstChild, nextSibling, nodeLink : array or list
+            Columns of the nodes
+        head : dict
+            First node of the node-link chain of every item
+        support : dict
+            Sum of the counts of the nodes of every item
+    """
+
+    def __init__(self, compact: bool = True) -> None:
+        if compact:
+            self.item, self.count, self.parent = array('i', [-1]), array('q', [0]), array('i', [-1])
+            self.firstChild, self.nextSibling, self.nodeLink = array('i', [-1]), array('i', [-1]), array('i', [-1])
+        else:
+            self.item, self.count, self.parent = [-1], [0], [-1]
+            self.firstChild, self.nextSibling, self.nodeLink = [-1], [-1], [-1]
+        self.head = {}
+        self.support = {}
+        self._index = {}
+
+    def __len__(self) -> int:
+        """
+        :return: number of nodes, without the root
+        :rtype: int
+        """
+        return len(self.item) - 1
+
+    def insert(self, transaction: Iterable[int], count: int = 1) -> None:
+        """
+        Adds a transaction to the tree
+
+        :param transaction: items in tree order
+        :type transaction: list
+        :param count: number of occurrences of the transaction
+        :type count: int
+        """
+        support = self.support
+        for x in transaction:
+            support[x] = support.get(x, 0) + count
+        self._insertPath(transaction, count)
+
+    def _insertPath(self, transaction: Iterable[int], count: int) -> None:
+        """
+        Adds a transaction to the nodes without updating the support of its items
+        """
+        item, counts, parent = self.item, self.count, self.parent
+        firstChild, nextSibling, nodeLink = self.firstChild, self.nextSibling, self.nodeLink
+        head, indexes = self.head, self._index
+        node = 0
+        for x in transaction:
+            index = indexes.get(node)
+            width = 0
+            if index is not None:
+                child = index.get(x, -1)
+            else:
+                child = firstChild[node]
+                while child >= 0 and item[child] != x:
+                    child = nextSibling[child]
+                    width += 1
+            if child >= 0:
+                counts[child] += count
+                node = child
+                continue
+            child = len(item)
+            item.append(x)
+            counts.append(count)
+            parent.append(node)
+            firstChild.append(-1)
+            nextSibling.append(firstChild[node])
+            firstChild[node] = child
+            nodeLink.append(head.get(x, -1))
+            head[x] = child
+            if index is not None:
+                index[x] = child
+            elif width >= _WIDE:
+                index, sibling = {}, child
+                while sibling >= 0:
+                    index[item[sibling]] = sibling
+                    sibling = nextSibling[sibling]
+                indexes[node] = index
+            node = child
+
+    def nodes(self, x: int) -> Iterator[int]:
+        """
+        :param x: an item
+        :type x: int
+        :return: the nodes of item x, following its node-link chain
+        :rtype: Iterator[int]
+        """
+        node, nodeLink = self.head.get(x, -1), self.nodeLink
+        while node >= 0:
+            yield node
+            node = nodeLink[node]
+
+    def prefixPaths(self, x: int) -> List[Tuple[List[int], int]]:
+        """
+        Conditional pattern base of item x
+
+        :param x: an item
+        :type x: int
+        :return: the items above every node of x, from the node up to the root, and the count of the node
+        :rtype: list
+        """
+        item, counts, parent = self.item, self.count, self.parent
+        paths = []
+        for node in self.nodes(x):
+            path = []
+            ancestor = parent[node]
+            while ancestor > 0:
+                path.append(item[ancestor])
+                ancestor = parent[ancestor]
+            if path:
+                paths.append((path, counts[node]))
+        return paths
+
+    def conditionalTree(self, x: int, minSup: float) -> Tuple[Optional['ArrayFPTree'], int]:
+        """
+        Builds the conditional FP-tree of item x. Items are ordered by their support in the conditional pattern base,
+        and the items below minSup are dropped.
+
+        :param x: an item
+        :type x: int
+        :param minSup: minimum support
+        :type minSup: int or float
+        :return: the conditional tree, or None if no item of the conditional pattern base is frequent, and the number
+                 of distinct items of the conditional pattern base
+        :rtype: tuple
+        """
+        item, counts, parent = self.item, self.count, self.parent
+        paths, supports = [], {}
+        for node in self.nodes(x):
+            count, path = counts[node], []
+            ancestor = parent[node]
+            while ancestor > 0:
+                y = item[ancestor]
+                path.append(y)
+                supports[y] = supports.get(y, 0) + count
+                ancestor = parent[ancestor]
+            if path:
+                paths.append((path, count))
+        candidates = len(supports)
+        frequent = sorted([y for y, s in supports.items() if s >= minSup], key=lambda y: (-supports[y], y))
+        if not frequent:
+            return None, candidates
+        rank = {y: r for r, y in enumerate(frequent)}
+        ranked = []
+        for path, count in paths:
+            path = sorted([rank[y] for y in path if y in rank])
+            if path:
+                ranked.append((path, count))
+        ranked.sort()
+        tree = ArrayFPTree(len(ranked) > _COMPACT)
+        tree.support = {y: supports[y] for y in frequent}
+        tree._insertSorted(ranked, frequent)
+        return tree, candidates
+
+    def _insertSorted(self, ranked: List[Tuple[List[int], int]], items: List[int]) -> None:
+        """
+        Builds the nodes of an empty tree from transactions sorted lexicographically. Consecutive transactions share
+        their common prefix, so the nodes are created without looking up any child.
+
+        :param ranked: sorted (transaction, count) pairs whose items are indexes into items
+        :type ranked: list
+        :param items: the item of every index
+        :type items: list
+        """
+        item, counts, parent = self.item, self.count, self.parent
+        firstChild, nextSibling, nodeLink, head = self.firstChild, self.nextSibling, self.nodeLink, self.head
+        previous, stack = [], [0]
+        for path, count in ranked:
+            common, length = 0, min(len(path), len(previous))
+            while common < length and path[common] == previous[common]:
+                common += 1
+            del stack[common + 1:]
+            for j in range(1, common + 1):
+                counts[stack[j]] += count
+            node = stack[-1]
+            for r in path[common:]:
+                x = items[r]
+                child = len(item)
+                item.append(x)
+                counts.append(count)
+                parent.append(node)
+                firstChild.append(-1)
+                nextSibling.append(firstChild[node])
+                firstChild[node] = child
+                nodeLink.append(head.get(x, -1))
+                head[x] = child
+                stack.append(child)
+                node = child
+            previous = path
+
+    def singlePath(self) -> Optional[List[Tuple[int, int]]]:
+        """
+        :return: the (item, count) pairs from the root down if the tree is a single path, None otherwise
+        :rtype: list
+        """
+        path = []
+        firstChild, nextSibling = self.firstChild, self.nextSibling
+        node = firstChild[0]
+        while node >= 0:
+            if nextSibling[node] >= 0:
+                return None
+            path.append((self.item[node], self.count[node]))
+            node = firstChild[node]
+        return path
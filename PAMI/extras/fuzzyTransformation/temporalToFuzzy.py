@@ -87,7 +87,7 @@ class temporalToFuzzy(_ab._convert):
           To process the input file and store the timestamps, items, and their values as lists respectively.
         """
         self._transactionsDB, self._fuzzyValuesDB, self._tsDB = [], [], []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -97,7 +97,7 @@ class temporalToFuzzy(_ab._convert):
                 self._fuzzyValuesDB = self._iFile['Utilities'].tolist()
 
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line = line.decode("utf-8")
@@ -72,7 +72,7 @@ class DF2Fig():
 
     """
 
-    def __init__(self, dataFrame: _pd.DataFrame) -> None:
+    def __init__(self, dataFrame: '_pd.DataFrame') -> None:
         self._dataFrame = dataFrame
 
     def plot(self, xColumn, yColumn, algorithm=None) -> None:
@@ -60,7 +60,7 @@ class plotGraphsFromDataFrame():
             obj.save()
     """
 
-    def __init__(self, dataFrame: _pd.DataFrame) -> None:
+    def __init__(self, dataFrame: '_pd.DataFrame') -> None:
 
         self._dataFrame = dataFrame
 
@@ -0,0 +1,135 @@
+# lazyImport defers the heavy third-party imports of PAMI (pandas, numpy, psutil, validators, urllib) until they are
+# actually used, so that importing a miner stays cheap for short-lived processes.
+#
+#  **Importing this algorithm into a python program**
+#  --------------------------------------------------------
+#
+#             from PAMI.extras.lazyImport import lazyModule, isDataFrame, isURL
+#
+#             pd = lazyModule('pandas')     # pandas is imported on the first attribute access, e.g. pd.DataFrame
+#
+#             isDataFrame(obj)              # never imports pandas
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import functools
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Any, Callable
+
+_URL_SCHEMES = ('http://', 'https://', 'ftp://', 'ftps://')
+
+
+class _LazyModule(ModuleType):
+    """
+    Stands in for a module until one of its attributes is accessed. The module is then imported normally and its
+    attributes are copied into the proxy, so that later accesses do not go through __getattr__. The proxy itself is
+    never registered in sys.modules.
+    """
+
+    def __getattr__(self, attribute: str) -> Any:
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attribute)
+
+
+#: Proxies handed out by lazyModule(), one per module name
+_proxies = {}
+
+
+def lazyModule(name: str) -> ModuleType:
+    """
+    Returns the module name without executing it. The module is imported on the first access to one of its attributes.
+    If it is already imported, it is returned as is, and if it cannot be found, the ImportError is raised here. Only
+    the modules of PAMI hold the proxy: sys.modules is left untouched until the module is actually imported.
+
+    :param name: name of the module, e.g. 'pandas'
+    :type name: str
+    :return: the module or a proxy of it
+    :rtype: ModuleType
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    if name not in _proxies:
+        if importlib.util.find_spec(name) is None:
+            return importlib.import_module(name)
+        _proxies[name] = _LazyModule(name)
+    return _proxies[name]
+
+
+def isDataFrame(obj: Any) -> bool:
+    """
+    Checks whether obj is a pandas DataFrame without importing pandas: if pandas was never imported, obj cannot be a
+    DataFrame.
+
+    :param obj: any object
+    :return: True if obj is a DataFrame
+    :rtype: bool
+    """
+    pandas = sys.modules.get('pandas')
+    if pandas is None:
+        return False
+    return isinstance(obj, pandas.DataFrame)
+
+
+def isURL(path: Any) -> bool:
+    """
+    Checks whether path is a URL. The validators package is only imported for strings that start with a URL scheme.
+
+    :param path: input of a miner
+    :return: True if path is a valid URL
+    :rtype: bool
+    """
+    if not isinstance(path, str) or not path.lower().startswith(_URL_SCHEMES):
+        return False
+    import validators
+    return bool(validators.url(path))
+
+
+def urlopen(*args, **kwargs) -> Any:
+    """
+    urllib.request.urlopen, imported on the first call
+    """
+    from urllib.request import urlopen as _urlopen
+    return _urlopen(*args, **kwargs)
+
+
+def deprecated(reason: str) -> Callable:
+    """
+    Same as deprecated.deprecated(reason), but the deprecated package is only imported when the decorated function is
+    first called.
+
+    :param reason: message of the DeprecationWarning
+    :type reason: str
+    :return: the decorator
+    :rtype: Callable
+    """
+    def decorator(function: Callable) -> Callable:
+        wrapped = []
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not wrapped:
+                from deprecated import deprecated as _deprecated
+                wrapped.append(_deprecated(reason)(function))
+            return wrapped[0](*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,324 @@
+# PatternTrie is a compact container for the patterns found by a miner. The items of every pattern are kept in sorted
+# order in a prefix tree whose nodes are stored in flat arrays, so that the prefixes shared by many patterns are
+# stored only once.
+#
+#  **Importing this algorithm into a python program**
+#  --------------------------------------------------------
+#
+#             from PAMI.extras.patternStore.PatternTrie import PatternTrie
+#
+#             trie = PatternTrie()
+#
+#             trie[('a', 'b')] = 5
+#
+#             print(trie[('b', 'a')], len(trie))
+#
+#             frequent = trie.filter(minLength=2, minSup=3)
+#
+#             df = trie.toDataFrame()
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from array import array
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from PAMI.extras.lazyImport import lazyModule
+pd = lazyModule('pandas')
+
+_WIDE = 16
+
+
+class PatternTrie(MutableMapping):
+    """
+    :Description:   PatternTrie is a mapping from patterns to their values (a support, or a list such as [support,
+                    periodicity]) that behaves like the dictionary finalPatterns. A pattern is an itemset, so the order of
+                    its items does not matter: trie[('b', 'a')] and trie[('a', 'b')] are the same entry, and the keys are
+                    returned with their items sorted.
+
+                    Node i of the tree is described by item[i], parent[i], firstChild[i], nextSibling[i], depth[i] and
+                    value[i]. These columns are arrays of machine integers as long as the items and values are integers,
+                    which is the case for the item ids of an ItemCodec, and fall back to lists otherwise. The children of
+                    a node form a sibling list sorted by item, and only nodes with many children get a dictionary index.
+
+    :param  patterns: dict :
+            Optional patterns to insert, keyed by tuples of items or by strings of items joined with sep
+    :param  sep: str :
+            Separator of the items in string keys
+
+    :Attributes:
+
+        labels : list
+            If set, the item stored in the tree is an index into labels and the mapping reads and returns the labels
+            instead, for example the item names of an ItemCodec
+    """
+
+    def __init__(self, patterns: Optional[Dict[Any, Any]] = None, sep: str = '\t') -> None:
+        self._item = array('i', [-1])
+        self._parent = array('i', [-1])
+        self._firstChild = array('i', [-1])
+        self._nextSibling = array('i', [-1])
+        self._depth = array('H', [0])
+        self._value = array('q', [0])
+        self._hasValue = bytearray(1)
+        self._index = {}
+        self._count = 0
+        self.labels = None
+        self._ids = None
+        if patterns is not None:
+            for key, value in patterns.items():
+                self[key.split(sep) if isinstance(key, str) else key] = value
+
+    def _path(self, key: Iterable[Any]) -> Optional[List[Any]]:
+        if self._ids is not None:
+            try:
+                return sorted([self._ids[x] for x in key])
+            except KeyError:
+                return None
+        return sorted(key)
+
+    def _child(self, node: int, item: Any) -> int:
+        index = self._index.get(node)
+        if index is not None:
+            return index.get(item, -1)
+        items, nextSibling = self._item, self._nextSibling
+        child = self._firstChild[node]
+        while child >= 0 and items[child] < item:
+            child = nextSibling[child]
+        if child >= 0 and items[child] == item:
+            return child
+        return -1
+
+    def _addChild(self, node: int, item: Any) -> int:
+        """
+        Creates the child of node for item, which must not exist yet. Children are kept in a sibling list sorted by
+        item, and nodes with more than _WIDE children also get a dictionary from item to child.
+        """
+        child = len(self._parent)
+        self._store('_item', item)
+        self._parent.append(node)
+        self._depth.append(self._depth[node] + 1)
+        self._store('_value', 0)
+        self._hasValue.append(0)
+        index = self._index.get(node)
+        if index is not None:
+            self._nextSibling.append(self._firstChild[node])
+            self._firstChild.append(-1)
+            self._firstChild[node] = child
+            index[item] = child
+            return child
+        items, nextSibling = self._item, self._nextSibling
+        previous, current, width = -1, self._firstChild[node], 1
+        while current >= 0 and items[current] < item:
+            previous, current, width = current, nextSibling[current], width + 1
+        nextSibling.append(current)
+        self._firstChild.append(-1)
+        if previous < 0:
+            self._firstChild[node] = child
+        else:
+            nextSibling[previous] = child
+        while current >= 0:
+            current, width = nextSibling[current], width + 1
+        if width > _WIDE:
+            index, current = {}, self._firstChild[node]
+            while current >= 0:
+                index[items[current]] = current
+                current = nextSibling[current]
+            self._index[node] = index
+        return child
+
+    def _find(self, key: Iterable[Any]) -> int:
+        path = self._path(key)
+        if path is None:
+            return -1
+        node = 0
+        for item in path:
+            node = self._child(node, item)
+            if node < 0:
+                return -1
+        return node
+
+    def _store(self, column: str, value: Any) -> None:
+        data = getattr(self, column)
+        try:
+            data.append(value)
+        except (TypeError, OverflowError):
+            data = list(data)
+            data.append(value)
+            setattr(self, column, data)
+
+    def __setitem__(self, key: Iterable[Any], value: Any) -> None:
+        path = self._path(key)
+        if path is None:
+            labels = list(self.labels)
+            for x in key:
+                if x not in self._ids:
+                    self._ids[x] = len(labels)
+                    labels.append(x)
+            self.labels = labels
+            path = self._path(key)
+        node = 0
+        for item in path:
+            child = self._child(node, item)
+            if child < 0:
+                child = self._addChild(node, item)
+            node = child
+        if not self._hasValue[node]:
+            self._hasValue[node] = 1
+            self._count += 1
+        try:
+            self._value[node] = value
+        except (TypeError, OverflowError):
+            self._value = list(self._value)
+            self._value[node] = value
+
+    def __getitem__(self, key: Iterable[Any]) -> Any:
+        node = self._find(key)
+        if node <= 0 or not self._hasValue[node]:
+            raise KeyError(key)
+        return self._value[node]
+
+    def __delitem__(self, key: Iterable[Any]) -> None:
+        node = self._find(key)
+        if node <= 0 or not self._hasValue[node]:
+            raise KeyError(key)
+        self._hasValue[node] = 0
+        self._count -= 1
+
+    def __contains__(self, key: Any) -> bool:
+        try:
+            node = self._find(key)
+        except TypeError:
+            return False
+        return node > 0 and self._hasValue[node] == 1
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _key(self, node: int) -> Tuple[Any, ...]:
+        path = []
+        item, parent = self._item, self._parent
+        while node > 0:
+            path.append(item[node])
+            node = parent[node]
+        path.reverse()
+        if self.labels is not None:
+            labels = self.labels
+            return tuple([labels[i] for i in path])
+        return tuple(path)
+
+    def _nodes(self) -> Iterator[int]:
+        hasValue = self._hasValue
+        return (node for node in range(1, len(hasValue)) if hasValue[node])
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        for node in self._nodes():
+            yield self._key(node)
+
+    def items(self) -> Iterator[Tuple[Tuple[Any, ...], Any]]:
+        """
+        :return: generator of (pattern, value) pairs
+        :rtype: Iterator
+        """
+        value = self._value
+        for node in self._nodes():
+            yield self._key(node), value[node]
+
+    def values(self) -> Iterator[Any]:
+        value = self._value
+        for node in self._nodes():
+            yield value[node]
+
+    def __repr__(self) -> str:
+        return "PatternTrie(" + str(self._count) + " patterns)"
+
+    def withLabels(self, labels: List[Any]) -> 'PatternTrie':
+        """
+        Returns a view of this trie that reads and returns labels[i] in place of every stored item i. The view shares
+        the nodes of this trie, it does not copy them.
+
+        :param labels: label of every item, for example ItemCodec.items
+        :type labels: list
+        :return: the labelled view
+        :rtype: PatternTrie
+        """
+        view = PatternTrie.__new__(PatternTrie)
+        view.__dict__.update(self.__dict__)
+        view.labels = labels
+        view._ids = {label: index for index, label in enumerate(labels)}
+        return view
+
+    def filter(self, minLength: int = 1, maxLength: Optional[int] = None, minSup: Optional[float] = None,
+               maxPer: Optional[float] = None) -> 'PatternTrie':
+        """
+        Selects the patterns by length, support and periodicity
+
+        :param minLength: minimum number of items of a pattern
+        :type minLength: int
+        :param maxLength: maximum number of items of a pattern, unlimited if None
+        :type maxLength: int
+        :param minSup: minimum support of a pattern. The support is the value, or its first element for list values.
+        :type minSup: int or float
+        :param maxPer: maximum periodicity of a pattern, i.e. the second element of list values
+        :type maxPer: int or float
+        :return: a new PatternTrie with the selected patterns
+        :rtype: PatternTrie
+        """
+        result = PatternTrie()
+        if self.labels is not None:
+            result.labels = list(self.labels)
+            result._ids = dict(self._ids)
+        depth, value = self._depth, self._value
+        for node in self._nodes():
+            if depth[node] < minLength or (maxLength is not None and depth[node] > maxLength):
+                continue
+            support = value[node]
+            if minSup is not None and (support[0] if isinstance(support, (list, tuple)) else support) < minSup:
+                continue
+            if maxPer is not None and support[1] > maxPer:
+                continue
+            path = []
+            while node > 0:
+                path.append(self._item[node])
+                node = self._parent[node]
+            labels = self.labels
+            result[[labels[i] for i in path] if labels is not None else path] = support
+        return result
+
+    def toDataFrame(self, sep: str = ' ') -> 'pd.DataFrame':
+        """
+        Converts the patterns in the format of getPatternsAsDataFrame()
+
+        :param sep: separator placed between the items of a pattern
+        :type sep: str
+        :return: a dataframe with a Patterns and a Support column, and a Periodicity column for [support, periodicity]
+                 values
+        :rtype: pd.DataFrame
+        """
+        data = []
+        for key, value in self.items():
+            pattern = sep.join([str(x) for x in key])
+            if isinstance(value, (list, tuple)):
+                data.append([pattern] + list(value[:2]))
+            else:
+                data.append([pattern, value])
+        columns = ['Patterns', 'Support']
+        if data and len(data[0]) == 3:
+            columns.append('Periodicity')
+        return pd.DataFrame(data, columns=columns)
@@ -0,0 +1,126 @@
+# SubsumptionIndex answers "is this itemset contained in one that was already found?" for the closed and maximal
+# miners. Every itemset is stored as a bitmask signature with one bit per item, grouped by a key such as (support,
+# tidset hash), and listed under each of its items, so that a query only scans the itemsets of its own key that
+# contain its rarest item.
+#
+#  **Importing this algorithm into a python program**
+#  --------------------------------------------------------
+#
+#             from PAMI.extras.patternStore.SubsumptionIndex import SubsumptionIndex
+#
+#             index = SubsumptionIndex()
+#
+#             index.add(['a', 'b', 'c'], key=3)
+#
+#             print(index.hasSuperset(['a', 'c'], key=3), index.hasSuperset(['a', 'c'], key=2))     # True False
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Any, Hashable, Iterable
+
+
+class SubsumptionIndex:
+    """
+    :Description:   SubsumptionIndex stores itemsets as integer bitmasks and finds whether a stored itemset with the
+                    same key is a superset of a given one. The bit of an item is assigned the first time the item is
+                    seen. Within a key, the masks are listed under every item they contain; a query picks the shortest
+                    of the lists of its items and checks each mask of that list with a single AND.
+
+                    A closed miner uses (support, tidset hash) as key, so only the itemsets with the same support and,
+                    almost always, the same tidset are compared. A maximal miner uses a single key.
+
+    :Attributes:
+
+        count : int
+            Number of itemsets stored
+    """
+
+    def __init__(self) -> None:
+        self._bits = {}
+        self._keys = {}
+        self.count = 0
+
+    def signature(self, items: Iterable[Any]) -> int:
+        """
+        :param items: the items of an itemset
+        :type items: list or tuple or set
+        :return: the bitmask of the itemset, giving a new bit to the items not seen before
+        :rtype: int
+        """
+        mask = 0
+        for item in items:
+            bit = self._bits.get(item)
+            if bit is None:
+                bit = self._bits[item] = 1 << len(self._bits)
+            mask |= bit
+        return mask
+
+    def add(self, items: Iterable[Any], key: Hashable = None) -> None:
+        """
+        Stores an itemset under a key
+
+        :param items: the items of the itemset
+        :type items: list or tuple or set
+        :param key: the key of the itemset, for example (support, tidset hash)
+        :type key: hashable
+        """
+        items = set(items)
+        mask = self.signature(items)
+        postings = self._keys.get(key)
+        if postings is None:
+            postings = self._keys[key] = {}
+        for item in items:
+            masks = postings.get(item)
+            if masks is None:
+                postings[item] = [mask]
+            else:
+                masks.append(mask)
+        self.count += 1
+
+    def hasSuperset(self, items: Iterable[Any], key: Hashable = None) -> bool:
+        """
+        :param items: the items of an itemset
+        :type items: list or tuple or set
+        :param key: the key of the itemset
+        :type key: hashable
+        :return: True if an itemset stored under the key contains all the items
+        :rtype: bool
+        """
+        postings = self._keys.get(key)
+        if postings is None:
+            return False
+        shortest = None
+        mask = 0
+        for item in items:
+            masks = postings.get(item)
+            if masks is None:
+                return False
+            if shortest is None or len(masks) < len(shortest):
+                shortest = masks
+            mask |= self._bits[item]
+        if shortest is None:
+            return any(postings.values())
+        for candidate in shortest:
+            if candidate & mask == mask:
+                return True
+        return False
+
+    def __len__(self) -> int:
+        return self.count
@@ -0,0 +1,139 @@
+# TopKCollector keeps the k best patterns found by a top-k miner in a bounded binary heap. Once k patterns are held,
+# its threshold is the value of the worst one, which the miner uses as its internal minimum support (or maximum
+# periodicity) to prune the rest of the search.
+#
+#  **Importing this algorithm into a python program**
+#  --------------------------------------------------------
+#
+#             from PAMI.extras.patternStore.TopKCollector import TopKCollector
+#
+#             topK = TopKCollector(2)
+#
+#             for pattern, support in [('a', 5), ('b', 3), ('a\tb', 4)]:
+#
+#                 topK.push(pattern, support)
+#
+#             print(topK.threshold, topK.toDict())     # 4 {'a': 5, 'a\tb': 4}
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import heapq
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+class TopKCollector:
+    """
+    :Description:   TopKCollector is a bounded min-heap of (rank, order, pattern, value) entries, where rank is the value
+                    of the pattern, or its negation when smaller values are better. The root of the heap is the worst
+                    pattern held, so a new pattern is compared with it in O(1) and replaces it in O(log k). A new
+                    pattern only replaces the worst one if it is strictly better, and among patterns with the same
+                    value the oldest one is evicted first.
+
+    :param  k: int :
+            Number of patterns to keep
+    :param  largest: bool :
+            Keep the k largest values, such as supports or utilities, if True, or the k smallest, such as
+            periodicities, if False
+    :param  unique: bool :
+            Ignore a pattern that is already held. The patterns must then be hashable
+
+    :Attributes:
+
+        threshold : int or float or None
+            Value of the worst pattern held once k patterns are held, None before
+    """
+
+    def __init__(self, k: int, largest: bool = True, unique: bool = True) -> None:
+        self._k = int(k)
+        self._sign = 1 if largest else -1
+        self._heap = []
+        self._order = 0
+        self._held = {} if unique else None
+        self.threshold = None
+
+    def push(self, pattern: Any, value: Any) -> bool:
+        """
+        Offers a pattern to the collector
+
+        :param pattern: the pattern
+        :type pattern: str or tuple or object
+        :param value: its support, utility or periodicity
+        :type value: int or float
+        :return: True if the pattern is held, False if it was ignored
+        :rtype: bool
+        """
+        if self._held is not None and pattern in self._held:
+            return False
+        if self._k <= 0:
+            return False
+        rank = self._sign * value
+        if len(self._heap) == self._k:
+            if rank <= self._heap[0][0]:
+                return False
+            worst = heapq.heapreplace(self._heap, (rank, self._order, pattern, value))
+            if self._held is not None:
+                del self._held[worst[2]]
+        else:
+            heapq.heappush(self._heap, (rank, self._order, pattern, value))
+        self._order += 1
+        if self._held is not None:
+            self._held[pattern] = value
+        if len(self._heap) == self._k:
+            self.threshold = self._heap[0][3]
+        return True
+
+    def isFull(self) -> bool:
+        """
+        :return: True once k patterns are held
+        :rtype: bool
+        """
+        return len(self._heap) == self._k
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, pattern: Any) -> bool:
+        if self._held is not None:
+            return pattern in self._held
+        return any(entry[2] is pattern for entry in self._heap)
+
+    def items(self) -> List[Tuple[Any, Any]]:
+        """
+        :return: the (pattern, value) pairs held, best first, the oldest first among equal values
+        :rtype: list
+        """
+        return [(entry[2], entry[3]) for entry in sorted(self._heap, key=lambda entry: (-entry[0], entry[1]))]
+
+    def patterns(self) -> List[Any]:
+        """
+        :return: the patterns held, best first
+        :rtype: list
+        """
+        return [pattern for pattern, value in self.items()]
+
+    def toDict(self) -> Dict[Any, Any]:
+        """
+        :return: the patterns held mapped to their values, best first
+        :rtype: dict
+        """
+        return dict(self.items())
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.patterns())
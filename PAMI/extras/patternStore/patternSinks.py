@@ -0,0 +1,318 @@
+# patternSinks lets a miner push every pattern to a sink as soon as it is found, instead of holding the complete set of
+# patterns in finalPatterns until the end of the mining process.
+#
+#  **Importing this algorithm into a python program**
+#  --------------------------------------------------------
+#
+#             from PAMI.extras.patternStore import patternSinks as ps
+#
+#             from PAMI.frequentPattern.basic import FPGrowth as alg
+#
+#             obj = alg.FPGrowth('sampleDB.txt', 10)
+#
+#             obj.setPatternSink(ps.FileSink('patterns.txt'))
+#
+#             obj.mine()     # patterns are written while mining, obj.save() is not needed
+#
+#             for pattern, support in alg.FPGrowth('sampleDB.txt', 10).iterPatterns():
+#
+#                 print(pattern, support)
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from abc import ABC as _ABC, abstractmethod as _abstractmethod
+import queue
+import threading
+from typing import Any, Callable, Iterator, Tuple, Optional
+
+
+class PatternSink(_ABC):
+    """
+    :Description:   PatternSink is the interface of every sink. A miner opens the sink at the start of mine() with a
+                    function that turns its internal pattern keys (for example tuples of item ids) into item names, pushes
+                    every pattern with sink[pattern] = value and closes the sink at the end of mine().
+
+    :Attributes:
+
+        inMemory : bool
+            True if the sink keeps the patterns, so that getPatterns(), save() and getPatternsAsDataFrame() still work
+    """
+
+    inMemory = False
+
+    def __init__(self) -> None:
+        self._decode = None
+        self._count = 0
+
+    def open(self, decode: Optional[Callable[[Any], Tuple]] = None) -> None:
+        """
+        Called by the miner before the first pattern is pushed
+
+        :param decode: converts an internal pattern key into a tuple of item names
+        :type decode: callable
+        """
+        self._decode = decode
+        self._count = 0
+
+    def _decoded(self, pattern: Any) -> Any:
+        if self._decode is None:
+            return pattern
+        return self._decode(pattern)
+
+    def __setitem__(self, pattern: Any, value: Any) -> None:
+        self._count += 1
+        self.write(self._decoded(pattern), value)
+
+    def __len__(self) -> int:
+        return self._count
+
+    @_abstractmethod
+    def write(self, pattern: Tuple, value: Any) -> None:
+        """
+        Receives one decoded pattern
+
+        :param pattern: item names of the pattern
+        :type pattern: tuple
+        :param value: support of the pattern, or a list of measures such as [support, periodicity]
+        :type value: int or list
+        """
+
+        pass
+
+    def close(self) -> None:
+        """
+        Called by the miner once mining has finished
+        """
+
+        pass
+
+
+def _formatValue(value: Any) -> str:
+    if isinstance(value, (list, tuple)):
+        return ":".join([str(x) for x in value])
+    return str(value)
+
+
+class MemorySink(dict):
+    """
+    :Description:   MemorySink keeps the patterns in a dictionary, exactly like the default behaviour of the miners. It
+                    is cleared every time it is opened.
+    """
+
+    inMemory = True
+
+    def open(self, decode: Optional[Callable[[Any], Tuple]] = None) -> None:
+        self.clear()
+
+    def close(self) -> None:
+        pass
+
+
+class FileSink(PatternSink):
+    """
+    :Description:   FileSink writes every pattern to a text file in the format of save(): the items joined with sep,
+                    followed by ':' and the support (and the other measures of the pattern, also separated by ':').
+                    Lines are buffered and written in blocks of bufferSize patterns.
+
+    :param  oFile: str :
+            Name of the output file
+    :param  sep: str :
+            Separator placed between the items of a pattern
+    :param  bufferSize: int :
+            Number of patterns buffered before they are written
+    """
+
+    def __init__(self, oFile: str, sep: str = '\t', bufferSize: int = 10000) -> None:
+        super().__init__()
+        self._oFile = oFile
+        self._sep = sep
+        self._bufferSize = bufferSize
+        self._buffer = []
+        self._writer = None
+
+    def open(self, decode: Optional[Callable[[Any], Tuple]] = None) -> None:
+        super().open(decode)
+        self._buffer = []
+        self._writer = open(self._oFile, 'w')
+
+    def write(self, pattern: Tuple, value: Any) -> None:
+        self._buffer.append(self._sep.join([str(x) for x in pattern]) + ":" + _formatValue(value) + "\n")
+        if len(self._buffer) >= self._bufferSize:
+            self._writer.writelines(self._buffer)
+            self._buffer = []
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.writelines(self._buffer)
+            self._buffer = []
+            self._writer.close()
+            self._writer = None
+
+
+class ParquetSink(PatternSink):
+    """
+    :Description:   ParquetSink writes the patterns to a Parquet file in row groups of batchSize patterns, with the same
+                    columns as getPatternsAsDataFrame(). It needs the optional pyarrow package.
+
+    :param  oFile: str :
+            Name of the output file
+    :param  batchSize: int :
+            Number of patterns in each row group
+    :param  columns: list :
+            Names of the measure columns. The default is ['Support'], or ['Support', 'Periodicity'] when the miner
+            pushes two measures per pattern.
+    """
+
+    def __init__(self, oFile: str, batchSize: int = 100000, columns: Optional[list] = None) -> None:
+        super().__init__()
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("ParquetSink needs pyarrow. Please install it with 'pip install pyarrow'")
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self._oFile = oFile
+        self._batchSize = batchSize
+        self._columns = columns
+        self._rows = []
+        self._writer = None
+
+    def open(self, decode: Optional[Callable[[Any], Tuple]] = None) -> None:
+        super().open(decode)
+        self._rows = []
+        self._writer = None
+
+    def write(self, pattern: Tuple, value: Any) -> None:
+        values = list(value)[:2] if isinstance(value, (list, tuple)) else [value]
+        self._rows.append([" ".join([str(x) for x in pattern])] + values)
+        if len(self._rows) >= self._batchSize:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._rows:
+            return
+        if self._columns is None:
+            self._columns = ['Support'] if len(self._rows[0]) == 2 else ['Support', 'Periodicity']
+        names = ['Patterns'] + self._columns
+        table = self._pa.table({name: [row[i] for row in self._rows] for i, name in enumerate(names)})
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self._oFile, table.schema)
+        self._writer.write_table(table)
+        self._rows = []
+
+    def close(self) -> None:
+        self._flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class CallbackSink(PatternSink):
+    """
+    :Description:   CallbackSink calls a user function with every pattern, for example to insert it into a database.
+
+    :param  callback: callable :
+            Function called as callback(pattern, value), where pattern is a tuple of item names
+    """
+
+    def __init__(self, callback: Callable[[Tuple, Any], None]) -> None:
+        super().__init__()
+        self._callback = callback
+
+    def write(self, pattern: Tuple, value: Any) -> None:
+        self._callback(pattern, value)
+
+
+class _Cancelled(Exception):
+    """
+    Raised inside the mining thread of a GeneratorSink when the consumer stopped iterating
+    """
+
+    pass
+
+
+class GeneratorSink(PatternSink):
+    """
+    :Description:   GeneratorSink turns a mining run into a generator. iterate() runs the mining function in a background
+                    thread and yields every pattern as soon as it is pushed. The bounded queue between the two threads
+                    keeps at most maxSize patterns in memory. It is used by iterPatterns() of the miners.
+
+    :param  maxSize: int :
+            Maximum number of patterns waiting to be consumed
+    """
+
+    _done = object()
+
+    def __init__(self, maxSize: int = 10000) -> None:
+        super().__init__()
+        self._queue = queue.Queue(maxSize)
+        self._cancelled = threading.Event()
+
+    def write(self, pattern: Tuple, value: Any) -> None:
+        while True:
+            if self._cancelled.is_set():
+                raise _Cancelled()
+            try:
+                self._queue.put((pattern, value), timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def iterate(self, mine: Callable[[], None]) -> Iterator[Tuple[Tuple, Any]]:
+        """
+        Runs mine() in a background thread and yields the patterns it pushes into this sink
+
+        :param mine: the mine() method of a miner whose sink is this GeneratorSink
+        :type mine: callable
+        :return: generator of (pattern, value) pairs
+        :rtype: Iterator
+        """
+        errors = []
+
+        def run():
+            try:
+                mine()
+            except _Cancelled:
+                pass
+            except BaseException as error:
+                errors.append(error)
+            finally:
+                while not self._cancelled.is_set():
+                    try:
+                        self._queue.put(self._done, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+
+        self._cancelled.clear()
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        try:
+            while True:
+                entry = self._queue.get()
+                if entry is self._done:
+                    break
+                yield entry
+        finally:
+            self._cancelled.set()
+            thread.join()
+        if errors:
+            raise errors[0]
@@ -0,0 +1,173 @@
+# Profiler records where a mining run spends its time and memory: the wall-clock time of each phase (reading the
+# database, the first scan, building the tree or tidlists, mining and writing the output), counters such as the number
+# of candidates and extensions, and the peak RSS sampled in a background thread while the run is in progress.
+#
+#  **Importing this algorithm into a python program**
+#  --------------------------------------------------------
+#
+#             from PAMI.frequentPattern.basic import FPGrowth as alg
+#
+#             obj = alg.FPGrowth('sampleDB.txt', 10)
+#
+#             obj.mine()
+#
+#             print(obj.getProfile())
+#
+#             obj.saveProfile('trace.json')
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+from PAMI.extras.lazyImport import lazyModule
+psutil = lazyModule('psutil')
+
+
+class Profiler:
+    """
+    :Description:   Profiler is owned by every miner of the instrumented families. The miner calls start() at the
+                    beginning of mine(), phase(name) whenever a new phase begins and stop() at the end. Phases are
+                    sequential: starting a phase ends the previous one, and a phase that is entered several times
+                    accumulates its time. Counters are added with count(name, n). Miners add their counters once per
+                    level or conditional tree rather than once per candidate, so the instrumentation stays cheap.
+
+    :param  interval: float :
+            Seconds between two RSS samples of the background thread
+
+    :Attributes:
+
+        phases : dict
+            Seconds spent in every phase
+        counters : dict
+            Value of every counter
+        peakRSS : int
+            Highest RSS in bytes observed between start() and stop()
+        events : list
+            Start and end offsets of every phase, in seconds since start()
+    """
+
+    def __init__(self, interval: float = 0.01) -> None:
+        self._interval = interval
+        self._process = None
+        self._thread = None
+        self._stopped = threading.Event()
+        self._current = None
+        self._phaseStart = 0.0
+        self._origin = 0.0
+        self._runtime = 0.0
+        self.phases = {}
+        self.counters = {}
+        self.peakRSS = 0
+        self.events = []
+
+    def _sample(self) -> None:
+        if self._process is None:
+            self._process = psutil.Process(os.getpid())
+        rss = self._process.memory_info().rss
+        if rss > self.peakRSS:
+            self.peakRSS = rss
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            self._sample()
+
+    def start(self) -> None:
+        """
+        Clears the previous profile and starts sampling the RSS
+        """
+        self.stop()
+        self.phases = {}
+        self.counters = {}
+        self.events = []
+        self.peakRSS = 0
+        self._origin = time.time()
+        self._runtime = 0.0
+        self._sample()
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _close(self) -> None:
+        if self._current is None:
+            return
+        now = time.time()
+        self.phases[self._current] = self.phases.get(self._current, 0.0) + now - self._phaseStart
+        self.events.append({'phase': self._current, 'start': self._phaseStart - self._origin, 'end': now - self._origin})
+        self._current = None
+
+    def phase(self, name: str) -> None:
+        """
+        Ends the current phase and starts the phase name
+
+        :param name: name of the phase, e.g. 'read', 'firstScan', 'build', 'mine' or 'output'
+        :type name: str
+        """
+        self._close()
+        self._current = name
+        self._phaseStart = time.time()
+
+    def count(self, name: str, n: int = 1) -> None:
+        """
+        Adds n to the counter name
+
+        :param name: name of the counter, e.g. 'candidates' or 'extensions'
+        :type name: str
+        :param n: value to add
+        :type n: int
+        """
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def stop(self) -> None:
+        """
+        Ends the current phase and stops the sampling thread
+        """
+        self._close()
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+            self._sample()
+            self._runtime = time.time() - self._origin
+
+    def getProfile(self) -> Dict[str, Any]:
+        """
+        :return: the phases, counters, peak RSS and runtime of the last run
+        :rtype: dict
+        """
+        return {'runtime': self._runtime, 'phases': dict(self.phases), 'counters': dict(self.counters),
+                'peakRSS': self.peakRSS}
+
+    def save(self, oFile: str, extra: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Writes the profile and the timeline of the phases as a JSON trace
+
+        :param oFile: name of the output file
+        :type oFile: str
+        :param extra: additional fields of the trace, e.g. the name of the algorithm and its parameters
+        :type extra: dict
+        """
+        trace = dict(extra) if extra else {}
+        trace.update(self.getProfile())
+        trace['events'] = list(self.events)
+        with open(oFile, 'w') as f:
+            json.dump(trace, f, indent=2, default=str)
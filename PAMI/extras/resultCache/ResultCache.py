@@ -0,0 +1,382 @@
+# ResultCache keeps the results of mining runs on disk, so that mining the same input with the same algorithm and
+# parameters again, e.g. after a restart of a pipeline, is answered by loading the stored patterns. Entries are keyed by
+# a content hash of the input (file, directory of a compiled TransactionStore or DataFrame), the algorithm and its
+# parameters. For the miners whose result is downward closed, a run whose minSup is higher than the minSup of a stored
+# run of the same input and parameters is answered by filtering the stored patterns. The least recently used entries are
+# evicted when the cache exceeds its size.
+#
+#  **Importing this algorithm into a python program**
+#  --------------------------------------------------------
+#
+#             from PAMI.extras.resultCache import ResultCache as rc
+#
+#             from PAMI.frequentPattern.basic import FPGrowth as alg
+#
+#             cache = rc.ResultCache('pamiCache', maxBytes=2 * 1024 ** 3)
+#
+#             obj = alg.FPGrowth('sampleDB.txt', 0.05)
+#
+#             cache.mine(obj)      # mines and stores the patterns, or loads them
+#
+#             print(len(obj.getPatterns()))
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import tempfile
+import time
+from typing import Any, Dict, Optional, Tuple
+from PAMI.extras.lazyImport import isDataFrame, isURL
+from PAMI.extras.patternStore.PatternTrie import PatternTrie
+
+_BLOCK = 1 << 20
+
+
+def _threshold(value: Any) -> Tuple[Optional[str], Optional[float]]:
+    """
+    Splits a user specified minSup into its unit, 'count' or 'fraction', and its value, in the same way as the miners
+    interpret it. Lists of thresholds have no single unit.
+    """
+    if isinstance(value, bool):
+        return None, None
+    if isinstance(value, int):
+        return 'count', value
+    if isinstance(value, float):
+        return 'fraction', value
+    if isinstance(value, str):
+        try:
+            return ('fraction', float(value)) if '.' in value else ('count', int(value))
+        except ValueError:
+            return None, None
+    return None, None
+
+
+def _support(value: Any) -> Any:
+    return value[0] if isinstance(value, (list, tuple)) else value
+
+
+class ResultCache:
+    """
+    :Description:   ResultCache stores the patterns of mining runs in a directory. The key of a run is the SHA-256 of
+                    the content of its input, the class of the miner and the values of the parameters of its
+                    constructor. Content hashes of files are remembered with their size and modification time, so an
+                    unchanged file is hashed only once. The content of a URL is not known before the miner downloads
+                    it, and a path that does not exist has no content yet, so the runs of these inputs are never
+                    cached: cache.mine() just mines them.
+
+                    Caching is opt-in: a miner declares the attributes holding the result of mine() in the class
+                    attribute _cacheState, as the abstract classes of the frequent, maximal, closed, top-k and
+                    periodic-frequent miners do, and the cache refuses the other miners with a TypeError. Only the
+                    miners whose class sets _downwardClosed = True, i.e. the plain frequent itemset miners, are answered
+                    by filtering a stored run at a lower minSup: the patterns of maximal, closed, top-k, periodic or
+                    utility miners at a higher minSup are not a subset of those at a lower one, so these miners are
+                    only answered by a run with the same parameters. Runs are only cached for the miners that keep
+                    their patterns in memory: if a pattern sink is set, cache.mine() just mines. Runtime and memory
+                    figures of a miner are not restored on a cache hit.
+
+    :param  directory: str :
+            Directory of the cache. The default is $XDG_CACHE_HOME/PAMI/results, i.e. ~/.cache/PAMI/results.
+    :param  maxBytes: int :
+            Size of the stored results above which the least recently used entries are evicted
+
+    :Attributes:
+
+        hits : int
+            Number of runs loaded from an entry with the same parameters
+        filtered : int
+            Number of runs answered by filtering an entry with a lower minSup
+        misses : int
+            Number of runs that were mined
+    """
+
+    def __init__(self, directory: Optional[str] = None, maxBytes: int = 1 << 30) -> None:
+        if directory is None:
+            base = os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache'))
+            directory = os.path.join(base, 'PAMI', 'results')
+        self._directory = directory
+        self._maxBytes = maxBytes
+        os.makedirs(directory, exist_ok=True)
+        self.hits = 0
+        self.filtered = 0
+        self.misses = 0
+
+    def _indexFile(self) -> str:
+        return os.path.join(self._directory, 'index.json')
+
+    def _readIndex(self) -> Dict[str, Any]:
+        try:
+            with open(self._indexFile()) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'entries': {}, 'files': {}}
+
+    def _writeIndex(self, index: Dict[str, Any]) -> None:
+        fd, name = tempfile.mkstemp(dir=self._directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(index, f)
+        os.replace(name, self._indexFile())
+
+    def _hashFile(self, path: str, index: Dict[str, Any]) -> str:
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        known = index['files'].get(path)
+        if known is not None and known[0] == stat.st_size and known[1] == stat.st_mtime_ns:
+            return known[2]
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(_BLOCK), b''):
+                digest.update(block)
+        index['files'][path] = [stat.st_size, stat.st_mtime_ns, digest.hexdigest()]
+        return digest.hexdigest()
+
+    def _fingerprint(self, iFile: Any, index: Dict[str, Any]) -> Optional[str]:
+        """
+        Content hash of the input of a miner, or None for a URL or a path that does not exist
+        """
+        if isDataFrame(iFile):
+            import pandas as pd
+            digest = hashlib.sha256(json.dumps([str(c) for c in iFile.columns]).encode())
+            digest.update(pd.util.hash_pandas_object(iFile, index=False).values.tobytes())
+            return 'dataframe:' + digest.hexdigest()
+        if isinstance(iFile, str) and not isURL(iFile):
+            if os.path.isdir(iFile):
+                digest = hashlib.sha256()
+                for name in sorted(os.listdir(iFile)):
+                    if os.path.isfile(os.path.join(iFile, name)):
+                        digest.update((name + self._hashFile(os.path.join(iFile, name), index)).encode())
+                return 'directory:' + digest.hexdigest()
+            if os.path.isfile(iFile):
+                return 'file:' + self._hashFile(iFile, index)
+        if isinstance(iFile, str):
+            return None
+        return 'object:' + hashlib.sha256(pickle.dumps(iFile)).hexdigest()
+
+    @staticmethod
+    def _parameters(miner: Any) -> Dict[str, Any]:
+        """
+        Current values of the parameters of the constructor of the miner, except its input
+        """
+        parameters = {}
+        for name, parameter in inspect.signature(type(miner).__init__).parameters.items():
+            if name in ('self', 'iFile') or parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
+                continue
+            value = getattr(miner, '_' + name, getattr(miner, name, parameter.default))
+            if name == 'minSup' and getattr(miner, '_minSups', None) is not None:
+                value = miner._minSups
+            parameters[name] = value if isinstance(value, (int, float, str, bool, type(None))) else repr(value)
+        return parameters
+
+    def _describe(self, miner: Any, index: Dict[str, Any]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        fingerprint = self._fingerprint(miner._iFile, index)
+        if fingerprint is None:
+            return None, None
+        parameters = self._parameters(miner)
+        description = {'algorithm': type(miner).__module__ + '.' + type(miner).__qualname__,
+                       'input': fingerprint,
+                       'parameters': {k: v for k, v in parameters.items() if k != 'minSup'},
+                       'minSup': parameters.get('minSup')}
+        key = hashlib.sha256(json.dumps(description, sort_keys=True, default=str).encode()).hexdigest()
+        return key, description
+
+    @staticmethod
+    def _cacheable(miner: Any) -> bool:
+        streamed = getattr(miner, '_patternsStreamed', None)
+        return not (streamed is not None and streamed())
+
+    @staticmethod
+    def _stateNames(miner: Any) -> Tuple[str, ...]:
+        """
+        Attributes holding the result of mine() that the miner declares in _cacheState
+
+        :raises TypeError: if the miner does not declare them
+        """
+        names = getattr(type(miner), '_cacheState', None)
+        if not names:
+            raise TypeError(type(miner).__name__ + " does not declare its cacheable state in _cacheState and cannot "
+                            "be cached")
+        return tuple(names)
+
+    @staticmethod
+    def _snapshot(miner: Any, names: Tuple[str, ...]) -> Dict[str, Any]:
+        """
+        The declared state of a miner after mine()
+
+        :raises TypeError: if the miner kept its patterns in an attribute the cache does not restore
+        """
+        hidden = [name for name in vars(miner) if name.endswith('__finalPatterns')]
+        if hidden or '_finalPatterns' not in names or not hasattr(miner, '_finalPatterns'):
+            raise TypeError(type(miner).__name__ + " keeps its patterns outside of its declared _cacheState and "
+                            "cannot be cached")
+        return {name: getattr(miner, name) for name in names if hasattr(miner, name)}
+
+    def _entryFile(self, key: str) -> str:
+        return os.path.join(self._directory, key + '.pkl')
+
+    def _loadEntry(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._entryFile(key), 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def _restore(self, miner: Any, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(miner, name, value)
+
+    def _lowerEntry(self, description: Dict[str, Any], index: Dict[str, Any]) -> Tuple[Optional[str], Any]:
+        """
+        Finds the stored run of the same input and parameters with the highest minSup that is not higher than the
+        minSup of description, and returns its key and the minSup of description as a count. Only used for the
+        miners with a downward closed result.
+        """
+        unit, value = _threshold(description['minSup'])
+        if unit is None:
+            return None, None
+        best, bestCount, count = None, None, None
+        for key, entry in index['entries'].items():
+            same = entry['algorithm'] == description['algorithm'] and entry['input'] == description['input'] and \
+                   entry['parameters'] == description['parameters']
+            if not same or entry.get('converted') is None:
+                continue
+            if unit == 'count':
+                count = value
+            elif entry.get('databaseSize') is not None:
+                count = entry['databaseSize'] * value
+            else:
+                continue
+            if entry['converted'] <= count and (bestCount is None or entry['converted'] > bestCount):
+                best, bestCount = key, entry['converted']
+        if best is None:
+            return None, None
+        entry = index['entries'][best]
+        return best, value if unit == 'count' else entry['databaseSize'] * value
+
+    def _load(self, miner: Any, index: Dict[str, Any], key: str, description: Dict[str, Any]) -> bool:
+        entry = self._loadEntry(key) if key in index['entries'] else None
+        if entry is not None:
+            self._restore(miner, entry['state'])
+            self.hits += 1
+        else:
+            if not getattr(type(miner), '_downwardClosed', False):
+                self._writeIndex(index)
+                return False
+            key, minSup = self._lowerEntry(description, index)
+            entry = self._loadEntry(key) if key is not None else None
+            if entry is None:
+                self._writeIndex(index)
+                return False
+            state = dict(entry['state'])
+            patterns = state['_finalPatterns']
+            if isinstance(patterns, PatternTrie):
+                state['_finalPatterns'] = patterns.filter(minSup=minSup)
+            else:
+                state['_finalPatterns'] = {k: v for k, v in patterns.items() if _support(v) >= minSup}
+            state['_minSup'] = minSup
+            self._restore(miner, state)
+            self.filtered += 1
+        index['entries'][key]['lastUsed'] = time.time()
+        self._writeIndex(index)
+        return True
+
+    def _store(self, miner: Any, index: Dict[str, Any], key: str, description: Dict[str, Any]) -> None:
+        """
+        Stores the result of mine() of miner under key, then evicts the least recently used entries above maxBytes
+        """
+        state = self._snapshot(miner, self._stateNames(miner))
+        converted = getattr(miner, '_minSup', None)
+        unit, value = _threshold(description['minSup'])
+        if unit is None or not isinstance(converted, (int, float)) or isinstance(converted, bool):
+            converted = None
+        description['converted'] = converted
+        description['databaseSize'] = round(converted / value) if unit == 'fraction' and converted and value else None
+        try:
+            data = pickle.dumps({'description': description, 'state': state}, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        fd, name = tempfile.mkstemp(dir=self._directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(name, self._entryFile(key))
+        description['size'] = len(data)
+        description['lastUsed'] = time.time()
+        index['entries'][key] = description
+        self._evict(index)
+        self._writeIndex(index)
+
+    def _evict(self, index: Dict[str, Any]) -> None:
+        entries = index['entries']
+        total = sum(entry['size'] for entry in entries.values())
+        for key in sorted(entries, key=lambda k: entries[k]['lastUsed']):
+            if total <= self._maxBytes:
+                break
+            total -= entries[key]['size']
+            del entries[key]
+            try:
+                os.remove(self._entryFile(key))
+            except OSError:
+                pass
+
+    def mine(self, miner: Any) -> bool:
+        """
+        Loads the result of miner from the cache, or calls miner.mine() and stores its result
+
+        :param miner: a PAMI miner that declares its _cacheState and whose mine() has not been called yet
+        :return: True if the result was loaded from the cache
+        :rtype: bool
+        :raises TypeError: if the miner does not declare its cacheable state
+        """
+        self._stateNames(miner)
+        if not self._cacheable(miner):
+            miner.mine()
+            return False
+        index = self._readIndex()
+        key, description = self._describe(miner, index)
+        if key is None:
+            miner.mine()
+            self.misses += 1
+            return False
+        if self._load(miner, index, key, description):
+            return True
+        miner.mine()
+        self.misses += 1
+        self._store(miner, self._readIndex(), key, description)
+        return False
+
+    def getSize(self) -> int:
+        """
+        :return: size in bytes of the stored results
+        :rtype: int
+        """
+        return sum(entry['size'] for entry in self._readIndex()['entries'].values())
+
+    def clear(self) -> None:
+        """
+        Removes every entry of the cache
+        """
+        for key in self._readIndex()['entries']:
+            try:
+                os.remove(self._entryFile(key))
+            except OSError:
+                pass
+        self._writeIndex({'entries': {}, 'files': {}})
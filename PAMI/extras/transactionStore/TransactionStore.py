@@ -0,0 +1,382 @@
+# TransactionStore compiles a transactional or temporal database into an integer-encoded binary store that every miner
+# can memory-map instead of re-parsing the text file.
+#
+#  **Importing this algorithm into a python program**
+#  --------------------------------------------------------
+#
+#             from PAMI.extras.transactionStore import TransactionStore as ts
+#
+#             store = ts.TransactionStore.compile('sampleDB.txt', 'sampleDB.store', sep='\t')
+#
+#             # the store directory can now be given to any miner as iFile
+#
+#             from PAMI.frequentPattern.basic import FPGrowth as alg
+#
+#             obj = alg.FPGrowth('sampleDB.store', 10)
+#
+#             obj.mine()
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import sys
+import json
+from array import array
+from typing import List, Union, Iterator
+from PAMI.extras.lazyImport import lazyModule
+np = lazyModule('numpy')
+pd = lazyModule('pandas')
+from PAMI.extras.transactionStore.streamReader import readTransactions
+from PAMI.extras.transactionStore.itemCodec import ItemCodec
+
+_FORMAT = 'pami-transaction-store'
+_VERSION = 1
+_META = 'meta.json'
+_DICTIONARY = 'dictionary.json'
+_OFFSETS = 'offsets.bin'
+_ITEMS = 'items.bin'
+_TIMESTAMPS = 'timestamps.bin'
+_SUPPORTS = 'supports.bin'
+
+
+class TransactionStore:
+    """
+    :Description:   TransactionStore is a read-only, memory-mapped view of a database that was compiled once with
+                    TransactionStore.compile(). The store is a directory holding an item dictionary, a CSR-style offsets
+                    array, an int32 item array, the support of every item and, for temporal databases, a timestamp column.
+                    Because the arrays are memory-mapped, opening a store is close to zero-copy and several processes
+                    mining the same store share the same pages.
+
+                    The store behaves like the list of transactions that the miners build in _creatingItemSets: len(store)
+                    is the number of transactions and store[i] returns the i-th transaction as a list of item names. For
+                    a temporal view the timestamp is prepended as a string, exactly as in a temporal input file.
+
+                    The miners that rank their items with an ItemCodec read a store at the level of its integer ids
+                    instead: getCodec() builds the codec from the stored supports, and getTidLists() and iterEncoded()
+                    translate the item array into codec ids with one array lookup, so no transaction is decoded to item
+                    names.
+
+    :param  path: str :
+            Directory of a compiled store
+    :param  temporal: bool :
+            Prepend the timestamp of every transaction. Stores compiled without timestamps use the transaction number
+            (starting at 1) as timestamp.
+
+    :Attributes:
+
+        itemNames : list
+            Item dictionary. The position of an item name is its integer id.
+        offsets : numpy.ndarray
+            Transaction i occupies data[offsets[i]:offsets[i + 1]]
+        data : numpy.ndarray
+            Item ids of all transactions, int32
+        timestamps : numpy.ndarray or None
+            Timestamp of every transaction, int64
+        supports : numpy.ndarray
+            Number of transactions containing each item, int64
+
+    **Importing this algorithm into a python program**
+    --------------------------------------------------------
+    .. code-block:: python
+
+            from PAMI.extras.transactionStore import TransactionStore as ts
+
+            store = ts.TransactionStore.compile('sampleDB.txt', 'sampleDB.store', sep='\t')
+
+            print(len(store), store.getNumberOfItems())
+
+            for transaction in store:
+                print(transaction)
+
+            codec = store.getCodec(minSup=10)
+
+            tidLists = store.getTidLists(codec)     # the transactions of every frequent item, by codec id
+
+    """
+
+    def __init__(self, path: str, temporal: bool = False) -> None:
+        if not TransactionStore.isStore(path):
+            raise ValueError(path + " is not a compiled transaction store")
+        self._path = path
+        with open(os.path.join(path, _META), 'r') as f:
+            self._meta = json.load(f)
+        if self._meta['version'] > _VERSION:
+            raise ValueError("Transaction store version " + str(self._meta['version']) + " is not supported")
+        with open(os.path.join(path, _DICTIONARY), 'r', encoding='utf-8') as f:
+            self.itemNames = json.load(f)
+        order = '<' if self._meta['byteorder'] == 'little' else '>'
+        self.offsets = self._map(_OFFSETS, order + 'i8', self._meta['transactions'] + 1)
+        self.data = self._map(_ITEMS, order + 'i4', self._meta['length'])
+        self.supports = self._map(_SUPPORTS, order + 'i8', len(self.itemNames))
+        self.timestamps = None
+        if self._meta['temporal']:
+            self.timestamps = self._map(_TIMESTAMPS, order + 'i8', self._meta['transactions'])
+        self._temporal = temporal
+
+    def _map(self, name: str, dtype: str, size: int) -> 'np.ndarray':
+        """
+        Memory-maps one column of the store. numpy cannot map an empty file, so empty columns are returned as arrays.
+
+        :param name: file name of the column inside the store
+        :type name: str
+        :param dtype: numpy dtype of the column
+        :type dtype: str
+        :param size: number of values in the column
+        :type size: int
+        :return: read-only array of the column
+        :rtype: numpy.ndarray
+        """
+        if size == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(os.path.join(self._path, name), dtype=dtype, mode='r', shape=(size,))
+
+    @staticmethod
+    def isStore(path) -> bool:
+        """
+        Checks whether the given input is a directory compiled by TransactionStore.compile()
+
+        :param path: input given to a miner
+        :type path: any
+        :return: True if path points to a compiled store
+        :rtype: bool
+        """
+        return isinstance(path, str) and os.path.isfile(os.path.join(path, _META))
+
+    @staticmethod
+    def compile(iFile: 'Union[str, pd.DataFrame]', oFile: str, sep: str = '\t', temporal: bool = False,
+                chunkSize: int = 100000) -> 'TransactionStore':
+        """
+        Compiles a transactional or temporal database into a binary store. The input is read once and written in chunks,
+        so compiling never holds more than chunkSize transactions in memory. Items repeated inside a transaction are
+        stored once.
+
+        :param iFile: input file, URL or DataFrame with a 'Transactions' (and for temporal databases a 'TS') column
+        :type iFile: str or pd.DataFrame
+        :param oFile: directory in which the store is written
+        :type oFile: str
+        :param sep: separator of the items in the input file
+        :type sep: str
+        :param temporal: the first value of every line is a timestamp
+        :type temporal: bool
+        :param chunkSize: number of transactions buffered before they are written
+        :type chunkSize: int
+        :return: the compiled store
+        :rtype: TransactionStore
+        """
+        os.makedirs(oFile, exist_ok=True)
+        dictionary = {}
+        supports = array('q')
+        offsets = array('q', [0])
+        items = array('i')
+        timestamps = array('q')
+        length = 0
+        transactions = 0
+        with open(os.path.join(oFile, _OFFSETS), 'wb') as offsetFile, \
+                open(os.path.join(oFile, _ITEMS), 'wb') as itemFile, \
+                open(os.path.join(oFile, _TIMESTAMPS), 'wb') as timestampFile:
+            for line in readTransactions(iFile, sep, temporal):
+                if temporal:
+                    timestamps.append(int(line[0]))
+                    line = line[1:]
+                seen = set()
+                for item in line:
+                    if item in seen:
+                        continue
+                    seen.add(item)
+                    if item not in dictionary:
+                        dictionary[item] = len(dictionary)
+                        supports.append(0)
+                    supports[dictionary[item]] += 1
+                    items.append(dictionary[item])
+                length += len(seen)
+                offsets.append(length)
+                transactions += 1
+                if len(offsets) >= chunkSize:
+                    offsets.tofile(offsetFile)
+                    items.tofile(itemFile)
+                    timestamps.tofile(timestampFile)
+                    offsets, items, timestamps = array('q'), array('i'), array('q')
+            offsets.tofile(offsetFile)
+            items.tofile(itemFile)
+            timestamps.tofile(timestampFile)
+        if not temporal:
+            os.remove(os.path.join(oFile, _TIMESTAMPS))
+        with open(os.path.join(oFile, _SUPPORTS), 'wb') as f:
+            supports.tofile(f)
+        with open(os.path.join(oFile, _DICTIONARY), 'w', encoding='utf-8') as f:
+            json.dump(list(dictionary), f)
+        with open(os.path.join(oFile, _META), 'w') as f:
+            json.dump({'format': _FORMAT, 'version': _VERSION, 'byteorder': sys.byteorder,
+                       'transactions': transactions, 'length': length, 'temporal': temporal}, f)
+        return TransactionStore(oFile, temporal)
+
+    def isTemporal(self) -> bool:
+        """
+        :return: True if the store was compiled with a timestamp column
+        :rtype: bool
+        """
+        return self.timestamps is not None
+
+    def getNumberOfItems(self) -> int:
+        """
+        :return: number of distinct items in the store
+        :rtype: int
+        """
+        return len(self.itemNames)
+
+    def getItemIds(self, index: int) -> 'np.ndarray':
+        """
+        Returns the item ids of one transaction without decoding them
+
+        :param index: transaction number, starting at 0
+        :type index: int
+        :return: item ids of the transaction
+        :rtype: numpy.ndarray
+        """
+        return self.data[self.offsets[index]:self.offsets[index + 1]]
+
+    def getTimestamp(self, index: int) -> int:
+        """
+        :param index: transaction number, starting at 0
+        :type index: int
+        :return: timestamp of the transaction, or its 1-based position if the store has no timestamps
+        :rtype: int
+        """
+        if self.timestamps is None:
+            return index + 1
+        return int(self.timestamps[index])
+
+    def getItemSupports(self) -> dict:
+        """
+        :return: support of every item, keyed by item name
+        :rtype: dict
+        """
+        return dict(zip(self.itemNames, self.supports.tolist()))
+
+    def getTimestamps(self) -> 'np.ndarray':
+        """
+        :return: timestamp of every transaction, or their 1-based positions if the store has no timestamps
+        :rtype: numpy.ndarray
+        """
+        if self.timestamps is None:
+            return np.arange(1, len(self) + 1, dtype=np.int64)
+        return np.asarray(self.timestamps, dtype=np.int64)
+
+    def getCodec(self, minSup: float = 0) -> ItemCodec:
+        """
+        Ranks the items by their stored supports, without reading the transactions
+
+        :param minSup: items with a support below minSup get no id
+        :type minSup: int or float
+        :return: the codec of the items whose support reaches minSup
+        :rtype: ItemCodec
+        """
+        return ItemCodec(self.getItemSupports(), minSup)
+
+    def _remap(self, codec: ItemCodec) -> 'np.ndarray':
+        """
+        :return: the codec id of every store id, -1 for the items that have no codec id
+        :rtype: numpy.ndarray
+        """
+        ids = codec.ids
+        return np.array([ids.get(name, -1) for name in self.itemNames], dtype=np.int64)
+
+    def getTidLists(self, codec: ItemCodec) -> List['np.ndarray']:
+        """
+        Transactions containing every item of the codec
+
+        :param codec: codec built with getCodec()
+        :type codec: ItemCodec
+        :return: sorted transaction numbers, starting at 0, of every codec id
+        :rtype: list of numpy.ndarray
+        """
+        mapped = self._remap(codec)[self.data]
+        tids = np.repeat(np.arange(len(self), dtype=np.int64), np.diff(self.offsets))
+        keep = mapped >= 0
+        mapped, tids = mapped[keep], tids[keep]
+        # a stable sort by codec id keeps the transactions of every item in ascending order
+        order = np.argsort(mapped, kind='stable')
+        bounds = np.cumsum(np.bincount(mapped, minlength=len(codec)))[:-1]
+        return np.split(tids[order], bounds)
+
+    def iterEncoded(self, codec: ItemCodec, chunkSize: int = 10000) -> Iterator[List[int]]:
+        """
+        The transactions as ItemCodec.encode() returns them, i.e. the ascending codec ids of their items. For a temporal
+        view the timestamp is prepended as an int. The store is translated chunkSize transactions at a time.
+
+        :param codec: codec built with getCodec()
+        :type codec: ItemCodec
+        :param chunkSize: number of transactions translated at once
+        :type chunkSize: int
+        :return: generator of encoded transactions
+        :rtype: Iterator[List[int]]
+        """
+        remap = self._remap(codec)
+        offsets = self.offsets
+        timestamps = self.getTimestamps() if self._temporal else None
+        for start in range(0, len(self), chunkSize):
+            stop = min(len(self), start + chunkSize)
+            mapped = remap[self.data[offsets[start]:offsets[stop]]]
+            rows = np.repeat(np.arange(stop - start), np.diff(offsets[start:stop + 1]))
+            keep = mapped >= 0
+            mapped, rows = mapped[keep], rows[keep]
+            order = np.lexsort((mapped, rows))
+            ids = mapped[order].tolist()
+            bounds = np.searchsorted(rows[order], np.arange(stop - start + 1)).tolist()
+            stamps = timestamps[start:stop].tolist() if timestamps is not None else None
+            for i in range(stop - start):
+                line = ids[bounds[i]:bounds[i + 1]]
+                if stamps is not None:
+                    line.insert(0, stamps[i])
+                yield line
+
+    def __len__(self) -> int:
+        return self._meta['transactions']
+
+    def __getitem__(self, index: int) -> List[str]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("transaction index out of range")
+        names = self.itemNames
+        transaction = [names[i] for i in self.getItemIds(index).tolist()]
+        if self._temporal:
+            transaction.insert(0, str(self.getTimestamp(index)))
+        return transaction
+
+    def __iter__(self) -> Iterator[List[str]]:
+        names = self.itemNames
+        offsets = self.offsets
+        for index in range(len(self)):
+            transaction = [names[i] for i in self.data[offsets[index]:offsets[index + 1]].tolist()]
+            if self._temporal:
+                transaction.insert(0, str(self.getTimestamp(index)))
+            yield transaction
+
+
+if __name__ == "__main__":
+    if len(sys.argv) in (3, 4, 5):
+        _sep = sys.argv[3] if len(sys.argv) >= 4 else '\t'
+        _temporal = len(sys.argv) == 5 and sys.argv[4].lower() in ('1', 'true', 'temporal')
+        _store = TransactionStore.compile(sys.argv[1], sys.argv[2], _sep, _temporal)
+        print("Compiled", len(_store), "transactions with", _store.getNumberOfItems(), "items into", sys.argv[2])
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
+        print("Usage: python3 TransactionStore.py <inputFile> <storeDirectory> [<sep>] [temporal]")
@@ -0,0 +1,126 @@
+# ItemCodec maps the items of a database to dense integer ids ranked by support, so that the miners can key their
+# trees, tidlists and patterns by int and only decode the item names when the patterns are returned or saved.
+#
+#  **Importing this algorithm into a python program**
+#  --------------------------------------------------------
+#
+#             from PAMI.extras.transactionStore import itemCodec as ic
+#
+#             codec = ic.ItemCodec({'a': 5, 'b': 9, 'c': 1}, minSup=2)
+#
+#             codec.encode(['c', 'a', 'b'])      # [0, 1]: 'b' is the most frequent item
+#
+#             codec.decode((0, 1))               # ('b', 'a')
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Dict, List, Tuple, Iterable, Any, Optional
+
+
+class ItemCodec:
+    """
+    :Description:   ItemCodec assigns contiguous integer ids to the items whose support reaches minSup. Id 0 is the most
+                    frequent item and ties are broken by item name, so ascending id order is a total order by decreasing
+                    support. Sorting the ids of a transaction therefore gives the FP-tree insertion order directly.
+
+    :param  supports: dict :
+            Support of every item of the database
+    :param  minSup: int or float :
+            Items with a support below minSup get no id and are dropped by encode()
+
+    :Attributes:
+
+        items : list
+            Item name of every id
+        ids : dict
+            Id of every frequent item name
+        supports : list
+            Support of every id
+    """
+
+    def __init__(self, supports: Dict[Any, int], minSup: float = 0) -> None:
+        self.items = sorted((item for item, support in supports.items() if support >= minSup),
+                            key=lambda x: (-supports[x], str(x)))
+        self.ids = {item: index for index, item in enumerate(self.items)}
+        self.supports = [supports[item] for item in self.items]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self.ids
+
+    def add(self, item: Any, support: int = 0) -> int:
+        """
+        Gives the next id to an item that has none. The ids of the items added this way do not follow the support
+        order, so the codec is only used with a fixed item order afterwards, as the canonical tree of an incremental
+        FPGrowth does.
+
+        :param item: item name
+        :type item: Any
+        :param support: support of the item
+        :type support: int
+        :return: the id of the item
+        :rtype: int
+        """
+        index = self.ids.get(item)
+        if index is None:
+            index = self.ids[item] = len(self.items)
+            self.items.append(item)
+            self.supports.append(support)
+        return index
+
+    def encode(self, transaction: Iterable[Any]) -> List[int]:
+        """
+        Encodes a transaction. Infrequent and repeated items are dropped and the ids are returned in ascending order.
+
+        :param transaction: item names of a transaction
+        :type transaction: Iterable
+        :return: sorted item ids
+        :rtype: list
+        """
+        ids = self.ids
+        return sorted({ids[item] for item in transaction if item in ids})
+
+    def decode(self, pattern: Iterable[int]) -> Tuple[Any, ...]:
+        """
+        :param pattern: item ids
+        :type pattern: Iterable[int]
+        :return: item names of the pattern, in the same order
+        :rtype: tuple
+        """
+        items = self.items
+        return tuple([items[i] for i in pattern])
+
+    def decodePatterns(self, patterns: Dict[Tuple[int, ...], Any], sep: Optional[str] = None) -> Dict[Any, Any]:
+        """
+        Decodes the keys of a pattern dictionary
+
+        :param patterns: patterns keyed by tuples of item ids
+        :type patterns: dict
+        :param sep: if given, every pattern is returned as its item names joined with sep instead of a tuple
+        :type sep: str
+        :return: patterns keyed by item names
+        :rtype: dict
+        """
+        items = self.items
+        if sep is None:
+            return {tuple([items[i] for i in k]): v for k, v in patterns.items()}
+        return {sep.join([str(items[i]) for i in k]): v for k, v in patterns.items()}
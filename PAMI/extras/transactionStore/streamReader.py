@@ -0,0 +1,138 @@
+# streamReader reads transactional and temporal databases as a stream of fixed-size chunks, so that miners can count
+# items and build their trees without holding the whole database in memory.
+#
+#  **Importing this algorithm into a python program**
+#  --------------------------------------------------------
+#
+#             from PAMI.extras.transactionStore import streamReader as sr
+#
+#             for chunk in sr.readChunks('sampleDB.txt', sep='\t', chunkSize=10000):
+#
+#                 for transaction in chunk:
+#
+#                     print(transaction)
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import List, Union, Iterator
+from PAMI.extras.lazyImport import lazyModule, isDataFrame, isURL, urlopen
+pd = lazyModule('pandas')
+
+
+def readTransactions(iFile: 'Union[str, pd.DataFrame]', sep: str = '\t', temporal: bool = False) -> Iterator[List[str]]:
+    """
+    Reads the input one transaction at a time, in the same way as the miners do in _creatingItemSets. Empty lines are
+    kept as empty transactions, except in temporal databases where every line must start with a timestamp.
+
+    :param iFile: input file, URL, compiled TransactionStore or DataFrame with a 'Transactions' (and for temporal
+                  databases a 'TS') column
+    :type iFile: str or pd.DataFrame
+    :param sep: separator of the items
+    :type sep: str
+    :param temporal: the first value of every transaction is its timestamp
+    :type temporal: bool
+    :return: generator of transactions
+    :rtype: Iterator[List[str]]
+    """
+    from PAMI.extras.transactionStore.TransactionStore import TransactionStore
+    if isDataFrame(iFile):
+        if iFile.empty:
+            print("its empty..")
+        columns = iFile.columns.values.tolist()
+        if 'Transactions' not in columns:
+            print("The column name should be Transactions and each line should be separated by tab space or a seperator specified by the user")
+            return
+        data = iFile['Transactions'].tolist()
+        ts = iFile['TS'].tolist() if temporal and 'TS' in columns else range(1, len(data) + 1)
+        for i in range(len(data)):
+            line = [x for x in data[i].split(sep) if x] if data[i] else []
+            if temporal:
+                line = [str(ts[i])] + line
+            yield line
+    elif TransactionStore.isStore(iFile):
+        yield from TransactionStore(iFile, temporal)
+    elif isURL(iFile):
+        for line in urlopen(iFile):
+            line = line.decode("utf-8")
+            temp = [i.rstrip() for i in line.split(sep)]
+            temp = [x for x in temp if x]
+            if temp or not temporal:
+                yield temp
+    else:
+        try:
+            with open(iFile, 'r', encoding='utf-8') as f:
+                for line in f:
+                    temp = [i.rstrip() for i in line.split(sep)]
+                    temp = [x for x in temp if x]
+                    if temp or not temporal:
+                        yield temp
+        except IOError:
+            print("File Not Found")
+            quit()
+
+
+def readChunks(iFile: 'Union[str, pd.DataFrame]', sep: str = '\t', chunkSize: int = 10000,
+               temporal: bool = False) -> Iterator[List[List[str]]]:
+    """
+    Reads the input as a stream of chunks holding at most chunkSize transactions each. Only one chunk is alive at a
+    time, so the memory needed to read the database does not grow with its size.
+
+    :param iFile: input file, URL, compiled TransactionStore or DataFrame
+    :type iFile: str or pd.DataFrame
+    :param sep: separator of the items
+    :type sep: str
+    :param chunkSize: maximum number of transactions in a chunk
+    :type chunkSize: int
+    :param temporal: the first value of every transaction is its timestamp
+    :type temporal: bool
+    :return: generator of chunks
+    :rtype: Iterator[List[List[str]]]
+    """
+    if chunkSize < 1:
+        raise ValueError("chunkSize should be a positive integer")
+    chunk = []
+    for transaction in readTransactions(iFile, sep, temporal):
+        chunk.append(transaction)
+        if len(chunk) == chunkSize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def streamTransactions(iFile: 'Union[str, pd.DataFrame]', sep: str = '\t', chunkSize: int = 10000,
+                       temporal: bool = False) -> Iterator[List[str]]:
+    """
+    Flattens readChunks() into one transaction at a time. It is the iterable handed to the tree construction of the
+    miners in place of the materialised database.
+
+    :param iFile: input file, URL, compiled TransactionStore or DataFrame
+    :type iFile: str or pd.DataFrame
+    :param sep: separator of the items
+    :type sep: str
+    :param chunkSize: maximum number of transactions read at once
+    :type chunkSize: int
+    :param temporal: the first value of every transaction is its timestamp
+    :type temporal: bool
+    :return: generator of transactions
+    :rtype: Iterator[List[str]]
+    """
+    for chunk in readChunks(iFile, sep, chunkSize, temporal):
+        yield from chunk
@@ -54,7 +54,7 @@ Copyright (C)  2021 Rage Uday Kiran
 from PAMI.faultTolerantFrequentPattern.basic import abstract as _ab
 import pandas as pd
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class FTApriori(_ab._faultTolerantFrequentPatterns):
@@ -175,7 +175,7 @@ class FTApriori(_ab._faultTolerantFrequentPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             temp = []
             if self._iFile.empty:
                 print("its empty..")
@@ -186,7 +186,7 @@ class FTApriori(_ab._faultTolerantFrequentPatterns):
             for k in temp:
                 self._Database.append(set(k))
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -58,7 +58,7 @@ Copyright (C)  2021 Rage Uday Kiran
 from PAMI.faultTolerantFrequentPattern.basic import abstract as _fp
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 _minSup = str()
 _fp._sys.setrecursionlimit(20000)
@@ -404,7 +404,7 @@ class FTFPGrowth(_fp._faultTolerantFrequentPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self.__Database = []
-        if isinstance(self._iFile, _fp._pd.DataFrame):
+        if _fp._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -413,7 +413,7 @@ class FTFPGrowth(_fp._faultTolerantFrequentPatterns):
 
             # print(self.Database)
         if isinstance(self._iFile, str):
-            if _fp._validators.url(self._iFile):
+            if _fp._isURL(self._iFile):
                 data = _fp._urlopen(self._iFile)
                 for line in data:
                     line.strip()
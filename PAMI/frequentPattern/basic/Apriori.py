@@ -53,7 +53,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.frequentPattern.basic import abstract as _ab
 from typing import Dict, Union
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class Apriori(_ab._frequentPatterns):
@@ -69,6 +69,7 @@ class Apriori(_ab._frequentPatterns):
                         - **oFile** (*str*) -- *Name of the output file to store complete set of frequent patterns.*
                         - **minSup** (*int or float or str*) -- *The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.*
                         - **sep** (*str*) -- *This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.*
+                        - **engine** (*str*) -- *'set' (default) stores the tidsets as Python sets. 'numpy' packs them into rows of uint64 words and counts every candidate with all the candidates that share its prefix in one vectorized AND and popcount. With both engines only candidates of the same prefix are joined, and a candidate is only counted if all its subsets are frequent.*
 
     :**Attributes**:    - **startTime** (*float*) -- *To record the start time of the mining process.*
                         - **endTime** (*float*) -- *To record the completion time of the mining process.*
@@ -136,6 +137,7 @@ class Apriori(_ab._frequentPatterns):
 
     """
 
+    _downwardClosed = True
     _minSup = float()
     _startTime = float()
     _endTime = float()
@@ -147,12 +149,18 @@ class Apriori(_ab._frequentPatterns):
     _memoryRSS = float()
     _Database = []
 
+    def __init__(self, iFile, minSup, sep='\t', engine='set') -> None:
+        super().__init__(iFile, minSup, sep)
+        if engine not in ('set', 'numpy'):
+            raise ValueError("engine should be 'set' or 'numpy'")
+        self._engine = engine
+
     def _creatingItemSets(self) -> None:
         """
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             temp = []
             if self._iFile.empty:
                 print("its empty..")
@@ -163,7 +171,9 @@ class Apriori(_ab._frequentPatterns):
             else:
                 print("The column name should be Transactions and each line should be separated by tab space or a seperator specified by the user")
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._TransactionStore.isStore(self._iFile):
+                self._Database = _ab._TransactionStore(self._iFile)
+            elif _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -211,6 +221,66 @@ class Apriori(_ab._frequentPatterns):
         """
         self.mine()
 
+    def _join(self, cands):
+        """
+        Joins the candidates of a level that share a prefix. The candidates of a level are generated sibling by sibling,
+        so the candidates with the same prefix are contiguous and a candidate is only compared with the siblings that
+        follow it. A joined candidate is dropped when one of its subsets is not among cands, since it cannot be frequent.
+
+        :param cands: the frequent patterns of a level, as tuples of increasing item ids
+        :type cands: list
+        :return: for every candidate, its index, the indexes of the siblings it is joined with and the number of its siblings
+        :rtype: generator
+        """
+        frequent = set(cands) if cands and len(cands[0]) > 1 else None
+        start = 0
+        while start < len(cands):
+            prefix = cands[start][:-1]
+            end = start + 1
+            while end < len(cands) and cands[end][:-1] == prefix:
+                end += 1
+            for i in range(start, end - 1):
+                cand = cands[i]
+                joined = range(i + 1, end)
+                if frequent is not None:
+                    # dropping one of the last two items gives cands[i] or cands[j], which are frequent
+                    joined = [j for j in joined if all(cand[:m] + cand[m + 1:] + cands[j][-1:] in frequent
+                                                       for m in range(len(cand) - 1))]
+                    self._profiler.count('subsetPruned', end - i - 1 - len(joined))
+                yield i, joined, end - i - 1
+            start = end
+
+    def _mineLevels(self, cands, rows):
+        """
+        Level-wise search of the numpy engine. Every candidate is intersected with all the siblings it is joined with
+        in one vectorized pass over rows, and only the tidsets of the items are stored.
+
+        :param cands: the frequent items
+        :type cands: list
+        :param rows: the tidsets of the items, packed into rows of uint64 words
+        :type rows: numpy.ndarray
+        :return: None
+        """
+        while cands:
+            newKeys = []
+            candidates = 0
+            for i, joined, siblings in self._join(cands):
+                candidates += siblings
+                if not joined:
+                    continue
+                row = rows[cands[i][0]]
+                for k in cands[i][1:]:
+                    row = row & rows[k]
+                lasts = [cands[j][-1] for j in joined]
+                words, intersections, counts = _ab._packedBitset.intersect(row, rows, select=lasts)
+                for j in (counts >= self._minSup).nonzero()[0].tolist():
+                    newCand = cands[i] + (lasts[j],)
+                    newKeys.append(newCand)
+                    self._finalPatterns[newCand] = int(counts[j])
+            self._profiler.count('candidates', candidates)
+            self._profiler.count('pruned', candidates - len(newKeys))
+            cands = newKeys
+
     def mine(self, memorySaver = True) -> None:
         """
         Frequent pattern mining process will start from here
@@ -223,71 +293,90 @@ class Apriori(_ab._frequentPatterns):
         """
         self._Database = []
         self._startTime = _ab._time.time()
+        self._finalPatterns = self._openSink()
+        self._profiler.start()
+        self._profiler.phase('read')
 
         self._creatingItemSets()
 
-        self._minSup = self._convert(self._minSup)
-
-        items = {}
-        index = 0
-        for line in self._Database:
-            for item in line:
-                if tuple([item]) in items:
-                    items[tuple([item])].append(index)
-                else:
-                    items[tuple([item])] = [index]
-            index += 1
-
-        # sort by length in descending order
-        items = dict(sorted(items.items(), key=lambda x: len(x[1]), reverse=True))
-
+        self._minSup = self._sweepMinSup(self._convert)
+        self._profiler.phase('firstScan')
+
+        # ids are ranked by support in descending order
+        tidLists = self._storeTidLists()
+        if tidLists is None:
+            items = {}
+            index = 0
+            for line in self._Database:
+                for item in line:
+                    if item in items:
+                        items[item].append(index)
+                    else:
+                        items[item] = [index]
+                index += 1
+            self._codec = _ab._ItemCodec({k: len(v) for k, v in items.items()}, self._minSup)
+            tidLists = [items[item] for item in self._codec.items]
+            del items
+        tidSets = [set(tids) for tids in tidLists]
+        del tidLists
+        self._profiler.phase('mine')
         cands = []
         fileData = {}
-        for key in items:
-            if len(items[key]) >= self._minSup:
-                cands.append(key)
-                # self._finalPatterns["\t".join(key)] = len(items[key])
-                self._finalPatterns[key] = len(items[key])
-                fileData[key] = set(items[key])
-            else:
-                break
-
-        if memorySaver:
+        for key in range(len(self._codec)):
+            cands.append(tuple([key]))
+            self._finalPatterns[tuple([key])] = len(tidSets[key])
+            fileData[tuple([key])] = tidSets[key]
+
+        if self._engine == 'numpy':
+            self._mineLevels(cands, _ab._packedBitset.pack(tidSets, index))
+        elif memorySaver:
             while cands:
                 newKeys = []
-                for i in range(len(cands)):
-                    for j in range(i + 1, len(cands)):
-                        if cands[i][:-1] == cands[j][:-1]:
-                            newCand = cands[i] + tuple([cands[j][-1]])
-                            intersection = fileData[tuple([newCand[0]])]
-                            for k in range(1, len(newCand)):
-                                intersection = intersection.intersection(fileData[tuple([newCand[k]])])
-                            if len(intersection) >= self._minSup:
-                                newKeys.append(newCand)
-                                self._finalPatterns[newCand] = len(intersection)
+                candidates = 0
+                for i, joined, siblings in self._join(cands):
+                    candidates += siblings
+                    if not joined:
+                        continue
+                    # the tidset of cands[i] is rebuilt once from the items and shared by all its joins
+                    prefix = tidSets[cands[i][0]]
+                    for k in cands[i][1:]:
+                        prefix = prefix & tidSets[k]
+                    for j in joined:
+                        newCand = cands[i] + tuple([cands[j][-1]])
+                        intersection = prefix & tidSets[newCand[-1]]
+                        if len(intersection) >= self._minSup:
+                            newKeys.append(newCand)
+                            self._finalPatterns[newCand] = len(intersection)
+                self._profiler.count('candidates', candidates)
+                self._profiler.count('pruned', candidates - len(newKeys))
                 del cands
                 cands = newKeys
                 del newKeys
         else:
             while cands:
                 newKeys = []
-                for i in range(len(cands)):
-                    for j in range(i + 1, len(cands)):
-                        if cands[i][:-1] == cands[j][:-1]:
-                            newCand = cands[i] + tuple([cands[j][-1]])
-                            intersection = fileData[cands[i]] & fileData[cands[j]]
-                            # intersection = fileData[tuple([newCand[0]])]
-                            # for k in range(1, len(newCand)):
-                                # intersection = intersection.intersection(fileData[tuple([newCand[k]])])
-                            if len(intersection) >= self._minSup:
-                                newKeys.append(newCand)
-                                self._finalPatterns[newCand] = len(intersection)
-                                fileData[newCand] = intersection
+                newData = {}
+                candidates = 0
+                for i, joined, siblings in self._join(cands):
+                    candidates += siblings
+                    for j in joined:
+                        newCand = cands[i] + tuple([cands[j][-1]])
+                        intersection = fileData[cands[i]] & fileData[cands[j]]
+                        if len(intersection) >= self._minSup:
+                            newKeys.append(newCand)
+                            self._finalPatterns[newCand] = len(intersection)
+                            newData[newCand] = intersection
+                self._profiler.count('candidates', candidates)
+                self._profiler.count('pruned', candidates - len(newKeys))
+                # only the tidsets of the last level are joined again
+                fileData = newData
                 del cands
                 cands = newKeys
                 del newKeys
-        
 
+        self._profiler.phase('output')
+        self._closeSink()
+        self._profiler.stop()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._endTime = _ab._time.time()
         self._memoryUSS = float()
@@ -329,7 +418,7 @@ class Apriori(_ab._frequentPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
 
         Storing final frequent patterns in a dataframe
@@ -349,7 +438,7 @@ class Apriori(_ab._frequentPatterns):
         #     dataFrame = _ab._pd.DataFrame(data, columns=['Patterns', 'Support'])
         # print("Time taken to convert the frequent patterns into DataFrame is: ", _ab._time.time() - time)
 
-        dataFrame = _ab._pd.DataFrame(list([[" ".join(x), y] for x,y in self._finalPatterns.items()]), columns=['Patterns', 'Support'])
+        dataFrame = _ab._pd.DataFrame(list([[" ".join(x), y] for x,y in self._decodedPatterns().items()]), columns=['Patterns', 'Support'])
 
         return dataFrame
 
@@ -362,6 +451,10 @@ class Apriori(_ab._frequentPatterns):
         :type outFile: csvfile
         :return: None
         """
+        if self._patternsStreamed():
+            # the sink already wrote the patterns while mining
+            return
+        self._profiler.phase('save')
 
         # self._oFile = outFile
         # writer = open(self._oFile, 'w+')
@@ -369,9 +462,10 @@ class Apriori(_ab._frequentPatterns):
         #     patternsAndSupport = x.strip() + ":" + str(y[0])
         #     writer.write("%s \n" % patternsAndSupport)
         with open(outFile, 'w') as f:
-            for x, y in self._finalPatterns.items():
+            for x, y in self._decodedPatterns().items():
                 x = seperator.join(x)
                 f.write(f"{x}:{y}\n")
+        self._profiler.stop()
 
     def getPatterns(self) -> Dict[str, int]:
         """
@@ -381,13 +475,13 @@ class Apriori(_ab._frequentPatterns):
         :return: returning frequent patterns
         :rtype: dict
         """
-        return self._finalPatterns
+        return self._decodedPatterns()
 
     def printResults(self) -> None:
         """
         This function is used to print the result
         """
-        print("Total number of Frequent Patterns:", len(self.getPatterns()))
+        print("Total number of Frequent Patterns:", len(self._finalPatterns))
         print("Total Memory in USS:", self.getMemoryUSS())
         print("Total Memory in RSS", self.getMemoryRSS())
         print("Total ExecutionTime in ms:", self.getRuntime())
@@ -52,7 +52,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.frequentPattern.basic import abstract as _ab
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class Aprioribitset(_ab._frequentPatterns):
@@ -68,6 +68,7 @@ class Aprioribitset(_ab._frequentPatterns):
                         - **oFile** (*str*) -- *Name of the output file to store complete set of frequent patterns.*
                         - **minSup** (*int or float or str*) -- *The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.*
                         - **sep** (*str*) -- *This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.*
+                        - **engine** (*str*) -- *'int' (default) stores every tidset in one Python integer and intersects the candidates pairwise. 'numpy' packs the tidsets into rows of uint64 words and intersects and counts every candidate with all the candidates that share its prefix in one vectorized AND and popcount, skipping the blocks of words where the candidate has no transaction.*
 
     :**Attributes**:    - **startTime** (*float*) -- *To record the start time of the mining process.*
                         - **endTime** (*float*) -- *To record the completion time of the mining process.*
@@ -136,6 +137,7 @@ class Aprioribitset(_ab._frequentPatterns):
 
     """
 
+    _downwardClosed = True
     _startTime = float()
     _endTime = float()
     _finalPatterns = {}
@@ -148,6 +150,13 @@ class Aprioribitset(_ab._frequentPatterns):
     _Database = []
     _mapSupport = {}
     _lno = 0
+    _bitSets = []
+
+    def __init__(self, iFile, minSup, sep='\t', engine='int') -> None:
+        super().__init__(iFile, minSup, sep)
+        if engine not in ('int', 'numpy'):
+            raise ValueError("engine should be 'int' or 'numpy'")
+        self._engine = engine
 
     def _convert(self, value):
         """
@@ -176,7 +185,7 @@ class Aprioribitset(_ab._frequentPatterns):
         """
         self._Database = []
         self._mapSupport = {}
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             temp = []
             if self._iFile.empty:
                 print("its empty..")
@@ -188,7 +197,9 @@ class Aprioribitset(_ab._frequentPatterns):
                 print("The column name should be Transactions and each line should be separated by tab space or a seperator specified by the user")
 
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._TransactionStore.isStore(self._iFile):
+                self._Database = _ab._TransactionStore(self._iFile)
+            elif _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -206,7 +217,7 @@ class Aprioribitset(_ab._frequentPatterns):
                             self._Database.append(splitter)
                 except IOError:
                     print("File Not Found")
-        self._minSup = self._convert(self._minSup)
+        self._minSup = self._sweepMinSup(self._convert)
 
     @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
 
@@ -228,48 +239,98 @@ class Aprioribitset(_ab._frequentPatterns):
 
         return packed_bits
 
+    def _mineLevels(self, cands):
+        """
+        Level-wise search of the numpy engine. The candidates of a level that share a prefix are joined as in the int
+        engine, but every candidate is intersected with all the following ones in one vectorized pass over the rows of
+        self._bitSets. Only the tidsets of the items are stored.
+
+        :param cands: the frequent items
+        :type cands: list
+        :return: None
+        """
+        rows = self._bitSets
+        while cands:
+            newCands = []
+            candidates = 0
+            start = 0
+            while start < len(cands):
+                prefix = cands[start][:-1]
+                end = start + 1
+                while end < len(cands) and cands[end][:-1] == prefix:
+                    end += 1
+                lasts = [cand[-1] for cand in cands[start:end]]
+                base = None
+                for item in prefix:
+                    base = rows[item] if base is None else base & rows[item]
+                for i in range(end - start - 1):
+                    row = rows[lasts[i]] if base is None else base & rows[lasts[i]]
+                    words, intersections, counts = _ab._packedBitset.intersect(row, rows, select=lasts[i + 1:])
+                    candidates += len(counts)
+                    for j in (counts >= self._minSup).nonzero()[0].tolist():
+                        newCand = cands[start + i] + (lasts[i + 1 + j],)
+                        newCands.append(newCand)
+                        self._finalPatterns[newCand] = int(counts[j])
+                start = end
+            self._profiler.count('candidates', candidates)
+            self._profiler.count('pruned', candidates - len(newCands))
+            cands = newCands
+
     def mine(self, memorySaver = True) -> None:
         """
         Frequent pattern mining process will start from here
         """
         self._startTime = _ab._time.time()
+        self._finalPatterns = self._openSink()
+        self._profiler.start()
+        self._profiler.phase('read')
 
         self._Database = []
 
         self._creatingItemSets()
 
+        self._profiler.phase('firstScan')
+        # ids are ranked by support in descending order
+        index = len(self._Database)
+        tidLists = self._storeTidLists()
+        if tidLists is None:
+            items = {}
+            for tid, line in enumerate(self._Database):
+                for item in line:
+                    if item in items:
+                        items[item].append(tid)
+                    else:
+                        items[item] = [tid]
+            self._codec = _ab._ItemCodec({k: len(set(v)) for k, v in items.items()}, self._minSup)
+            tidLists = [items[item] for item in self._codec.items]
+            del items
+        if self._engine == 'numpy':
+            self._bitSets = _ab._packedBitset.pack(tidLists, index)
+        else:
+            self._bitSets = [self._bitPacker(tids, index) for tids in tidLists]
+        del tidLists
+        self._profiler.phase('mine')
         items = {}
-        index = 0
-        for line in self._Database:
-            for item in line:
-                if tuple([item]) in items:
-                    items[tuple([item])].append(index)
-                else:
-                    items[tuple([item])] = [index]
-            index += 1
-
-        # sort by length in descending order
-        items = dict(sorted(items.items(), key=lambda x: len(x[1]), reverse=True))
         cands = []
-        for key in items:
-            if len(items[key]) >= self._minSup:
-                self._finalPatterns[key] = len(items[key])
-                cands.append(key)
-                items[key] = self._bitPacker(items[key], index)
-                # print(key, items[key])
-            else:
-                break
-
-        if memorySaver:
+        for key in range(len(self._codec)):
+            self._finalPatterns[tuple([key])] = self._codec.supports[key]
+            cands.append(tuple([key]))
+            items[tuple([key])] = self._bitSets[key]
+
+        if self._engine == 'numpy':
+            self._mineLevels(cands)
+        elif memorySaver:
             while cands:
                 newCands = []
+                candidates = 0
                 for i in range(len(cands)):
                     for j in range(i + 1, len(cands)):
                         if cands[i][:-1] == cands[j][:-1]:
+                            candidates += 1
                             newCand = tuple(cands[i] + tuple([cands[j][-1]]))
-                            intersection = items[tuple([newCand[0]])]
+                            intersection = self._bitSets[newCand[0]]
                             for k in range(1, len(newCand)):
-                                intersection &= items[tuple([newCand[k]])]
+                                intersection &= self._bitSets[newCand[k]]
                             count = int.bit_count(intersection)
                             if count >= self._minSup:
                                 newCands.append(newCand)
@@ -277,13 +338,17 @@ class Aprioribitset(_ab._frequentPatterns):
                         else:
                             break
 
+                self._profiler.count('candidates', candidates)
+                self._profiler.count('pruned', candidates - len(newCands))
                 cands = newCands
         else:
             while cands:
                 newCands = []
+                candidates = 0
                 for i in range(len(cands)):
                     for j in range(i + 1, len(cands)):
                         if cands[i][:-1] == cands[j][:-1]:
+                            candidates += 1
                             newCand = tuple(cands[i] + tuple([cands[j][-1]]))
                             # intersection = items[tuple([newCand[0]])]
                             # for k in range(1, len(newCand)):
@@ -297,8 +362,13 @@ class Aprioribitset(_ab._frequentPatterns):
                         else:
                             break
 
+                self._profiler.count('candidates', candidates)
+                self._profiler.count('pruned', candidates - len(newCands))
                 cands = newCands
 
+        self._profiler.phase('output')
+        self._closeSink()
+        self._profiler.stop()
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -337,7 +407,7 @@ class Aprioribitset(_ab._frequentPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final frequent patterns in a dataframe
 
@@ -355,7 +425,7 @@ class Aprioribitset(_ab._frequentPatterns):
         #     dataFrame = _ab._pd.DataFrame(data, columns=['Patterns', 'Support'])
         # print("Time taken to convert the frequent patterns into DataFrame is: ", _ab._time.time() - time)
 
-        dataFrame = _ab._pd.DataFrame(list([[" ".join(x), y] for x,y in self._finalPatterns.items()]), columns=['Patterns', 'Support'])
+        dataFrame = _ab._pd.DataFrame(list([[" ".join(x), y] for x,y in self._decodedPatterns().items()]), columns=['Patterns', 'Support'])
         # dataFrame = _ab._pd.DataFrame(list(self._finalPatterns.items()), columns=['Patterns', 'Support'])
 
         return dataFrame
@@ -368,6 +438,10 @@ class Aprioribitset(_ab._frequentPatterns):
         :type outFile: csvfile
         :return: None
         """
+        if self._patternsStreamed():
+            # the sink already wrote the patterns while mining
+            return
+        self._profiler.phase('save')
 
         # self._oFile = outFile
         # writer = open(self._oFile, 'w+')
@@ -375,9 +449,10 @@ class Aprioribitset(_ab._frequentPatterns):
         #     patternsAndSupport = x.strip() + ":" + str(y[0])
         #     writer.write("%s \n" % patternsAndSupport)
         with open(outFile, 'w') as f:
-            for x, y in self._finalPatterns.items():
+            for x, y in self._decodedPatterns().items():
                 x = seperator.join(x)
                 f.write(f"{x}:{y}\n")
+        self._profiler.stop()
 
     def getPatterns(self):
         """
@@ -386,13 +461,13 @@ class Aprioribitset(_ab._frequentPatterns):
         :return: returning frequent patterns
         :rtype: dict
         """
-        return self._finalPatterns
+        return self._decodedPatterns()
 
     def printResults(self):
         """
         This function is used to print the result
         """
-        print("Total number of Frequent Patterns:", len(self.getPatterns()))
+        print("Total number of Frequent Patterns:", len(self._finalPatterns))
         print("Total Memory in USS:", self.getMemoryUSS())
         print("Total Memory in RSS", self.getMemoryRSS())
         print("Total ExecutionTime in ms:", self.getRuntime())
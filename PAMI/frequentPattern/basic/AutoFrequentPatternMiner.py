@@ -0,0 +1,526 @@
+# AutoFrequentPatternMiner discovers frequent patterns in a transactional database with the frequent pattern engine that
+# suits it best. The engine is chosen from the statistics of the database computed by extras.dbStats and the threshold,
+# optionally checked by timing a few engines on a sample, and the reasons of the choice are reported with the patterns.
+#
+# **Importing this algorithm into a python program**
+#
+#             import PAMI.frequentPattern.basic.AutoFrequentPatternMiner as alg
+#
+#             iFile = 'sampleDB.txt'
+#
+#             minSup = 10  # can also be specified between 0 and 1
+#
+#             obj = alg.AutoFrequentPatternMiner(iFile, minSup, sampleSize=2000)
+#
+#             obj.mine()
+#
+#             frequentPatterns = obj.getPatterns()
+#
+#             print("Total number of Frequent Patterns:", len(frequentPatterns))
+#
+#             print(obj.getReport())
+#
+#             obj.save(oFile)
+#
+#             Df = obj.getPatternInDataFrame()
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from PAMI.frequentPattern.basic import abstract as _ab
+from PAMI.extras.lazyImport import deprecated
+from typing import Any, Dict, List, Tuple
+import importlib as _importlib
+import random as _random
+import tempfile as _tempfile
+
+#: Engines the miner can dispatch to: name -> (module of PAMI.frequentPattern.basic, keyword arguments)
+ENGINES = {
+    'Apriori': ('Apriori', {}),
+    'ECLAT': ('ECLAT', {}),
+    'ECLATbitset': ('ECLATbitset', {'engine': 'int'}),
+    'ECLATbitset-numpy': ('ECLATbitset', {'engine': 'numpy'}),
+    'ECLATDiffset': ('ECLATDiffset', {}),
+    'FPGrowth': ('FPGrowth', {}),
+}
+
+#: Engines timed on the sample when no candidates are given. Apriori and ECLATDiffset are left out: on the benchmark
+#: databases they were never the fastest, and ECLATDiffset takes minutes on sparse databases at low thresholds.
+_TIMED = ('ECLATbitset', 'ECLATbitset-numpy', 'ECLAT', 'FPGrowth')
+
+#: From this many transactions the packed uint64 bitsets of ECLATbitset(engine='numpy') are intersected faster than
+#: the Python integer bitsets
+_NUMPY_TRANSACTIONS = 10000
+
+
+def _timeEngine(name, transactions, minSup, sep) -> float:
+    """
+    Mines a sample with an engine and returns the seconds spent in mine(). The sample is written to a temporary file,
+    which every engine accepts as input.
+
+    :param name: key of ENGINES
+    :type name: str
+    :param transactions: the transactions of the sample
+    :type transactions: list
+    :param minSup: minimum support count in the sample
+    :type minSup: int
+    :param sep: separator of the items
+    :type sep: str
+    :return: the mining time in seconds
+    :rtype: float
+    """
+    module, kwargs = ENGINES[name]
+    miner = getattr(_importlib.import_module('PAMI.frequentPattern.basic.' + module), module)
+    with _tempfile.NamedTemporaryFile('w', suffix='.txt', encoding='utf-8', delete=False) as f:
+        f.write("\n".join(sep.join(str(item) for item in transaction) for transaction in transactions))
+    try:
+        engine = miner(f.name, minSup, sep, **kwargs)
+        start = _ab._time.perf_counter()
+        engine.mine()
+        return _ab._time.perf_counter() - start
+    finally:
+        _ab._os.remove(f.name)
+
+
+class AutoFrequentPatternMiner(_ab._frequentPatterns):
+    """
+    **About this algorithm**
+
+    :**Description**: AutoFrequentPatternMiner reads the database once with extras.dbStats.TransactionalDatabase and
+                      derives the size of the database, the average transaction length, the number of items and the
+                      density (average length / number of items). With the threshold it then counts the frequent items
+                      and their density, i.e. the average fraction of the transactions that contain a frequent item.
+                      These statistics decide the engine:
+
+                      - Apriori when at most one item is frequent, since its first counting pass finds every pattern,
+                      - FPGrowth when workers > 1, as it is the only engine mining in a process pool,
+                      - FPGrowth when the bitsets of the frequent items would exceed memoryLimit bytes, as its tree
+                        shares the prefixes of the transactions instead of holding one bitset per item,
+                      - ECLATbitset with the numpy engine from 10000 transactions, and with Python integer bitsets below.
+
+                      With sampleSize > 0 the rule based choice is checked by mining a random sample of sampleSize
+                      transactions, at the threshold scaled to the sample, with every candidate engine. The fastest one
+                      is used. Small samples favour the engines with the lowest fixed cost, so the sample should not be
+                      much smaller than the databases the rules were measured on.
+
+                      The chosen engine mines the whole database and its patterns, profile counters and sweep become
+                      those of this miner. getReport() returns the engine, the statistics, the timings and the reasons.
+
+    :**Parameters**:    - **iFile** (*str or URL or dataFrame*) -- *Name of the Input file to mine complete set of frequent patterns.*
+                        - **oFile** (*str*) -- *Name of the output file to store complete set of frequent patterns.*
+                        - **minSup** (*int or float or str*) -- *The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.*
+                        - **sep** (*str*) -- *This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.*
+                        - **sampleSize** (*int*) -- *Number of transactions of the sample the candidate engines are timed on. The default 0 chooses from the statistics only.*
+                        - **candidates** (*list*) -- *Names of the engines timed on the sample, keys of ENGINES. By default the rule based choice, ECLATbitset (both engines), ECLAT and FPGrowth.*
+                        - **memoryLimit** (*int*) -- *Bytes the bitsets of the frequent items may take before FPGrowth is preferred. The default is 1 GiB.*
+                        - **workers** (*int*) -- *Number of processes. More than one selects FPGrowth, which mines its header table in a process pool.*
+                        - **seed** (*int*) -- *Seed of the sample.*
+
+    :**Attributes**:    - **startTime** (*float*) -- *To record the start time of the mining process.*
+                        - **endTime** (*float*) -- *To record the completion time of the mining process.*
+                        - **finalPatterns** (*dict*) -- *Storing the complete set of patterns in a dictionary variable.*
+                        - **memoryUSS** (*float*) -- *To store the total amount of USS memory consumed by the program.*
+                        - **memoryRSS** (*float*) -- *To store the total amount of RSS memory consumed by the program.*
+                        - **lno** (*int*) -- *Number of transactions of the database.*
+                        - **report** (*dict*) -- *Engine, statistics, timings and reasons of the choice.*
+
+    **Execution methods**
+
+    **Terminal command**
+
+    .. code-block:: console
+
+      Format:
+
+      (.venv) $ python3 AutoFrequentPatternMiner.py <inputFile> <outputFile> <minSup>
+
+      Example Usage:
+
+      (.venv) $ python3 AutoFrequentPatternMiner.py sampleDB.txt patterns.txt 10.0
+
+    .. note:: minSup can be specified  in support count or a value between 0 and 1.
+
+
+    **Calling from a python program**
+
+    .. code-block:: python
+
+            import PAMI.frequentPattern.basic.AutoFrequentPatternMiner as alg
+
+            iFile = 'sampleDB.txt'
+
+            minSup = 10  # can also be specified between 0 and 1
+
+            obj = alg.AutoFrequentPatternMiner(iFile, minSup, sampleSize=2000)
+
+            obj.mine()
+
+            frequentPatterns = obj.getPatterns()
+
+            print("Total number of Frequent Patterns:", len(frequentPatterns))
+
+            print(obj.getReport()['engine'], obj.getReport()['reasons'])
+
+            obj.save(oFile)
+
+            Df = obj.getPatternInDataFrame()
+
+            memUSS = obj.getMemoryUSS()
+
+            print("Total Memory in USS:", memUSS)
+
+            memRSS = obj.getMemoryRSS()
+
+            print("Total Memory in RSS", memRSS)
+
+            run = obj.getRuntime()
+
+            print("Total ExecutionTime in seconds:", run)
+
+    """
+
+    _downwardClosed = True
+    _cacheState = _ab._frequentPatterns._cacheState + ('_report',)
+    _minSup = float()
+    _startTime = float()
+    _endTime = float()
+    _finalPatterns = {}
+    _iFile = " "
+    _oFile = " "
+    _sep = " "
+    _memoryUSS = float()
+    _memoryRSS = float()
+    _lno = 0
+
+    def __init__(self, iFile, minSup, sep='\t', sampleSize=0, candidates=None, memoryLimit=2 ** 30, workers=1,
+                 seed=None) -> None:
+        super().__init__(iFile, minSup, sep)
+        if sampleSize < 0:
+            raise ValueError("sampleSize should be a non-negative integer")
+        if candidates is not None:
+            unknown = [name for name in candidates if name not in ENGINES]
+            if unknown or not candidates:
+                raise ValueError("candidates should be names of " + ", ".join(ENGINES))
+        if workers is None:
+            workers = _ab._os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers should be at least 1")
+        self._sampleSize = sampleSize
+        self._candidates = candidates
+        self._memoryLimit = memoryLimit
+        self._workers = workers
+        self._seed = seed
+        self._report = {}
+
+    def _convert(self, value) -> float:
+        """
+
+        To convert the user specified minSup value
+
+        :param value: user specified minSup value
+        :return: converted type
+        :rtype: float
+        """
+        if type(value) is int:
+            value = int(value)
+        if type(value) is float:
+            value = (self._lno * value)
+        if type(value) is str:
+            if '.' in value:
+                value = float(value)
+                value = (self._lno * value)
+            else:
+                value = int(value)
+        return value
+
+    @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
+    def startMine(self) -> None:
+        """
+        Frequent pattern mining process will start from here
+        """
+
+        self.mine()
+
+    def _readStatistics(self) -> Tuple[Dict[str, Any], List[List[str]]]:
+        """
+
+        Reads the database with extras.dbStats.TransactionalDatabase
+
+        :return: the statistics of the database, without the threshold, and its transactions
+        :rtype: tuple
+        """
+        from PAMI.extras.dbStats.TransactionalDatabase import TransactionalDatabase
+
+        database = TransactionalDatabase(self._iFile, self._sep)
+        if isinstance(self._iFile, str) and _ab._TransactionStore.isStore(self._iFile):
+            database.database = dict(enumerate(_ab._TransactionStore(self._iFile), 1))
+            database.lengthList = [len(transaction) for transaction in database.database.values()]
+        else:
+            if _ab._isDataFrame(self._iFile) and 'tid' not in self._iFile.columns:
+                # the miners read the Transactions column alone, the statistics need a tid column too
+                database.inputFile = self._iFile.assign(tid=range(1, len(self._iFile) + 1))
+            database.readDatabase()
+            if _ab._isDataFrame(self._iFile):
+                # the Transactions column holds the items joined by sep
+                database.database = {tid: [item for item in str(transaction).split(self._sep) if item]
+                                     for tid, transaction in database.database.items()}
+                database.lengthList = [len(transaction) for transaction in database.database.values()]
+        size = database.getDatabaseSize()
+        supports = database.getSortedListOfItemFrequencies()
+        averageLength = database.getAverageTransactionLength() if size else 0.0
+        statistics = {'transactions': size, 'averageLength': averageLength, 'items': len(supports),
+                      'density': averageLength / len(supports) if supports else 0.0, 'supports': supports}
+        return statistics, list(database.database.values())
+
+    def _choose(self, statistics) -> Tuple[str, List[str]]:
+        """
+
+        Picks the engine from the statistics of the database and the threshold
+
+        :param statistics: the statistics returned by _readStatistics, with frequentItems and frequentDensity
+        :type statistics: dict
+        :return: the name of the engine and the reasons of the choice
+        :rtype: tuple
+        """
+        size, frequent = statistics['transactions'], statistics['frequentItems']
+        bitsetBytes = frequent * size // 8
+        reasons = ["{} transactions, {} items, average length {:.2f}, density {:.4f}".format(
+            size, statistics['items'], statistics['averageLength'], statistics['density']),
+            "{} items reach minSup {}, frequent density {:.4f}".format(
+            frequent, self._minSup, statistics['frequentDensity'])]
+        if frequent <= 1:
+            reasons.append("at most one item is frequent, so the first counting pass of Apriori finds every pattern")
+            return 'Apriori', reasons
+        if self._workers > 1:
+            reasons.append("workers={}: FPGrowth is the engine that mines in a process pool".format(self._workers))
+            return 'FPGrowth', reasons
+        if bitsetBytes > self._memoryLimit:
+            reasons.append("the bitsets of the frequent items would take {} bytes, more than memoryLimit={}; the "
+                           "FP-tree shares the prefixes of the transactions instead".format(bitsetBytes, self._memoryLimit))
+            return 'FPGrowth', reasons
+        if size >= _NUMPY_TRANSACTIONS:
+            reasons.append("{} bytes of bitsets fit in memory, and from {} transactions the packed uint64 bitsets of "
+                           "the numpy engine intersect faster than Python integers".format(bitsetBytes, _NUMPY_TRANSACTIONS))
+            return 'ECLATbitset-numpy', reasons
+        reasons.append("{} bytes of bitsets fit in memory, and below {} transactions the Python integer bitsets have "
+                       "the lowest fixed cost".format(bitsetBytes, _NUMPY_TRANSACTIONS))
+        return 'ECLATbitset', reasons
+
+    def _timeCandidates(self, transactions, choice, reasons) -> Tuple[str, Dict[str, float]]:
+        """
+
+        Times the candidate engines on a random sample of the transactions and returns the fastest one
+
+        :param transactions: the transactions of the database
+        :type transactions: list
+        :param choice: the engine chosen from the statistics
+        :type choice: str
+        :param reasons: the reasons of the choice, extended in place
+        :type reasons: list
+        :return: the fastest engine and the seconds of every candidate
+        :rtype: tuple
+        """
+        candidates = list(self._candidates) if self._candidates is not None else \
+            [choice] + [name for name in _TIMED if name != choice]
+        sample = _random.Random(self._seed).sample(transactions, min(self._sampleSize, len(transactions)))
+        # a pattern frequent in the database is expected at the same proportion in the sample
+        minSup = max(1, int(self._minSup * len(sample) / self._lno))
+        timings = {}
+        for name in candidates:
+            timings[name] = _timeEngine(name, sample, minSup, self._sep)
+            self._profiler.count('timedEngines')
+        fastest = min(candidates, key=timings.get)
+        reasons.append("on a sample of {} transactions at minSup {}: ".format(len(sample), minSup) +
+                       ", ".join("{} {:.3f}s".format(name, timings[name]) for name in candidates))
+        if fastest != choice:
+            reasons.append("{} was faster on the sample than {}".format(fastest, choice))
+        return fastest, timings
+
+    def mine(self) -> None:
+        """
+        Frequent pattern mining process will start from here
+        """
+        self._startTime = _ab._time.time()
+        self._profiler.start()
+        if self._iFile is None:
+            raise Exception("Please enter the file path or file name:")
+        if self._minSup is None:
+            raise Exception("Please enter the Minimum Support")
+        self._profiler.phase('firstScan')
+        statistics, transactions = self._readStatistics()
+        self._lno = statistics['transactions']
+        # the chosen engine converts the threshold as given by the user
+        threshold = self._minSups if self._minSups is not None else self._minSup
+        self._minSup = self._sweepMinSup(self._convert)
+        supports = statistics.pop('supports')
+        frequent = [support for support in supports.values() if support >= self._minSup]
+        statistics['frequentItems'] = len(frequent)
+        statistics['frequentDensity'] = sum(frequent) / (len(frequent) * self._lno) if frequent else 0.0
+        engine, reasons = self._choose(statistics)
+
+        timings = {}
+        if self._sampleSize > 0 and engine not in ('Apriori', 'FPGrowth'):
+            self._profiler.phase('sample')
+            engine, timings = self._timeCandidates(transactions, engine, reasons)
+        del transactions
+        self._report = {'engine': engine, 'statistics': statistics, 'timings': timings, 'reasons': reasons}
+
+        self._profiler.phase('mine')
+        module, kwargs = ENGINES[engine]
+        if engine == 'FPGrowth':
+            kwargs = dict(kwargs, workers=self._workers)
+        miner = getattr(_importlib.import_module('PAMI.frequentPattern.basic.' + module), module)
+        chosen = miner(self._iFile, threshold, self._sep, **kwargs)
+        chosen.setPatternSink(self._sink)
+        chosen.mine()
+        self._finalPatterns = chosen._finalPatterns
+        self._codec = chosen._codec
+        self._sweep = chosen._sweep
+        self._mined = chosen._mined
+        for name, value in chosen.getProfile()['counters'].items():
+            self._profiler.count(name, value)
+        self._profiler.stop()
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Frequent patterns were generated successfully using AutoFrequentPatternMiner with " + engine)
+
+    def getReport(self) -> dict:
+        """
+
+        Why the engine of the last mining run was chosen
+
+        :return: the engine ('engine'), the statistics of the database ('statistics'), the seconds of the engines timed
+                 on the sample ('timings') and the reasons of the choice ('reasons')
+        :rtype: dict
+        """
+        return self._report
+
+    def getMemoryUSS(self) -> float:
+        """
+
+        Total amount of USS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning USS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryUSS
+
+    def getMemoryRSS(self) -> float:
+        """
+
+        Total amount of RSS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning RSS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryRSS
+
+    def getRuntime(self) -> float:
+        """
+        Calculating the total amount of runtime taken by the mining process
+
+        :return: returning total amount of runtime taken by the mining process
+        :rtype: float
+        """
+
+        return self._endTime - self._startTime
+
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
+        """
+
+        Storing final frequent patterns in a dataframe
+
+        :return: returning frequent patterns in a dataframe
+        :rtype: pd.DataFrame
+        """
+
+        return _ab._pd.DataFrame([[" ".join(x), y] for x, y in self._decodedPatterns().items()], columns=['Patterns', 'Support'])
+
+    def save(self, outFile: str, seperator = "\t" ) -> None:
+        """
+
+        Complete set of frequent patterns will be loaded in to an output file
+
+        :param outFile: name of the output file
+        :type outFile: csvfile
+        :return: None
+        """
+        if self._patternsStreamed():
+            # the sink already wrote the patterns while mining
+            return
+        self._profiler.phase('save')
+        with open(outFile, 'w') as f:
+            for x, y in self._decodedPatterns().items():
+                x = seperator.join(x)
+                f.write(f"{x}:{y}\n")
+        self._profiler.stop()
+
+    def getPatterns(self) -> dict:
+        """
+        Function to send the set of frequent patterns after completion of the mining process
+
+        :return: returning frequent patterns
+        :rtype: dict
+        """
+        return self._decodedPatterns()
+
+    def printResults(self) -> None:
+        """
+        Function used to print the results
+        """
+        print("Total number of Frequent Patterns:", len(self._finalPatterns))
+        print("Total Memory in USS:", self.getMemoryUSS())
+        print("Total Memory in RSS", self.getMemoryRSS())
+        print("Total ExecutionTime in ms:",  self.getRuntime())
+
+
+if __name__ == "__main__":
+    _ap = str()
+    if len(_ab._sys.argv) == 4 or len(_ab._sys.argv) == 5:
+        if len(_ab._sys.argv) == 5:
+            _ap = AutoFrequentPatternMiner(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
+        if len(_ab._sys.argv) == 4:
+            _ap = AutoFrequentPatternMiner(_ab._sys.argv[1], _ab._sys.argv[3])
+        _ap.mine()
+        print("Total number of Frequent Patterns:", len(_ap.getPatterns()))
+        _ap.save(_ab._sys.argv[2])
+        print(_ap.getPatternsAsDataFrame())
+        print("Total Memory in USS:",  _ap.getMemoryUSS())
+        print("Total Memory in RSS", _ap.getMemoryRSS())
+        print("Total ExecutionTime in ms:", _ap.getRuntime())
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
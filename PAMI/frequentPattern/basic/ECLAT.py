@@ -52,7 +52,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.frequentPattern.basic import abstract as _ab
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 class ECLAT(_ab._frequentPatterns):
     """
@@ -133,6 +133,7 @@ class ECLAT(_ab._frequentPatterns):
 
     """
 
+    _downwardClosed = True
     _minSup = float()
     _startTime = float()
     _endTime = float()
@@ -143,6 +144,7 @@ class ECLAT(_ab._frequentPatterns):
     _memoryUSS = float()
     _memoryRSS = float()
     _Database = []
+    _tidSets = []
 
     def _creatingItemSets(self) -> float:
         """
@@ -153,7 +155,7 @@ class ECLAT(_ab._frequentPatterns):
         :rtype: float
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -163,7 +165,9 @@ class ECLAT(_ab._frequentPatterns):
             else:
                 print("The column name should be Transactions and each line should be separated by tab space or a seperator specified by the user")
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._TransactionStore.isStore(self._iFile):
+                self._Database = _ab._TransactionStore(self._iFile)
+            elif _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -234,6 +238,8 @@ class ECLAT(_ab._frequentPatterns):
                         newCands.append(newCand)
                         items[newCand] = intersection
                         self._finalPatterns[newCand] = len(intersection)
+                self._profiler.count('candidates', len(cands) - i - 1)
+                self._profiler.count('pruned', len(cands) - i - 1 - len(newCands))
                 if len(newCands) > 1:
                     self.__recursive(items, newCands, memorySaver)
         else:
@@ -242,12 +248,14 @@ class ECLAT(_ab._frequentPatterns):
                 for j in range(i + 1, len(cands)):
 
                     newCand = tuple(cands[i] + tuple([cands[j][-1]]))
-                    intersection = items[tuple([newCand[0]])]
+                    intersection = self._tidSets[newCand[0]]
                     for k in newCand[1:]:
-                        intersection = intersection.intersection(items[tuple([k])])
+                        intersection = intersection.intersection(self._tidSets[k])
                     if len(intersection) >= self._minSup:
                         newCands.append(newCand)
                         self._finalPatterns[newCand] = len(intersection)
+                self._profiler.count('candidates', len(cands) - i - 1)
+                self._profiler.count('pruned', len(cands) - i - 1 - len(newCands))
                 if len(newCands) > 1:
                     self.__recursive(items, newCands, memorySaver)
 
@@ -257,26 +265,36 @@ class ECLAT(_ab._frequentPatterns):
         """
 
         self._startTime = _ab._time.time()
+        self._finalPatterns = self._openSink()
+        self._profiler.start()
         if self._iFile is None:
             raise Exception("Please enter the file path or file name:")
         if self._minSup is None:
             raise Exception("Please enter the Minimum Support")
+        self._profiler.phase('read')
         self._creatingItemSets()
 
-        self._minSup = self._convert(self._minSup)
-
-    
-        items = {}
-        index = 0
-        for line in self._Database:
-            for item in line:
-                if item not in items:
-                    items[item] = []
-                items[item].append(index)
-            index += 1
-        
-        items = {tuple([k]): set(v) for k, v in items.items() if len(v) >= self._minSup}
-        items = {k: v for k, v in sorted(items.items(), key=lambda item: len(item[1]), reverse=False)}
+        self._minSup = self._sweepMinSup(self._convert)
+        self._profiler.phase('firstScan')
+
+        # ids are ranked by support, so descending ids visit the items in ascending order of support
+        tidLists = self._storeTidLists()
+        if tidLists is None:
+            items = {}
+            index = 0
+            for line in self._Database:
+                for item in line:
+                    if item not in items:
+                        items[item] = []
+                    items[item].append(index)
+                index += 1
+            self._codec = _ab._ItemCodec({k: len(v) for k, v in items.items()}, self._minSup)
+            tidLists = [items[item] for item in self._codec.items]
+            del items
+        self._tidSets = [set(tids) for tids in tidLists]
+        del tidLists
+        self._profiler.phase('mine')
+        items = {tuple([k]): self._tidSets[k] for k in reversed(range(len(self._codec)))}
         for k, v in items.items():
             self._finalPatterns[k] = len(v)
 
@@ -285,6 +303,9 @@ class ECLAT(_ab._frequentPatterns):
         self.__recursive(items, cands, memorySaver)
 
 
+        self._profiler.phase('output')
+        self._closeSink()
+        self._profiler.stop()
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -325,7 +346,7 @@ class ECLAT(_ab._frequentPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
 
         Storing final frequent patterns in a dataframe
@@ -343,7 +364,7 @@ class ECLAT(_ab._frequentPatterns):
         #     dataFrame = _ab._pd.DataFrame(data, columns=['Patterns', 'Support'])
         # print("Time taken to convert the frequent patterns into DataFrame is: ", _ab._time.time() - time)
 
-        dataFrame = _ab._pd.DataFrame(list([[" ".join(x), y] for x,y in self._finalPatterns.items()]), columns=['Patterns', 'Support'])
+        dataFrame = _ab._pd.DataFrame(list([[" ".join(x), y] for x,y in self._decodedPatterns().items()]), columns=['Patterns', 'Support'])
         # dataFrame = _ab._pd.DataFrame(list(self._finalPatterns.items()), columns=['Patterns', 'Support'])
 
         return dataFrame
@@ -357,6 +378,10 @@ class ECLAT(_ab._frequentPatterns):
         :type outFile: csvfile
         :return: None
         """
+        if self._patternsStreamed():
+            # the sink already wrote the patterns while mining
+            return
+        self._profiler.phase('save')
 
         # self._oFile = outFile
         # writer = open(self._oFile, 'w+')
@@ -364,9 +389,10 @@ class ECLAT(_ab._frequentPatterns):
         #     patternsAndSupport = x.strip() + ":" + str(y[0])
         #     writer.write("%s \n" % patternsAndSupport)
         with open(outFile, 'w') as f:
-            for x, y in self._finalPatterns.items():
+            for x, y in self._decodedPatterns().items():
                 x = seperator.join(x)
                 f.write(f"{x}:{y}\n")
+        self._profiler.stop()
 
     def getPatterns(self) -> dict:
         """
@@ -375,13 +401,13 @@ class ECLAT(_ab._frequentPatterns):
         :return: returning frequent patterns
         :rtype: dict
         """
-        return self._finalPatterns
+        return self._decodedPatterns()
 
     def printResults(self) -> None:
         """
         Function used to print the results
         """
-        print("Total number of Frequent Patterns:", len(self.getPatterns()))
+        print("Total number of Frequent Patterns:", len(self._finalPatterns))
         print("Total Memory in USS:", self.getMemoryUSS())
         print("Total Memory in RSS", self.getMemoryRSS())
         print("Total ExecutionTime in ms:",  self.getRuntime())
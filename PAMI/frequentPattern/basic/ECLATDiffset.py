@@ -53,7 +53,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 
 from PAMI.frequentPattern.basic import abstract as _ab
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class ECLATDiffset(_ab._frequentPatterns):
@@ -136,6 +136,7 @@ class ECLATDiffset(_ab._frequentPatterns):
 
     """
 
+    _downwardClosed = True
     _minSup = float()
     _startTime = float()
     _endTime = float()
@@ -154,7 +155,7 @@ class ECLATDiffset(_ab._frequentPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -164,7 +165,9 @@ class ECLATDiffset(_ab._frequentPatterns):
             else:
                 print("The column name should be Transactions and each line should be separated by tab space or a seperator specified by the user")
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._TransactionStore.isStore(self._iFile):
+                self._Database = _ab._TransactionStore(self._iFile)
+            elif _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -233,6 +236,8 @@ class ECLATDiffset(_ab._frequentPatterns):
                     newCands.append(newCand)
                     items[newCand] = intersection
                     self._finalPatterns[newCand] = supp
+            self._profiler.count('candidates', len(cands) - i - 1)
+            self._profiler.count('pruned', len(cands) - i - 1 - len(newCands))
             if len(newCands) > 1:
                 self.__recursive(items, newCands)
 
@@ -242,44 +247,51 @@ class ECLATDiffset(_ab._frequentPatterns):
         """
 
         self._startTime = _ab._time.time()
+        self._finalPatterns = self._openSink()
+        self._profiler.start()
         self._Database = []
-        self._finalPatterns = {}
         self._diffSets = {}
         self._trans_set = set()
         if self._iFile is None:
             raise Exception("Please enter the file path or file name:")
         if self._minSup is None:
             raise Exception("Please enter the Minimum Support")
+        self._profiler.phase('read')
         self._creatingItemSets()
         #print(len(self._Database))
-        self._minSup = self._convert(self._minSup)
+        self._minSup = self._sweepMinSup(self._convert)
+        self._profiler.phase('firstScan')
 
-        items = {}
         db = set([i for i in range(len(self._Database))])
-        for i in range(len(self._Database)):
-            for item in self._Database[i]:
-                if tuple([item]) in items:
-                    items[tuple([item])].append(i)
-                else:
-                    items[tuple([item])] = [i]
-        
-        items = dict(sorted(items.items(), key=lambda x: len(x[1]), reverse=True))
-
+        # ids are ranked by support in descending order
+        tidLists = self._storeTidLists()
+        if tidLists is None:
+            items = {}
+            for i in range(len(self._Database)):
+                for item in self._Database[i]:
+                    if item in items:
+                        items[item].append(i)
+                    else:
+                        items[item] = [i]
+            self._codec = _ab._ItemCodec({k: len(set(v)) for k, v in items.items()}, self._minSup)
+            tidLists = [items[item] for item in self._codec.items]
+            del items
+        diffSets = {}
         keys = []
-        for item in list(items.keys()):
-            if len(items[item]) < self._minSup:
-                del items[item]
-                continue
-            self._finalPatterns[item] = len(items[item])
-            # print(item, len(items[item]))
-            items[item] = db - set(items[item])
-            # print(item, len(items[item]))
-            keys.append(item)
-
+        for key in range(len(self._codec)):
+            self._finalPatterns[tuple([key])] = self._codec.supports[key]
+            diffSets[tuple([key])] = db - set(tidLists[key])
+            keys.append(tuple([key]))
+        del tidLists
+        items = diffSets
         self._db = db
+        self._profiler.phase('mine')
 
         self.__recursive(items, keys)
 
+        self._profiler.phase('output')
+        self._closeSink()
+        self._profiler.stop()
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -336,7 +348,7 @@ class ECLATDiffset(_ab._frequentPatterns):
         #     data.append([a.replace('\t', ' '), b[0]])
         #     dataFrame = _ab._pd.DataFrame(data, columns=['Patterns', 'Support'])
 
-        dataFrame = _ab._pd.DataFrame(list([[" ".join(x), y] for x,y in self._finalPatterns.items()]), columns=['Patterns', 'Support'])
+        dataFrame = _ab._pd.DataFrame(list([[" ".join(x), y] for x,y in self._decodedPatterns().items()]), columns=['Patterns', 'Support'])
         
         return dataFrame
 
@@ -349,6 +361,10 @@ class ECLATDiffset(_ab._frequentPatterns):
         :type outFile: csvfile
         :return: None
         """
+        if self._patternsStreamed():
+            # the sink already wrote the patterns while mining
+            return
+        self._profiler.phase('save')
 
         # self._oFile = outFile
         # writer = open(self._oFile, 'w+')
@@ -356,9 +372,10 @@ class ECLATDiffset(_ab._frequentPatterns):
         #     patternsAndSupport = x.strip() + ":" + str(y[0])
         #     writer.write("%s \n" % patternsAndSupport)
         with open(outFile, 'w') as f:
-            for x, y in self._finalPatterns.items():
+            for x, y in self._decodedPatterns().items():
                 x = seperator.join(x)
                 f.write(f"{x}:{y}\n")
+        self._profiler.stop()
 
     def getPatterns(self):
         """
@@ -368,13 +385,13 @@ class ECLATDiffset(_ab._frequentPatterns):
         :return: returning frequent patterns
         :rtype: dict
         """
-        return self._finalPatterns
+        return self._decodedPatterns()
 
     def printResults(self):
         """
         This function is used to print the results.
         """
-        print("Total number of Frequent Patterns:", len(self.getPatterns()))
+        print("Total number of Frequent Patterns:", len(self._finalPatterns))
         print("Total Memory in USS:", self.getMemoryUSS())
         print("Total Memory in RSS", self.getMemoryRSS())
         print("Total ExecutionTime in ms:",  self.getRuntime())
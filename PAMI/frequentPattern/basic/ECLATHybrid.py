@@ -0,0 +1,497 @@
+# ECLATHybrid discovers frequent patterns in a transactional database with ECLAT, choosing for every equivalence class
+# whether its candidates are stored as tidsets, diffsets or bitsets.
+#
+# **Importing this algorithm into a python program**
+#
+#             import PAMI.frequentPattern.basic.ECLATHybrid as alg
+#
+#             iFile = 'sampleDB.txt'
+#
+#             minSup = 10  # can also be specified between 0 and 1
+#
+#             obj = alg.ECLATHybrid(iFile, minSup)
+#
+#             obj.mine()
+#
+#             frequentPatterns = obj.getPatterns()
+#
+#             print("Total number of Frequent Patterns:", len(frequentPatterns))
+#
+#             obj.save(oFile)
+#
+#             Df = obj.getPatternInDataFrame()
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from PAMI.frequentPattern.basic import abstract as _ab
+from PAMI.extras.lazyImport import deprecated
+
+_np = _ab._lazyModule('numpy')
+
+#: Cost of one 64-bit word of a bitset, relative to the cost of one element of a tidset or diffset
+_WORD_COST = 0.3
+
+
+class ECLATHybrid(_ab._frequentPatterns):
+    """
+    **About this algorithm**
+
+    :**Description**: ECLATHybrid is ECLAT with a storage format chosen per equivalence class. ECLAT always intersects
+                      tidsets, ECLATDiffset always subtracts diffsets and ECLATbitset always ANDs bitsets, but which one
+                      is cheapest depends on the density of the class, and the density changes from one branch of the
+                      search to another. Before a class is built, its size is estimated from its parent class: the
+                      candidates of the prefix X are expected to occur in the same fraction of the transactions of X as
+                      the items that follow X occur in the transactions of the parent prefix. The class is then stored
+                      in the format with the lowest estimated cost:
+
+                      - tidsets, the transactions of every candidate, when the class is sparse,
+                      - diffsets, the transactions of the prefix that miss the candidate, when the class is dense,
+                      - bitsets of the whole database, when either set would hold more than about 1/200 of it.
+
+                      A bitset class can switch to tidsets or diffsets, and a tidset class to diffsets, but a diffset
+                      class stays a diffset class, since its tidsets are no longer known. The patterns, their supports
+                      and their order are the same as with ECLAT.
+
+    :**Reference**:  Mohammed Javeed Zaki, Karam Gouda: Fast vertical mining using diffsets. KDD 2003: 326-335,
+                     https://doi.org/10.1145/956750.956788
+
+    :**Parameters**:    - **iFile** (*str or URL or dataFrame*) -- *Name of the Input file to mine complete set of frequent patterns.*
+                        - **oFile** (*str*) -- *Name of the output file to store complete set of frequent patterns.*
+                        - **minSup** (*int or float or str*) -- *The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.*
+                        - **sep** (*str*) -- *This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.*
+
+    :**Attributes**:    - **startTime** (*float*) -- *To record the start time of the mining process.*
+                        - **endTime** (*float*) -- *To record the completion time of the mining process.*
+                        - **finalPatterns** (*dict*) -- *Storing the complete set of patterns in a dictionary variable.*
+                        - **memoryUSS** (*float*) -- *To store the total amount of USS memory consumed by the program.*
+                        - **memoryRSS** (*float*) -- *To store the total amount of RSS memory consumed by the program.*
+                        - **Database** (*list*) -- *To store the transactions of a database in list.*
+
+    **Execution methods**
+
+    **Terminal command**
+
+    .. code-block:: console
+
+      Format:
+
+      (.venv) $ python3 ECLATHybrid.py <inputFile> <outputFile> <minSup>
+
+      Example Usage:
+
+      (.venv) $ python3 ECLATHybrid.py sampleDB.txt patterns.txt 10.0
+
+    .. note:: minSup can be specified  in support count or a value between 0 and 1.
+
+
+    **Calling from a python program**
+
+    .. code-block:: python
+
+            import PAMI.frequentPattern.basic.ECLATHybrid as alg
+
+            iFile = 'sampleDB.txt'
+
+            minSup = 10  # can also be specified between 0 and 1
+
+            obj = alg.ECLATHybrid(iFile, minSup)
+
+            obj.mine()
+
+            frequentPatterns = obj.getPatterns()
+
+            print("Total number of Frequent Patterns:", len(frequentPatterns))
+
+            obj.save(oFile)
+
+            Df = obj.getPatternInDataFrame()
+
+            memUSS = obj.getMemoryUSS()
+
+            print("Total Memory in USS:", memUSS)
+
+            memRSS = obj.getMemoryRSS()
+
+            print("Total Memory in RSS", memRSS)
+
+            run = obj.getRuntime()
+
+            print("Total ExecutionTime in seconds:", run)
+
+            print(obj.getProfile()['counters'])     # number of tidset, diffset and bitset classes
+
+    """
+
+    _downwardClosed = True
+    _minSup = float()
+    _startTime = float()
+    _endTime = float()
+    _finalPatterns = {}
+    _iFile = " "
+    _oFile = " "
+    _sep = " "
+    _memoryUSS = float()
+    _memoryRSS = float()
+    _Database = []
+    _bytes = 0
+
+    def _creatingItemSets(self) -> None:
+        """
+
+        Storing the complete transactions of the database/input file in a database variable
+        """
+        self._Database = []
+        if _ab._isDataFrame(self._iFile):
+            if self._iFile.empty:
+                print("its empty..")
+            i = self._iFile.columns.values.tolist()
+            if 'Transactions' in i:
+                self._Database = self._iFile['Transactions'].tolist()
+                self._Database = [x.split(self._sep) for x in self._Database]
+            else:
+                print("The column name should be Transactions and each line should be separated by tab space or a seperator specified by the user")
+        if isinstance(self._iFile, str):
+            if _ab._TransactionStore.isStore(self._iFile):
+                self._Database = _ab._TransactionStore(self._iFile)
+            elif _ab._isURL(self._iFile):
+                data = _ab._urlopen(self._iFile)
+                for line in data:
+                    line.strip()
+                    line = line.decode("utf-8")
+                    temp = [i.rstrip() for i in line.split(self._sep)]
+                    temp = [x for x in temp if x]
+                    self._Database.append(temp)
+            else:
+                try:
+                    with open(self._iFile, 'r', encoding='utf-8') as f:
+                        for line in f:
+                            line.strip()
+                            temp = [i.rstrip() for i in line.split(self._sep)]
+                            temp = [x for x in temp if x]
+                            self._Database.append(temp)
+                except IOError:
+                    print("File Not Found")
+                    quit()
+
+    def _convert(self, value) -> float:
+        """
+
+        To convert the user specified minSup value
+
+        :param value: user specified minSup value
+        :return: converted type
+        :rtype: float
+        """
+        if type(value) is int:
+            value = int(value)
+        if type(value) is float:
+            value = (len(self._Database) * value)
+        if type(value) is str:
+            if '.' in value:
+                value = float(value)
+                value = (len(self._Database) * value)
+            else:
+                value = int(value)
+        return value
+
+    @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
+    def startMine(self) -> None:
+        """
+        Frequent pattern mining process will start from here
+        """
+
+        self.mine()
+
+    def _choose(self, kind, support, density) -> str:
+        """
+
+        Picks the format of a class from the estimated size of its candidates
+
+        :param kind: format of the parent class: 'bitset', 'tidset' or 'diffset'
+        :type kind: str
+        :param support: support of the prefix of the class
+        :type support: int
+        :param density: expected fraction of the transactions of the prefix that contain a candidate
+        :type density: float
+        :return: 'bitset', 'tidset' or 'diffset'
+        :rtype: str
+        """
+        costs = {'diffset': (1 - density) * support}
+        if kind != 'diffset':
+            costs['tidset'] = density * support
+        if kind == 'bitset':
+            costs['bitset'] = self._bytes / 8 * _WORD_COST
+        return min(costs, key=costs.get)
+
+    def _toTidset(self, bits) -> set:
+        """
+
+        :param bits: a bitset of transactions
+        :type bits: int
+        :return: the transactions of the bitset
+        :rtype: set
+        """
+        raw = _np.frombuffer(bits.to_bytes(self._bytes, 'little'), dtype=_np.uint8)
+        return set(_np.flatnonzero(_np.unpackbits(raw, bitorder='little')).tolist())
+
+    def _rootClass(self, tidLists, size):
+        """
+
+        Stores the frequent items in the format chosen for the whole database
+
+        :param tidLists: the transactions of every frequent item
+        :type tidLists: list
+        :param size: number of transactions
+        :type size: int
+        :return: the format and the tidsets, diffsets or bitsets of the items
+        :rtype: tuple
+        """
+        supports = [len(tids) for tids in tidLists]
+        kind = self._choose('bitset', size, sum(supports) / max(1, len(supports) * size))
+        if kind == 'bitset':
+            rows = _ab._packedBitset.pack(tidLists, size)
+            return kind, [int.from_bytes(row.astype('<u8').tobytes(), 'little') for row in rows]
+        if kind == 'tidset':
+            return kind, [set(tids) for tids in tidLists]
+        everything = set(range(size))
+        return kind, [everything.difference(tids) for tids in tidLists]
+
+    def _mineClasses(self, cands, kind, data, supports, size):
+        """
+
+        Extends the equivalence classes depth first from an explicit stack of [format, prefix support, candidates,
+        tidsets/diffsets/bitsets, supports, next index] frames.
+
+        :param cands: candidates of the root class
+        :type cands: list
+        :param kind: format of the root class
+        :type kind: str
+        :param data: tidsets, diffsets or bitsets of the root candidates
+        :type data: list
+        :param supports: supports of the root candidates
+        :type supports: list
+        :param size: number of transactions
+        :type size: int
+        :return: None
+        """
+        self._profiler.count(kind + 'Classes')
+        stack = [[kind, size, cands, data, supports, 0]]
+        while stack:
+            frame = stack[-1]
+            kind, prefixSupport, cands, data, supports, i = frame
+            if i == len(cands):
+                stack.pop()
+                continue
+            frame[5] = i + 1
+            rest = len(cands) - i - 1
+            x, support = data[i], supports[i]
+            child = self._choose(kind, support, sum(supports[i + 1:]) / max(1, rest * prefixSupport))
+            newCands, newData, newSupports = [], [], []
+            for j in range(i + 1, len(cands)):
+                y = data[j]
+                if kind == 'bitset':
+                    both = x & y
+                    count = both.bit_count()
+                elif kind == 'diffset':
+                    both = y - x
+                    count = support - len(both)
+                elif child == 'tidset':
+                    both = x & y
+                    count = len(both)
+                else:
+                    both = x - y
+                    count = support - len(both)
+                if count >= self._minSup:
+                    if kind == 'bitset' and child != 'bitset':
+                        both = self._toTidset(both if child == 'tidset' else x & ~y)
+                    newCand = cands[i] + (cands[j][-1],)
+                    newCands.append(newCand)
+                    newData.append(both)
+                    newSupports.append(count)
+                    self._finalPatterns[newCand] = count
+            self._profiler.count('candidates', rest)
+            self._profiler.count('pruned', rest - len(newCands))
+            if len(newCands) > 1:
+                self._profiler.count(child + 'Classes')
+                stack.append([child, support, newCands, newData, newSupports, 0])
+
+    def mine(self) -> None:
+        """
+        Frequent pattern mining process will start from here
+        """
+
+        self._startTime = _ab._time.time()
+        self._finalPatterns = self._openSink()
+        self._profiler.start()
+        if self._iFile is None:
+            raise Exception("Please enter the file path or file name:")
+        if self._minSup is None:
+            raise Exception("Please enter the Minimum Support")
+        self._profiler.phase('read')
+        self._creatingItemSets()
+
+        self._minSup = self._sweepMinSup(self._convert)
+        self._profiler.phase('firstScan')
+
+        # ids are ranked by support, so descending ids visit the items in ascending order of support
+        index = len(self._Database)
+        tidLists = self._storeTidLists()
+        if tidLists is None:
+            items = {}
+            for tid, line in enumerate(self._Database):
+                for item in line:
+                    if item not in items:
+                        items[item] = []
+                    items[item].append(tid)
+            self._codec = _ab._ItemCodec({k: len(set(v)) for k, v in items.items()}, self._minSup)
+            tidLists = [items[item] for item in self._codec.items]
+            del items
+        self._bytes = -(-index // 64) * 8
+        keys = list(reversed(range(len(self._codec))))
+        kind, data = self._rootClass([tidLists[k] for k in keys], index)
+        del tidLists
+        self._profiler.phase('mine')
+        cands = [tuple([k]) for k in keys]
+        supports = [self._codec.supports[k] for k in keys]
+        for cand, support in zip(cands, supports):
+            self._finalPatterns[cand] = support
+
+        self._mineClasses(cands, kind, data, supports, index)
+
+        self._profiler.phase('output')
+        self._closeSink()
+        self._profiler.stop()
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Frequent patterns were generated successfully using ECLAT Hybrid algorithm")
+
+    def getMemoryUSS(self) -> float:
+        """
+
+        Total amount of USS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning USS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryUSS
+
+    def getMemoryRSS(self) -> float:
+        """
+
+        Total amount of RSS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning RSS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryRSS
+
+    def getRuntime(self) -> float:
+        """
+        Calculating the total amount of runtime taken by the mining process
+
+        :return: returning total amount of runtime taken by the mining process
+        :rtype: float
+        """
+
+        return self._endTime - self._startTime
+
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
+        """
+
+        Storing final frequent patterns in a dataframe
+
+        :return: returning frequent patterns in a dataframe
+        :rtype: pd.DataFrame
+        """
+
+        return _ab._pd.DataFrame([[" ".join(x), y] for x, y in self._decodedPatterns().items()], columns=['Patterns', 'Support'])
+
+    def save(self, outFile: str, seperator = "\t" ) -> None:
+        """
+
+        Complete set of frequent patterns will be loaded in to an output file
+
+        :param outFile: name of the output file
+        :type outFile: csvfile
+        :return: None
+        """
+        if self._patternsStreamed():
+            # the sink already wrote the patterns while mining
+            return
+        self._profiler.phase('save')
+        with open(outFile, 'w') as f:
+            for x, y in self._decodedPatterns().items():
+                x = seperator.join(x)
+                f.write(f"{x}:{y}\n")
+        self._profiler.stop()
+
+    def getPatterns(self) -> dict:
+        """
+        Function to send the set of frequent patterns after completion of the mining process
+
+        :return: returning frequent patterns
+        :rtype: dict
+        """
+        return self._decodedPatterns()
+
+    def printResults(self) -> None:
+        """
+        Function used to print the results
+        """
+        print("Total number of Frequent Patterns:", len(self._finalPatterns))
+        print("Total Memory in USS:", self.getMemoryUSS())
+        print("Total Memory in RSS", self.getMemoryRSS())
+        print("Total ExecutionTime in ms:",  self.getRuntime())
+
+
+if __name__ == "__main__":
+    _ap = str()
+    if len(_ab._sys.argv) == 4 or len(_ab._sys.argv) == 5:
+        if len(_ab._sys.argv) == 5:
+            _ap = ECLATHybrid(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
+        if len(_ab._sys.argv) == 4:
+            _ap = ECLATHybrid(_ab._sys.argv[1], _ab._sys.argv[3])
+        _ap.mine()
+        print("Total number of Frequent Patterns:", len(_ap.getPatterns()))
+        _ap.save(_ab._sys.argv[2])
+        print(_ap.getPatternsAsDataFrame())
+        print("Total Memory in USS:",  _ap.getMemoryUSS())
+        print("Total Memory in RSS", _ap.getMemoryRSS())
+        print("Total ExecutionTime in ms:", _ap.getRuntime())
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
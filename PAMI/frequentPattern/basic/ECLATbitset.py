@@ -52,7 +52,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.frequentPattern.basic import abstract as _ab
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class ECLATbitset(_ab._frequentPatterns):
@@ -68,6 +68,7 @@ class ECLATbitset(_ab._frequentPatterns):
                         - **oFile** (*str*) -- *Name of the output file to store complete set of frequent patterns*
                         - **minSup** (*int or float or str*) -- *The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count.*
                         - **sep** (*str*) -- *This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.*
+                        - **engine** (*str*) -- *'int' (default) stores every tidset in one Python integer and intersects the candidates pairwise. 'numpy' packs the tidsets into rows of uint64 words and intersects and counts all the candidates of an equivalence class in one vectorized AND and popcount, skipping the blocks of words where the prefix has no transaction.*
 
     :**Attributes**:    - **startTime** (*float*) -- *To record the start time of the mining process.*
                         - **endTime** (*float*) -- *To record the end time of the mining process.*
@@ -133,6 +134,7 @@ class ECLATbitset(_ab._frequentPatterns):
 
     """
 
+    _downwardClosed = True
     _startTime = float()
     _endTime = float()
     _finalPatterns = {}
@@ -145,6 +147,13 @@ class ECLATbitset(_ab._frequentPatterns):
     _Database = []
     _mapSupport = {}
     _lno = 0
+    _bitSets = []
+
+    def __init__(self, iFile, minSup, sep='\t', engine='int') -> None:
+        super().__init__(iFile, minSup, sep)
+        if engine not in ('int', 'numpy'):
+            raise ValueError("engine should be 'int' or 'numpy'")
+        self._engine = engine
 
     def _convert(self, value):
         """
@@ -174,7 +183,7 @@ class ECLATbitset(_ab._frequentPatterns):
         """
         self._Database = []
         self._mapSupport = {}
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -185,7 +194,9 @@ class ECLATbitset(_ab._frequentPatterns):
                 print("The column name should be Transactions and each line should be separated by tab space or a seperator specified by the user")
 
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._TransactionStore.isStore(self._iFile):
+                self._Database = _ab._TransactionStore(self._iFile)
+            elif _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -203,7 +214,7 @@ class ECLATbitset(_ab._frequentPatterns):
                             self._Database.append(splitter)
                 except IOError:
                     print("File Not Found")
-        self._minSup = self._convert(self._minSup)
+        self._minSup = self._sweepMinSup(self._convert)
 
     @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
     def startMine(self):
@@ -234,7 +245,8 @@ class ECLATbitset(_ab._frequentPatterns):
     def __recursive(self, items, cands, memorySaver):
         """
 
-        This function generates new candidates by taking input as original candidates.
+        This function generates new candidates by taking input as original candidates. The equivalence classes are
+        extended depth first from an explicit stack of [candidates, next index] frames instead of recursive calls.
 
         :param items: A dictionary containing items and their corresponding support values.
         :type items: dict
@@ -243,23 +255,26 @@ class ECLATbitset(_ab._frequentPatterns):
         :return: None
         """
 
-        if memorySaver:
-            for i in range(len(cands)):
-                newCands = []
+        stack = [[cands, 0]]
+        while stack:
+            frame = stack[-1]
+            cands, i = frame
+            if i == len(cands):
+                stack.pop()
+                continue
+            frame[1] = i + 1
+            newCands = []
+            if memorySaver:
                 for j in range(i + 1, len(cands)):
                     newCand = tuple(cands[i] + tuple([cands[j][-1]]))
-                    intersection = items[tuple([newCand[0]])]
+                    intersection = self._bitSets[newCand[0]]
                     for k in newCand[1:]:
-                        intersection &= items[tuple([k])]
+                        intersection &= self._bitSets[k]
                     count = int.bit_count(intersection)
                     if count >= self._minSup:
                         newCands.append(newCand)
                         self._finalPatterns[newCand] = count
-                if len(newCands) > 1:
-                    self.__recursive(items, newCands, memorySaver)
-        else:
-            for i in range(len(cands)):
-                newCands = []
+            else:
                 for j in range(i + 1, len(cands)):
                     newCand = tuple(cands[i] + tuple([cands[j][-1]]))
                     intersection = items[cands[i]] & items[cands[j]]
@@ -268,8 +283,41 @@ class ECLATbitset(_ab._frequentPatterns):
                         newCands.append(newCand)
                         self._finalPatterns[newCand] = count
                         items[newCand] = intersection
-                if len(newCands) > 1:
-                    self.__recursive(items, newCands, memorySaver)
+            self._profiler.count('candidates', len(cands) - i - 1)
+            self._profiler.count('pruned', len(cands) - i - 1 - len(newCands))
+            if len(newCands) > 1:
+                stack.append([newCands, 0])
+
+    def _mineClasses(self, cands):
+        """
+
+        Vectorized equivalence class traversal of the numpy engine. Every frame of the stack holds the candidates of an
+        equivalence class and their tidsets as a matrix of uint64 words; the tidsets of a sub-class only keep the
+        blocks of words where its prefix has a transaction.
+
+        :param cands: the frequent items, whose tidsets are the rows of self._bitSets
+        :type cands: list
+        :return: None
+        """
+        stack = [[cands, self._bitSets, 0]]
+        while stack:
+            frame = stack[-1]
+            cands, rows, i = frame
+            if i == len(cands):
+                stack.pop()
+                continue
+            frame[2] = i + 1
+            words, intersections, counts = _ab._packedBitset.intersect(rows[i], rows[i + 1:])
+            keep = (counts >= self._minSup).nonzero()[0]
+            newCands = []
+            for j in keep.tolist():
+                newCand = cands[i] + (cands[i + 1 + j][-1],)
+                newCands.append(newCand)
+                self._finalPatterns[newCand] = int(counts[j])
+            self._profiler.count('candidates', len(cands) - i - 1)
+            self._profiler.count('pruned', len(cands) - i - 1 - len(newCands))
+            if len(newCands) > 1:
+                stack.append([newCands, intersections[keep], 0])
 
     def mine(self, memorySaver = True) -> None:
         """
@@ -277,36 +325,50 @@ class ECLATbitset(_ab._frequentPatterns):
         # Bitset implementation
         """
         self._startTime = _ab._time.time()
+        self._finalPatterns = self._openSink()
+        self._profiler.start()
+        self._profiler.phase('read')
 
         self._Database = []
 
         self._creatingItemSets()
 
+        self._profiler.phase('firstScan')
+        # ids are ranked by support in descending order
+        index = len(self._Database)
+        tidLists = self._storeTidLists()
+        if tidLists is None:
+            items = {}
+            for tid, line in enumerate(self._Database):
+                for item in line:
+                    if item in items:
+                        items[item].append(tid)
+                    else:
+                        items[item] = [tid]
+            self._codec = _ab._ItemCodec({k: len(set(v)) for k, v in items.items()}, self._minSup)
+            tidLists = [items[item] for item in self._codec.items]
+            del items
+        if self._engine == 'numpy':
+            self._bitSets = _ab._packedBitset.pack(tidLists, index)
+        else:
+            self._bitSets = [self._bitPacker(tids, index) for tids in tidLists]
+        del tidLists
+        self._profiler.phase('mine')
         items = {}
-        index = 0
-        for line in self._Database:
-            for item in line:
-                if tuple([item]) in items:
-                    items[tuple([item])].append(index)
-                else:
-                    items[tuple([item])] = [index]
-            index += 1
-
-        # sort by length in descending order
-        items = dict(sorted(items.items(), key=lambda x: len(x[1]), reverse=True))
         cands = []
-        for key in list(items.keys()):
-            if len(items[key]) >= self._minSup:
-                self._finalPatterns["\t".join(key)] = len(items[key])
-                cands.append(key)
-                items[key] = self._bitPacker(items[key], index)
-            else:
-                break
-
-
-        self.__recursive(items, cands, memorySaver)
+        for key in range(len(self._codec)):
+            self._finalPatterns[tuple([key])] = self._codec.supports[key]
+            cands.append(tuple([key]))
+            items[tuple([key])] = self._bitSets[key]
+        if self._engine == 'numpy':
+            self._mineClasses(cands)
+        else:
+            self.__recursive(items, cands, memorySaver)
         
 
+        self._profiler.phase('output')
+        self._closeSink()
+        self._profiler.stop()
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -363,7 +425,7 @@ class ECLATbitset(_ab._frequentPatterns):
         #     data.append([a.replace('\t', ' '), b])
         #     dataFrame = _ab._pd.DataFrame(data, columns=['Patterns', 'Support'])
 
-        dataFrame = _ab._pd.DataFrame(list([[x.replace("\t", " "), y] for x,y in self._finalPatterns.items()]), columns=['Patterns', 'Support'])
+        dataFrame = _ab._pd.DataFrame(list([[" ".join(x), y] for x,y in self._decodedPatterns().items()]), columns=['Patterns', 'Support'])
         return dataFrame
 
     def save(self, outFile: str, seperator = "\t" ) -> None:
@@ -375,6 +437,10 @@ class ECLATbitset(_ab._frequentPatterns):
         :type outFile: csvfile
         :return: None
         """
+        if self._patternsStreamed():
+            # the sink already wrote the patterns while mining
+            return
+        self._profiler.phase('save')
 
         # self._oFile = outFile
         # writer = open(self._oFile, 'w+')
@@ -382,9 +448,10 @@ class ECLATbitset(_ab._frequentPatterns):
         #     patternsAndSupport = x.strip() + ":" + str(y[0])
         #     writer.write("%s \n" % patternsAndSupport)
         with open(outFile, 'w') as f:
-            for x, y in self._finalPatterns.items():
+            for x, y in self._decodedPatterns().items():
                 x = seperator.join(x)
                 f.write(f"{x}:{y}\n")
+        self._profiler.stop()
 
     def getPatterns(self):
         """
@@ -394,13 +461,13 @@ class ECLATbitset(_ab._frequentPatterns):
         :return: returning frequent patterns
         :rtype: dict
         """
-        return self._finalPatterns
+        return self._decodedPatterns()
 
     def printResults(self):
         """
         This function is used to print the result
         """
-        print("Total number of Frequent Patterns:", len(self.getPatterns()))
+        print("Total number of Frequent Patterns:", len(self._finalPatterns))
         print("Total Memory in USS:", self.getMemoryUSS())
         print("Total Memory in RSS", self.getMemoryRSS())
         print("Total ExecutionTime in ms:", self.getRuntime())
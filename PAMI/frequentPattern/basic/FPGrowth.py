@@ -53,12 +53,38 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.frequentPattern.basic import abstract as _fp
 from typing import List, Dict, Tuple, Any
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 from itertools import combinations
 from collections import Counter
 
 _minSup = str()
-_fp._sys.setrecursionlimit(20000)
+
+#: FP-tree and minSup of a worker process of FPGrowth(..., workers=N), set by _initWorker
+_workerTree = None
+_workerMinSup = None
+
+
+def _initWorker(tree, minSup) -> None:
+    """
+    Initializer of the worker processes: keeps the global FP-tree, which is shipped once per worker
+    """
+    global _workerTree, _workerMinSup
+    _workerTree, _workerMinSup = tree, minSup
+
+
+def _mineWorkerItem(item) -> Tuple[List[Tuple[Tuple[int, ...], int]], Dict[str, int]]:
+    """
+    Mines the patterns of an item of the global header table in a worker process
+
+    :param item: item id
+    :type item: int
+    :return: the patterns, keyed by item ids, and the profiler counters
+    :rtype: tuple
+    """
+    miner = FPGrowth.__new__(FPGrowth)
+    miner._finalPatterns, miner._profiler = {}, _fp._Profiler()
+    miner._mineTree(_workerTree, (), _workerMinSup, items=[item])
+    return list(miner._finalPatterns.items()), miner._profiler.counters
 
 
 class _Node:
@@ -126,15 +152,21 @@ class FPGrowth(_fp._frequentPatterns):
                         - **oFile** (*str*) -- *Name of the output file to store complete set of frequent patterns.*
                         - **minSup** (*int or float or str*) -- *The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.*
                         - **sep** (*str*) -- *This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.*
+                        - **engine** (*str*) -- *'array' (default) stores the FP-tree and the conditional trees in an ArrayFPTree of parallel arrays and extracts conditional pattern bases by walking parent indices. 'node' uses one _Node object per tree node.*
+                        - **workers** (*int*) -- *Number of processes that mine the items of the global header table. The FP-tree is built once and shipped to every worker, and the items with the largest conditional pattern bases are handed out first. None uses every CPU. The default is 1, i.e. mining in the calling process.*
+                        - **incremental** (*bool*) -- *Keep the mined state so that update() can append transactions. The FP-tree then holds every item in a canonical order that new transactions do not change, and only the patterns with an item of the new transactions are mined again. Needs the array engine and a single worker. The default is False.*
 
     :**Attributes**:    - **startTime** (*float*) -- *To record the start time of the mining process.*
                         - **endTime** (*float*) -- *To record the completion time of the mining process.*
                         - **finalPatterns** (*dict*) -- *Storing the complete set of patterns in a dictionary variable.*
                         - **memoryUSS** (*float*) -- *To store the total amount of USS memory consumed by the program.*
                         - **memoryRSS** (*float*) -- *To store the total amount of RSS memory consumed by the program.*
-                        - **Database** (*list*) -- *To store the transactions of a database in list.*
+                        - **lno** (*int*) -- *To store the number of transactions in the database.*
+                        - **chunkSize** (*int*) -- *Number of transactions read at a time. The database is streamed twice (item counting and tree construction) instead of being held in memory.*
                         - **mapSupport** (*Dictionary*) -- *To maintain the information of item and their frequency.*
                         - **tree** (*class*) --  *it represents the Tree class.*
+                        - **codec** (*ItemCodec*) -- *Maps the frequent items to integer ids ranked by support. The tree and finalPatterns are keyed by these ids and decoded in getPatterns(), save() and getPatternsAsDataFrame().*
+                        - **tree** (*ArrayFPTree*) -- *The canonical FP-tree of every item kept by the incremental mode, None otherwise.*
 
 
     **Execution methods**
@@ -153,6 +185,12 @@ class FPGrowth(_fp._frequentPatterns):
 
     .. note:: minSup can be specified  in support count or a value between 0 and 1.
 
+    .. note:: minSup can also be a list of thresholds, e.g. [0.01, 0.02, 0.05]. The database is then read and mined once
+              at the lowest threshold, and getSweepPatterns() returns the patterns of every threshold.
+
+    .. note:: FPGrowth(iFile, minSup, incremental=True) keeps its FP-tree after mine(), and obj.update(newTransactions)
+              appends transactions to the database and brings getPatterns() up to date without a full re-mine.
+
 
     **Calling from a python program**
 
@@ -195,6 +233,7 @@ class FPGrowth(_fp._frequentPatterns):
 
     """
 
+    _downwardClosed = True
     __startTime = float()
     __endTime = float()
     _minSup = str()
@@ -204,52 +243,27 @@ class FPGrowth(_fp._frequentPatterns):
     _sep = " "
     __memoryUSS = float()
     __memoryRSS = float()
-    __Database = []
     __mapSupport = {}
     __lno = 0
+    _chunkSize = 10000
     __rank = {}
     __rankDup = {}
 
-    def __init__(self, iFile, minSup, sep='\t') -> None:
+    def __init__(self, iFile, minSup, sep='\t', engine='array', workers=1, incremental=False) -> None:
         super().__init__(iFile, minSup, sep)
-
-    def __creatingItemSets(self) -> None:
-        """
-        Storing the complete transactions of the database/input file in a database variable
-        """
-        self.__Database = []
-        if isinstance(self._iFile, _fp._pd.DataFrame):
-            if self._iFile.empty:
-                print("its empty..")
-            i = self._iFile.columns.values.tolist()
-            if 'Transactions' in i:
-                self.__Database = self._iFile['Transactions'].tolist()
-                self.__Database = [x.split(self._sep) for x in self.__Database]
-            else:
-                print("The column name should be Transactions and each line should be separated by tab space or a seperator specified by the user")
-                
-
-            #print(self.Database)
-        if isinstance(self._iFile, str):
-            if _fp._validators.url(self._iFile):
-                data = _fp._urlopen(self._iFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    self.__Database.append(temp)
-            else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line.strip()
-                            temp = [i.rstrip() for i in line.split(self._sep)]
-                            temp = [x for x in temp if x]
-                            self.__Database.append(temp)
-                except IOError:
-                    print("File Not Found")
-                    quit()
+        if engine not in ('array', 'node'):
+            raise ValueError("engine should be 'array' or 'node'")
+        if workers is None:
+            workers = _fp._os.cpu_count() or 1
+        if workers < 1 or (workers > 1 and engine != 'array'):
+            raise ValueError("workers should be at least 1, and more than 1 worker needs the array engine")
+        if incremental and (engine != 'array' or workers > 1):
+            raise ValueError("the incremental mode needs the array engine and a single worker")
+        self._engine = engine
+        self._workers = workers
+        self._incremental = incremental
+        self._givenMinSup = minSup
+        self._tree = None
 
     def __convert(self, value) -> float:
         """
@@ -263,11 +277,11 @@ class FPGrowth(_fp._frequentPatterns):
         if type(value) is int:
             value = int(value)
         if type(value) is float:
-            value = (len(self.__Database) * value)
+            value = (self.__lno * value)
         if type(value) is str:
             if '.' in value:
                 value = float(value)
-                value = (len(self.__Database) * value)
+                value = (self.__lno * value)
             else:
                 value = int(value)
         return value
@@ -276,24 +290,23 @@ class FPGrowth(_fp._frequentPatterns):
         """
         Constructs the FP-tree from the given transactions.
 
-        :param items: A dictionary containing item frequencies.
-        :type items: Dict
-        :param data: A list of transactions.
-        :type data: List
+        :param items: The support of every item id, indexed by id.
+        :type items: List
+        :param data: An iterable of transactions encoded with ItemCodec.encode(), i.e. item ids in ascending order. It is consumed once, so the database can be streamed.
+        :type data: Iterable
         :param minSup: The minimum support threshold.
         :type minSup: int
         :return: The root node of the constructed FP-tree and a dictionary containing information about nodes associated with each item.
         :rtype: Tuple[_Node, Dict]
         """
 
-        items = {k: v for k, v in items.items() if v >= minSup}
-
         root = _Node([], 0, None)
         itemNodes = {}
         for line in data:
             currNode = root
-            line = sorted([item for item in line if item in items], key = lambda x: items[x], reverse = True)
             for item in line:
+                if items[item] < minSup:
+                    continue
                 currNode = currNode.addChild(item)
                 if item in itemNodes:
                     itemNodes[item][0].add(currNode)
@@ -322,7 +335,9 @@ class FPGrowth(_fp._frequentPatterns):
     def _recursive(self, root, itemNode, minSup, patterns):
         """
 
-         Recursively explores the FP-tree to generate frequent patterns.
+         Explores the FP-tree to generate frequent patterns. The conditional trees are mined depth first from an
+         explicit stack of (root, itemNode, remaining items) frames, so the depth of the patterns is not bounded by the
+         recursion limit of Python.
 
          :param root: The root node of the current subtree.
          :type root: _Node
@@ -333,72 +348,317 @@ class FPGrowth(_fp._frequentPatterns):
          :param patterns: A dictionary to store the generated frequent patterns.
          :type patterns: Dict
         """
-        itemNode = {k: v for k, v in sorted(itemNode.items(), key = lambda x: x[1][1])}
+        stack = [(root, itemNode, iter(sorted(itemNode, key=lambda x: itemNode[x][1])))]
+        while stack:
+            root, itemNode, items = stack[-1]
+            for item in items:
+                if itemNode[item][1] < self._minSup:
+                    stack.pop()
+                    break
+
+                newRoot = _Node(root.item + [item], 0, None)
+                # pat = "\t".join([str(i) for i in newRoot.item])
+                # self.__finalPatterns[pat] = itemNode[item][1]
+                self._finalPatterns[tuple(newRoot.item)] = itemNode[item][1]
+                newItemNode = {}
+
+                if len(itemNode[item][0]) == 1:
+                    transaction, count = itemNode[item][0].pop().traverse()
+                    if len(transaction) == 0:
+                        continue
+                    combination = self._all_combinations(transaction)
+                    for comb in combination:
+                        # pat = "\t".join([str(i) for i in comb])
+                        # pat = pat + "\t" + "\t".join([str(i) for i in newRoot.item])
+                        # self.__finalPatterns[pat] = count
+                        self._finalPatterns[tuple(list(comb) + newRoot.item)] = count
+                    pass
+
+
+                itemCount = {}
+                transactions = {}
+                for node in itemNode[item][0]:
+                    transaction, count = node.traverse()
+                    if len(transaction) == 0:
+                        continue
+                    if tuple(transaction) in transactions:
+                        transactions[tuple(transaction)] += count
+                    else:
+                        transactions[tuple(transaction)] = count
+
 
-        for item in itemNode:
-            if itemNode[item][1] < self._minSup:
-                break 
+                    for item in transaction:
+                        if item in itemCount:
+                            itemCount[item] += count
+                        else:
+                            itemCount[item] = count
 
-            newRoot = _Node(root.item + [item], 0, None)
-            # pat = "\t".join([str(i) for i in newRoot.item])
-            # self.__finalPatterns[pat] = itemNode[item][1]
-            self._finalPatterns[tuple(newRoot.item)] = itemNode[item][1]
-            newItemNode = {}
 
-            if len(itemNode[item][0]) == 1:
-                transaction, count = itemNode[item][0].pop().traverse()
-                if len(transaction) == 0:
+                # remove items that are below minSup
+                candidates = len(itemCount)
+                itemCount = {k: v for k, v in itemCount.items() if v >= minSup}
+                self._profiler.count('candidates', candidates)
+                self._profiler.count('pruned', candidates - len(itemCount))
+                if len(itemCount) == 0:
                     continue
-                combination = self._all_combinations(transaction)
-                for comb in combination:
-                    # pat = "\t".join([str(i) for i in comb])
-                    # pat = pat + "\t" + "\t".join([str(i) for i in newRoot.item])
-                    # self.__finalPatterns[pat] = count
-                    self._finalPatterns[tuple(list(comb) + newRoot.item)] = count
-                pass
-
-
-            itemCount = {}
-            transactions = {}
-            for node in itemNode[item][0]:
-                transaction, count = node.traverse()
-                if len(transaction) == 0:
+
+                for transaction, count in transactions.items():
+                    transaction = sorted([item for item in transaction if item in itemCount], key = lambda x: (itemCount[x], x), reverse = True)
+                    currNode = newRoot
+                    for item in transaction:
+                        currNode = currNode.addChild(item, count)
+                        if item in newItemNode:
+                            newItemNode[item][0].add(currNode)
+                            newItemNode[item][1] += count
+                        else:
+                            newItemNode[item] = [set([currNode]), count]
+
+                if len(newItemNode) < 1:
                     continue
-                if tuple(transaction) in transactions:
-                    transactions[tuple(transaction)] += count
-                else:
-                    transactions[tuple(transaction)] = count
 
+                # mine(newRoot, newItemNode, minSup, patterns)
+                self._profiler.count('conditionalTrees')
+                stack.append((newRoot, newItemNode, iter(sorted(newItemNode, key=lambda x: newItemNode[x][1]))))
+                break
+            else:
+                stack.pop()
 
-                for item in transaction:
-                    if item in itemCount:
-                        itemCount[item] += count
-                    else:
-                        itemCount[item] = count
-
-
-            # remove items that are below minSup
-            itemCount = {k: v for k, v in itemCount.items() if v >= minSup}
-            if len(itemCount) == 0:
-                continue
-
-            for transaction, count in transactions.items():
-                transaction = sorted([item for item in transaction if item in itemCount], key = lambda x: itemCount[x], reverse = True)
-                currNode = newRoot
-                for item in transaction:
-                    currNode = currNode.addChild(item, count)
-                    if item in newItemNode:
-                        newItemNode[item][0].add(currNode)
-                        newItemNode[item][1] += count
-                    else:
-                        newItemNode[item] = [set([currNode]), count]
 
-            if len(newItemNode) < 1:
-                continue
+    def _mineTree(self, tree, prefix, minSup, items=None):
+        """
+        Mines an ArrayFPTree whose items are all frequent. A tree that is a single path gives every combination of
+        its items directly; otherwise the conditional tree of every item is built and mined. The conditional trees
+        are mined depth first from an explicit stack of (tree, prefix, remaining items) frames instead of recursive
+        calls, so long patterns do not depend on the recursion limit.
 
-            # mine(newRoot, newItemNode, minSup, patterns)
-            self._recursive(newRoot, newItemNode, minSup, patterns)
+        :param tree: the FP-tree or a conditional FP-tree
+        :type tree: ArrayFPTree
+        :param prefix: the items the tree is conditioned on
+        :type prefix: tuple
+        :param minSup: The minimum support threshold.
+        :type minSup: int
+        :param items: the items of tree to mine, all of them by default
+        :type items: list
+        """
+        if items is None and self._minePath(tree, prefix):
+            return
+        stack = [(tree, prefix, iter(tree.support if items is None else items))]
+        while stack:
+            tree, prefix, items = stack[-1]
+            for item in items:
+                conditional = self._mineItem(tree, item, prefix, minSup)
+                if conditional is not None and not self._minePath(conditional, prefix + (item,)):
+                    stack.append((conditional, prefix + (item,), iter(conditional.support)))
+                    break
+            else:
+                stack.pop()
+
+    def _minePath(self, tree, prefix):
+        """
+        Stores every combination of the items of tree if it is a single path
+
+        :param tree: the FP-tree or a conditional FP-tree
+        :type tree: ArrayFPTree
+        :param prefix: the items the tree is conditioned on
+        :type prefix: tuple
+        :return: True if tree is a single path
+        :rtype: bool
+        """
+        path = tree.singlePath()
+        if path is None:
+            return False
+        for r in range(1, len(path) + 1):
+            for comb in combinations(range(len(path)), r):
+                self._finalPatterns[prefix + tuple([path[i][0] for i in comb])] = path[comb[-1]][1]
+        return True
 
+    def _mineItem(self, tree, item, prefix, minSup):
+        """
+        Stores the pattern prefix + (item,) and builds the conditional tree of item
+
+        :param tree: the FP-tree or a conditional FP-tree
+        :type tree: ArrayFPTree
+        :param item: an item of tree
+        :type item: int
+        :param prefix: the items the tree is conditioned on
+        :type prefix: tuple
+        :param minSup: The minimum support threshold.
+        :type minSup: int
+        :return: the conditional tree of item, or None if it has no frequent item
+        :rtype: ArrayFPTree
+        """
+        pattern = prefix + (item,)
+        self._finalPatterns[pattern] = tree.support[item]
+        conditional, candidates = tree.conditionalTree(item, minSup)
+        self._profiler.count('candidates', candidates)
+        self._profiler.count('pruned', candidates - (len(conditional.support) if conditional is not None else 0))
+        if conditional is not None:
+            self._profiler.count('conditionalTrees')
+        return conditional
+
+    def _mineParallel(self, tree, minSup):
+        """
+        Mines the items of the global header table in a pool of self._workers processes. Every worker receives the
+        FP-tree once. The items are submitted by decreasing size of their conditional pattern base, i.e. the sum of the
+        depths of their nodes, so the heaviest items are handed out first, and the patterns of every item are merged
+        into finalPatterns as soon as its worker is done.
+
+        :param tree: the global FP-tree
+        :type tree: ArrayFPTree
+        :param minSup: The minimum support threshold.
+        :type minSup: int
+        """
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        if tree.singlePath() is not None:
+            self._mineTree(tree, (), minSup)
+            return
+        parent, depth = tree.parent, [0] * (len(tree) + 1)
+        for node in range(1, len(tree) + 1):
+            depth[node] = depth[parent[node]] + 1
+        cost = {item: sum([depth[node] for node in tree.nodes(item)]) for item in tree.support}
+        items = sorted(tree.support, key=lambda item: cost[item], reverse=True)
+        with ProcessPoolExecutor(min(self._workers, len(items)), initializer=_initWorker, initargs=(tree, minSup)) as executor:
+            futures = [executor.submit(_mineWorkerItem, item) for item in items]
+            for future in as_completed(futures):
+                patterns, counters = future.result()
+                for pattern, support in patterns:
+                    self._finalPatterns[pattern] = support
+                for name, n in counters.items():
+                    self._profiler.count(name, n)
+
+    def _countCanonical(self, tree, candidates):
+        """
+        Counts itemsets in a canonical tree, whose transactions were inserted by ascending item id. The ancestors of a
+        node of item x then hold every smaller item of its transactions, so the prefix paths of the last item of a
+        candidate are all the transactions that may contain it. The candidates are grouped by their last item, their
+        other items are stored in a prefix tree, and for every prefix path only the branches of the prefix tree whose
+        items are on the path are walked.
+
+        :param tree: a canonical FP-tree
+        :type tree: ArrayFPTree
+        :param candidates: itemsets of at least two items, as tuples of increasing item ids
+        :type candidates: list
+        :return: the support of every candidate
+        :rtype: dict
+        """
+        groups = {}
+        for candidate in candidates:
+            groups.setdefault(candidate[-1], []).append(candidate)
+        supports = dict.fromkeys(candidates, 0)
+        for last, group in groups.items():
+            trie = {}
+            for candidate in group:
+                node = None
+                children = trie
+                for item in candidate[:-1]:
+                    node = children.get(item)
+                    if node is None:
+                        node = children[item] = [None, {}]
+                    children = node[1]
+                node[0] = candidate
+            for path, count in tree.prefixPaths(last):
+                path = set(path)
+                stack = [trie]
+                while stack:
+                    for item, node in stack.pop().items():
+                        if item not in path:
+                            continue
+                        if node[0] is not None:
+                            supports[node[0]] += count
+                        if node[1]:
+                            stack.append(node[1])
+        return supports
+
+    def update(self, newTransactions) -> None:
+        """
+        Appends transactions to the database of an incremental FPGrowth and brings the patterns up to date, following
+        FUP. The new transactions are inserted into the canonical tree, whose item order never changes, and into a
+        small canonical tree of their own. The patterns are then rebuilt level by level from the frequent patterns of
+        the previous level, joined as in Apriori. A candidate without any item of the new transactions keeps its
+        previous support. A previously frequent candidate adds its support in the new transactions. The support of any
+        other candidate was below the previous minSup, so it is only counted in the whole canonical tree if its
+        support in the new transactions can lift it to minSup. The patterns stay exactly those of a full re-mine.
+
+        :param newTransactions: the new transactions, as a list of lists of items or as a file, URL or DataFrame in
+                                the format of iFile
+        :type newTransactions: list or str or pd.DataFrame
+        """
+        if self._tree is None:
+            raise Exception("Please mine() an FPGrowth(..., incremental=True) before calling update()")
+        if self._patternsStreamed():
+            raise Exception("update() needs the patterns in memory, but they were written to a sink")
+        self.__startTime = _fp._time.time()
+        self._profiler.start()
+        self._profiler.phase('build')
+        codec, tree, increment = self._codec, self._tree, _fp._ArrayFPTree()
+        supports = codec.supports
+        if isinstance(newTransactions, list):
+            chunks = [newTransactions]
+        else:
+            chunks = _fp._readChunks(newTransactions, self._sep, self._chunkSize)
+        for chunk in chunks:
+            self.__lno += len(chunk)
+            self._profiler.count('newTransactions', len(chunk))
+            for line in chunk:
+                for item in line:
+                    codec.add(item)
+                line = codec.encode(line)
+                for item in line:
+                    supports[item] += 1
+                tree.insert(line)
+                increment.insert(line)
+        affected = set(increment.support)
+        self._profiler.count('affectedItems', len(affected))
+        previousMinSup = self._minSup
+        self._minSup = self._givenMinSup
+        self._minSup = minSup = self._sweepMinSup(self.__convert)
+
+        self._profiler.phase('mine')
+        previous = {tuple(sorted(pattern)): support for pattern, support in self._finalPatterns.items()}
+        patterns = _fp._PatternTrie()
+        level = sorted([(item,) for item, support in tree.support.items() if support >= minSup])
+        for pattern in level:
+            patterns[pattern] = tree.support[pattern[0]]
+        while level:
+            frequent = set(level)
+            candidates = []
+            start = 0
+            while start < len(level):
+                prefix = level[start][:-1]
+                end = start + 1
+                while end < len(level) and level[end][:-1] == prefix:
+                    end += 1
+                for i in range(start, end - 1):
+                    for j in range(i + 1, end):
+                        candidate = level[i] + level[j][-1:]
+                        if all(candidate[:m] + candidate[m + 1:] in frequent for m in range(len(candidate) - 2)):
+                            candidates.append(candidate)
+                start = end
+            self._profiler.count('candidates', len(candidates))
+            known, unknown = [], []
+            for candidate in candidates:
+                if affected.isdisjoint(candidate):
+                    if previous.get(candidate, 0) >= minSup:
+                        patterns[candidate] = previous[candidate]
+                        self._profiler.count('keptPatterns')
+                elif candidate in previous:
+                    known.append(candidate)
+                else:
+                    unknown.append(candidate)
+            counts = self._countCanonical(increment, known + unknown)
+            for candidate in known:
+                counts[candidate] += previous[candidate]
+            # a candidate that was not frequent had a support below previousMinSup
+            unknown = [candidate for candidate in unknown if counts.pop(candidate) + previousMinSup > minSup]
+            self._profiler.count('treeCounted', len(unknown))
+            counts.update(self._countCanonical(tree, unknown))
+            for candidate, support in counts.items():
+                if support >= minSup:
+                    patterns[candidate] = support
+            level = sorted([candidate for candidate in candidates if candidate in patterns])
+        self._finalPatterns = patterns
+        self._profiler.stop()
+        self.__endTime = _fp._time.time()
 
     def mine(self) -> None:
         """
@@ -406,22 +666,60 @@ class FPGrowth(_fp._frequentPatterns):
         """
         global _minSup
         self.__startTime = _fp._time.time()
+        self._finalPatterns = self._openSink()
+        self._profiler.start()
         if self._iFile is None:
             raise Exception("Please enter the file path or file name:")
         if self._minSup is None:
             raise Exception("Please enter the Minimum Support")
-        self.__creatingItemSets()
-        self._minSup = self.__convert(self._minSup)
+        self._profiler.phase('firstScan')
+        # a compiled store holds the supports of its items and is read at the level of its item ids
+        store = _fp._TransactionStore(self._iFile) if _fp._TransactionStore.isStore(self._iFile) else None
+        if store is not None:
+            self.__lno = len(store)
+        else:
+            itemCount = Counter()
+            self.__lno = 0
+            for chunk in _fp._readChunks(self._iFile, self._sep, self._chunkSize):
+                self.__lno += len(chunk)
+                for line in chunk:
+                    itemCount.update(line)
+        self._minSup = self._sweepMinSup(self.__convert)
         _minSup = self._minSup
 
-        itemCount = Counter()
-        for line in self.__Database:
-            itemCount.update(line)
-
-        root, itemNode = self._construct(itemCount, self.__Database, self._minSup)
-        self._recursive(root, itemNode, self._minSup, self.__finalPatterns)
+        self._profiler.phase('build')
+        if store is not None:
+            self._codec = store.getCodec(0 if self._incremental else self._minSup)
+            encoded = store.iterEncoded(self._codec, self._chunkSize)
+        else:
+            self._codec = _fp._ItemCodec(itemCount, 0 if self._incremental else self._minSup)
+            encoded = (self._codec.encode(line) for line in _fp._streamTransactions(self._iFile, self._sep, self._chunkSize))
+        if self._engine == 'array':
+            supports, minSup = self._codec.supports, self._minSup
+            tree = _fp._ArrayFPTree()
+            if self._incremental:
+                for line in encoded:
+                    tree.insert(line)
+                self._tree = tree
+                self._profiler.phase('mine')
+                self._mineTree(tree, (), minSup, sorted([item for item in tree.support if tree.support[item] >= minSup]))
+            else:
+                for line in encoded:
+                    tree.insert([item for item in line if supports[item] >= minSup])
+                self._profiler.phase('mine')
+                if self._workers > 1:
+                    self._mineParallel(tree, minSup)
+                else:
+                    self._mineTree(tree, (), minSup)
+        else:
+            root, itemNode = self._construct(self._codec.supports, encoded, self._minSup)
+            self._profiler.phase('mine')
+            self._recursive(root, itemNode, self._minSup, self._finalPatterns)
         
         print("Frequent patterns were generated successfully using frequentPatternGrowth algorithm")
+        self._profiler.phase('output')
+        self._closeSink()
+        self._profiler.stop()
         self.__endTime = _fp._time.time()
         self.__memoryUSS = float()
         self.__memoryRSS = float()
@@ -470,7 +768,7 @@ class FPGrowth(_fp._frequentPatterns):
         return self.__endTime - self.__startTime
     
 
-    def getPatternsAsDataFrame(self) -> _fp._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_fp._pd.DataFrame':
         """
 
         Storing final frequent patterns in a dataframe
@@ -485,7 +783,7 @@ class FPGrowth(_fp._frequentPatterns):
         # #     data.append([a.replace('\t', ' '), b])
         # #     dataframe = _fp._pd.DataFrame(data, columns=['Patterns', 'Support'])
         # dataFrame = _fp._pd.DataFrame(list(self._finalPatterns.items()), columns=['Patterns', 'Support'])
-        dataFrame = _fp._pd.DataFrame(list([[" ".join(x), y] for x,y in self._finalPatterns.items()]), columns=['Patterns', 'Support'])
+        dataFrame = _fp._pd.DataFrame(list([[" ".join(x), y] for x,y in self._decodedPatterns().items()]), columns=['Patterns', 'Support'])
 
         return dataFrame
 
@@ -498,10 +796,15 @@ class FPGrowth(_fp._frequentPatterns):
         :type outFile: csvfile
         :return: None
         """
+        if self._patternsStreamed():
+            # the sink already wrote the patterns while mining
+            return
+        self._profiler.phase('save')
         with open(outFile, 'w') as f:
-            for x, y in self._finalPatterns.items():
+            for x, y in self._decodedPatterns().items():
                 x = seperator.join(x)
                 f.write(f"{x}:{y}\n")
+        self._profiler.stop()
 
     def getPatterns(self) -> Dict[str, int]:
         """
@@ -511,13 +814,13 @@ class FPGrowth(_fp._frequentPatterns):
         :return: returning frequent patterns
         :rtype: dict
         """
-        return self._finalPatterns
+        return self._decodedPatterns()
     
     def printResults(self) -> None:
         """
         This function is used to print the results
         """
-        print("Total number of Frequent Patterns:", len(self.getPatterns()))
+        print("Total number of Frequent Patterns:", len(self._finalPatterns))
         print("Total Memory in USS:", self.getMemoryUSS())
         print("Total Memory in RSS", self.getMemoryRSS())
         print("Total ExecutionTime in ms:", self.getRuntime())
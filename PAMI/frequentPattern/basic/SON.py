@@ -0,0 +1,529 @@
+# SON discovers frequent patterns in a transactional database that does not fit in memory. The database is split into
+# partitions that do, every partition is mined at a proportionally scaled threshold with one of the frequent pattern
+# miners, and the union of the local patterns is counted in a second pass over the database.
+#
+# **Importing this algorithm into a python program**
+#
+#             import PAMI.frequentPattern.basic.SON as alg
+#
+#             iFile = 'sampleDB.txt'
+#
+#             minSup = 10  # can also be specified between 0 and 1
+#
+#             obj = alg.SON(iFile, minSup, miner='FPGrowth', partitionSize=100000, workers=4)
+#
+#             obj.mine()
+#
+#             frequentPatterns = obj.getPatterns()
+#
+#             print("Total number of Frequent Patterns:", len(frequentPatterns))
+#
+#             obj.save(oFile)
+#
+#             Df = obj.getPatternInDataFrame()
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from PAMI.frequentPattern.basic import abstract as _ab
+from PAMI.extras.lazyImport import deprecated
+from collections import Counter
+from typing import Dict, List, Tuple
+import contextlib as _contextlib
+import importlib as _importlib
+import io as _io
+import tempfile as _tempfile
+
+#: Candidate trie and item ids of a counting worker process of SON(..., workers=N), set by _initCounter
+_workerTrie = None
+_workerIds = None
+
+
+def _minePartition(miner, transactions, minSup, sep) -> List[Tuple[Tuple[str, ...], int]]:
+    """
+    Mines one partition with a frequent pattern miner. The partition is written to a temporary file, which every miner
+    accepts as input, and the miner's own messages are kept out of the output of SON.
+
+    :param miner: the miner class, e.g. FPGrowth
+    :type miner: type
+    :param transactions: the transactions of the partition
+    :type transactions: list
+    :param minSup: local minimum support count
+    :type minSup: int
+    :param sep: separator of the items
+    :type sep: str
+    :return: the patterns of the partition with their local supports
+    :rtype: list
+    """
+    with _tempfile.NamedTemporaryFile('w', suffix='.txt', encoding='utf-8', delete=False) as f:
+        f.write("\n".join(sep.join(transaction) for transaction in transactions))
+    try:
+        local = miner(f.name, minSup, sep)
+        with _contextlib.redirect_stdout(_io.StringIO()):
+            local.mine()
+        return list(local.getPatterns().items())
+    finally:
+        _ab._os.remove(f.name)
+
+
+def _buildTrie(candidates) -> Tuple[Dict, Dict[str, int]]:
+    """
+    Stores the candidates in a prefix tree. The items are given integer ids and every candidate is inserted with its
+    ids in ascending order. A node is a dictionary from the id of a child to [index of the candidate ending there or
+    -1, children].
+
+    :param candidates: the candidates
+    :type candidates: list
+    :return: the root of the trie and the ids of the items
+    :rtype: tuple
+    """
+    ids = {}
+    root = {}
+    for index, candidate in enumerate(candidates):
+        node = None
+        children = root
+        for item in sorted(ids.setdefault(item, len(ids)) for item in candidate):
+            node = children.get(item)
+            if node is None:
+                node = children[item] = [-1, {}]
+            children = node[1]
+        node[0] = index
+    return root, ids
+
+
+def _countChunk(trie, ids, chunk) -> Counter:
+    """
+    Counts the candidates contained in the transactions of a chunk. For every transaction, the trie is walked from an
+    explicit stack of (node, next position in the transaction) pairs, so only the candidates that share a prefix with
+    the transaction are visited.
+
+    :param trie: root of the candidate trie
+    :type trie: dict
+    :param ids: ids of the items
+    :type ids: dict
+    :param chunk: the transactions
+    :type chunk: list
+    :return: the number of transactions containing every candidate, keyed by candidate index
+    :rtype: Counter
+    """
+    counts = Counter()
+    for transaction in chunk:
+        items = sorted({ids[item] for item in transaction if item in ids})
+        stack = [(trie, 0)]
+        while stack:
+            children, start = stack.pop()
+            for position in range(start, len(items)):
+                node = children.get(items[position])
+                if node is None:
+                    continue
+                if node[0] >= 0:
+                    counts[node[0]] += 1
+                if node[1]:
+                    stack.append((node[1], position + 1))
+    return counts
+
+
+def _initCounter(trie, ids) -> None:
+    """
+    Initializer of the counting worker processes: keeps the candidate trie, which is shipped once per worker
+    """
+    global _workerTrie, _workerIds
+    _workerTrie, _workerIds = trie, ids
+
+
+def _countWorkerChunk(chunk) -> Counter:
+    return _countChunk(_workerTrie, _workerIds, chunk)
+
+
+class SON(_ab._frequentPatterns):
+    """
+    **About this algorithm**
+
+    :**Description**: SON is a two-pass driver around the in-memory frequent pattern miners. The first pass cuts the
+                      database into partitions of partitionSize transactions and mines each partition with the chosen
+                      miner at the threshold minSup * |partition| / |database|, rounded down. A pattern that is frequent
+                      in the whole database is frequent in at least one partition, so the union of the local patterns
+                      contains every frequent pattern. The second pass streams the database again and counts the
+                      candidates in a prefix tree, keeping those that reach minSup. The result is exact, and at any time
+                      only a partition, or the candidates and a chunk of transactions, are held in memory.
+
+                      With workers > 1, the partitions are mined and the chunks counted in a pool of processes. At most
+                      one partition per worker is in flight.
+
+    :**Reference**:  Ashok Savasere, Edward Omiecinski, Shamkant B. Navathe: An Efficient Algorithm for Mining Association
+                     Rules in Large Databases. VLDB 1995: 432-444
+
+    :**Parameters**:    - **iFile** (*str or URL or dataFrame*) -- *Name of the Input file to mine complete set of frequent patterns.*
+                        - **oFile** (*str*) -- *Name of the output file to store complete set of frequent patterns.*
+                        - **minSup** (*int or float or str*) -- *The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.*
+                        - **sep** (*str*) -- *This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.*
+                        - **miner** (*str or class*) -- *The miner of the partitions, a class or the name of a module of PAMI.frequentPattern.basic such as 'FPGrowth' (default), 'ECLAT' or 'Apriori'.*
+                        - **partitionSize** (*int*) -- *Number of transactions of a partition. It bounds the memory used by the miner of a partition.*
+                        - **workers** (*int*) -- *Number of processes that mine the partitions and count the candidates. None uses every CPU. The default is 1, i.e. mining in the calling process.*
+
+    :**Attributes**:    - **startTime** (*float*) -- *To record the start time of the mining process.*
+                        - **endTime** (*float*) -- *To record the completion time of the mining process.*
+                        - **finalPatterns** (*dict*) -- *Storing the complete set of patterns in a dictionary variable.*
+                        - **memoryUSS** (*float*) -- *To store the total amount of USS memory consumed by the program.*
+                        - **memoryRSS** (*float*) -- *To store the total amount of RSS memory consumed by the program.*
+                        - **lno** (*int*) -- *Number of transactions of the database.*
+
+    **Execution methods**
+
+    **Terminal command**
+
+    .. code-block:: console
+
+      Format:
+
+      (.venv) $ python3 SON.py <inputFile> <outputFile> <minSup>
+
+      Example Usage:
+
+      (.venv) $ python3 SON.py sampleDB.txt patterns.txt 10.0
+
+    .. note:: minSup can be specified  in support count or a value between 0 and 1.
+
+
+    **Calling from a python program**
+
+    .. code-block:: python
+
+            import PAMI.frequentPattern.basic.SON as alg
+
+            iFile = 'sampleDB.txt'
+
+            minSup = 10  # can also be specified between 0 and 1
+
+            obj = alg.SON(iFile, minSup, miner='FPGrowth', partitionSize=100000, workers=4)
+
+            obj.mine()
+
+            frequentPatterns = obj.getPatterns()
+
+            print("Total number of Frequent Patterns:", len(frequentPatterns))
+
+            obj.save(oFile)
+
+            Df = obj.getPatternInDataFrame()
+
+            memUSS = obj.getMemoryUSS()
+
+            print("Total Memory in USS:", memUSS)
+
+            memRSS = obj.getMemoryRSS()
+
+            print("Total Memory in RSS", memRSS)
+
+            run = obj.getRuntime()
+
+            print("Total ExecutionTime in seconds:", run)
+
+            print(obj.getProfile()['counters'])     # partitions, candidates and false positives
+
+    """
+
+    _downwardClosed = True
+    _minSup = float()
+    _startTime = float()
+    _endTime = float()
+    _finalPatterns = {}
+    _iFile = " "
+    _oFile = " "
+    _sep = " "
+    _memoryUSS = float()
+    _memoryRSS = float()
+    _lno = 0
+
+    def __init__(self, iFile, minSup, sep='\t', miner='FPGrowth', partitionSize=100000, workers=1) -> None:
+        super().__init__(iFile, minSup, sep)
+        if isinstance(miner, str):
+            miner = getattr(_importlib.import_module('PAMI.frequentPattern.basic.' + miner), miner)
+        if partitionSize < 1:
+            raise ValueError("partitionSize should be a positive integer")
+        if workers is None:
+            workers = _ab._os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers should be at least 1")
+        self._miner = miner
+        self._partitionSize = partitionSize
+        self._workers = workers
+
+    def _convert(self, value) -> float:
+        """
+
+        To convert the user specified minSup value
+
+        :param value: user specified minSup value
+        :return: converted type
+        :rtype: float
+        """
+        if type(value) is int:
+            value = int(value)
+        if type(value) is float:
+            value = (self._lno * value)
+        if type(value) is str:
+            if '.' in value:
+                value = float(value)
+                value = (self._lno * value)
+            else:
+                value = int(value)
+        return value
+
+    @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
+    def startMine(self) -> None:
+        """
+        Frequent pattern mining process will start from here
+        """
+
+        self.mine()
+
+    def _map(self, executor, function, iterable):
+        """
+
+        Applies function to every element of iterable in the executor, keeping at most one task per worker in flight
+        so that the elements are read from the database only as fast as they are consumed
+
+        :param executor: a pool of processes, or None to run in the calling process
+        :type executor: ProcessPoolExecutor
+        :param function: the task
+        :type function: function
+        :param iterable: the arguments of the tasks
+        :type iterable: iterable
+        :return: generator of the results, in order
+        :rtype: Iterator
+        """
+        if executor is None:
+            for args in iterable:
+                yield function(*args)
+            return
+        pending = []
+        for args in iterable:
+            pending.append(executor.submit(function, *args))
+            if len(pending) >= self._workers:
+                yield pending.pop(0).result()
+        for future in pending:
+            yield future.result()
+
+    def _localCandidates(self, executor, minSup) -> List[Tuple[str, ...]]:
+        """
+
+        First pass: mines every partition at its scaled threshold and returns the union of the local patterns
+
+        :param executor: a pool of processes, or None
+        :type executor: ProcessPoolExecutor
+        :param minSup: global minimum support count
+        :type minSup: int or float
+        :return: the candidates
+        :rtype: list
+        """
+        def partitions():
+            for chunk in _ab._readChunks(self._iFile, self._sep, self._partitionSize):
+                self._profiler.count('partitions')
+                # a pattern below this count in every partition is below minSup in the database
+                yield self._miner, chunk, max(1, int(minSup * len(chunk) / self._lno)), self._sep
+
+        candidates = set()
+        for patterns in self._map(executor, _minePartition, partitions()):
+            candidates.update(frozenset(pattern) for pattern, support in patterns)
+        return [tuple(candidate) for candidate in candidates]
+
+    def _globalSupports(self, executor, candidates) -> Counter:
+        """
+
+        Second pass: counts the candidates in the whole database
+
+        :param executor: a pool of processes initialized with the candidate trie, or None
+        :type executor: ProcessPoolExecutor
+        :param candidates: the candidates
+        :type candidates: list
+        :return: the supports of the candidates, keyed by candidate index
+        :rtype: Counter
+        """
+        chunks = ((chunk,) for chunk in _ab._readChunks(self._iFile, self._sep, self._partitionSize))
+        if executor is None:
+            trie, ids = _buildTrie(candidates)
+            counts = self._map(None, lambda chunk: _countChunk(trie, ids, chunk), chunks)
+        else:
+            counts = self._map(executor, _countWorkerChunk, chunks)
+        supports = Counter()
+        for count in counts:
+            supports.update(count)
+        return supports
+
+    def mine(self) -> None:
+        """
+        Frequent pattern mining process will start from here
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        self._startTime = _ab._time.time()
+        self._finalPatterns = self._openSink()
+        self._profiler.start()
+        if self._iFile is None:
+            raise Exception("Please enter the file path or file name:")
+        if self._minSup is None:
+            raise Exception("Please enter the Minimum Support")
+        self._profiler.phase('firstScan')
+        self._lno = 0
+        for chunk in _ab._readChunks(self._iFile, self._sep, self._partitionSize):
+            self._lno += len(chunk)
+        self._minSup = self._sweepMinSup(self._convert)
+
+        self._profiler.phase('mine')
+        if self._workers > 1:
+            with ProcessPoolExecutor(self._workers) as executor:
+                candidates = self._localCandidates(executor, self._minSup)
+        else:
+            candidates = self._localCandidates(None, self._minSup)
+        self._profiler.count('candidates', len(candidates))
+
+        self._profiler.phase('verify')
+        if self._workers > 1 and candidates:
+            trie, ids = _buildTrie(candidates)
+            with ProcessPoolExecutor(self._workers, initializer=_initCounter, initargs=(trie, ids)) as executor:
+                supports = self._globalSupports(executor, candidates)
+        else:
+            supports = self._globalSupports(None, candidates)
+
+        self._profiler.phase('output')
+        for index, candidate in enumerate(candidates):
+            if supports[index] >= self._minSup:
+                self._finalPatterns[candidate] = supports[index]
+            else:
+                self._profiler.count('falsePositives')
+        self._closeSink()
+        self._profiler.stop()
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Frequent patterns were generated successfully using SON algorithm")
+
+    def getMemoryUSS(self) -> float:
+        """
+
+        Total amount of USS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning USS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryUSS
+
+    def getMemoryRSS(self) -> float:
+        """
+
+        Total amount of RSS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning RSS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryRSS
+
+    def getRuntime(self) -> float:
+        """
+        Calculating the total amount of runtime taken by the mining process
+
+        :return: returning total amount of runtime taken by the mining process
+        :rtype: float
+        """
+
+        return self._endTime - self._startTime
+
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
+        """
+
+        Storing final frequent patterns in a dataframe
+
+        :return: returning frequent patterns in a dataframe
+        :rtype: pd.DataFrame
+        """
+
+        return _ab._pd.DataFrame([[" ".join(x), y] for x, y in self._decodedPatterns().items()], columns=['Patterns', 'Support'])
+
+    def save(self, outFile: str, seperator = "\t" ) -> None:
+        """
+
+        Complete set of frequent patterns will be loaded in to an output file
+
+        :param outFile: name of the output file
+        :type outFile: csvfile
+        :return: None
+        """
+        if self._patternsStreamed():
+            # the sink already wrote the patterns while mining
+            return
+        self._profiler.phase('save')
+        with open(outFile, 'w') as f:
+            for x, y in self._decodedPatterns().items():
+                x = seperator.join(x)
+                f.write(f"{x}:{y}\n")
+        self._profiler.stop()
+
+    def getPatterns(self) -> dict:
+        """
+        Function to send the set of frequent patterns after completion of the mining process
+
+        :return: returning frequent patterns
+        :rtype: dict
+        """
+        return self._decodedPatterns()
+
+    def printResults(self) -> None:
+        """
+        Function used to print the results
+        """
+        print("Total number of Frequent Patterns:", len(self._finalPatterns))
+        print("Total Memory in USS:", self.getMemoryUSS())
+        print("Total Memory in RSS", self.getMemoryRSS())
+        print("Total ExecutionTime in ms:",  self.getRuntime())
+
+
+if __name__ == "__main__":
+    _ap = str()
+    if len(_ab._sys.argv) == 4 or len(_ab._sys.argv) == 5:
+        if len(_ab._sys.argv) == 5:
+            _ap = SON(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
+        if len(_ab._sys.argv) == 4:
+            _ap = SON(_ab._sys.argv[1], _ab._sys.argv[3])
+        _ap.mine()
+        print("Total number of Frequent Patterns:", len(_ap.getPatterns()))
+        _ap.save(_ab._sys.argv[2])
+        print(_ap.getPatternsAsDataFrame())
+        print("Total Memory in USS:",  _ap.getMemoryUSS())
+        print("Total Memory in RSS", _ap.getMemoryRSS())
+        print("Total ExecutionTime in ms:", _ap.getRuntime())
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
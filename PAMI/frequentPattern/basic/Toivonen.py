@@ -0,0 +1,533 @@
+# Toivonen discovers frequent patterns from a uniform sample of a transactional database. The sample is sized from the
+# accepted error of the support estimates, it is mined at a lowered threshold, and the patterns are reported with
+# their estimated supports and confidence intervals. Optionally, the patterns and their negative border are counted
+# in the whole database, which makes the result exact.
+#
+# **Importing this algorithm into a python program**
+#
+#             import PAMI.frequentPattern.basic.Toivonen as alg
+#
+#             iFile = 'sampleDB.txt'
+#
+#             minSup = 0.01  # can also be specified as a count
+#
+#             obj = alg.Toivonen(iFile, minSup, epsilon=0.005, delta=0.05)
+#
+#             obj.mine()
+#
+#             frequentPatterns = obj.getPatterns()
+#
+#             intervals = obj.getConfidenceIntervals()
+#
+#             candidates = obj.getCandidates()
+#
+#             print("Total number of Frequent Patterns:", len(frequentPatterns))
+#
+#             obj.save(oFile)
+#
+#             Df = obj.getPatternInDataFrame()
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from PAMI.frequentPattern.basic import abstract as _ab
+from PAMI.frequentPattern.basic import SON as _son
+from PAMI.extras.lazyImport import deprecated
+from collections import Counter
+from typing import Dict, FrozenSet, List, Set, Tuple
+import importlib as _importlib
+import math as _math
+import random as _random
+
+
+def sampleSize(epsilon, delta) -> int:
+    """
+    Number of transactions of a uniform sample in which the frequency of a pattern is within epsilon of its frequency
+    in the database with probability at least 1 - delta, by the Hoeffding bound
+
+    :param epsilon: accepted error of a frequency
+    :type epsilon: float
+    :param delta: accepted probability of a larger error
+    :type delta: float
+    :return: the sample size
+    :rtype: int
+    """
+    return int(_math.ceil(_math.log(2 / delta) / (2 * epsilon * epsilon)))
+
+
+def negativeBorder(frequent, items) -> List[Tuple[str, ...]]:
+    """
+    Negative border of a downward closed collection of patterns: the patterns that are not in the collection but all of
+    whose subsets one item shorter are
+
+    :param frequent: the patterns, as frozensets
+    :type frequent: set
+    :param items: every item of the database
+    :type items: iterable
+    :return: the patterns of the negative border, with their items sorted
+    :rtype: list
+    """
+    border = [(item,) for item in sorted(items) if frozenset([item]) not in frequent]
+    levels = {}
+    for pattern in frequent:
+        levels.setdefault(len(pattern), []).append(tuple(sorted(pattern)))
+    for size, patterns in levels.items():
+        patterns.sort()
+        # two patterns sharing all but their last item are joined into a pattern one item longer
+        start = 0
+        while start < len(patterns):
+            end = start + 1
+            while end < len(patterns) and patterns[end][:-1] == patterns[start][:-1]:
+                end += 1
+            for i in range(start, end):
+                for j in range(i + 1, end):
+                    candidate = patterns[i] + (patterns[j][-1],)
+                    itemSet = frozenset(candidate)
+                    if itemSet in frequent:
+                        continue
+                    if all(itemSet.difference([item]) in frequent for item in candidate[:-2]):
+                        border.append(candidate)
+            start = end
+    return border
+
+
+class Toivonen(_ab._frequentPatterns):
+    """
+    **About this algorithm**
+
+    :**Description**: Toivonen mines a uniform sample of the database instead of the database. A single pass draws a
+                      reservoir sample of sampleSize(epsilon, delta) = ln(2 / delta) / (2 epsilon^2) transactions, so
+                      that the frequency of any pattern in the sample is within epsilon of its frequency in the
+                      database with probability at least 1 - delta. The sample is mined with the chosen miner at the
+                      lowered frequency minSup / |database| - epsilon, so a frequent pattern is missed with probability
+                      at most delta.
+
+                      Without verification, every pattern of the sample is a candidate, with its support in the sample
+                      scaled to the database as an estimate. getPatterns() returns the candidates whose estimate reaches
+                      minSup, getCandidates() returns every candidate and getConfidenceIntervals() gives the interval of
+                      the support of every candidate at confidence 1 - delta. This trades recall for precision: the
+                      candidates hold every frequent pattern with probability at least 1 - delta, but many of them are
+                      infrequent, while the patterns are mostly frequent but miss the frequent patterns whose estimate
+                      fell below minSup. The candidates whose interval reaches minSup are the ones worth verifying.
+
+                      With verify=True, the patterns of the sample and their negative border are counted in a second
+                      pass over the database. If no pattern of the negative border is frequent, the frequent patterns
+                      are exactly the counted patterns that reach minSup. Otherwise the negative border of the frequent
+                      patterns is counted in further passes until it holds no frequent pattern, so the result is always
+                      exact, usually after a single verification pass.
+
+    :**Reference**:  Hannu Toivonen: Sampling Large Databases for Association Rules. VLDB 1996: 134-145
+
+    :**Parameters**:    - **iFile** (*str or URL or dataFrame*) -- *Name of the Input file to mine complete set of frequent patterns.*
+                        - **oFile** (*str*) -- *Name of the output file to store complete set of frequent patterns.*
+                        - **minSup** (*int or float or str*) -- *The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.*
+                        - **sep** (*str*) -- *This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.*
+                        - **epsilon** (*float*) -- *Accepted error of the frequency (support / number of transactions) of a pattern.*
+                        - **delta** (*float*) -- *Accepted probability that the error of a pattern is larger than epsilon.*
+                        - **verify** (*bool*) -- *Counts the patterns and their negative border in the database to return the exact frequent patterns.*
+                        - **miner** (*str or class*) -- *The miner of the sample, a class or the name of a module of PAMI.frequentPattern.basic such as 'FPGrowth' (default), 'ECLAT' or 'Apriori'.*
+                        - **seed** (*int*) -- *Seed of the random sample.*
+
+    :**Attributes**:    - **startTime** (*float*) -- *To record the start time of the mining process.*
+                        - **endTime** (*float*) -- *To record the completion time of the mining process.*
+                        - **finalPatterns** (*dict*) -- *Storing the complete set of patterns in a dictionary variable.*
+                        - **memoryUSS** (*float*) -- *To store the total amount of USS memory consumed by the program.*
+                        - **memoryRSS** (*float*) -- *To store the total amount of RSS memory consumed by the program.*
+                        - **lno** (*int*) -- *Number of transactions of the database.*
+                        - **sample** (*list*) -- *The transactions of the sample.*
+                        - **intervals** (*dict*) -- *The confidence interval of the support of every candidate.*
+                        - **candidates** (*dict*) -- *The estimated support of every pattern of the sample mined at the lowered threshold.*
+
+    **Execution methods**
+
+    **Terminal command**
+
+    .. code-block:: console
+
+      Format:
+
+      (.venv) $ python3 Toivonen.py <inputFile> <outputFile> <minSup>
+
+      Example Usage:
+
+      (.venv) $ python3 Toivonen.py sampleDB.txt patterns.txt 0.01
+
+    .. note:: minSup can be specified  in support count or a value between 0 and 1.
+
+
+    **Calling from a python program**
+
+    .. code-block:: python
+
+            import PAMI.frequentPattern.basic.Toivonen as alg
+
+            iFile = 'sampleDB.txt'
+
+            minSup = 0.01  # can also be specified as a count
+
+            obj = alg.Toivonen(iFile, minSup, epsilon=0.005, delta=0.05)
+
+            obj.mine()
+
+            frequentPatterns = obj.getPatterns()
+
+            intervals = obj.getConfidenceIntervals()
+
+            candidates = obj.getCandidates()
+
+            print("Total number of Frequent Patterns:", len(frequentPatterns))
+
+            obj.save(oFile)
+
+            Df = obj.getPatternInDataFrame()
+
+            memUSS = obj.getMemoryUSS()
+
+            print("Total Memory in USS:", memUSS)
+
+            memRSS = obj.getMemoryRSS()
+
+            print("Total Memory in RSS", memRSS)
+
+            run = obj.getRuntime()
+
+            print("Total ExecutionTime in seconds:", run)
+
+            print(obj.getProfile()['counters'])     # sample size, candidates, border and verification passes
+
+    """
+
+    _minSup = float()
+    _startTime = float()
+    _endTime = float()
+    _finalPatterns = {}
+    _iFile = " "
+    _oFile = " "
+    _sep = " "
+    _memoryUSS = float()
+    _memoryRSS = float()
+    _lno = 0
+    _sample = []
+    _intervals = {}
+    _candidates = {}
+    _cacheState = _ab._frequentPatterns._cacheState + ('_intervals', '_candidates')
+
+    def __init__(self, iFile, minSup, sep='\t', epsilon=0.01, delta=0.05, verify=False, miner='FPGrowth',
+                 seed=None) -> None:
+        super().__init__(iFile, minSup, sep)
+        if isinstance(miner, str):
+            miner = getattr(_importlib.import_module('PAMI.frequentPattern.basic.' + miner), miner)
+        if not 0 < epsilon < 1 or not 0 < delta < 1:
+            raise ValueError("epsilon and delta should be between 0 and 1")
+        self._epsilon = epsilon
+        self._delta = delta
+        self._verify = verify
+        self._miner = miner
+        self._seed = seed
+
+    def _convert(self, value) -> float:
+        """
+
+        To convert the user specified minSup value
+
+        :param value: user specified minSup value
+        :return: converted type
+        :rtype: float
+        """
+        if type(value) is int:
+            value = int(value)
+        if type(value) is float:
+            value = (self._lno * value)
+        if type(value) is str:
+            if '.' in value:
+                value = float(value)
+                value = (self._lno * value)
+            else:
+                value = int(value)
+        return value
+
+    @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
+    def startMine(self) -> None:
+        """
+        Frequent pattern mining process will start from here
+        """
+
+        self.mine()
+
+    def _drawSample(self) -> Set[str]:
+        """
+
+        Draws a reservoir sample of sampleSize(epsilon, delta) transactions in one pass, counting the transactions of
+        the database
+
+        :return: every item of the database
+        :rtype: set
+        """
+        size = sampleSize(self._epsilon, self._delta)
+        generator = _random.Random(self._seed)
+        self._sample = []
+        self._lno = 0
+        items = set()
+        for transaction in _ab._streamTransactions(self._iFile, self._sep):
+            items.update(transaction)
+            self._lno += 1
+            if len(self._sample) < size:
+                self._sample.append(transaction)
+            else:
+                position = generator.randrange(self._lno)
+                if position < size:
+                    self._sample[position] = transaction
+        return items
+
+    def _count(self, candidates) -> Dict[FrozenSet[str], int]:
+        """
+
+        Counts the candidates in one pass over the database
+
+        :param candidates: the candidates
+        :type candidates: list
+        :return: the supports of the candidates
+        :rtype: dict
+        """
+        self._profiler.count('passes')
+        trie, ids = _son._buildTrie(candidates)
+        supports = Counter()
+        for chunk in _ab._readChunks(self._iFile, self._sep):
+            supports.update(_son._countChunk(trie, ids, chunk))
+        return {frozenset(candidate): supports[index] for index, candidate in enumerate(candidates)}
+
+    def _verifyPatterns(self, patterns, items) -> Dict[FrozenSet[str], int]:
+        """
+
+        Counts the patterns of the sample and their negative border in the database, then the negative border of the
+        frequent patterns until it holds no frequent pattern
+
+        :param patterns: the patterns of the sample
+        :type patterns: set
+        :param items: every item of the database
+        :type items: set
+        :return: the frequent patterns with their supports
+        :rtype: dict
+        """
+        border = negativeBorder(patterns, items)
+        self._profiler.count('border', len(border))
+        counted = self._count([tuple(pattern) for pattern in patterns] + border)
+        while True:
+            frequent = {pattern for pattern, support in counted.items() if support >= self._minSup}
+            missing = [pattern for pattern in negativeBorder(frequent, items) if frozenset(pattern) not in counted]
+            if not missing:
+                return {pattern: counted[pattern] for pattern in frequent}
+            self._profiler.count('borderFailures')
+            counted.update(self._count(missing))
+
+    def mine(self) -> None:
+        """
+        Frequent pattern mining process will start from here
+        """
+
+        self._startTime = _ab._time.time()
+        self._finalPatterns = self._openSink()
+        self._profiler.start()
+        if self._iFile is None:
+            raise Exception("Please enter the file path or file name:")
+        if self._minSup is None:
+            raise Exception("Please enter the Minimum Support")
+        self._profiler.phase('sample')
+        items = self._drawSample()
+        self._minSup = self._sweepMinSup(self._convert)
+        size = len(self._sample)
+        self._profiler.count('sample', size)
+        exact = size == self._lno
+        # a pattern at the frequency minSup in the database is above this count in the sample with probability 1 - delta
+        lowered = self._minSup / max(1, self._lno) - (0 if exact else self._epsilon)
+
+        self._profiler.phase('mine')
+        patterns = _son._minePartition(self._miner, self._sample, max(1, int(lowered * size)), self._sep)
+        self._sample = []
+        self._profiler.count('candidates', len(patterns))
+
+        if exact:
+            # the sample is the database, so its supports are exact
+            supports = {frozenset(pattern): support for pattern, support in patterns if support >= self._minSup}
+        elif self._verify:
+            self._profiler.phase('verify')
+            supports = self._verifyPatterns({frozenset(pattern) for pattern, support in patterns}, items)
+        else:
+            supports = None
+
+        self._profiler.phase('output')
+        self._intervals = {}
+        self._candidates = {}
+        if supports is not None:
+            for pattern, support in supports.items():
+                pattern = tuple(sorted(pattern))
+                self._finalPatterns[pattern] = support
+                self._candidates[pattern] = support
+                self._intervals[pattern] = (support, support)
+        else:
+            for pattern, support in patterns:
+                pattern = tuple(sorted(pattern))
+                frequency = support / size
+                estimate = int(round(frequency * self._lno))
+                self._candidates[pattern] = estimate
+                self._intervals[pattern] = (max(0, int(_math.floor((frequency - self._epsilon) * self._lno))),
+                                            min(self._lno, int(_math.ceil((frequency + self._epsilon) * self._lno))))
+                # the candidates estimated below minSup are only kept for recall, in getCandidates()
+                if estimate >= self._minSup:
+                    self._finalPatterns[pattern] = estimate
+        self._closeSink()
+        self._profiler.stop()
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Frequent patterns were generated successfully using Toivonen algorithm")
+
+    def getConfidenceIntervals(self) -> Dict[Tuple[str, ...], Tuple[int, int]]:
+        """
+        Confidence intervals of the supports of the candidates of the last run, at confidence 1 - delta. Verified
+        patterns have the exact support as both bounds.
+
+        :return: (lower, upper) bounds of the support of every candidate, keyed by the pattern with its items sorted
+        :rtype: dict
+        """
+        return self._intervals
+
+    def getCandidates(self) -> Dict[Tuple[str, ...], int]:
+        """
+        Patterns of the sample mined at the lowered threshold, with their estimated supports. Unlike getPatterns(), they
+        include the patterns estimated below minSup, so they hold every frequent pattern with probability at least
+        1 - delta. After a verification, they are the frequent patterns with their exact supports.
+
+        :return: the estimated support of every candidate, keyed by the pattern with its items sorted
+        :rtype: dict
+        """
+        return self._candidates
+
+    def getMemoryUSS(self) -> float:
+        """
+
+        Total amount of USS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning USS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryUSS
+
+    def getMemoryRSS(self) -> float:
+        """
+
+        Total amount of RSS memory consumed by the mining process will be retrieved from this function
+
+        :return: returning RSS memory consumed by the mining process
+        :rtype: float
+        """
+
+        return self._memoryRSS
+
+    def getRuntime(self) -> float:
+        """
+        Calculating the total amount of runtime taken by the mining process
+
+        :return: returning total amount of runtime taken by the mining process
+        :rtype: float
+        """
+
+        return self._endTime - self._startTime
+
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
+        """
+
+        Storing final frequent patterns in a dataframe
+
+        :return: returning frequent patterns in a dataframe
+        :rtype: pd.DataFrame
+        """
+
+        return _ab._pd.DataFrame([[" ".join(x), y] for x, y in self._decodedPatterns().items()], columns=['Patterns', 'Support'])
+
+    def save(self, outFile: str, seperator = "\t" ) -> None:
+        """
+
+        Complete set of frequent patterns will be loaded in to an output file
+
+        :param outFile: name of the output file
+        :type outFile: csvfile
+        :return: None
+        """
+        if self._patternsStreamed():
+            # the sink already wrote the patterns while mining
+            return
+        self._profiler.phase('save')
+        with open(outFile, 'w') as f:
+            for x, y in self._decodedPatterns().items():
+                x = seperator.join(x)
+                f.write(f"{x}:{y}\n")
+        self._profiler.stop()
+
+    def getPatterns(self) -> dict:
+        """
+        Function to send the set of frequent patterns after completion of the mining process
+
+        :return: returning frequent patterns
+        :rtype: dict
+        """
+        return self._decodedPatterns()
+
+    def printResults(self) -> None:
+        """
+        Function used to print the results
+        """
+        print("Total number of Frequent Patterns:", len(self._finalPatterns))
+        print("Total Memory in USS:", self.getMemoryUSS())
+        print("Total Memory in RSS", self.getMemoryRSS())
+        print("Total ExecutionTime in ms:",  self.getRuntime())
+
+
+if __name__ == "__main__":
+    _ap = str()
+    if len(_ab._sys.argv) == 4 or len(_ab._sys.argv) == 5:
+        if len(_ab._sys.argv) == 5:
+            _ap = Toivonen(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
+        if len(_ab._sys.argv) == 4:
+            _ap = Toivonen(_ab._sys.argv[1], _ab._sys.argv[3])
+        _ap.mine()
+        print("Total number of Frequent Patterns:", len(_ap.getPatterns()))
+        _ap.save(_ab._sys.argv[2])
+        print(_ap.getPatternsAsDataFrame())
+        print("Total Memory in USS:",  _ap.getMemoryUSS())
+        print("Total Memory in RSS", _ap.getMemoryRSS())
+        print("Total ExecutionTime in ms:", _ap.getRuntime())
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
@@ -53,7 +53,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.frequentPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 class Apriori(_ab._frequentPatterns):
     """
@@ -166,7 +166,7 @@ class Apriori(_ab._frequentPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             temp = []
             if self._iFile.empty:
                 print("its empty..")
@@ -177,7 +177,7 @@ class Apriori(_ab._frequentPatterns):
             for k in temp:
                 self._Database.append(set(k))
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -372,7 +372,7 @@ class Apriori(_ab._frequentPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
 
         Storing final frequent patterns in a dataframe
@@ -52,7 +52,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.frequentPattern.basic import abstract as _fp
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 _minSup = str()
 _fp._sys.setrecursionlimit(20000)
@@ -360,6 +360,7 @@ class FPGrowth(_fp._frequentPatterns):
 
     __startTime = float()
     __endTime = float()
+    _cacheState = None
     _minSup = str()
     __finalPatterns = {}
     _iFile = " "
@@ -382,7 +383,7 @@ class FPGrowth(_fp._frequentPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self.__Database = []
-        if isinstance(self._iFile, _fp._pd.DataFrame):
+        if _fp._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -391,7 +392,7 @@ class FPGrowth(_fp._frequentPatterns):
 
             #print(self.Database)
         if isinstance(self._iFile, str):
-            if _fp._validators.url(self._iFile):
+            if _fp._isURL(self._iFile):
                 data = _fp._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -625,7 +626,7 @@ class FPGrowth(_fp._frequentPatterns):
 
         return self.__endTime - self.__startTime
 
-    def getPatternsAsDataFrame(self) -> _fp._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_fp._pd.DataFrame':
         """
         Storing final frequent patterns in a dataframe
 
@@ -53,7 +53,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 
 from PAMI.frequentPattern.closed import abstract as _ab
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class CHARM(_ab._frequentPatterns):
@@ -80,7 +80,7 @@ class CHARM(_ab._frequentPatterns):
                         - **tree** (*class*) -- *It represents the Tree class.*
                         - **itemSetCount** (*int*) -- *It represents the total no of patterns.*
                         - **tidList** (*dict*) -- *Stores the timestamps of an item.*
-                        - **hashing** (*dict*) -- *Stores the patterns with their support to check for the closed property.*
+                        - **hashing** (*SubsumptionIndex*) -- *Stores the patterns under their support and tidset hash to check for the closed property.*
 
 
     **Execution methods**
@@ -154,10 +154,9 @@ class CHARM(_ab._frequentPatterns):
     _tidList = {}
     _lno = 0
     _mapSupport = {}
-    _hashing = {}
+    _hashing = None
     _itemSetCount = 0
     _maxItemId = 0
-    _tableSize = 10000
     _writer = None
 
     def _convert(self, value):
@@ -187,7 +186,7 @@ class CHARM(_ab._frequentPatterns):
         """
         self._tidList = {}
         self._lno = 0
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -205,7 +204,15 @@ class CHARM(_ab._frequentPatterns):
                         self._tidList[j].append(self._lno)
 
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._TransactionStore.isStore(self._iFile):
+                for i in _ab._TransactionStore(self._iFile):
+                    self._lno += 1
+                    for j in i:
+                        if j not in self._tidList:
+                            self._tidList[j] = [self._lno]
+                        else:
+                            self._tidList[j].append(self._lno)
+            elif _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -249,13 +256,13 @@ class CHARM(_ab._frequentPatterns):
         :rtype: int
         """
 
-        return abs(sum(tidSet)) % self._tableSize
+        return sum(tidSet)
 
     def _contains(self, itemSet, value, hashcode):
         """
 
-        Check for the closed property(patterns with same support) by checking the hashcode(sum of timestamps),
-        if hashcode key in hashing dict is none then returns a false, else returns with true.
+        Check for the closed property(patterns with same support) by looking for a superset among the patterns
+        stored under the same support and hashcode(sum of timestamps), returns true if one is found.
 
         :param itemSet: frequent pattern
         :type itemSet: list
@@ -264,13 +271,7 @@ class CHARM(_ab._frequentPatterns):
         :param hashcode: calculated from the timestamps of pattern
         :type hashcode: int
         """
-        if self._hashing.get(hashcode) is None:
-            return False
-        for i in self._hashing[hashcode]:
-            itemSetx = i
-            if value == self._hashing[hashcode][itemSetx] and set(itemSetx).issuperset(itemSet):
-                return True
-        return False
+        return self._hashing.hasSuperset(itemSet, (value, hashcode))
 
     def _save(self, prefix, suffix, tidSetx):
         """
@@ -300,15 +301,14 @@ class CHARM(_ab._frequentPatterns):
                     sample = sample + i + "\t"
                 self._itemSetCount += 1
                 self._finalPatterns[sample] = val
-            if hashcode not in self._hashing:
-                self._hashing[hashcode] = {tuple(prefix): val}
-            else:
-                self._hashing[hashcode][tuple(prefix)] = val
+                self._hashing.add(prefix, (val, hashcode))
 
     def _processEquivalenceClass(self, prefix, itemSets, tidSets):
         """
 
-        Equivalence class is followed  and check for the patterns which satisfies frequent properties.
+        Equivalence class is followed  and check for the patterns which satisfies frequent properties. The classes are
+        processed depth first from an explicit stack of [prefix, itemSets, tidSets, next index, size, pending save]
+        frames, and the pattern that opened a class is saved when the class is popped, after all its sub-classes.
 
         :param prefix:  main equivalence prefix
         :type prefix: frequent item or pattern
@@ -317,62 +317,72 @@ class CHARM(_ab._frequentPatterns):
         :param tidSets: timestamps of the items in the argument itemSets
         :type tidSets: list
         """
-        if len(itemSets) == 1:
-            i = itemSets[0]
-            tidI = tidSets[0]
-            self._save(prefix, [i], tidI)
-            return
-        if len(itemSets) == 2:
-            itemX = itemSets[0]
-            tidSetX = tidSets[0]
-            itemY = itemSets[1]
-            tidSetY = tidSets[1]
-            # y1 = list(set(tidSetX).intersection(tidSetY))
-            y1 = tidSetX.intersection(tidSetY)
-            if len(y1) >= self._minSup:
-                suffix = []
-                suffix += [itemX, itemY]
-                suffix = list(set(suffix))
-                self._save(prefix, suffix, y1)
-            if len(y1) != len(tidSetX):
-                self._save(prefix, [itemX], tidSetX)
-            if len(y1) != len(tidSetY):
-                self._save(prefix, [itemX], tidSetY)
-            return
-        for i in range(len(itemSets)):
-            itemX = itemSets[i]
-            if itemX is None:
-                continue
-            tidSetX = tidSets[i]
-            classItemSets = []
-            classTidSets = []
-            itemSetx = [itemX]
-            for j in range(i + 1, len(itemSets)):
-                itemY = itemSets[j]
-                if itemY is None:
+        stack = [[prefix, itemSets, tidSets, 0, len(itemSets), None]]
+        while stack:
+            frame = stack[-1]
+            prefix, itemSets, tidSets, start, size, pending = frame
+            if start == 0 and size == 1:
+                i = itemSets[0]
+                tidI = tidSets[0]
+                self._save(prefix, [i], tidI)
+                start = size
+            elif start == 0 and size == 2:
+                itemX = itemSets[0]
+                tidSetX = tidSets[0]
+                itemY = itemSets[1]
+                tidSetY = tidSets[1]
+                # y1 = list(set(tidSetX).intersection(tidSetY))
+                y1 = tidSetX.intersection(tidSetY)
+                if len(y1) >= self._minSup:
+                    suffix = []
+                    suffix += [itemX, itemY]
+                    suffix = list(set(suffix))
+                    self._save(prefix, suffix, y1)
+                if len(y1) != len(tidSetX):
+                    self._save(prefix, [itemX], tidSetX)
+                if len(y1) != len(tidSetY):
+                    self._save(prefix, [itemX], tidSetY)
+                start = size
+            for i in range(start, size):
+                itemX = itemSets[i]
+                if itemX is None:
                     continue
-                tidSetY = tidSets[j]
-                y = tidSetX.intersection(tidSetY)
-                if len(y) < self._minSup:
-                    continue
-                if len(tidSetX) == len(tidSetY) and len(y) == len(tidSetX):
-                    itemSets.insert(j, None)
-                    tidSets.insert(j, None)
-                    itemSetx.append(itemY)
-                elif len(tidSetX) < len(tidSetY) and len(y) == len(tidSetX):
-                    itemSetx.append(itemY)
-                elif len(tidSetX) > len(tidSetY) and len(y) == len(tidSetY):
-                    itemSets.insert(j, None)
-                    tidSets.insert(j, None)
-                    classItemSets.append(itemY)
-                    classTidSets.append(y)
-                else:
-                    classItemSets.append(itemY)
-                    classTidSets.append(y)
-            if len(classItemSets):
-                newPrefix = list(set(itemSetx)) + prefix
-                self._processEquivalenceClass(newPrefix, classItemSets, classTidSets)
-                self._save(prefix, list(set(itemSetx)), tidSetX)
+                tidSetX = tidSets[i]
+                classItemSets = []
+                classTidSets = []
+                itemSetx = [itemX]
+                for j in range(i + 1, len(itemSets)):
+                    itemY = itemSets[j]
+                    if itemY is None:
+                        continue
+                    tidSetY = tidSets[j]
+                    y = tidSetX.intersection(tidSetY)
+                    if len(y) < self._minSup:
+                        continue
+                    if len(tidSetX) == len(tidSetY) and len(y) == len(tidSetX):
+                        itemSets.insert(j, None)
+                        tidSets.insert(j, None)
+                        itemSetx.append(itemY)
+                    elif len(tidSetX) < len(tidSetY) and len(y) == len(tidSetX):
+                        itemSetx.append(itemY)
+                    elif len(tidSetX) > len(tidSetY) and len(y) == len(tidSetY):
+                        itemSets.insert(j, None)
+                        tidSets.insert(j, None)
+                        classItemSets.append(itemY)
+                        classTidSets.append(y)
+                    else:
+                        classItemSets.append(itemY)
+                        classTidSets.append(y)
+                if len(classItemSets):
+                    newPrefix = list(set(itemSetx)) + prefix
+                    frame[3] = i + 1
+                    stack.append([newPrefix, classItemSets, classTidSets, 0, len(classItemSets),
+                                  (prefix, list(set(itemSetx)), tidSetX)])
+                    break
+            else:
+                stack.pop()
+                if pending is not None:
+                    self._save(*pending)
 
     @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
     def startMine(self):
@@ -390,7 +400,7 @@ class CHARM(_ab._frequentPatterns):
         self._startTime = _ab._time.time()
         _plist = self._creatingItemsets()
         self._finalPatterns = {}
-        self._hashing = {}
+        self._hashing = _ab._SubsumptionIndex()
         for i in range(len(_plist)):
             itemX = _plist[i]
             if itemX is None:
@@ -17,21 +17,19 @@ from abc import ABC as _ABC, abstractmethod as _abstractmethod
 import time as _time
 import math as _math
 import csv as _csv
-import pandas as _pd
+from PAMI.extras.lazyImport import lazyModule as _lazyModule, isDataFrame as _isDataFrame, isURL as _isURL
+_pd = _lazyModule('pandas')
 from collections import defaultdict as _defaultdict
 from itertools import combinations as _c
 import os as _os
 import os.path as _ospath
-import psutil as _psutil
+_psutil = _lazyModule('psutil')
 import sys as _sys
-import validators as _validators
-import cupy as _cp
+_validators = _lazyModule('validators')
 import numpy as _np
-from urllib.request import urlopen as _urlopen
-import pycuda.gpuarray as _gpuarray
-import pycuda.autoinit
-import pycuda.driver as _cuda
-from pycuda.compiler import _SourceModule
+from PAMI.extras.lazyImport import urlopen as _urlopen
+from PAMI.extras.backend.bitmapDevice import selectBackend as _selectBackend, arrayModule as _arrayModule, \
+    Kernel as _Kernel, popcount as _popcount, sumBits as _sumBits, BACKENDS as _BACKENDS
 
 
 class _frequentPatterns(_ABC):
@@ -51,6 +49,9 @@ class _frequentPatterns(_ABC):
         sep : str
             This variable is used to distinguish items from one another in a transaction. The default seperator is tab space or \t.
             However, the users can override their default separator.
+        backend : str
+            'cuda' runs the miner on the GPU, 'cpu' runs the same bit-matrix algorithm with NumPy arrays, and 'auto'
+            (the default) uses the GPU when cupy finds one.
         startTime:float
             To record the start time of the algorithm
         endTime:float
@@ -82,7 +83,7 @@ class _frequentPatterns(_ABC):
             Total amount of runtime taken by the program will be retrieved from this function
     """
 
-    def __init__(self, iFile, minSup, sep = '\t'):
+    def __init__(self, iFile, minSup, sep = '\t', backend='auto'):
         """
         :param iFile: Input file name or path of the input file
         :type iFile: str
@@ -93,6 +94,8 @@ class _frequentPatterns(_ABC):
         :type minSup: int or float or str
         :param sep: separator used in user specified input file
         :type sep: str
+        :param backend: 'cuda', 'cpu' or 'auto'
+        :type backend: str
         """
 
         self._iFile = iFile
@@ -104,6 +107,10 @@ class _frequentPatterns(_ABC):
         self._memoryRSS = float()
         self._memoryUSS = float()
         self._oFile = " "
+        self._backend = _selectBackend(backend)
+        self._xp = _arrayModule(self._backend)
+        if self._backend == 'cuda':
+            self._xp.cuda.Device(0).use()
 
     @_abstractmethod
     def startMine(self):
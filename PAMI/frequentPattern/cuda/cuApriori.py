@@ -51,7 +51,7 @@ Copyright (C)  2021 Rage Uday Kiran
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 from PAMI.frequentPattern.cuda import abstract as _ab
 # import abstract as _ab
 
@@ -70,6 +70,8 @@ class cuApriori(_ab._frequentPatterns):
                    The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  backend: str :
+                   'cuda' runs the bit-matrix algorithm on the GPU with cupy, 'cpu' runs it with NumPy arrays and the NumPy twins of the kernels. The default 'auto' uses the GPU when cupy finds one.
 
     :Attributes:
 
@@ -148,8 +150,6 @@ class cuApriori(_ab._frequentPatterns):
 
     """
 
-    _ab._cp.cuda.Device(0).use()
-
     _minSup = float()
     _startTime = float()
     _endTime = float()
@@ -161,7 +161,7 @@ class cuApriori(_ab._frequentPatterns):
     _memoryRSS = float()
     _Database = []
 
-    _sumKernel = _ab._cp.RawKernel(r'''
+    _sumKernel = _ab._Kernel(r'''
 
     #define uint32_t unsigned int
 
@@ -177,14 +177,14 @@ class cuApriori(_ab._frequentPatterns):
         return;    
     }
 
-    ''', 'sumKernel')
+    ''', 'sumKernel', _ab._sumBits)
 
     def _creatingItemSets(self):
         """
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             temp = []
             if self._iFile.empty:
                 print("its empty..")
@@ -195,7 +195,7 @@ class cuApriori(_ab._frequentPatterns):
             for k in temp:
                 self._Database.append(set(k))
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -253,7 +253,7 @@ class cuApriori(_ab._frequentPatterns):
         newArraysAndItems = {}
 
         for k, v in ArraysAndItems.items():
-            ArraysAndItems[k] = _ab._cp.array(v, dtype=_ab._np.uint32)
+            ArraysAndItems[k] = self._xp.array(v, dtype=_ab._np.uint32)
             if len(v) >= self._minSup:
                 self._finalPatterns[k] = len(v)
                 newArraysAndItems[k] = ArraysAndItems[k]
@@ -288,7 +288,7 @@ class cuApriori(_ab._frequentPatterns):
                 for j in range(i + 1, len(ArraysAndItems)):
                     jList = list(keys[j])
                     union = tuple(sorted(set(iList + jList)))
-                    intersect = _ab._cp.intersect1d(ArraysAndItems[keys[i]], ArraysAndItems[keys[j]],
+                    intersect = self._xp.intersect1d(ArraysAndItems[keys[i]], ArraysAndItems[keys[j]],
                                                     assume_unique=True)
                     if len(intersect) >= self._minSup and union not in self._finalPatterns:
                         newArraysAndItems[union] = intersect
@@ -50,9 +50,9 @@ Copyright (C)  2021 Rage Uday Kiran
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-# from PAMI.frequentPattern.cuda import abstract as _ab
-import abstract as _ab
-from deprecated import deprecated
+from PAMI.frequentPattern.cuda import abstract as _ab
+# import abstract as _ab
+from PAMI.extras.lazyImport import deprecated
 
 
 class cuAprioriBit(_ab._frequentPatterns):
@@ -70,6 +70,8 @@ class cuAprioriBit(_ab._frequentPatterns):
                    The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  backend: str :
+                   'cuda' runs the bit-matrix algorithm on the GPU with cupy, 'cpu' runs it with NumPy arrays and the NumPy twins of the kernels. The default 'auto' uses the GPU when cupy finds one.
 
     :Attributes:
 
@@ -159,7 +161,7 @@ class cuAprioriBit(_ab._frequentPatterns):
     _memoryRSS = float()
     _Database = []
 
-    _sumKernel = _ab._cp.RawKernel(r'''
+    _sumKernel = _ab._Kernel(r'''
 
     #define uint32_t unsigned int
 
@@ -175,7 +177,7 @@ class cuAprioriBit(_ab._frequentPatterns):
         return;    
     }
 
-    ''', 'sumKernel')
+    ''', 'sumKernel', _ab._sumBits)
 
     def _creatingItemSets(self):
         """
@@ -268,7 +270,7 @@ class cuAprioriBit(_ab._frequentPatterns):
                 bitRep[k][i // 32] |= 1 << 31 - (i % 32)
 
         for k, v in bitRep.items():
-            bitRep[k] = _ab._cp.array(v)
+            bitRep[k] = self._xp.array(v)
 
         return bitRep
 
@@ -299,10 +301,10 @@ class cuAprioriBit(_ab._frequentPatterns):
                 # print(i, "/", len(ArraysAndItems), end="\r")
                 iList = list(keys[i])
                 for j in range(i + 1, len(ArraysAndItems)):
-                    unionData = _ab._cp.bitwise_and(ArraysAndItems[keys[i]], ArraysAndItems[keys[j]])
-                    sum = _ab._cp.zeros(1, dtype=_ab._np.uint32)
+                    unionData = self._xp.bitwise_and(ArraysAndItems[keys[i]], ArraysAndItems[keys[j]])
+                    sum = self._xp.zeros(1, dtype=_ab._np.uint32)
                     self._sumKernel((len(unionData) // 32 + 1,), (32,),
-                                    (unionData, sum, _ab._cp.uint32(len(unionData))))
+                                    (unionData, sum, self._xp.uint32(len(unionData))))
                     sum = sum[0]
                     jList = list(keys[j])
                     union = tuple(sorted(set(iList + jList)))
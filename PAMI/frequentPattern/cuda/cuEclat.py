@@ -52,9 +52,9 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 
-# from PAMI.frequentPattern.cuda import abstract as _ab
-import abstract as _ab
-from deprecated import deprecated
+from PAMI.frequentPattern.cuda import abstract as _ab
+# import abstract as _ab
+from PAMI.extras.lazyImport import deprecated
 
 class cuEclat(_ab._frequentPatterns):
     """
@@ -71,6 +71,8 @@ class cuEclat(_ab._frequentPatterns):
                    The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  backend: str :
+                   'cuda' runs the bit-matrix algorithm on the GPU with cupy, 'cpu' runs it with NumPy arrays and the NumPy twins of the kernels. The default 'auto' uses the GPU when cupy finds one.
 
 
 
@@ -151,8 +153,6 @@ class cuEclat(_ab._frequentPatterns):
 
     """
 
-    _ab._cp.cuda.Device(0).use()
-
 
 
     _minSup = float()
@@ -245,7 +245,7 @@ class cuEclat(_ab._frequentPatterns):
         newArraysAndItems = {}
 
         for k,v in ArraysAndItems.items():
-            ArraysAndItems[k] = _ab._cp.array(v, dtype=_ab._np.uint32)
+            ArraysAndItems[k] = self._xp.array(v, dtype=_ab._np.uint32)
             if len(v) >= self._minSup:
                 self._finalPatterns[k] = len(v)
                 newArraysAndItems[k] = ArraysAndItems[k]
@@ -282,7 +282,7 @@ class cuEclat(_ab._frequentPatterns):
                     if iList[:-1] == jList[:-1] and iList[-1] != jList[-1]:
                         union = iList + [jList[-1]]
                         union = tuple(union)
-                        intersect = _ab._cp.intersect1d(ArraysAndItems[keys[i]], ArraysAndItems[keys[j]], assume_unique=True)
+                        intersect = self._xp.intersect1d(ArraysAndItems[keys[i]], ArraysAndItems[keys[j]], assume_unique=True)
                         if len(intersect) >= self._minSup:
                             newArraysAndItems[union] = intersect
                             self._finalPatterns[union] = len(intersect)
@@ -53,21 +53,16 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 
-from deprecated import deprecated
-import abstract as _ab
+from PAMI.extras.lazyImport import deprecated
+from PAMI.frequentPattern.cuda import abstract as _ab
 
 import os
 import csv
 import time
 import numpy as np
-import pycuda.gpuarray as _gpuarray
-import pycuda.autoinit
 import psutil
-import pycuda.driver as cuda
-from pycuda.compiler import SourceModule
-import pycuda
 
-deviceIntersection = SourceModule("""
+_intersectionSource = """
     __global__ void intersection(int *compareThis, int *compareThat, int *resultStart,
                                  int *values, int *result, int resultX, int resultY){
         const int tidX = blockIdx.x * blockDim.x + threadIdx.x;
@@ -90,7 +85,6 @@ deviceIntersection = SourceModule("""
     }
 
 """
-                                  )
 
 
 class cudaAprioriTID:
@@ -108,6 +102,8 @@ class cudaAprioriTID:
                    The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  backend: str :
+                   'cuda' intersects the tid lists on the GPU with pycuda, 'cpu' computes the same intersections with NumPy. The default 'auto' uses the GPU when pycuda finds one.
 
     :Attributes:
 
@@ -196,10 +192,11 @@ class cudaAprioriTID:
     _minSup = 0
     Patterns = {}
 
-    def __init__(self, filePath, sep, minSup):
-        self.filePath = filePath
-        self.sep = sep
-        self.minSup = minSup
+    def __init__(self, iFile, minSup, sep='\t', backend='auto'):
+        self._iFile = iFile
+        self._sep = sep
+        self._minSup = minSup
+        self._backend = _ab._selectBackend(backend, 'pycuda')
         self.__time = 0
         self.__memRSS = 0
         self.__memUSS = 0
@@ -208,9 +205,8 @@ class cudaAprioriTID:
         """
         Storing the complete transactions of the database/input file in a database variable
         """
-        self._Database = {}
-        lineNumber = 1
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        self._Database = []
+        if _ab._isDataFrame(self._iFile):
             temp = []
             if self._iFile.empty:
                 print("its empty..")
@@ -221,18 +217,11 @@ class cudaAprioriTID:
             for k in temp:
                 self._Database.append(set(k))
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
                     line = line.decode("utf-8")
-                    for i in range(len(line)):
-                        if line[i] in self._Database:
-                            self._Database[i].append(lineNumber)
-                        else:
-                            self._Database[i] = [lineNumber]
-                    lineNumber += 1
-
                     temp = [i.rstrip() for i in line.split(self._sep)]
                     temp = [x for x in temp if x]
                     self._Database.append(set(temp))
@@ -346,6 +335,31 @@ class cudaAprioriTID:
     def get_numberOfPatterns(self):
         return len(self.Patterns)
 
+    def __intersection(self, values):
+        """
+        NumPy twin of the intersection kernel: row k of the result keeps the tids of row i of values that are also in
+        row j, and 0 elsewhere, where (i, j) is the k-th pair of rows with i < j
+
+        :param values: tid lists padded with 0, one per row
+        :type values: numpy.ndarray
+        :return: intersections of every pair of rows
+        :rtype: numpy.ndarray
+        """
+        # every row holds its tids in ascending order before the padding, so row j is searched with a binary search
+        # instead of a membership table over all the transactions
+        lengths = np.count_nonzero(values, axis=1)
+        result = np.zeros((len(values) * (len(values) - 1) // 2, values.shape[1]), dtype=np.uint32)
+        index = 0
+        for i in range(len(values) - 1):
+            row = values[i]
+            for j in range(i + 1, len(values)):
+                other = values[j, :lengths[j]]
+                if len(other):
+                    position = np.minimum(np.searchsorted(other, row), len(other) - 1)
+                    result[index] = row * (other[position] == row)
+                index += 1
+        return result
+
     @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
     def startMine(self):
         """
@@ -357,7 +371,11 @@ class cudaAprioriTID:
         """
         Frequent pattern mining process will start from here
         """
-        dev_Intersection = deviceIntersection.get_function("intersection")
+        if self._backend == 'cuda':
+            import pycuda.autoinit
+            import pycuda.driver as cuda
+            from pycuda.compiler import SourceModule
+            dev_Intersection = SourceModule(_intersectionSource).get_function("intersection")
         startTime = time.time()
         final = {}
 
@@ -365,8 +383,11 @@ class cudaAprioriTID:
         self._minSup = self._convert(self._minSup)
         minSup = self._minSup
 
-
-        data = dict(filter(lambda x: len(x[1]) >= self.minSup, self._Database()))
+        tids = {}
+        for lineNumber, transaction in enumerate(self._Database, 1):
+            for item in transaction:
+                tids.setdefault(item, []).append(lineNumber)
+        data = dict(filter(lambda x: len(x[1]) >= self._minSup, tids.items()))
         for key, value in data.items():
             final[key] = len(value)
 
@@ -405,43 +426,46 @@ class cudaAprioriTID:
             values = np.array(values, dtype=np.uint32)
             result = np.array(result, dtype=np.uint32)
 
-            # allocate memory on GPU
-            compareThis_gpu = cuda.mem_alloc(compareThis.nbytes)
-            compareThat_gpu = cuda.mem_alloc(compareThat.nbytes)
-            resultStart_gpu = cuda.mem_alloc(resultStart.nbytes)
-            values_gpu = cuda.mem_alloc(values.nbytes)
-            result_gpu = cuda.mem_alloc(result.nbytes)
-
-            # add all nbytes to GPU_MEM
-            sumBytes = compareThis.nbytes + compareThat.nbytes + resultStart.nbytes + values.nbytes + result.nbytes
-            if sumBytes > self.__GPU_MEM:
-                self.__GPU_MEM = sumBytes
-
-            # copy data to GPU
-            cuda.memcpy_htod(compareThis_gpu, compareThis)
-            cuda.memcpy_htod(compareThat_gpu, compareThat)
-            cuda.memcpy_htod(resultStart_gpu, resultStart)
-            cuda.memcpy_htod(values_gpu, values)
-            cuda.memcpy_htod(result_gpu, result)
-
-            blockDim = (32, 32, 1)
-            gridDim = (resultSize//32 + 1, len(maxLength)//32 + 1, 1)
-
-            dev_Intersection(compareThis_gpu, compareThat_gpu,
-                             resultStart_gpu, values_gpu, result_gpu,
-                             np.uint32(resultSize), np.uint32(len(maxLength)),
-                             block=blockDim, grid=gridDim)
-
-            # copy data back to CPU
-            cuda.Context.synchronize()
-            cuda.memcpy_dtoh(result, result_gpu)
-
-            # free GPU memory
-            cuda.DeviceAllocation.free(compareThis_gpu)
-            cuda.DeviceAllocation.free(compareThat_gpu)
-            cuda.DeviceAllocation.free(resultStart_gpu)
-            cuda.DeviceAllocation.free(values_gpu)
-            cuda.DeviceAllocation.free(result_gpu)
+            if self._backend == 'cpu':
+                result = self.__intersection(values)
+            else:
+                # allocate memory on GPU
+                compareThis_gpu = cuda.mem_alloc(compareThis.nbytes)
+                compareThat_gpu = cuda.mem_alloc(compareThat.nbytes)
+                resultStart_gpu = cuda.mem_alloc(resultStart.nbytes)
+                values_gpu = cuda.mem_alloc(values.nbytes)
+                result_gpu = cuda.mem_alloc(result.nbytes)
+
+                # add all nbytes to GPU_MEM
+                sumBytes = compareThis.nbytes + compareThat.nbytes + resultStart.nbytes + values.nbytes + result.nbytes
+                if sumBytes > self.__GPU_MEM:
+                    self.__GPU_MEM = sumBytes
+
+                # copy data to GPU
+                cuda.memcpy_htod(compareThis_gpu, compareThis)
+                cuda.memcpy_htod(compareThat_gpu, compareThat)
+                cuda.memcpy_htod(resultStart_gpu, resultStart)
+                cuda.memcpy_htod(values_gpu, values)
+                cuda.memcpy_htod(result_gpu, result)
+
+                blockDim = (32, 32, 1)
+                gridDim = (resultSize//32 + 1, len(maxLength)//32 + 1, 1)
+
+                dev_Intersection(compareThis_gpu, compareThat_gpu,
+                                 resultStart_gpu, values_gpu, result_gpu,
+                                 np.uint32(resultSize), np.uint32(len(maxLength)),
+                                 block=blockDim, grid=gridDim)
+
+                # copy data back to CPU
+                cuda.Context.synchronize()
+                cuda.memcpy_dtoh(result, result_gpu)
+
+                # free GPU memory
+                cuda.DeviceAllocation.free(compareThis_gpu)
+                cuda.DeviceAllocation.free(compareThat_gpu)
+                cuda.DeviceAllocation.free(resultStart_gpu)
+                cuda.DeviceAllocation.free(values_gpu)
+                cuda.DeviceAllocation.free(result_gpu)
 
             keys = list(data.keys())
             # convert all to string and add " "
@@ -453,7 +477,7 @@ class cudaAprioriTID:
                 for j in range(i+1, len(keys)):
                     newResult = list(sorted(set(result[index])))
                     newResult = list(filter(lambda x: x > 0, newResult))
-                    if len(newResult) >= self.minSup:
+                    if len(newResult) >= self._minSup:
                         keyI = keys[i].split()
                         keyJ = keys[j].split()
                         combinedKey = " ".join(list(str(x) for x in (
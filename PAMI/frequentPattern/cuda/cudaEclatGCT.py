@@ -51,7 +51,7 @@ Copyright (C)  2021 Rage Uday Kiran
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 from PAMI.frequentPattern.basic import abstract as _ab
 
 minSup = str()
@@ -61,8 +61,7 @@ import os
 import csv
 import time
 import numpy as np
-import pycuda.gpuarray as _gpuarray
-import pycuda.autoinit
+from PAMI.extras.backend.bitmapDevice import selectBackend as _selectBackend
 import psutil
 
 
@@ -81,6 +80,8 @@ class cudaEclatGCT:
                    The user can specify minSup either in count or proportion of database size. If the program detects the data type of minSup is integer, then it treats minSup is expressed in count. Otherwise, it will be treated as float.
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  backend: str :
+                   'cuda' sums the vertical bitvectors on the GPU with pycuda, 'cpu' sums the same bitvectors as NumPy arrays. The default 'auto' uses the GPU when pycuda finds one.
 
     :Attributes:
 
@@ -163,8 +164,9 @@ class cudaEclatGCT:
     _minSup = 0
     _finalPatterns = {}
 
-    def __init__(self, filePath, minSup, sep):
+    def __init__(self, filePath, minSup, sep='\t', backend='auto'):
         self._iFile = filePath
+        self._backend = _selectBackend(backend, 'pycuda')
         self._sep = sep
         self._minSup = minSup
         self.__time = 0
@@ -190,7 +192,7 @@ class cudaEclatGCT:
         Storing the complete transactions of the database/input file in a database variable
         """
         self.__Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -199,7 +201,7 @@ class cudaEclatGCT:
 
             # print(self.Database)
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -243,6 +245,31 @@ class cudaEclatGCT:
                 value = int(value)
         return value
 
+    def _toDevice(self, array):
+        """
+        Copies the vertical bitvectors to the GPU with the cuda backend, the cpu backend keeps the NumPy array
+
+        :param array: vertical bitvectors
+        :type array: numpy.ndarray
+        :return: the bitvectors on the device of the backend
+        """
+        if self._backend == 'cuda':
+            import pycuda.autoinit
+            import pycuda.gpuarray as gpuarray
+            return gpuarray.to_gpu(array)
+        return array
+
+    def _sum(self, array):
+        """
+        :param array: bitvector on the device of the backend
+        :return: number of transactions of the bitvector
+        :rtype: int
+        """
+        if self._backend == 'cuda':
+            import pycuda.gpuarray as gpuarray
+            return gpuarray.sum(array).get()
+        return array.sum()
+
     def compute_vertical_bitvector_data(self):
         """
         Converting  database into bit vector
@@ -261,7 +288,7 @@ class cudaEclatGCT:
         for trans_id, transaction in enumerate(self.__Database):
             for item in transaction:
                 vb_data[item2idx[item], trans_id] = 1
-        vb_data = _gpuarray.to_gpu(vb_data.astype(np.uint16))
+        vb_data = self._toDevice(vb_data.astype(np.uint16))
         return vb_data, idx2item
 
     def getRuntime(self):
@@ -338,7 +365,7 @@ class cudaEclatGCT:
                     total = vb_data[valueList[0]]
                     for k in range(1, len(valueList)):
                         total = total.__mul__(vb_data[valueList[k]])
-                    support = _gpuarray.sum(total).get()
+                    support = self._sum(total)
                     if support >= self._minSup:
                         newBasePattern.append(" ".join(unionOfKey))
                         final[" ".join(unionOfKey)] = support
@@ -367,9 +394,9 @@ class cudaEclatGCT:
         vb_data, idx2item = self.compute_vertical_bitvector_data()
 
         for i in range(len(vb_data)):
-            if _gpuarray.sum(vb_data[i]).get() >= self._minSup:
+            if self._sum(vb_data[i]) >= self._minSup:
                 basePattern.append(idx2item[i])
-                final[idx2item[i]] = _gpuarray.sum(vb_data[i]).get()
+                final[idx2item[i]] = self._sum(vb_data[i])
 
         # reverse idx2item
         item2idx = {idx2item[i]: i for i in idx2item}
@@ -53,7 +53,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 
 from PAMI.frequentPattern.maximal import abstract as _ab
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 _minSup = str()
@@ -292,106 +292,46 @@ class _Tree(object):
             self.removeNode(i)
 
 
-class _MNode(object):
-    """
-    A class used to represent the node in maximal tree
-
-    :Attributes:
-        item : int
-            storing item of a node
-        children : list
-            To maintain the children of node
-
-    :Methods:
-        addChild(itemName)
-            storing the children to their respective parent nodes
-    """
-
-    def __init__(self, item, children):
-        self.item = item
-        self.children = children
-
-    def addChild(self, node):
-        """
-        To add the children details to a parent node
-        :param node: children node
-        :type node: _MNode
-        :return: adding children details to parent node
-        """
-        self.children[node.item] = node
-        node.parent = self
-
-
 class _MPTree(object):
     """
-    A class used to represent the frequentPatternGrowth tree structure
+    A class used to represent the maximal frequent patterns found so far, as the bitmask signatures of a
+    SubsumptionIndex, so that checking a pattern only scans the maximal patterns containing its rarest item
 
     :Attributes:
 
-        root : Node
-            Represents the root node of the tree
-        summaries : dictionary
-            storing the nodes with same item name
-
+        index : SubsumptionIndex
+            Stores the maximal frequent patterns extracted till now
 
     :Methods:
 
         addTransaction(transaction)
-            creating transaction as a branch in frequentPatternTree
-        addConditionalTransaction(prefixPaths, supportOfItems)
-            construct the conditional tree for prefix paths
+            storing a maximal frequent pattern in the index
         checkerSub(items):
             Given a set of items to the subset of them is present or not
     """
 
     def __init__(self):
-        self.root = _MNode(None, {})
-        self.summaries = {}
+        self.index = _ab._SubsumptionIndex()
 
     def addTransaction(self, transaction):
         """
-        To construct the maximal frequent pattern into maximal tree
+        To store the maximal frequent pattern into the index
         :param transaction: the maximal frequent patterns extracted till now
         :type transaction: list
-        :return: the maximal tree
+        :return: the index with the pattern added
         """
-        currentNode = self.root
         transaction.sort()
-        for i in range(len(transaction)):
-            if transaction[i] not in currentNode.children:
-                newNode = _MNode(transaction[i], {})
-                currentNode.addChild(newNode)
-                if transaction[i] in self.summaries:
-                    self.summaries[transaction[i]].insert(0, newNode)
-                else:
-                    self.summaries[transaction[i]] = [newNode]
-                currentNode = newNode
-            else:
-                currentNode = currentNode.children[transaction[i]]
+        self.index.add(transaction)
 
     def checkerSub(self, items):
         """
-        To check the subset of pattern present in tree
+        To check if a superset of the pattern is present in the index
         :param items: the sub frequent pattern
         :type items: list
-        :return: checks if subset present in the tree
-        """
-        items.sort(reverse=True)
-        item = items[0]
-        if item not in self.summaries:
-            return 1
-        else:
-            if len(items) == 1:
-                return 0
-        for t in self.summaries[item]:
-            cur = t.parent
-            i = 1
-            while cur.item is not None:
-                if items[i] == cur.item:
-                    i += 1
-                    if i == len(items):
-                        return 0
-                cur = cur.parent
+        :return: 0 if a superset is present in the index, 1 otherwise
+        """
+        if self.index.hasSuperset(items):
+            return 0
         return 1
 
 
@@ -527,7 +467,7 @@ class MaxFPGrowth(_ab._frequentPatterns):
             Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -538,7 +478,9 @@ class MaxFPGrowth(_ab._frequentPatterns):
                 print("The column name should be Transactions and each line should be separated by tab space or a seperator specified by the user")
 
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._TransactionStore.isStore(self._iFile):
+                self._Database = _ab._TransactionStore(self._iFile)
+            elif _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -53,7 +53,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.frequentPattern.pyspark import abstract as _ab
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class parallelApriori(_ab._frequentPatterns):
@@ -75,6 +75,8 @@ class parallelApriori(_ab._frequentPatterns):
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
     :param  numPartitions: int :
                    The number of partitions. On each worker node, an executor process is started and this process performs processing.The processing unit of worker node is partition
+    :param  backend: str :
+                   'spark' (default) runs the plan on a SparkContext. 'process' runs the same plan on a local pool of numPartitions processes, without starting a JVM.
 
 
 
@@ -167,22 +169,22 @@ class parallelApriori(_ab._frequentPatterns):
     _numPartitions = int()
     _lno = int()
 
-    def __init__(self, iFile, minSup, numWorkers, sep='\t'):
-        super().__init__(iFile, minSup, int(numWorkers), sep)
+    def __init__(self, iFile, minSup, numWorkers, sep='\t', backend='spark'):
+        super().__init__(iFile, minSup, int(numWorkers), sep, backend)
 
     def _creatingItemSets(self):
         """
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
             if 'Transactions' in i:
                 self._Database = self._iFile['Transactions'].tolist()
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -373,9 +375,8 @@ class parallelApriori(_ab._frequentPatterns):
         """
         self._startTime = _ab._time.time()
 
-        # setting SparkConf and SparkContext to process in parallel
-        conf = _ab._SparkConf().setAppName("parallelApriori").setMaster("local[*]")
-        sc = _ab._SparkContext(conf=conf)
+        # setting the SparkContext, or the ProcessContext of the process backend, to process in parallel
+        sc = _ab._createContext(self._backend, "parallelApriori", "local[*]", self._numPartitions)
         # sc.addFile("file:///home/hadoopuser/Spark_code/abstract.py")
 
         # read database from iFile
@@ -52,11 +52,10 @@ Copyright (C)  2021 Rage Uday Kiran
      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from pyspark import SparkConf, SparkContext
 # import abstract as _ab
 from PAMI.frequentPattern.pyspark import abstract as _ab
 from abc import ABC as _ABC, abstractmethod as _abstractmethod
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class parallelECLAT(_ab._frequentPatterns):
@@ -76,6 +75,8 @@ class parallelECLAT(_ab._frequentPatterns):
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
     :param  numPartitions: int :
                    The number of partitions. On each worker node, an executor process is started and this process performs processing.The processing unit of worker node is partition
+    :param  backend: str :
+                   'spark' (default) runs the plan on a SparkContext. 'process' runs the same plan on a local pool of numPartitions processes, without starting a JVM.
 
 
     :Attributes:
@@ -165,8 +166,8 @@ class parallelECLAT(_ab._frequentPatterns):
     _memoryRSS = float()
     _lno = int()
 
-    def __init__(self, iFile, minSup, numWorkers, sep="\t"):
-        super().__init__(iFile, minSup, int(numWorkers), sep)
+    def __init__(self, iFile, minSup, numWorkers, sep="\t", backend='spark'):
+        super().__init__(iFile, minSup, int(numWorkers), sep, backend)
 
     def getMemoryUSS(self):
         """
@@ -308,8 +309,7 @@ class parallelECLAT(_ab._frequentPatterns):
         """
 
         self._startTime = _ab._time.time()
-        conf = SparkConf().setAppName("Parallel ECLAT").setMaster("local[*]")
-        sc = SparkContext(conf=conf)
+        sc = _ab._createContext(self._backend, "Parallel ECLAT", "local[*]", self._numPartitions)
 
         data = sc.textFile(self._iFile, self._numPartitions) \
             .map(lambda line: [int(y) for y in line.rstrip().split(self._sep)]).persist()
@@ -58,8 +58,7 @@ Copyright (C)  2021 Rage Uday Kiran
 from collections import defaultdict
 from PAMI.frequentPattern.pyspark import abstract as _ab
 from operator import add
-from pyspark import SparkConf as _SparkConf, SparkContext as _SparkContext
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class Node:
@@ -167,6 +166,8 @@ class parallelFPGrowth(_ab._frequentPatterns):
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
     :param  numPartitions: int :
                    The number of partitions. On each worker node, an executor process is started and this process performs processing.The processing unit of worker node is partition
+    :param  backend: str :
+                   'spark' (default) runs the plan on a SparkContext. 'process' runs the same plan on a local pool of numPartitions processes, without starting a JVM.
 
 
     :Attributes:
@@ -257,8 +258,8 @@ class parallelFPGrowth(_ab._frequentPatterns):
     _lno = int()
 
 
-    def __init__(self, iFile, minSup, numWorkers, sep='\t'):
-        super().__init__(iFile, minSup, int(numWorkers), sep)
+    def __init__(self, iFile, minSup, numWorkers, sep='\t', backend='spark'):
+        super().__init__(iFile, minSup, int(numWorkers), sep, backend)
 
     @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
     def startMine(self):
@@ -274,8 +275,7 @@ class parallelFPGrowth(_ab._frequentPatterns):
 
         self._startTime = _ab._time.time()
 
-        conf = _SparkConf().setAppName("Parallel FPGrowth").setMaster("local[*]")
-        sc = _SparkContext(conf=conf)
+        sc = _ab._createContext(self._backend, "Parallel FPGrowth", "local[*]", self._numPartitions)
 
         rdd = sc.textFile(self._iFile, self._numPartitions)\
             .map(lambda x: x.rstrip().split(self._sep))\
@@ -52,7 +52,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.frequentPattern.topk import abstract as _ab
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class FAE(_ab._frequentPatterns):
@@ -151,7 +151,7 @@ class FAE(_ab._frequentPatterns):
         """
 
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -163,7 +163,9 @@ class FAE(_ab._frequentPatterns):
 
             # print(self.Database)
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._TransactionStore.isStore(self._iFile):
+                self._Database = _ab._TransactionStore(self._iFile)
+            elif _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -198,17 +200,21 @@ class FAE(_ab._frequentPatterns):
                     candidate[j] += 1
                     self._tidList[j].append(i)
         self._finalPatterns = {}
+        self._topK = _ab._TopKCollector(self._k)
         plist = [key for key, value in sorted(candidate.items(), key=lambda x: x[1], reverse=True)]
         self._tidList = {k: frozenset(v) for k, v in self._tidList.items()}
-        for i in plist:
-            if len(self._finalPatterns) >= self._k:
-                break
-            else:
-                self._finalPatterns[i] = candidate[i]
-        self._minimum = min([self._finalPatterns[i] for i in self._finalPatterns.keys()])
-        plist = list(self._finalPatterns.keys())
+        for i in plist[:self._k]:
+            self._topK.push(i, candidate[i])
+        self._raiseMinimum()
+        plist = self._topK.patterns()
         return plist
 
+    def _raiseMinimum(self):
+        """
+        Once k patterns are held, a pattern needs at least the support of the worst of them to enter the top-k
+        """
+        self._minimum = self._topK.threshold if self._topK.isFull() else 1
+
     def _save(self, prefix, suffix, tidSetI):
         """
         Saves the patterns that satisfy the periodic frequent property.
@@ -225,26 +231,9 @@ class FAE(_ab._frequentPatterns):
             prefix = suffix
         else:
             prefix = prefix + suffix
-        val = len(tidSetI)
-        sample = str()
-        # for i in prefix:
-        #     sample = sample + i + "\t"
         sample = "\t".join(prefix)
-        if len(self._finalPatterns) < self._k:
-            if val > self._minimum:
-                self._finalPatterns[sample] = val
-                self._finalPatterns = {k: v for k, v in sorted(self._finalPatterns.items(), key=lambda item: item[1], reverse=True)}
-                self._minimum = min([i for i in self._finalPatterns.values()])
-        else:
-            for x, y in sorted(self._finalPatterns.items(), key=lambda x: x[1]):
-                if val > y:
-                    del self._finalPatterns[x]
-                    self._finalPatterns[sample] = val
-                    self._finalPatterns = {k: v for k, v in
-                                              sorted(self._finalPatterns.items(), key=lambda item: item[1],
-                                                     reverse=True)}
-                    self._minimum = min([i for i in self._finalPatterns.values()])
-                    return
+        if self._topK.push(sample, len(tidSetI)):
+            self._raiseMinimum()
 
     def _Generation(self, prefix, itemSets, tidSets):
         """
@@ -267,6 +256,9 @@ class FAE(_ab._frequentPatterns):
             if itemI is None:
                 continue
             tidSetI = tidSets[i]
+            if len(tidSetI) < self._minimum:
+                # the minimum was raised since the class was built
+                continue
             classItemSets = []
             classTidSets = []
             itemSetX = [itemI]
@@ -323,6 +315,8 @@ class FAE(_ab._frequentPatterns):
         for i in range(len(plist)):
             itemI = plist[i]
             tidSetI = self._tidList[itemI]
+            if len(tidSetI) < self._minimum:
+                continue
             itemSetX = [itemI]
             itemSets = []
             tidSets = []
@@ -334,6 +328,7 @@ class FAE(_ab._frequentPatterns):
                     itemSets.append(itemJ)
                     tidSets.append(y1)
             self._Generation(itemSetX, itemSets, tidSets)
+        self._finalPatterns = self._topK.toDict()
         print(" TopK frequent patterns were successfully generated using FAE algorithm.")
         self._endTime = _ab._time.time()
         self._memoryUSS = float()
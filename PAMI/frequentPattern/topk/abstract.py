@@ -17,15 +17,18 @@ from abc import ABC as _ABC, abstractmethod as _abstractmethod
 import time as _time
 import math as _math
 import csv as _csv
-import pandas as _pd
+from PAMI.extras.lazyImport import lazyModule as _lazyModule, isDataFrame as _isDataFrame, isURL as _isURL
+_pd = _lazyModule('pandas')
 from collections import defaultdict as _defauldict
 from itertools import combinations as _c
 import os as _os
 import os.path as _ospath
-import psutil as _psutil
+_psutil = _lazyModule('psutil')
 import sys as _sys
-import validators as _validators
-from urllib.request import urlopen as _urlopen
+_validators = _lazyModule('validators')
+from PAMI.extras.lazyImport import urlopen as _urlopen
+from PAMI.extras.transactionStore.TransactionStore import TransactionStore as _TransactionStore
+from PAMI.extras.patternStore.TopKCollector import TopKCollector as _TopKCollector
 
 
 class _frequentPatterns(_ABC):
@@ -71,6 +74,10 @@ class _frequentPatterns(_ABC):
             Total amount of runtime taken by the program will be retrieved from this function
     """
 
+    #: Attributes holding the result of mine(), restored by extras.resultCache on a cache hit. Subclasses that keep
+    #: their result elsewhere set it to None, which makes the cache refuse them.
+    _cacheState = ('_finalPatterns', '_minSup')
+
     def __init__(self, iFile, k, sep = '\t'):
         """
         :param iFile: Input file name or path of the input file
@@ -35,7 +35,7 @@
 
 from PAMI.fuzzyCorrelatedPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class _FFList:
@@ -435,7 +435,7 @@ class FCPGrowth(_ab._corelatedFuzzyFrequentPatterns):
         :return: None
         """
         self._transactions, self._fuzzyValues = [], []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -445,7 +445,7 @@ class FCPGrowth(_ab._corelatedFuzzyFrequentPatterns):
                 self._fuzzyValues = self._iFile['Utilities'].tolist()
             # print(self.Database)
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line = line.decode("utf-8")
@@ -712,7 +712,7 @@ class FCPGrowth(_ab._corelatedFuzzyFrequentPatterns):
         """
         return self._finalPatterns
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final frequent patterns in a dataframe
 
@@ -53,7 +53,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 from PAMI.fuzzyFrequentPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class _FFList:
@@ -424,7 +424,7 @@ class FFIMiner(_ab._fuzzyFrequentPattenrs):
         Storing the complete transactions of the database/input file in a database variable
         """
         self._transactions, self._fuzzyValues, self._Database = [], [], []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -434,7 +434,7 @@ class FFIMiner(_ab._fuzzyFrequentPattenrs):
                 self._fuzzyValues = self._iFile['fuzzyValues'].tolist()
             # print(self.Database)
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line = line.decode("utf-8")
@@ -710,7 +710,7 @@ class FFIMiner(_ab._fuzzyFrequentPattenrs):
         res1 = str(sumIUtil)
         self._finalPatterns[res] = res1
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final frequent patterns in a dataframe
 
@@ -54,7 +54,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.fuzzyGeoreferencedFrequentPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class _FFList:
@@ -335,7 +335,7 @@ class FFSPMiner(_ab._fuzzySpatialFrequentPatterns):
         :return: None
         """
         self._transactions, self._fuzzyValues = [], []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -345,7 +345,7 @@ class FFSPMiner(_ab._fuzzySpatialFrequentPatterns):
                 self.fuzzyValues = self._iFile['Utilities'].tolist()
 
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line = line.decode("utf-8")
@@ -375,7 +375,7 @@ class FFSPMiner(_ab._fuzzySpatialFrequentPatterns):
 
     def _mapNeighbours(self) -> None:
         self._mapItemNeighbours = {}
-        if isinstance(self._nFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._nFile):
             data, items = [], []
             if self._nFile.empty:
                 print("its empty..")
@@ -388,7 +388,7 @@ class FFSPMiner(_ab._fuzzySpatialFrequentPatterns):
                 self._mapItemNeighbours[items[k]] = data[k]
 
         if isinstance(self._nFile, str):
-            if _ab._validators.url(self._nFile):
+            if _ab._isURL(self._nFile):
                 data = _ab._urlopen(self._nFile)
                 for line in data:
                     line = line.decode("utf-8")
@@ -635,7 +635,7 @@ class FFSPMiner(_ab._fuzzySpatialFrequentPatterns):
         res1 = str(sumIUtil)
         self._finalPatterns[res] = res1
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final frequent patterns in a dataframe
 
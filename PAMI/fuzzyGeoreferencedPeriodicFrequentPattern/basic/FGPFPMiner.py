@@ -55,7 +55,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 
 import PAMI.fuzzyGeoreferencedPeriodicFrequentPattern.basic.abstract as _ab
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class _FFList:
@@ -326,7 +326,7 @@ class FGPFPMiner(_ab._fuzzySpatialFrequentPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self._transactionsDB, self._fuzzyValuesDB, self._ts = [], [], []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -336,7 +336,7 @@ class FGPFPMiner(_ab._fuzzySpatialFrequentPatterns):
                 self._fuzzyValuesDB = self._iFile['fuzzyValues'].tolist()
 
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line = line.decode("utf-8")
@@ -369,7 +369,7 @@ class FGPFPMiner(_ab._fuzzySpatialFrequentPatterns):
         A function to map items to their Neighbours
         """
         self._mapItemNeighbours = {}
-        if isinstance(self._nFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._nFile):
             data, items = [], []
             if self._nFile.empty:
                 print("its empty..")
@@ -382,7 +382,7 @@ class FGPFPMiner(_ab._fuzzySpatialFrequentPatterns):
                 self._mapItemNeighbours[items[k]] = data[k]
 
         if isinstance(self._nFile, str):
-            if _ab._validators.url(self._nFile):
+            if _ab._isURL(self._nFile):
                 data = _ab._urlopen(self._nFile)
                 for line in data:
                     line = line.decode("utf-8")
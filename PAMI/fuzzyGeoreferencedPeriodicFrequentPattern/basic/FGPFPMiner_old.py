@@ -43,7 +43,7 @@ Copyright (C)  2021 Rage Uday Kiran
 import pandas as pd
 import plotly.express as px
 import PAMI.fuzzyGeoreferencedPeriodicFrequentPattern.basic.abstract as _ab
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class _FFList:
@@ -351,7 +351,7 @@ class FGPFPMiner(_ab._fuzzySpatialFrequentPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self._transactionsDB, self._fuzzyValuesDB = [], []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -361,7 +361,7 @@ class FGPFPMiner(_ab._fuzzySpatialFrequentPatterns):
                 self._fuzzyValuesDB = self._iFile['fuzzyValues'].tolist()
 
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line = line.decode("utf-8")
@@ -392,7 +392,7 @@ class FGPFPMiner(_ab._fuzzySpatialFrequentPatterns):
         A function to map items to their Neighbours
         """
         self._mapItemNeighbours = {}
-        if isinstance(self._nFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._nFile):
             data, items = [], []
             if self._nFile.empty:
                 print("its empty..")
@@ -405,7 +405,7 @@ class FGPFPMiner(_ab._fuzzySpatialFrequentPatterns):
                 self._mapItemNeighbours[items[k]] = data[k]
 
         if isinstance(self._nFile, str):
-            if _ab._validators.url(self._nFile):
+            if _ab._isURL(self._nFile):
                 data = _ab._urlopen(self._nFile)
                 for line in data:
                     line = line.decode("utf-8")
@@ -64,7 +64,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.fuzzyPartialPeriodicPatterns.basic import abstract as _ab
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class _FFList:
@@ -348,7 +348,7 @@ class F3PMiner(_ab._fuzzyPartialPeriodicPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self._transactions, self._fuzzyValues, self._Database, self._ts = [], [], [], []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -358,7 +358,7 @@ class F3PMiner(_ab._fuzzyPartialPeriodicPatterns):
                 self._fuzzyValues = self._iFile['fuzzyValues'].tolist()
             # print(self.Database)
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line = line.decode("utf-8")
@@ -66,7 +66,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.fuzzyPeriodicFrequentPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class _FFList:
@@ -309,7 +309,7 @@ class FPFPMiner(_ab._fuzzyPeriodicFrequentPatterns):
     _fuzzyValues = []
     _ts = []
 
-    def __init__(self, iFile: Union[str, _ab._pd.DataFrame], minSup: Union[int, float], period: Union[int, float], sep: str="\t") -> None:
+    def __init__(self, iFile: 'Union[str, _ab._pd.DataFrame]', minSup: Union[int, float], period: Union[int, float], sep: str="\t") -> None:
         super().__init__(iFile, minSup, period, sep)
         self._oFile = ""
         self._BufferSize = 200
@@ -376,7 +376,7 @@ class FPFPMiner(_ab._fuzzyPeriodicFrequentPatterns):
         :return: None
         """
         data, self._transactions, self._fuzzyValues, ts = [], [], [], []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -387,7 +387,7 @@ class FPFPMiner(_ab._fuzzyPeriodicFrequentPatterns):
             if 'fuzzyValues' in i:
                 self._fuzzyValues = self._iFile['fuzzyValues'].tolist()
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 count = 0
                 for line in data:
@@ -631,7 +631,7 @@ class FPFPMiner(_ab._fuzzyPeriodicFrequentPatterns):
         #res1 = str(sumLUtil) + " : " + str(period)
         self._finalPatterns[res] = [sumLUtil, period]
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final frequent patterns in a dataframe
 
@@ -61,7 +61,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 
 from PAMI.fuzzyPeriodicFrequentPattern.basic import abstract as _ab
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class _FFList:
@@ -400,7 +400,7 @@ class FPFPMiner(_ab._fuzzyPeriodicFrequentPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         data, self._transactions, self._fuzzyValues, ts = [], [], [], []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -411,7 +411,7 @@ class FPFPMiner(_ab._fuzzyPeriodicFrequentPatterns):
             if 'fuzzyValues' in i:
                 self._fuzzyValues = self._iFile['fuzzyValues'].tolist()
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 count = 0
                 for line in data:
@@ -53,7 +53,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from  PAMI.geoReferencedPeriodicFrequentPattern.basic import abstract as _ab
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class GPFPMiner(_ab._geoReferencedPeriodicFrequentPatterns):
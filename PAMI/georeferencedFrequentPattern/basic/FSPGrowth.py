@@ -54,7 +54,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.georeferencedFrequentPattern.basic import abstract as _ab
 from typing import List, Dict
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 class _Node:
     """
@@ -394,7 +394,7 @@ class FSPGrowth(_ab._spatialFrequentPatterns):
         """
 
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -402,7 +402,7 @@ class FSPGrowth(_ab._spatialFrequentPatterns):
                 self._Database = self._iFile['Transactions'].tolist()
             self._lno = len(self._Database)
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -425,7 +425,7 @@ class FSPGrowth(_ab._spatialFrequentPatterns):
                     quit()
 
         self._neighbourList = {}
-        if isinstance(self._nFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._nFile):
             data, items = [], []
             if self._nFile.empty:
                 print("its empty..")
@@ -438,7 +438,7 @@ class FSPGrowth(_ab._spatialFrequentPatterns):
                 self._neighbourList[items[k][0]] = data[k]
             # print(self.Database)
         if isinstance(self._nFile, str):
-            if _ab._validators.url(self._nFile):
+            if _ab._isURL(self._nFile):
                 data = _ab._urlopen(self._nFile)
                 for line in data:
                     line.strip()
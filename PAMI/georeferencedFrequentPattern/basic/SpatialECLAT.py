@@ -53,7 +53,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.georeferencedFrequentPattern.basic import abstract as _ab
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class SpatialECLAT(_ab._spatialFrequentPatterns):
@@ -210,7 +210,7 @@ class SpatialECLAT(_ab._spatialFrequentPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -219,7 +219,7 @@ class SpatialECLAT(_ab._spatialFrequentPatterns):
             if 'Patterns' in i:
                 self._Database = self._iFile['Patterns'].tolist()
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -375,7 +375,7 @@ class SpatialECLAT(_ab._spatialFrequentPatterns):
         A function to map items to their Neighbours
         """
         self._NeighboursMap = {}
-        if isinstance(self._nFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._nFile):
             data, items = [], []
             if self._nFile.empty:
                 print("its empty..")
@@ -388,7 +388,7 @@ class SpatialECLAT(_ab._spatialFrequentPatterns):
                 self._NeighboursMap[items[k]] = data[k]
             # print(self.Database)
         if isinstance(self._nFile, str):
-            if _ab._validators.url(self._nFile):
+            if _ab._isURL(self._nFile):
                 data = _ab._urlopen(self._nFile)
                 for line in data:
                     line.strip()
@@ -58,7 +58,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.georeferencedFrequentSequencePattern.basic import abstract as _ab
 import sys
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 sys.setrecursionlimit(10000)
 
@@ -215,7 +215,7 @@ class GFSP_Miner(_ab._sequentialSpatialPatterns):
         """
         self._Database = []
 
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             temp = []
             if self._iFile.empty:
                 print("its empty..")
@@ -235,7 +235,7 @@ class GFSP_Miner(_ab._sequentialSpatialPatterns):
                     addList.append(temp[k + 1])
             self._Database.append(addList)
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -294,7 +294,7 @@ class GFSP_Miner(_ab._sequentialSpatialPatterns):
         A function to map items to their Neighbours
         """
         self._NeighboursMap = {}
-        if isinstance(self._nFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._nFile):
             data, items = [], []
             if self._nFile.empty:
                 print("its empty..")
@@ -307,7 +307,7 @@ class GFSP_Miner(_ab._sequentialSpatialPatterns):
                 self._NeighboursMap[items[k]] = data[k]
             # print(self.Database)
         if isinstance(self._nFile, str):
-            if _ab._validators.url(self._nFile):
+            if _ab._isURL(self._nFile):
                 data = _ab._urlopen(self._nFile)
                 for line in data:
                     line.strip()
@@ -56,7 +56,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.georeferencedFrequentSequencePattern.basic import abstract as _ab
 import sys
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 sys.setrecursionlimit(10000)
 
@@ -241,7 +241,7 @@ class GFSPminer(_ab._GeorefarencedFequentialPatterns):
         """
         self._Database = []
 
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             temp = []
             if self._iFile.empty:
                 print("its empty..")
@@ -261,7 +261,7 @@ class GFSPminer(_ab._GeorefarencedFequentialPatterns):
                     addList.append(temp[k + 1])
             self._Database.append(addList)
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -320,7 +320,7 @@ class GFSPminer(_ab._GeorefarencedFequentialPatterns):
         A function to map items to their Neighbours
         """
         self._NeighboursMap = {}
-        if isinstance(self._nFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._nFile):
             data, items = [], []
             if self._nFile.empty:
                 print("its empty..")
@@ -333,7 +333,7 @@ class GFSPminer(_ab._GeorefarencedFequentialPatterns):
                 self._NeighboursMap[items[k]] = data[k]
             # print(self.Database)
         if isinstance(self._nFile, str):
-            if _ab._validators.url(self._nFile):
+            if _ab._isURL(self._nFile):
                 data = _ab._urlopen(self._nFile)
                 for line in data:
                     line.strip()
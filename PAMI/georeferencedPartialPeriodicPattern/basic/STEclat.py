@@ -52,7 +52,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 
 from PAMI.georeferencedPartialPeriodicPattern.basic import abstract as _ab
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class STEclat(_ab._partialPeriodicSpatialPatterns):
@@ -209,7 +209,7 @@ class STEclat(_ab._partialPeriodicSpatialPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             data, ts = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -224,7 +224,7 @@ class STEclat(_ab._partialPeriodicSpatialPatterns):
                 self._Database.append(tr)
 
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -392,7 +392,7 @@ class STEclat(_ab._partialPeriodicSpatialPatterns):
         A function to map items to their Neighbours
         """
         self._NeighboursMap = {}
-        if isinstance(self._nFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._nFile):
             data = []
             if self._nFile.empty:
                 print("its empty..")
@@ -402,7 +402,7 @@ class STEclat(_ab._partialPeriodicSpatialPatterns):
             for i in data:
                 self._NeighboursMap[i[0]] = i[1:]
         if isinstance(self._nFile, str):
-            if _ab._validators.url(self._nFile):
+            if _ab._isURL(self._nFile):
                 data = _ab._urlopen(self._nFile)
                 for line in data:
                     line.strip()
@@ -56,7 +56,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.highUtilityFrequentPattern.basic import abstract as _ab
 from typing import List, Dict, Union
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class _Transaction:
@@ -223,7 +223,7 @@ class _Dataset:
     transactions = []
     maxItem = 0
     
-    def __init__(self, datasetPath: Union[str, _ab._pd.DataFrame], sep: str) -> None:
+    def __init__(self, datasetPath: 'Union[str, _ab._pd.DataFrame]', sep: str) -> None:
         self.strToInt = {}
         self.intToStr = {}
         self.cnt = 1
@@ -241,7 +241,7 @@ class _Dataset:
         """
         self.Database = []
         self.transactions = []
-        if isinstance(datasetPath, _ab._pd.DataFrame):
+        if _ab._isDataFrame(datasetPath):
             utilities, data, utilitySum = [], [], []
             if datasetPath.empty:
                 print("its empty..")
@@ -255,7 +255,7 @@ class _Dataset:
             for k in range(len(data)):
                 self.transactions.append(self.createTransaction(data[k], utilities[k], utilitySum[k]))
         if isinstance(datasetPath, str):
-            if _ab._validators.url(datasetPath):
+            if _ab._isURL(datasetPath):
                 data = _ab._urlopen(datasetPath)
                 for line in data:
                     line = line.decode("utf-8")
@@ -863,7 +863,7 @@ class HUFIM(_ab._utilityPatterns):
                 else:
                     self._utilityBinArrayLU[item] = transaction.transactionUtility
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final patterns in a dataframe
 
@@ -29,15 +29,16 @@
 from abc import ABC as _ABC, abstractmethod as _abstractmethod
 import time as _time
 import csv as _csv
-import pandas as _pd
+from PAMI.extras.lazyImport import lazyModule as _lazyModule, isDataFrame as _isDataFrame, isURL as _isURL
+_pd = _lazyModule('pandas')
 from collections import defaultdict as _defaultdict
 from itertools import combinations as _c
 import os as _os
 import os.path as _ospath
-import psutil as _psutil
-import validators as _validators
+_psutil = _lazyModule('psutil')
+_validators = _lazyModule('validators')
 import sys as _sys
-from urllib.request import urlopen as _urlopen
+from PAMI.extras.lazyImport import urlopen as _urlopen
 import functools as _functools
 
 
@@ -54,7 +54,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 from PAMI.highUtilityGeoreferencedFrequentPattern.basic import abstract as _ab
 from functools import cmp_to_key as _comToKey
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 class _Transaction:
     """
@@ -229,7 +229,7 @@ class _Dataset:
         :type datasetPath: str
         """
         pmuString = None
-        if isinstance(datasetPath, _ab._pd.DataFrame):
+        if _ab._isDataFrame(datasetPath):
             utilities, data, utilitySum, pmuString = [], [], [], []
             if datasetPath.empty:
                 print("its empty..")
@@ -245,7 +245,7 @@ class _Dataset:
             for k in range(len(data)):
                 self.transactions.append(self.createTransaction(data[k], utilities[k], utilitySum[k], pmuString[k]))
         if isinstance(datasetPath, str):
-            if _ab._validators.url(datasetPath):
+            if _ab._isURL(datasetPath):
                 data = _ab._urlopen(datasetPath)
                 for line in data:
                     line = line.decode("utf-8")
@@ -54,7 +54,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.highUtilityPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class _Transaction:
@@ -198,7 +198,7 @@ class _Dataset:
     transactions = []
     maxItem = 0
     
-    def __init__(self,datasetPath: Union[str, _ab._pd.DataFrame], sep: str) -> None:
+    def __init__(self,datasetPath: 'Union[str, _ab._pd.DataFrame]', sep: str) -> None:
         self.strToInt = {}
         self.intToStr = {}
         self.transactions = []
@@ -207,7 +207,7 @@ class _Dataset:
         self.sep = sep
         self.createItemsets(datasetPath)
 
-    def createItemsets(self, datasetPath: Union[str, _ab._pd.DataFrame]) -> None:
+    def createItemsets(self, datasetPath: 'Union[str, _ab._pd.DataFrame]') -> None:
         """
         Storing the complete transactions of the database/input file in a database variable
         :param datasetPath: It represents the peth for the dataset
@@ -215,7 +215,7 @@ class _Dataset:
         :return: None
         """
         self.Database = []
-        if isinstance(datasetPath, _ab._pd.DataFrame):
+        if _ab._isDataFrame(datasetPath):
             utilities, data, transactionUtility = [], [], []
             if datasetPath.empty:
                 print("its empty..")
@@ -228,7 +228,7 @@ class _Dataset:
                 transactionUtility = datasetPath['UtilitySum'].tolist()
             self.transactions.append(self.createTransaction(data, utilities, transactionUtility))
         if isinstance(datasetPath, str):
-            if _ab._validators.url(datasetPath):
+            if _ab._isURL(datasetPath):
                 data = _ab._urlopen(datasetPath)
                 for line in data:
                     line = line.decode("utf-8")
@@ -53,7 +53,7 @@ Copyright (C)  2021 Rage Uday Kiran
 """
 
 from PAMI.highUtilityPattern.basic import abstract as _ab
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class _Element:
@@ -311,7 +311,7 @@ class HMiner(_ab._utilityPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self._transactions, self._utilities, self._utilitySum = [], [], []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -322,7 +322,7 @@ class HMiner(_ab._utilityPatterns):
             if 'UtilitySum' in i:
                 self._utilitySum = self._iFile['UtilitySum'].tolist()
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 #print("hey")
                 data = _ab._urlopen(self._iFile)
                 for line in data:
@@ -54,7 +54,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.highUtilityPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class _UPItem:
@@ -480,7 +480,7 @@ class UPGrowth(_ab._utilityPatterns):
         :return: None
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             timeStamp, data = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -496,7 +496,7 @@ class UPGrowth(_ab._utilityPatterns):
                 tr.append(data[i])
                 self._Database.append(tr)
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line = line.decode("utf-8")
@@ -683,7 +683,7 @@ class UPGrowth(_ab._utilityPatterns):
         """
         print('number of PHUIS are ' + str(len(self._phuis)))
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final frequent patterns in a dataframe
         :return: returning frequent patterns in a dataframe
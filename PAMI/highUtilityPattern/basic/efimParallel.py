@@ -56,7 +56,7 @@ import mmap
 import time
 import psutil
 from joblib import Parallel, delayed
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 __copyright__ = """
  Copyright (C)  2021 Rage Uday Kiran
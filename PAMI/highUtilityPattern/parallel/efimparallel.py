@@ -57,7 +57,7 @@ import mmap
 import time
 import psutil
 from joblib import Parallel, delayed
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 from PAMI.highUtilityPattern.parallel import abstract as _ab
@@ -58,7 +58,7 @@ import mmap
 import psutil
 import cupy as cp
 import numpy as np
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 searchGPU = cp.RawKernel(r'''
 
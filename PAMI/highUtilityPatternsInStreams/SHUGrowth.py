@@ -26,7 +26,7 @@ import abstract as _hus
 import pandas as pd
 from functools import reduce
 from operator import and_
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 _minSup = str()
 _hus._sys.setrecursionlimit(20000)
@@ -56,7 +56,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.highUtilitySpatialPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 class _Element:
     """
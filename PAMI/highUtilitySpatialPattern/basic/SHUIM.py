@@ -56,7 +56,7 @@ from PAMI.highUtilitySpatialPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator, Optional, TypeVar
 from functools import cmp_to_key as _cmpToKey
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class _Transaction:
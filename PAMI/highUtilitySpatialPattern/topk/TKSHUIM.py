@@ -57,8 +57,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 from PAMI.highUtilitySpatialPattern.topk.abstract import *
 from functools import cmp_to_key
-import heapq
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 class Transaction:
     """
@@ -428,7 +427,7 @@ class TKSHUIM(utilityPatterns):
     minUtil = 0
     memoryUSS = float()
     memoryRSS = float()
-    heapList = []
+    topK = None
 
     def __init__(self, iFile, nFile, k, sep="\t"):
         super().__init__(iFile, nFile, k, sep)
@@ -459,6 +458,7 @@ class TKSHUIM(utilityPatterns):
                 self.Neighbours[item] = lst
         o.close()
         InitialMemory = psutil.virtual_memory()[3]
+        self.topK = TopKCollector(self.k)
         self.useUtilityBinArrayToCalculateLocalUtilityFirstTime(self.dataset)
         itemsToKeep = []
         for key in self.utilityBinArrayLU.keys():
@@ -480,7 +480,7 @@ class TKSHUIM(utilityPatterns):
                 emptyTransactionCount += 1
         self.dataset.transactions = self.dataset.transactions[emptyTransactionCount:]
         self.useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self.dataset)
-        self.heapList = []
+        self.topK = TopKCollector(self.k)
         itemsToExplore = []
         for item in itemsToKeep:
             if self.utilityBinArraySU[item] >= self.minUtil:
@@ -499,8 +499,7 @@ class TKSHUIM(utilityPatterns):
         self.memoryRSS = float()
         self.memoryUSS = process.memory_full_info().uss
         self.memoryRSS = process.memory_info().rss
-        for item in self.heapList:
-            self.finalPatterns[item[1]] = item[0]
+        self.finalPatterns = self.topK.toDict()
         print('TOP-K mining process is completed by TKSHUIM')
 
     def backtrackingEFIM(self, transactionsOfP, itemsToKeep, itemsToExplore, prefixLength):
@@ -821,7 +820,7 @@ class TKSHUIM(utilityPatterns):
 
     def additemset(self, itemset, utility):
         """
-        adds the itemset to the priority queue
+        adds the itemset to the top-k collector and raises minUtil to the utility of the worst itemset held once k are held
 
         :param itemset: the itemset to be added
 
@@ -831,13 +830,8 @@ class TKSHUIM(utilityPatterns):
 
         :type utility: numpy.array
         """
-        heapq.heappush(self.heapList, (utility, itemset))
-        if len(self.heapList) > self.k:
-            while len(self.heapList) > self.k:
-                heapq.heappop(self.heapList)
-                if len(self.heapList) == 0:
-                    break
-            self.minUtil = heapq.nsmallest(1, self.heapList)[0][0]
+        if self.topK.push(itemset, utility) and self.topK.isFull():
+            self.minUtil = self.topK.threshold
 
     def getPatternsAsDataFrame(self):
         """
@@ -39,6 +39,7 @@ import os.path
 import psutil
 import sys
 from urllib.request import urlopen
+from PAMI.extras.patternStore.TopKCollector import TopKCollector
 
 
 class utilityPatterns(ABC):
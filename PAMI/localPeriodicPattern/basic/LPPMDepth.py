@@ -60,7 +60,7 @@ Copyright (C)  2021 Rage Uday Kiran
 from PAMI.localPeriodicPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class LPPMDepth(_ab._localPeriodicPatterns):
@@ -217,7 +217,7 @@ class LPPMDepth(_ab._localPeriodicPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self.__Database = []
-        if isinstance(self._localPeriodicPatterns__iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._localPeriodicPatterns__iFile):
             if self._localPeriodicPatterns__iFile.empty:
                 print("its empty..")
             i = self._localPeriodicPatterns__iFile.columns.values.tolist()
@@ -227,7 +227,7 @@ class LPPMDepth(_ab._localPeriodicPatterns):
                 self.__Database = self._localPeriodicPatterns__iFile['Patterns'].tolist()
 
         if isinstance(self._localPeriodicPatterns__iFile, str):
-            if _ab._validators.url(self._localPeriodicPatterns__iFile):
+            if _ab._isURL(self._localPeriodicPatterns__iFile):
                 data = _ab._urlopen(self._localPeriodicPatterns__iFile)
                 for line in data:
                     line.strip()
@@ -498,7 +498,7 @@ class LPPMDepth(_ab._localPeriodicPatterns):
 
         return self._localPeriodicPatterns__endTime - self._localPeriodicPatterns__startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final local periodic patterns in a dataframe
 
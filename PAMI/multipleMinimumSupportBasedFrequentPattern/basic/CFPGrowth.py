@@ -56,7 +56,7 @@ __copyright__ = """
 from PAMI.multipleMinimumSupportBasedFrequentPattern.basic import abstract as _fp
 from typing import List, Dict, Tuple, Generator
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 _fp._sys.setrecursionlimit(20000)
 _MIS = {}
@@ -386,7 +386,7 @@ class CFPGrowth(_fp._frequentPatterns):
         :return: None
         """
         self.__Database = []
-        if isinstance(self._iFile, _fp._pd.DataFrame):
+        if _fp._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -395,7 +395,7 @@ class CFPGrowth(_fp._frequentPatterns):
 
             # print(self.Database)
         if isinstance(self._iFile, str):
-            if _fp._validators.url(self._iFile):
+            if _fp._isURL(self._iFile):
                 data = _fp._urlopen(self._iFile)
                 for line in data:
                     line = line.strip()
@@ -422,7 +422,7 @@ class CFPGrowth(_fp._frequentPatterns):
         :reurtn: None
         """
         self._MISValues = {}
-        if isinstance(self._MIS, _fp._pd.DataFrame):
+        if _fp._isDataFrame(self._MIS):
             items, MIS = [], []
             if self._MIS.empty:
                 print("its empty..")
@@ -435,7 +435,7 @@ class CFPGrowth(_fp._frequentPatterns):
                 self._MISValues[items[i]] = MIS[i]
 
         if isinstance(self._MIS, str):
-            if _fp._validators.url(self._MIS):
+            if _fp._isURL(self._MIS):
                 data = _fp._urlopen(self._MIS)
                 for line in data:
                     line = line.strip()
@@ -23,7 +23,7 @@ from PAMI.partialPeriodicFrequentPattern.basic.abstract import *
 import cupy as cp
 import numpy as np
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 class cuGPPMiner(partialPeriodicPatterns):
   __path = ' '
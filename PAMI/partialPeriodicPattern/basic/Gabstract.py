@@ -100,7 +100,7 @@ class _partialPeriodicPatterns(_ABC):
         pass
 
     @_abstractmethod
-    def getPatternsAsDataFrame(self) -> _pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_pd.DataFrame':
         """Complete set of frequent patterns will be loaded in to data frame from this function"""
 
         pass
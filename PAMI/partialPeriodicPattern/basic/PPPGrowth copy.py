@@ -59,7 +59,7 @@ import validators as _validators
 from urllib.request import urlopen as _urlopen
 import sys as _sys
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 _minPS = float()
 _period = float()
@@ -446,7 +446,7 @@ class PPPGrowth(_abstract._partialPeriodicPatterns):
         :return: None
         """
         self._Database = []
-        if isinstance(self._iFile, _abstract._pd.DataFrame):
+        if _abstract._isDataFrame(self._iFile):
             data, tids = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -648,7 +648,7 @@ class PPPGrowth(_abstract._partialPeriodicPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _abstract._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_abstract._pd.DataFrame':
         """Storing final frequent patterns in a dataframe
 
         :return: returning frequent patterns in a dataframe
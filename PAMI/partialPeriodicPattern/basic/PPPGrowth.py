@@ -60,7 +60,7 @@ from urllib.request import urlopen as _urlopen
 import sys as _sys
 import pandas as pd
 import numpy as np
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 _minPS = float()
 _period = float()
@@ -548,7 +548,7 @@ class PPPGrowth(_abstract._partialPeriodicPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _abstract._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_abstract._pd.DataFrame':
         """Storing final frequent patterns in a dataframe
 
         :return: returning frequent patterns in a dataframe
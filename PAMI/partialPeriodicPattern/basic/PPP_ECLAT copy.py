@@ -58,7 +58,7 @@ import pandas as pd
 
 from PAMI.partialPeriodicPattern.basic import abstract as _ab
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 class PPP_ECLAT(_ab._partialPeriodicPatterns):
     """
@@ -250,7 +250,7 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
         :return: None
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             data, tids = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -266,7 +266,7 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
             self._lno = len(self._Database)
 
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -453,7 +453,7 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """Storing final frequent patterns in a dataframe
 
         :return: returning frequent patterns in a dataframe
@@ -56,7 +56,7 @@ from PAMI.partialPeriodicPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
 import pandas as pd
 import numpy as np
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 class PPP_ECLAT(_ab._partialPeriodicPatterns):
     """
@@ -276,7 +276,7 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
                     self._Database.append([str(ts[i])])
 
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -423,7 +423,7 @@ class PPP_ECLAT(_ab._partialPeriodicPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """Storing final frequent patterns in a dataframe
 
         :return: returning frequent patterns in a dataframe
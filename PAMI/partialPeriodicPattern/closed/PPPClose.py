@@ -58,7 +58,7 @@ import validators as _validators
 from urllib.request import urlopen as _urlopen
 from PAMI.partialPeriodicPattern.closed import abstract as _abstract
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 class PPPClose(_abstract._partialPeriodicPatterns):
     """
@@ -231,7 +231,7 @@ class PPPClose(_abstract._partialPeriodicPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
-        if isinstance(self._iFile, _abstract._pd.DataFrame):
+        if _abstract._isDataFrame(self._iFile):
             timeStamp, data = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -26,7 +26,7 @@ import numpy as np
 
 from PAMI.partialPeriodicPattern.basic import abstract as _ab
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 class cpucuGPPMiner(_ab._partialPeriodicPatterns):
     """
@@ -3,11 +3,11 @@ import csv
 import time
 import psutil
 import numpy as np
-import deprecated
-import pycuda.driver as cuda
-from pycuda.compiler import SourceModule
+from PAMI.extras.lazyImport import deprecated
+from PAMI.extras.backend.bitmapDevice import selectBackend as _selectBackend, unpackWords as _unpackWords, \
+    gaps as _gaps
 
-supportAndPeriod = SourceModule(r"""
+_supportAndPeriodSource = r"""
     
 #define uint64_t unsigned long long int
 
@@ -70,15 +70,13 @@ __global__ void supportAndPeriod(uint64_t *bitArray, // containing transactions
     }
 
 """
-                                )
 
 
 class gPPMiner:
 
-    supportAndPeriod = supportAndPeriod.get_function("supportAndPeriod")
-
-    def __init__(self, filePath, periodicSupport, maxPeriod, sep="\t"):
+    def __init__(self, filePath, periodicSupport, maxPeriod, sep="\t", backend='auto'):
         self.filePath = filePath
+        self.backend = _selectBackend(backend, 'pycuda')
         self.sep = sep
         self.periodicSupport = periodicSupport
         self.Patterns = {}
@@ -168,8 +166,10 @@ class gPPMiner:
                 index += 1
                 self.Patterns[tuple([key])] = self.__getPeriodicSupport(value)
         bitValues = np.array(bitValues, dtype=np.uint64)
-        gpuBitArray = cuda.mem_alloc(bitValues.nbytes)
         self.bvnb = bitValues.nbytes
+        if self.backend == 'cpu':
+            return bitValues, index2id
+        gpuBitArray = cuda.mem_alloc(bitValues.nbytes)
         cuda.memcpy_htod(gpuBitArray, bitValues)
         return gpuBitArray, index2id
 
@@ -180,84 +180,16 @@ class gPPMiner:
         """
         self.mine()
 
-    def __eclat(self, bitValues, keys, index2id):
-        """
-        Recursive Eclat
-
-        Args:
-        :param bitValues (list): bit array
-        :param keys (list): list of keys
-        :param index2id (list): list of index to id
-        """
-        print("Number of Keys: " + str(len(keys)))
-        locations = [0]
-        newKeys = []
-        for i in range(len(keys)):
-            for j in range(i+1, len(keys)):
-                if keys[i][:-1] == keys[j][:-1] and keys[i][-1] != keys[j][-1]:
-                    newCan = keys[i] + [keys[j][-1]]
-                    newKeys.append(newCan)
-                    locations.append(locations[-1]+len(newKeys[-1]))
-                else:
-                    break
-
-        if len(locations) > 1:
-            locations = np.array(locations, dtype=np.uint64)
-            newKeys = np.array(newKeys, dtype=np.uint64)
-            newKeys = newKeys.flatten()
-            period = np.zeros(len(newKeys), dtype=np.uint64)
-
-            totalMemory = period.nbytes + \
-                newKeys.nbytes + locations.nbytes + self.bvnb
-            if totalMemory > self.__GPU_MEM:
-                self.__GPU_MEM = totalMemory - self.__baseGPUMem
-
-            gpuPeriod = cuda.mem_alloc(period.nbytes)
-            gpuNewKeys = cuda.mem_alloc(newKeys.nbytes)
-            gpuLocations = cuda.mem_alloc(locations.nbytes)
-            cuda.memcpy_htod(gpuPeriod, period)
-            cuda.memcpy_htod(gpuNewKeys, newKeys)
-            cuda.memcpy_htod(gpuLocations, locations)
-
-            # print("GPU Launching")
-            self.supportAndPeriod(bitValues, gpuPeriod,
-                                  gpuNewKeys, gpuLocations, np.uint64(
-                                      len(locations)),
-                                  np.uint64(self.numberOfBits), np.uint64(
-                                      self.lengthOfArray),
-                                  np.uint64(self.period), np.uint64(
-                                      self.maxTimeStamp),
-                                  block=(32, 1, 1), grid=(len(locations)//32+1, 1, 1))
-
-            cuda.memcpy_dtoh(period, gpuPeriod)
-            # print("GPU Finished")
-
-            # free
-            gpuPeriod.free()
-            gpuNewKeys.free()
-            gpuLocations.free()
-
-            keys = newKeys
-            newKeys = []
-            for i in range(len(locations)-1):
-                # print(support[i], period[i])
-                # print("i: " + str(i), end="\r")
-                if period[i] > self.periodicSupport:
-                    key = keys[locations[i]:locations[i+1]]
-                    nkey = sorted([index2id[key[i]] for i in range(len(key))])
-                    if tuple(nkey) not in self.Patterns:
-                        self.Patterns[tuple(nkey)] = period[i]
-                        newKeys.append(list(key))
-            # print()
-
-            keys = newKeys
-            if len(keys) > 1:
-                self.__eclat(bitValues, keys, index2id)
-
     def mine(self):
         """
         Start the mining process
         """
+        if self.backend == 'cuda':
+            global cuda
+            import pycuda.autoinit
+            import pycuda.driver as cuda
+            from pycuda.compiler import SourceModule
+            self.supportAndPeriod = SourceModule(_supportAndPeriodSource).get_function("supportAndPeriod")
         startTime = time.time()
         data = self.__readFile()
         bitValues, index2id = self.__generateBitArray(data)
@@ -303,35 +235,38 @@ class gPPMiner:
             newKeys = newKeys.flatten()
             period = np.zeros(len(newKeys), dtype=np.uint64)
 
-            totalMemory = period.nbytes + \
-                newKeys.nbytes + locations.nbytes + self.bvnb
-            if totalMemory > self.__GPU_MEM:
-                self.__GPU_MEM = totalMemory - self.__baseGPUMem
-
-            gpuPeriod = cuda.mem_alloc(period.nbytes)
-            gpuNewKeys = cuda.mem_alloc(newKeys.nbytes)
-            gpuLocations = cuda.mem_alloc(locations.nbytes)
-            cuda.memcpy_htod(gpuPeriod, period)
-            cuda.memcpy_htod(gpuNewKeys, newKeys)
-            cuda.memcpy_htod(gpuLocations, locations)
-
-            # print("GPU Launching")
-            self.supportAndPeriod(bitValues, gpuPeriod,
-                                  gpuNewKeys, gpuLocations, np.uint64(
-                                      len(locations)),
-                                  np.uint64(self.numberOfBits), np.uint64(
-                                      self.lengthOfArray),
-                                  np.uint64(self.period), np.uint64(
-                                      self.maxTimeStamp),
-                                  block=(32, 1, 1), grid=(len(locations)//32+1, 1, 1))
-
-            cuda.memcpy_dtoh(period, gpuPeriod)
-            # print("GPU Finished")
-
-            # free
-            gpuPeriod.free()
-            gpuNewKeys.free()
-            gpuLocations.free()
+            if self.backend == 'cpu':
+                period = self.__supportAndPeriod(bitValues, newKeys, locations)
+            else:
+                totalMemory = period.nbytes + \
+                    newKeys.nbytes + locations.nbytes + self.bvnb
+                if totalMemory > self.__GPU_MEM:
+                    self.__GPU_MEM = totalMemory - self.__baseGPUMem
+
+                gpuPeriod = cuda.mem_alloc(period.nbytes)
+                gpuNewKeys = cuda.mem_alloc(newKeys.nbytes)
+                gpuLocations = cuda.mem_alloc(locations.nbytes)
+                cuda.memcpy_htod(gpuPeriod, period)
+                cuda.memcpy_htod(gpuNewKeys, newKeys)
+                cuda.memcpy_htod(gpuLocations, locations)
+
+                # print("GPU Launching")
+                self.supportAndPeriod(bitValues, gpuPeriod,
+                                      gpuNewKeys, gpuLocations, np.uint64(
+                                          len(locations)),
+                                      np.uint64(self.numberOfBits), np.uint64(
+                                          self.lengthOfArray),
+                                      np.uint64(self.period), np.uint64(
+                                          self.maxTimeStamp),
+                                      block=(32, 1, 1), grid=(len(locations)//32+1, 1, 1))
+
+                cuda.memcpy_dtoh(period, gpuPeriod)
+                # print("GPU Finished")
+
+                # free
+                gpuPeriod.free()
+                gpuNewKeys.free()
+                gpuLocations.free()
 
             keys = newKeys
             newKeys = []
@@ -351,6 +286,27 @@ class gPPMiner:
                 self.__eclat(bitValues, keys, index2id)
 
 
+    def __supportAndPeriod(self, bitValues, keys, locations):
+        """
+        NumPy twin of the supportAndPeriod kernel: for every candidate, the number of its timestamps that come at most
+        self.period after the previous one
+
+        :param bitValues (numpy.ndarray): bit array of the items
+        :param keys (numpy.ndarray): items of the candidates, one after the other
+        :param locations (numpy.ndarray): start of every candidate in keys
+        :return: numpy.ndarray: periodic support of every candidate
+        """
+        candidates = keys.reshape(-1, int(locations[1]))
+        period = np.zeros(len(candidates), dtype=np.uint64)
+        # bound the size of the unpacked bitmaps
+        step = max(1, (1 << 22) // max(1, self.maxTimeStamp))
+        for start in range(0, len(candidates), step):
+            words = np.bitwise_and.reduce(bitValues[candidates[start:start + step].astype(np.intp)], axis=1)
+            bits = _unpackWords(words, self.maxTimeStamp)
+            periods, _ = _gaps(bits)
+            period[start:start + step] = (bits & (periods <= self.period)).sum(axis=1)
+        return period
+
     def getRuntime(self):
         return self.__time
 
@@ -552,7 +552,7 @@ class Max3PGrowth(_abstract._partialPeriodicPatterns):
         """
 
         self._Database = []
-        if isinstance(self._iFile, _abstract._pd.DataFrame):
+        if _abstract._isDataFrame(self._iFile):
             timeStamp, data = [], []
             if self._iFile.empty:
                 print("its empty..")
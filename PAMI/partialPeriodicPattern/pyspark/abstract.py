@@ -2,15 +2,17 @@ from abc import ABC as _ABC, abstractmethod as _abstractmethod
 import time as _time
 import math as _math
 import csv as _csv
-import pandas as _pd
+from PAMI.extras.lazyImport import lazyModule as _lazyModule, isDataFrame as _isDataFrame, isURL as _isURL
+_pd = _lazyModule('pandas')
 from collections import defaultdict as _defaultdict
 from itertools import combinations as _combinations
 import os as _os
 import os.path as _ospath
-import psutil as _psutil
+_psutil = _lazyModule('psutil')
 import sys as _sys
-import validators as _validators
-from urllib.request import urlopen as _urlopen
+_validators = _lazyModule('validators')
+from PAMI.extras.lazyImport import urlopen as _urlopen
+from PAMI.extras.backend.ProcessContext import createContext as _createContext, BACKENDS as _BACKENDS
 
 
 class _partialPeriodicPatterns(_ABC):
@@ -37,6 +39,8 @@ class _partialPeriodicPatterns(_ABC):
             To store the total amount of USS memory consumed by the program
         memoryRSS : float
             To store the total amount of RSS memory consumed by the program
+        backend : str
+            'spark' (default) to run on Spark, 'process' to run the same plan on a local pool of processes
 
     :Methods:
 
@@ -56,19 +60,25 @@ class _partialPeriodicPatterns(_ABC):
             Total amount of runtime taken by the program will be retrieved from this function
     """
 
-    def __init__(self, iFile, minPS, period, numWorkers=1,sep='\t'):
+    def __init__(self, iFile, minPS, period, numWorkers=1,sep='\t', backend='spark'):
         """
         :param iFile: Input file name or path of the input file
         :type iFile: str
         :param minPS: UserSpecified minimum period-support value. It has to be given in terms of count of total number of
         transactions in the input database/file
         :type minPS: float
+        :param backend: 'spark' runs the plan on a SparkContext, 'process' on a ProcessContext, i.e. a local pool of
+        numWorkers processes without Spark
+        :type backend: str
         """
 
+        if backend not in _BACKENDS:
+            raise ValueError("backend should be one of " + ", ".join(_BACKENDS))
         self._iFile = iFile
         self._minPS = minPS
         self._period = period
         self._numWorkers = numWorkers
+        self._backend = backend
         self._sep = sep
         self._finalPatterns = {}
         self._oFile = str()
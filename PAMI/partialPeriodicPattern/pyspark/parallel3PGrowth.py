@@ -54,9 +54,8 @@ from PAMI.partialPeriodicPattern.pyspark import abstract as _ab
 import validators as _validators
 from urllib.request import urlopen as _urlopen
 import sys as _sys
-from pyspark import SparkContext, SparkConf
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 _periodicSupport = float()
 _period = float()
@@ -158,11 +157,13 @@ class Tree(object):
     
     """
 
-    def __init__(self):
+    def __init__(self, minPS=0, period=0):
 
         self.root = Node(None, {})
         self.summaries = {}
         self.info={}
+        self.minPS = minPS
+        self.period = period
 
 
     def add_transaction(self,transaction,tid):
@@ -241,7 +242,7 @@ class Tree(object):
                 final_patterns.append(set2)
                 final_sets.append(set1)
         # print(final_patterns,final_sets)
-        x,y,z=cond_trans(final_patterns,final_sets)#find this
+        x,y,z=cond_trans(final_patterns,final_sets,self.minPS,self.period)
         return x,y,z
     
     def remove_node(self,node_val):
@@ -315,7 +316,7 @@ class Tree(object):
                 rec_pattern.append(glist[j])
                 yield (rec_pattern,self.info[j])
                 patterns,tids,info=self.get_condition_pattern(j)
-                conditional_tree=Tree()
+                conditional_tree=Tree(self.minPS, self.period)
                 conditional_tree.info=info
                 for pat in range(len(patterns)):
                     conditional_tree.add_transaction_summ(patterns[pat],tids[pat])
@@ -494,18 +495,17 @@ class parallel3PGrowth(_ab._partialPeriodicPatterns):
         if self._minPS is None:
             raise Exception("Please enter the Minimum Period-Support")
 
-        self._period = self._convert(self._period)
-        self._minPS = self._convert(self._minPS)
-        minPS = self._minPS
-        period = self._period
-
         APP_NAME = "4PGrowth"
-        conf = SparkConf().setAppName(APP_NAME)
-        sc = SparkContext(conf=conf).getOrCreate()
+        sc = _ab._createContext(self._backend, APP_NAME, None, self._numWorkers)
 
         self._startTime = _ab._time.time()
 
         data = sc.textFile(self._iFile, self.numPartitions).map(lambda x: [y for y in x.strip().split(self._sep)])
+        self._dbSize = data.count()
+        self._period = self._convert(self._period)
+        self._minPS = self._convert(self._minPS)
+        minPS = self._minPS
+        period = self._period
         # self.numPartitions = data.getNumPartitions()
         # numPartitions = 50
         freqItems, RecItems = self.getFrequentItems(data)
@@ -514,7 +514,7 @@ class parallel3PGrowth(_ab._partialPeriodicPatterns):
         trans = self.getFrequentItemsets(data, freqItems, self._period, self._minPS, dict(RecItems))
         a = trans.collect()
 
-        # print(type(a))
+        self._finalPatterns = {}
         for k, v in a:
             string = "\t".join(k)
             # print(string,":",v)
@@ -590,8 +590,8 @@ class parallel3PGrowth(_ab._partialPeriodicPatterns):
 
         up_dict={}
         for m in data1:
-            up_dict[m]=getps(data1[m])
-        up_dict={k: v for k,v in up_dict.items() if v>=minPS}
+            up_dict[m]=self.getps(data1[m])
+        up_dict={k: v for k,v in up_dict.items() if v>=self._minPS}
         count=0
         for p in cond_pat:
             p1=[v for v in p if v in up_dict]
@@ -696,7 +696,7 @@ class parallel3PGrowth(_ab._partialPeriodicPatterns):
             inf[rank[i]]=PSinfo[i]
             c+=1
         # print(inf)
-        emptyTree = Tree()
+        emptyTree = Tree(minPS, per)
 
         emptyTree.info=inf    
         forest = workByPartition.aggregateByKey(emptyTree,lambda tree,transaction: tree.add_transaction(transaction[1:], transaction[0]),lambda tree1,tree2: tree1.merge(tree2))
@@ -813,7 +813,7 @@ class parallel3PGrowth(_ab._partialPeriodicPatterns):
     def setPartitions(self,nums):
         self.numPartitions = nums
 
-def cond_trans(cond_pat,cond_tids):
+def cond_trans(cond_pat,cond_tids,minPS,period):
     """
     returns the condition pattern
 
@@ -821,6 +821,10 @@ def cond_trans(cond_pat,cond_tids):
             condition pattern
     :param cond_tids : list
             condition tids
+    :param minPS : int
+            minimum periodic support
+    :param period : int
+            period
 
     """
     
@@ -837,7 +841,7 @@ def cond_trans(cond_pat,cond_tids):
 
     up_dict={}
     for m in data1:
-        up_dict[m]=getps(data1[m])
+        up_dict[m]=getps(data1[m],period)
     up_dict={k: v for k,v in up_dict.items() if v>=minPS}
     count=0
     for p in cond_pat:
@@ -849,13 +853,15 @@ def cond_trans(cond_pat,cond_tids):
         count+=1
     return pat,tids,up_dict
 
-def getps(tid_list):
+def getps(tid_list,period):
     """
     
     returns the periodic support
 
     :param tid_list : list.
             list of tids
+    :param period : int
+            period
 
     """
     tid_list.sort()
@@ -57,7 +57,7 @@ import validators as _validators
 from urllib.request import urlopen as _urlopen
 import sys as _sys
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 class k3PMiner(_abstract.partialPeriodicPatterns):
     """
@@ -201,7 +201,7 @@ class k3PMiner(_abstract.partialPeriodicPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
-        if isinstance(self._iFile, _abstract._pd.DataFrame):
+        if _abstract._isDataFrame(self._iFile):
             timeStamp, data = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -288,20 +288,19 @@ class k3PMiner(_abstract.partialPeriodicPatterns):
         plist = [key for key, value in sorted(self._mapSupport.items(), key=lambda x: x[1], reverse=True)]
         #print(plist)
         self._finalPatterns = {}
-        for i in plist:
-            if self._mapSupport[i] == 0:
-                continue
-            if len(self._finalPatterns) >= self._k:
-                break
-            else:
-                self._finalPatterns[i] = self._mapSupport[i]
-        #print(len(self._finalPatterns),  self._k, self._periodicity)
-        #print(self._finalPatterns)
-        self._minimum = min([self._finalPatterns[i] for i in self._finalPatterns.keys()])
-        #print(self._minimum)
-        plist = list(self._finalPatterns.keys())
+        self._topK = _abstract._TopKCollector(self._k)
+        for i in [i for i in plist if self._mapSupport[i] > 0][:self._k]:
+            self._topK.push(i, self._mapSupport[i])
+        self._raiseMinimum()
+        plist = self._topK.patterns()
         return plist
 
+    def _raiseMinimum(self):
+        """
+        Once k patterns are held, a pattern needs more than the periodic-support of the worst of them to enter the top-k
+        """
+        self._minimum = self._topK.threshold if self._topK.isFull() else 0
+
     def _getSupportAndPeriod(self, timeStamps):
         """To calculate the periodicity and support
 
@@ -338,25 +337,8 @@ class k3PMiner(_abstract.partialPeriodicPatterns):
         sample = str()
         for i in prefix:
             sample = sample + i + "\t"
-        if len(self._finalPatterns) < self._k:
-            if val > self._minimum:
-                self._finalPatterns[sample] = val
-                self._finalPatterns = {k: v for k, v in
-                                       sorted(self._finalPatterns.items(), key=lambda item: item[1], reverse=True)}
-                self._minimum = min([self._finalPatterns[i] for i in self._finalPatterns.keys()])
-                #print(self._finalPatterns)
-        else:
-            #print(prefix, val)
-            for x, y in sorted(self._finalPatterns.items(), key=lambda x: x[1]):
-                if val > y:
-                    #print("yes")
-                    del self._finalPatterns[x]
-                    self._finalPatterns[sample] = val
-                    self._finalPatterns = {k: v for k, v in
-                                           sorted(self._finalPatterns.items(), key=lambda item: item[1], reverse=True)}
-                    self._minimum = min([self._finalPatterns[i] for i in self._finalPatterns.keys()])
-                    #print(self._finalPatterns)
-                    return
+        if val > self._minimum and self._topK.push(sample, val):
+            self._raiseMinimum()
 
     def _Generation(self, prefix, itemSets, tidSets):
         """Equivalence class is followed  and checks for the patterns generated for periodic-frequent patterns.
@@ -379,6 +361,9 @@ class k3PMiner(_abstract.partialPeriodicPatterns):
             if itemI is None:
                 continue
             tidSetI = tidSets[i]
+            if self._getSupportAndPeriod(tidSetI) <= self._minimum:
+                # the minimum was raised since the class was built
+                continue
             classItemSets = []
             classTidSets = []
             itemSetX = [itemI]
@@ -417,6 +402,8 @@ class k3PMiner(_abstract.partialPeriodicPatterns):
             for i in range(len(plist)):
                 itemI = plist[i]
                 tidSetI = self._tidList[itemI]
+                if self._getSupportAndPeriod(tidSetI) <= self._minimum:
+                    continue
                 itemSetX = [itemI]
                 itemSets = []
                 tidSets = []
@@ -429,6 +416,7 @@ class k3PMiner(_abstract.partialPeriodicPatterns):
                         itemSets.append(itemJ)
                         tidSets.append(y1)
                 self._Generation(itemSetX, itemSets, tidSets)
+            self._finalPatterns = self._topK.toDict()
             print("TopK partial periodic patterns were generated successfully")
             self._endTime = _abstract._time.time()
             process = _abstract._psutil.Process(_abstract._os.getpid())
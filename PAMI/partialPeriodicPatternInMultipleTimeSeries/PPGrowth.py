@@ -49,7 +49,7 @@ __copyright__ = """
 """
 
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 from PAMI.partialPeriodicPatternInMultipleTimeSeries import abstract as _ab
 
 
@@ -469,7 +469,7 @@ class PPGrowth(_ab._partialPeriodicPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             data, ts = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -484,7 +484,7 @@ class PPGrowth(_ab._partialPeriodicPatterns):
                 self._Database.append(tr)
 
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
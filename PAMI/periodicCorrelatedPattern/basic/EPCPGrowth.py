@@ -474,7 +474,7 @@ class EPCPGrowth(_ab._periodicCorrelatedPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             data, ts = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -489,7 +489,7 @@ class EPCPGrowth(_ab._periodicCorrelatedPatterns):
                 self._Database.append(tr)
 
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -56,7 +56,7 @@ __copyright__ = """
 """
 
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 import numpy as np
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
@@ -203,7 +203,7 @@ class PFECLAT(_ab._periodicFrequentPatterns):
         :return: None
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             data, ts = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -220,7 +220,9 @@ class PFECLAT(_ab._periodicFrequentPatterns):
                     self._Database.append([str(ts[i])])
 
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._TransactionStore.isStore(self._iFile):
+                self._Database = _ab._TransactionStore(self._iFile, temporal=True)
+            elif _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -262,13 +264,21 @@ class PFECLAT(_ab._periodicFrequentPatterns):
 
         items = {}
         maxTS = 0
-        for line in self._Database:
-            index = int(line[0])
-            maxTS = max(maxTS, index)
-            for item in line[1:]:
-                if tuple([item]) not in items:
-                    items[tuple([item])] = set()
-                items[tuple([item])].add(index)
+        if isinstance(self._Database, _ab._TransactionStore):
+            # a compiled store is read at the level of its item ids, without decoding the transactions
+            codec = self._Database.getCodec()
+            timestamps = self._Database.getTimestamps()
+            for item, tids in zip(codec.items, self._Database.getTidLists(codec)):
+                items[item] = set(timestamps[tids].tolist())
+            maxTS = max(0, int(timestamps.max())) if len(timestamps) else 0
+        else:
+            for line in self._Database:
+                index = int(line[0])
+                maxTS = max(maxTS, index)
+                for item in line[1:]:
+                    if item not in items:
+                        items[item] = set()
+                    items[item].add(index)
 
         self._dbSize = maxTS
 
@@ -278,8 +288,9 @@ class PFECLAT(_ab._periodicFrequentPatterns):
         maxPer = self._maxPer
 
 
-        items = {k: v for k, v in items.items() if len(v) >= minSup}
-        items = {k: v for k, v in sorted(items.items(), key = lambda x: len(x[1]), reverse = True)}
+        # ids are ranked by support in descending order
+        self._codec = _ab._ItemCodec({k: len(v) for k, v in items.items()}, minSup)
+        items = {tuple([key]): items[item] for key, item in enumerate(self._codec.items)}
 
         keys = []
         for item in list(items.keys()):
@@ -306,11 +317,6 @@ class PFECLAT(_ab._periodicFrequentPatterns):
                         break
             keys = newKeys
 
-        newPattern = {}
-        for k, v in self._finalPatterns.items():
-            newPattern["\t".join([str(x) for x in k])] = v
-
-        self._finalPatterns = newPattern
 
         # self._generateEclat(frequentSets)
         self._endTime = _ab._time.time()
@@ -351,7 +357,7 @@ class PFECLAT(_ab._periodicFrequentPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final periodic-frequent patterns in a dataframe
 
@@ -361,7 +367,7 @@ class PFECLAT(_ab._periodicFrequentPatterns):
 
         dataframe = {}
         data = []
-        for a, b in self._finalPatterns.items():
+        for a, b in self._decodedPatterns("\t").items():
             data.append([a, b[0], b[1]])
             dataframe = _ab._pd.DataFrame(data, columns=['Patterns', 'Support', 'Periodicity'])
         return dataframe
@@ -376,7 +382,7 @@ class PFECLAT(_ab._periodicFrequentPatterns):
         """
         self._oFile = outFile
         writer = open(self._oFile, 'w+')
-        for x, y in self._finalPatterns.items():
+        for x, y in self._decodedPatterns("\t").items():
             s1 = x + ":" + str(y[0]) + ":" + str(y[1])
             #s1 = x.replace(' ', '\t') + ":" + str(y[0]) + ":" + str(y[1])
             writer.write("%s \n" % s1)
@@ -388,7 +394,7 @@ class PFECLAT(_ab._periodicFrequentPatterns):
         :return: returning periodic-frequent patterns
         :rtype: dict
         """
-        return self._finalPatterns
+        return self._decodedPatterns("\t")
 
     def printResults(self) -> None:
         """
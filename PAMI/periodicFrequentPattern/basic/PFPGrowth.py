@@ -57,67 +57,110 @@ __copyright__ = """
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
 from typing import Dict, Tuple
-import pandas as pd
-from deprecated import deprecated
-import numpy as np
+from PAMI.extras.lazyImport import deprecated
+from array import array as _array
+from itertools import chain as _chain
+np = _ab._lazyModule('numpy')
 
 _maxPer = float()
 _minSup = float()
 _lno = int()
 
 
+def _expand(keys, starts, lengths, stamps):
+    """
+    Pairs every key with a block of timestamps: key i gets stamps[starts[i]:starts[i] + lengths[i]]
+
+    :param keys: int64 array of keys, e.g. node indices or item ids
+    :type keys: numpy.ndarray
+    :param starts: int64 array with the start of the block of every key in stamps
+    :type starts: numpy.ndarray
+    :param lengths: int64 array with the length of the block of every key
+    :type lengths: numpy.ndarray
+    :param stamps: int64 array of timestamps
+    :type stamps: numpy.ndarray
+    :return: the keys and the timestamps of the pairs
+    :rtype: tuple
+    """
+    offsets = np.cumsum(lengths) - lengths
+    index = np.arange(lengths.sum()) + np.repeat(starts - offsets, lengths)
+    return np.repeat(keys, lengths), stamps[index]
+
+
+def _attach(nodes, owners, stamps):
+    """
+    Gives every node of a tree its timestamps. The (node index, timestamp) pairs are sorted once, by node and
+    timestamp, into the timestamp buffer of the tree, and every node keeps the start and the length of its
+    slice of the buffer, so a tree holds one int64 array instead of a list of timestamps per node.
+
+    :param nodes: the nodes of the tree
+    :type nodes: list
+    :param owners: int64 array with the index in nodes of every pair
+    :type owners: numpy.ndarray
+    :param stamps: int64 array with the timestamp of every pair
+    :type stamps: numpy.ndarray
+    :return: the timestamp buffer of the tree
+    :rtype: numpy.ndarray
+    """
+    stamps = stamps[np.lexsort((stamps, owners))]
+    start = 0
+    for node, count in zip(nodes, np.bincount(owners, minlength=len(nodes)).tolist()):
+        node.start = start
+        node.count = count
+        start += count
+    return stamps
+
+
 class _Node(object):
     """
     A class used to represent the node of frequentPatternTree
 
     :**Attributes**:    - **item** (*int or None*) -- *Storing item of a node.*
-                        - **timeStamps** (*list*) -- *To maintain the timestamps of a database at the end of the branch.*
+                        - **start** (*int*) -- *Start of the timestamps of the node in the timestamp buffer of its tree. The slice holds the sorted timestamps of the transactions containing the path of the node.*
+                        - **count** (*int*) -- *Number of timestamps of the node.*
                         - **parent** (*list*) -- *To maintain the parent of every node.*
                         - **children** (*list*) -- *To maintain the children of a node.*
 
     :**Methods**:    -**addChild(itemName)** -- *Storing the children to their respective parent nodes.*
     """
 
-    def __init__(self, item, locations, parent=None):
+    __slots__ = ('item', 'start', 'count', 'parent', 'children')
+
+    def __init__(self, item, parent=None):
         self.item = item
-        self.locations = locations
+        self.start = 0
+        self.count = 0
         self.parent = parent
         self.children = {}
 
-    def addChild(self, item, locations):
+    def addChild(self, item):
         """
-        This method takes an item and locations as input, adds a new child node
-        if the item does not already exist among the current node's children, or
-        updates the locations of the existing child node if the item is already present.
+        This method takes an item as input and adds a new child node if the item does not already exist among
+        the current node's children. The timestamps of the nodes are attached once the tree is complete.
 
         :param item: Represents the distinct item to be added as a child node.
         :type item: Any
-        :param locations: Represents the locations associated with the item.
-        :type locations: list
         :return: The child node associated with the item.
         :rtype: _Node
         """
-        if item not in self.children:
-            self.children[item] = _Node(item, locations, self)
-        else:
-            self.children[item].locations = locations + self.children[item].locations
-            
-        return self.children[item]
+        child = self.children.get(item)
+        if child is None:
+            child = self.children[item] = _Node(item, self)
+        return child
 
     def traverse(self):
         """
         This method constructs a transaction by traversing from the current node to the root node, collecting items along the way.
 
-        :return: A tuple containing the transaction and the locations associated with the current node.
-        :rtype: tuple(list, Any)
+        :return: The items of the path from the root to the parent of the current node.
+        :rtype: list
         """
         transaction = []
-        locs = self.locations
         node = self.parent
         while node.parent is not None:
             transaction.append(node.item)
             node = node.parent
-        return transaction[::-1], locs
+        return transaction[::-1]
 
 
 class PFPGrowth(_ab._periodicFrequentPatterns):
@@ -141,7 +184,8 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
                         - **finalPatterns** (*dict*) -- *Storing the complete set of patterns in a dictionary variable.*
                         - **memoryUSS** (*float*) -- *To store the total amount of USS memory consumed by the program.*
                         - **memoryRSS** (*float*) -- *To store the total amount of RSS memory consumed by the program.*
-                        - **Database** (*list*) -- *To store the transactions of a database in list.*
+                        - **lno** (*int*) -- *To store the number of transactions in the database.*
+                        - **chunkSize** (*int*) -- *Number of transactions read at a time. The database is streamed twice (item scan and tree construction) instead of being held in memory.*
                         - **mapSupport** (*Dictionary*) -- *To maintain the information of item and their frequency.*
                         - **lno** (*int*) -- *It represents the total no of transactions*
                         - **tree** (*class*) -- *it represents the Tree class.*
@@ -176,6 +220,10 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
 
     .. note:: minSup will be considered in percentage of database transactions
 
+    .. note:: minSup and maxPer can also be lists of thresholds. The database is then read and mined once with the
+              lowest minSup and the highest maxPer, and getSweepPatterns() returns the patterns of every (minSup, maxPer)
+              pair.
+
 
     **Calling from a python program**
 
@@ -229,54 +277,10 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
     _sep = " "
     _memoryUSS = float()
     _memoryRSS = float()
-    _Database = []
     _rank = {}
     _rankedUp = {}
     _lno = 0
-
-    def _creatingItemSets(self) -> None:
-        """
-        Storing the complete transactions of the database/input file in a database variable
-
-        :return: None
-        """
-        self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
-            data, ts = [], []
-            if self._iFile.empty:
-                print("its empty..")
-            i = self._iFile.columns.values.tolist()
-            if 'TS' in i:
-                ts = self._iFile['TS'].tolist()
-            if 'Transactions' in i:
-                data = self._iFile['Transactions'].tolist()
-            for i in range(len(data)):
-                if data[i]:
-                    tr = [str(ts[i])] + [x for x in data[i].split(self._sep)]
-                    self._Database.append(tr)
-                else:
-                    self._Database.append([str(ts[i])])
-
-        if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    self._Database.append(temp)
-            else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line.strip()
-                            temp = [i.rstrip() for i in line.split(self._sep)]
-                            temp = [x for x in temp if x]
-                            self._Database.append(temp)
-                except IOError:
-                    print("File Not Found")
-                    quit()
+    _chunkSize = 10000
 
     def _convert(self, value) -> int:
         """
@@ -288,11 +292,11 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
         if type(value) is int:
             value = int(value)
         if type(value) is float:
-            value = (len(self._Database) * value)
+            value = (self._lno * value)
         if type(value) is str:
             if '.' in value:
                 value = float(value)
-                value = (len(self._Database) * value)
+                value = (self._lno * value)
             else:
                 value = int(value)
         return value
@@ -303,20 +307,90 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
 
     def _getMaxPer(self, arr, maxTS):
         """
-        This method appends `0` and `maxTS` to the input array, sorts the array,
-        and then computes the differences between consecutive elements.
+        Computes the periodicity of a sorted array of timestamps in one pass: the largest gap between
+        consecutive timestamps, from 0 to the first one and from the last one to maxTS.
 
-        :param arr: The input array of elements.
+        :param arr: The sorted timestamps.
         :type arr: numpy.ndarray
-        :param maxTS: The maximum timestamp to be appended to the array.
+        :param maxTS: The maximum timestamp.
         :type maxTS: int or float
-        :return: None
+        :return: the periodicity
+        :rtype: int or float
+        """
+        if len(arr) == 0:
+            return maxTS
+        if arr[-1] > maxTS:
+            # the timestamps run past maxTS, which then splits one of the gaps
+            arr = np.insert(arr, np.searchsorted(arr, maxTS), maxTS)
+            return max(arr[0].item(), np.diff(arr).max().item())
+        period = max(arr[0].item(), maxTS - arr[-1].item())
+        if len(arr) > 1:
+            period = max(period, np.diff(arr).max().item())
+        return period
+
+    def _scanItems(self):
+        """
+        First scan of the database. Only running counts are kept per item: support, first and last timestamp, largest
+        gap and whether the timestamps arrived in order. It also counts the transactions in lno.
+
+        :return: [support, first timestamp, last timestamp, largest gap, in order] of every item
+        :rtype: dict
+        """
+        stats = {}
+        self._lno = 0
+        for chunk in _ab._readChunks(self._iFile, self._sep, self._chunkSize, temporal=True):
+            self._lno += len(chunk)
+            for line in chunk:
+                index = int(line[0])
+                for item in line[1:]:
+                    stat = stats.get(item)
+                    if stat is None:
+                        stats[item] = [1, index, index, 0, True]
+                        continue
+                    stat[0] += 1
+                    if index >= stat[2]:
+                        if index - stat[2] > stat[3]:
+                            stat[3] = index - stat[2]
+                        stat[2] = index
+                    else:
+                        stat[4] = False
+        return stats
+
+    def _itemPeriods(self, stats, minSup, maxTS):
         """
-        arr = np.append(arr, [0, maxTS])
-        arr = np.sort(arr)
-        arr = np.diff(arr)
+        Periodicities of the items with at least minSup occurrences, from the running counts of the first scan. The
+        counts of an item whose timestamps went backwards, or ran past maxTS, which splits one of its gaps, do not give
+        its periodicity: the timestamps of these items only are read again from the database and sorted.
 
-        return np.max(arr)
+        :param stats: [support, first timestamp, last timestamp, largest gap, in order] of every item
+        :type stats: dict
+        :param minSup: The minimum support threshold.
+        :type minSup: int
+        :param maxTS: The maximum timestamp.
+        :type maxTS: int or float
+        :return: (support, periodicity) of every item with at least minSup occurrences
+        :rtype: dict
+        """
+        periods = {}
+        unordered = {}
+        for item, (support, first, last, gap, ordered) in stats.items():
+            if support < minSup:
+                continue
+            if ordered and last <= maxTS:
+                periods[item] = (support, max(first, gap, maxTS - last))
+            else:
+                unordered[item] = _array('q')
+        if unordered:
+            self._profiler.count('unorderedItems', len(unordered))
+            for line in _ab._streamTransactions(self._iFile, self._sep, self._chunkSize, temporal=True):
+                index = int(line[0])
+                for item in line[1:]:
+                    if item in unordered:
+                        unordered[item].append(index)
+            for item, ts in unordered.items():
+                ts = np.sort(np.frombuffer(ts, dtype=np.int64))
+                periods[item] = (len(ts), self._getMaxPer(ts, maxTS))
+        return periods
 
     def _construct(self, items, data, minSup, maxPer, maxTS, patterns):
 
@@ -325,11 +399,15 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
         maximum period (maxPer). It then constructs a tree structure from the
         filtered items and data.
 
-        :param items: A dictionary where keys are items and values are lists of timestamps.
+        While the tree is built, every node on the path of a transaction only records the pair (node, timestamp)
+        in two flat int64 buffers, which _attach() turns into the sorted timestamps of the nodes.
+
+        :param items: A dictionary where keys are item ids and values are their (support, periodicity).
         :type items: dict
         :param data: The dataset used to construct the tree, where each entry is a list with
-                     an index followed by items.
-        :type data: list of lists
+                     an index followed by item ids in ascending order (see ItemCodec.encode).
+                     Any iterable works, so the database can be streamed.
+        :type data: iterable of lists
         :param minSup: The minimum support threshold.
         :type minSup: int
         :param maxPer: The maximum period threshold.
@@ -338,44 +416,53 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
         :type maxTS: int or float
         :param patterns: A dictionary to store the patterns discovered during the construction.
         :type patterns: dict
-        :return: A tuple containing the root node of the constructed tree and a dictionary
-                 of item nodes.
-        :rtype: tuple(_Node, dict)
+        :return: A tuple containing the root node of the constructed tree, a dictionary
+                 of item nodes and the timestamp buffer of the tree.
+        :rtype: tuple(_Node, dict, numpy.ndarray)
         """
 
-        # maxPerItems = {k: self.getMaxPer(v, maxTS) for k, v in items.items() if len(v) >= minSup}
-
-        items = {k: v for k, v in items.items() if len(v) >= minSup and self._getMaxPer(v, maxTS) <= maxPer}
+        periods = {k: v[1] for k, v in items.items() if v[0] >= minSup}
+        items = {k: items[k][0] for k, v in periods.items() if v <= maxPer}
 
         #tested ok
-        for item, ts in items.items():
-            # pat = "\t".join(item)
-            # self.patCount += 1
-            # patterns[pat] = (len(ts), self.getMaxPer(ts, maxTS))
-            patterns[tuple([item])] = [len(ts), self._getMaxPer(ts, maxTS)]
+        for item, support in items.items():
+            patterns[tuple([item])] = [support, periods[item]]
 
-        root = _Node([], None, None)
+        root = _Node([], None)
         itemNodes = {}
+        nodes = []
+        owners = _array('q')
+        stamps = _array('q')
         for line in data:
             currNode = root
             index = int(line[0])
             line = line[1:]
-            line = sorted([item for item in line if item in items], key = lambda x: len(items[x]), reverse = True)
+            line = [item for item in line if item in items]
             for item in line:
-                currNode = currNode.addChild(item, [index])   # heavy
-                if item in itemNodes:
-                    itemNodes[item].add(currNode)
-                else:
-                    itemNodes[item] = set([currNode])
+                child = currNode.children.get(item)
+                if child is None:
+                    child = currNode.addChild(item)
+                    # until the tree is complete, the start of a node holds its index in nodes
+                    child.start = len(nodes)
+                    nodes.append(child)
+                    if item in itemNodes:
+                        itemNodes[item].add(child)
+                    else:
+                        itemNodes[item] = set([child])
+                currNode = child
+                owners.append(child.start)
+                stamps.append(index)
+        stamps = _attach(nodes, np.frombuffer(owners, dtype=np.int64), np.frombuffer(stamps, dtype=np.int64))
 
-        return root, itemNodes
+        return root, itemNodes, stamps
 
 
-    def _recursive(self, root, itemNode, minSup, maxPer, patterns, maxTS):
+    def _recursive(self, root, itemNode, minSup, maxPer, patterns, maxTS, stamps):
         """
-        This method recursively constructs a pattern tree from the given root node,
+        This method constructs the conditional pattern trees of the given root node,
         filtering items based on the minimum support (minSup) and maximum period (maxPer).
-        It updates the patterns dictionary with the discovered patterns.
+        It updates the patterns dictionary with the discovered patterns. The trees are mined depth first
+        from an explicit stack of (root, itemNode, remaining items) frames instead of recursive calls.
 
         :param root: The current root node of the pattern tree.
         :type root: _Node
@@ -386,64 +473,98 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
         :type minSup: int
         :param maxPer: The maximum period threshold.
         :type maxPer: int or float
-        :param patterns: A dictionary to store the patterns discovered during the recursion.
+        :param patterns: A dictionary to store the patterns discovered during the traversal.
         :type patterns: dict
         :param maxTS: The maximum timestamp.
         :type maxTS: int or float
+        :param stamps: The timestamp buffer of the tree of root.
+        :type stamps: numpy.ndarray
         """
 
-        for item in itemNode:
-            newRoot = _Node(root.item + [item], None, None)
-
-            itemLocs = {}
-            transactions = {}
-            for node in itemNode[item]:
-                transaction, locs = node.traverse()
-                if len(transaction) < 1:
+        stack = [(root, itemNode, iter(itemNode), stamps)]
+        while stack:
+            root, itemNode, items, stamps = stack[-1]
+            for item in items:
+                newRoot = _Node(root.item + [item], None)
+
+                transactions = []
+                for node in itemNode[item]:
+                    transaction = node.traverse()
+                    if len(transaction) < 1:
+                        continue
+                    transactions.append((transaction, node))
+                if not transactions:
                     continue
-                # transactions.append((transaction, locs))
-                if tuple(transaction) in transactions:
-                    transactions[tuple(transaction)].extend(locs)
-                else:
-                    transactions[tuple(transaction)] = locs
-
-                for item in transaction:
-                    if item in itemLocs:
-                        itemLocs[item] += locs
-                    else:
-                        itemLocs[item] = list(locs)
-
-            # Precompute getMaxPer results for itemLocs
-            maxPerResults = {item: self._getMaxPer(itemLocs[item], maxTS) for item in itemLocs if len(itemLocs[item]) >= minSup}
-
-            # Filter itemLocs based on minSup and maxPer
-            itemLocs = {k: len(v) for k, v in itemLocs.items() if k in maxPerResults and maxPerResults[k] <= maxPer}
-
-            # Iterate over filtered itemLocs
-            for item in itemLocs:
-                # pat = "\t".join([str(x) for x in newRoot.item + [item]])
-                # self.patCount += 1
-                # patterns[pat] = [itemLocs[item], maxPerResults[item]]
-                patterns[tuple(newRoot.item + [item])] = [itemLocs[item], maxPerResults[item]]
-            
-            if not itemLocs:
-                continue
-
-            newItemNodes = {}
 
-            for transaction, locs in transactions.items():
-                transaction = sorted([item for item in transaction if item in itemLocs], key = lambda x: itemLocs[x], reverse = True)
-                if len(transaction) < 1:
+                # the prefix paths as flat arrays: the items of every path, and the block of timestamps of every
+                # path in stamps
+                starts = np.fromiter((node.start for transaction, node in transactions), np.int64, len(transactions))
+                lengths = np.fromiter((node.count for transaction, node in transactions), np.int64, len(transactions))
+                pathLengths = np.fromiter((len(transaction) for transaction, node in transactions), np.int64, len(transactions))
+                pathItems = np.fromiter(_chain.from_iterable(transaction for transaction, node in transactions), np.int64, pathLengths.sum())
+                blockLengths = np.repeat(lengths, pathLengths)
+                supports = np.bincount(pathItems, weights=blockLengths)
+                candidates = np.count_nonzero(np.bincount(pathItems))
+
+                # the timestamps of the frequent items, with 0 and maxTS, are sorted by item and timestamp once,
+                # and the periodicity of every item is the largest gap of its group
+                frequent = np.flatnonzero(supports >= minSup)
+                keep = supports[pathItems] >= minSup
+                keys, itemStamps = _expand(pathItems[keep], np.repeat(starts, pathLengths)[keep], blockLengths[keep], stamps)
+                keys = np.concatenate((keys, frequent, frequent))
+                itemStamps = np.concatenate((itemStamps, np.zeros(len(frequent), np.int64), np.full(len(frequent), maxTS, np.int64)))
+                order = np.lexsort((itemStamps, keys))
+                keys, itemStamps = keys[order], itemStamps[order]
+                gaps = np.diff(itemStamps, prepend=0)
+                groups = np.flatnonzero(np.diff(keys, prepend=-1))
+                gaps[groups] = 0
+                periods = np.maximum.reduceat(gaps, groups) if len(groups) else gaps
+
+                itemLocs = {}
+                maxPerResults = {}
+                for other, period in zip(keys[groups].tolist(), periods.tolist()):
+                    if period <= maxPer:
+                        itemLocs[other] = int(supports[other])
+                        maxPerResults[other] = period
+                self._profiler.count('candidates', candidates)
+                self._profiler.count('pruned', candidates - len(itemLocs))
+
+                # Iterate over filtered itemLocs
+                for other in itemLocs:
+                    patterns[tuple(newRoot.item + [other])] = [itemLocs[other], maxPerResults[other]]
+
+                if not itemLocs:
                     continue
-                currNode = newRoot
-                for item in transaction:
-                    currNode = currNode.addChild(item, locs)
-                    if item in newItemNodes:
-                        newItemNodes[item].add(currNode)
-                    else:
-                        newItemNodes[item] = set([currNode])
 
-            self._recursive(newRoot, newItemNodes, minSup, maxPer, patterns, _lno)
+                # every new node gets the block of timestamps of the transactions whose path goes through it
+                newItemNodes = {}
+                nodes = []
+                owners = []
+                blocks = []
+                for position, (transaction, node) in enumerate(transactions):
+                    transaction = sorted([other for other in transaction if other in itemLocs], key = lambda x: (itemLocs[x], x), reverse = True)
+                    currNode = newRoot
+                    for other in transaction:
+                        child = currNode.children.get(other)
+                        if child is None:
+                            child = currNode.addChild(other)
+                            child.start = len(nodes)
+                            nodes.append(child)
+                            if other in newItemNodes:
+                                newItemNodes[other].add(child)
+                            else:
+                                newItemNodes[other] = set([child])
+                        currNode = child
+                        owners.append(child.start)
+                        blocks.append(position)
+                blocks = np.array(blocks, dtype=np.int64)
+                newStamps = _attach(nodes, *_expand(np.array(owners, dtype=np.int64), starts[blocks], lengths[blocks], stamps))
+
+                self._profiler.count('conditionalTrees')
+                stack.append((newRoot, newItemNodes, iter(newItemNodes), newStamps))
+                break
+            else:
+                stack.pop()
 
     def mine(self) -> None:
         """
@@ -454,6 +575,8 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
 
         global _minSup, _maxPer, _lno
         self._startTime = _ab._time.time()
+        self._finalPatterns = self._openSink()
+        self._profiler.start()
         if self._iFile is None:
             raise Exception("Please enter the file path or file name:")
         if self._minSup is None:
@@ -463,34 +586,47 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
         if self._sep is None:
             raise Exception("Default separator is tab space, please enter the separator if you have different separator in the input file")
 
-        self._creatingItemSets()
-        self._minSup = self._convert(self._minSup)
-        self._maxPer = self._convert(self._maxPer)
-        #tested ok
-        _minSup, _maxPer, _lno = self._minSup, self._maxPer, len(self._Database)
-        if self._minSup > len(self._Database):
+        # only running counts are kept per item: support, first and last timestamp, largest gap and whether the
+        # timestamps arrived in order
+        # a compiled store holds the supports of its items and is read at the level of its item ids
+        self._profiler.phase('firstScan')
+        store = None
+        if _ab._TransactionStore.isStore(self._iFile):
+            store = _ab._TransactionStore(self._iFile, temporal=True)
+            stats = None
+            self._lno = len(store)
+        else:
+            stats = self._scanItems()
+        self._minSup, self._maxPer = self._sweepThresholds(self._convert)
+        _minSup, _maxPer, _lno = self._minSup, self._maxPer, self._lno
+        if self._minSup > self._lno:
             raise Exception("Please enter the minSup in range between 0 to 1")
-        
-
-        items = {}
 
-        # tested ok
-        for line in self._Database:
-            index = int(line[0])
-            for item in line[1:]:
-                if item not in items:
-                    items[item] = []
-                items[item].append(index)
-
-        root, itemNodes = self._construct(items, self._Database, _minSup, _maxPer, _lno, self._finalPatterns)
-
-        self._recursive(root, itemNodes, _minSup, _maxPer, self._finalPatterns, _lno)
-
-        newPattern = {}
-        for k, v in self._finalPatterns.items():
-            newPattern["\t".join([str(x) for x in k])] = v
-
-        self._finalPatterns = newPattern
+        # ids are ranked by support, so encoded transactions are already in tree insertion order
+        self._profiler.phase('build')
+        if store is not None:
+            self._codec = store.getCodec(self._minSup)
+            timestamps = store.getTimestamps()
+            items = {}
+            for key, tids in enumerate(store.getTidLists(self._codec)):
+                items[key] = (len(tids), self._getMaxPer(np.sort(timestamps[tids]), _lno))
+            del timestamps
+            encoded = store.iterEncoded(self._codec, self._chunkSize)
+        else:
+            self._codec = _ab._ItemCodec({k: v[0] for k, v in stats.items()}, self._minSup)
+            periods = self._itemPeriods(stats, _minSup, _lno)
+            items = {key: periods[item] for key, item in enumerate(self._codec.items)}
+            del periods
+            encoded = ([line[0]] + self._codec.encode(line[1:]) for line in _ab._streamTransactions(self._iFile, self._sep, self._chunkSize, temporal=True))
+        del stats
+        root, itemNodes, stamps = self._construct(items, encoded, _minSup, _maxPer, _lno, self._finalPatterns)
+        del items, encoded
+
+        self._profiler.phase('mine')
+        self._recursive(root, itemNodes, _minSup, _maxPer, self._finalPatterns, _lno, stamps)
+        self._profiler.phase('output')
+        self._closeSink()
+        self._profiler.stop()
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -529,7 +665,7 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final periodic-frequent patterns in a dataframe
 
@@ -539,7 +675,7 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
 
         dataFrame = {}
         data = []
-        for a, b in self._finalPatterns.items():
+        for a, b in self._decodedPatterns("\t").items():
             data.append([a, b[0], b[1]])
             dataFrame = _ab._pd.DataFrame(data, columns=['Patterns', 'Support', 'Periodicity'])
         return dataFrame
@@ -552,12 +688,17 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
         :type outFile: csv file
         :return: None
         """
+        if self._patternsStreamed():
+            # the sink already wrote the patterns while mining
+            return
+        self._profiler.phase('save')
         self._oFile = outFile
         writer = open(self._oFile, 'w+')
-        for x, y in self._finalPatterns.items():
+        for x, y in self._decodedPatterns("\t").items():
             s1 = x + ":" + str(y[0]) + ":" + str(y[1])
             #s1 = x.replace(' ', '\t').strip() + ":" + str(y[0]) + ":" + str(y[1])
             writer.write("%s \n" % s1)
+        self._profiler.stop()
 
     def getPatterns(self) -> Dict[str, Tuple[int, int]]:
         """
@@ -566,7 +707,7 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
         :return: returning periodic-frequent patterns
         :rtype: dict
         """
-        return self._finalPatterns
+        return self._decodedPatterns("\t")
 
     def printResults(self) -> None:
         """
@@ -574,7 +715,7 @@ class PFPGrowth(_ab._periodicFrequentPatterns):
 
         :return: None
         """
-        print("Total number of Periodic Frequent Patterns:", len(self.getPatterns()))
+        print("Total number of Periodic Frequent Patterns:", len(self._finalPatterns))
         print("Total Memory in USS:", self.getMemoryUSS())
         print("Total Memory in RSS", self.getMemoryRSS())
         print("Total ExecutionTime in ms:",  self.getRuntime())
@@ -55,7 +55,6 @@ __copyright__ = """
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
 import pandas as pd
-from deprecated import deprecated
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Set, Union, Any, Generator
@@ -443,7 +442,7 @@ class PFPGrowthPlus(_ab._periodicFrequentPatterns):
         :return: None
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             data, ts = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -460,7 +459,9 @@ class PFPGrowthPlus(_ab._periodicFrequentPatterns):
                     self._Database.append([str(ts[i])])
 
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._TransactionStore.isStore(self._iFile):
+                self._Database = _ab._TransactionStore(self._iFile, temporal=True)
+            elif _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -685,7 +686,7 @@ class PFPGrowthPlus(_ab._periodicFrequentPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final periodic-frequent patterns in a dataframe
 
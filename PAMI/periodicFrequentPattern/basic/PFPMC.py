@@ -54,7 +54,6 @@ __copyright__ = """
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
 import pandas as pd
-from deprecated import deprecated
 from itertools import groupby as _groupby
 from operator import itemgetter as _itemgetter
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
@@ -301,7 +300,7 @@ class PFPMC(_ab._periodicFrequentPatterns):
         """
         plist = []
         Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             ts, data = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -318,7 +317,7 @@ class PFPMC(_ab._periodicFrequentPatterns):
                     Database.append([str(ts[i])])
                     
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -457,7 +456,7 @@ class PFPMC(_ab._periodicFrequentPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
         Storing final periodic-frequent patterns in a dataframe
 
@@ -17,15 +17,22 @@ from abc import ABC as _ABC, abstractmethod as _abstractmethod
 import time as _time
 import math as _math
 import csv as _csv
-import pandas as _pd
+from PAMI.extras.lazyImport import lazyModule as _lazyModule, isDataFrame as _isDataFrame, isURL as _isURL
+_pd = _lazyModule('pandas')
 from collections import defaultdict as _defaultdict
 from itertools import combinations as _c
 import os as _os
 import os.path as _ospath
-import psutil as _psutil
+_psutil = _lazyModule('psutil')
 import sys as _sys
-import validators as _validators
-from urllib.request import urlopen as _urlopen
+_validators = _lazyModule('validators')
+from PAMI.extras.lazyImport import urlopen as _urlopen
+from PAMI.extras.transactionStore.TransactionStore import TransactionStore as _TransactionStore
+from PAMI.extras.transactionStore.streamReader import readChunks as _readChunks, streamTransactions as _streamTransactions
+from PAMI.extras.transactionStore.itemCodec import ItemCodec as _ItemCodec
+from PAMI.extras.patternStore.patternSinks import GeneratorSink as _GeneratorSink
+from PAMI.extras.patternStore.PatternTrie import PatternTrie as _PatternTrie
+from PAMI.extras.profiler.Profiler import Profiler as _Profiler
 
 
 class _periodicFrequentPatterns(_ABC):
@@ -47,6 +54,7 @@ class _periodicFrequentPatterns(_ABC):
             If the program detects the data type of maxPer is integer, then it treats maxPer is expressed in count.
             Otherwise, it will be treated as float.
             Example: maxPer=10 will be treated as integer, while maxPer=10.0 will be treated as float
+            Miners that support sweeps also accept lists of minSup and maxPer values (see getSweepPatterns())
         sep : str
             This variable is used to distinguish items from one another in a transaction. The default seperator is tab space or \t.
             However, the users can override their default separator.
@@ -55,13 +63,20 @@ class _periodicFrequentPatterns(_ABC):
         endTime : float
             To record the completion time of the algorithm
         finalPatterns : dict
-            Storing the complete set of patterns in a dictionary variable
+            Storing the complete set of patterns in a dictionary variable, or in a PatternTrie for the miners that
+            encode their items with the codec
         oFile : str
             Name of the output file to store complete set of periodic-frequent patterns
         memoryUSS : float
             To store the total amount of USS memory consumed by the program
         memoryRSS : float
             To store the total amount of RSS memory consumed by the program
+        codec : ItemCodec
+            Maps the items to dense integer ids ranked by support. Miners that use it key finalPatterns by item ids.
+        sink : PatternSink
+            If set with setPatternSink(), the patterns are pushed to the sink while mining instead of finalPatterns
+        profiler : Profiler
+            Records the phases, counters and peak RSS of the mining run
 
     :Methods:
 
@@ -69,6 +84,8 @@ class _periodicFrequentPatterns(_ABC):
             Mining process will start from here
         getPatterns()
             Complete set of patterns will be retrieved with this function
+        getSweepPatterns()
+            Patterns of every (minSup, maxPer) pair when minSup or maxPer is a list of thresholds
         save(oFile)
             Complete set of periodic-frequent patterns will be loaded in to a output file
         getPatternsAsDataFrame()
@@ -81,6 +98,10 @@ class _periodicFrequentPatterns(_ABC):
             Total amount of runtime taken by the program will be retrieved from this function
     """
 
+    #: Attributes holding the result of mine(), restored by extras.resultCache on a cache hit. Subclasses that keep
+    #: their result elsewhere set it to None, which makes the cache refuse them.
+    _cacheState = ('_finalPatterns', '_codec', '_sweep', '_minSup', '_maxPer', '_mined')
+
     def __init__(self, iFile, minSup, maxPer, sep = '\t'):
         """
         :param iFile: Input file name or path of the input file
@@ -109,6 +130,184 @@ class _periodicFrequentPatterns(_ABC):
         self._memoryRSS = float()
         self._memoryUSS = float()
         self._oFile = " "
+        self._codec = None
+        self._sink = None
+        self._mined = None
+        self._profiler = _Profiler()
+        self._minSups = list(minSup) if isinstance(minSup, (list, tuple)) else None
+        self._maxPers = list(maxPer) if isinstance(maxPer, (list, tuple)) else None
+        self._sweep = None
+
+    def _decodedPatterns(self, sep=None, patterns=None):
+        """
+        Replaces the integer item ids in the keys of finalPatterns by the item names, using the codec built while mining.
+        Miners that do not encode their items return finalPatterns unchanged.
+
+        :param sep: if given, every pattern is returned as its item names joined with sep instead of a tuple
+        :type sep: str
+        :param patterns: the patterns to decode, finalPatterns by default
+        :type patterns: dict or PatternTrie
+        :return: patterns keyed by item names
+        :rtype: dict
+        """
+        if self._patternsStreamed():
+            raise Exception("The patterns were pushed to " + type(self._sink).__name__ + " while mining and are not held in memory")
+        if patterns is None:
+            patterns = self._finalPatterns
+        if self._codec is None:
+            return patterns
+        return self._codec.decodePatterns(patterns, sep)
+
+    def _sweepThresholds(self, convert):
+        """
+        Called by mine() to convert minSup and maxPer with the convert function of the miner. If minSup or maxPer was
+        given as a list of thresholds, every combination of minSup and maxPer is remembered for getSweepPatterns(), and
+        the lowest minSup and the highest maxPer are returned, so that a single mining run finds the patterns of every
+        combination.
+
+        :param convert: converts a user specified minSup or maxPer into a count
+        :type convert: function
+        :return: the minSup and maxPer to mine with
+        :rtype: tuple
+        """
+        if self._minSups is None and self._maxPers is None:
+            self._sweep = None
+            return convert(self._minSup), convert(self._maxPer)
+        minSups = self._minSups if self._minSups is not None else [self._minSup]
+        maxPers = self._maxPers if self._maxPers is not None else [self._maxPer]
+        self._sweep = {(minSup, maxPer): (convert(minSup), convert(maxPer)) for minSup in minSups for maxPer in maxPers}
+        return min(v[0] for v in self._sweep.values()), max(v[1] for v in self._sweep.values())
+
+    def getSweepPatterns(self):
+        """
+        Patterns of every combination of thresholds of a sweep. A sweep is requested by giving minSup or maxPer as a
+        list of thresholds: mine() reads the database and mines once with the lowest minSup and the highest maxPer,
+        getPatterns() returns the patterns of these thresholds, and the patterns of every (minSup, maxPer) pair are
+        selected from them by support and periodicity.
+        A sweep needs the patterns in memory: with a sink that does not keep them, such as FileSink, the sink receives
+        the patterns of the mined thresholds only and this method raises an exception.
+
+        :return: the patterns of every (minSup, maxPer) pair, in the same form as getPatterns()
+        :rtype: dict
+        """
+        if self._sweep is None:
+            raise Exception("Neither minSup nor maxPer was given as a list of thresholds")
+        if self._patternsStreamed():
+            raise Exception("The patterns were pushed to " + type(self._sink).__name__ + " while mining, the patterns of "
+                            "every threshold can only be selected from patterns held in memory")
+        result = {}
+        for thresholds, (minSup, maxPer) in self._sweep.items():
+            if isinstance(self._finalPatterns, _PatternTrie):
+                patterns = self._finalPatterns.filter(minSup=minSup, maxPer=maxPer)
+            else:
+                patterns = {k: v for k, v in self._finalPatterns.items() if v[0] >= minSup and v[1] <= maxPer}
+            result[thresholds] = self._decodedPatterns("\t", patterns)
+        return result
+
+    def setPatternSink(self, sink):
+        """
+        Makes the miner push every pattern to sink as soon as it is found instead of collecting the patterns in
+        finalPatterns. Passing None restores the default in-memory PatternTrie.
+
+        :param sink: a PatternSink such as FileSink, ParquetSink or CallbackSink from PAMI.extras.patternStore.patternSinks
+        :type sink: PatternSink or None
+        """
+        self._sink = sink
+
+    def _decodePattern(self, pattern):
+        if self._codec is None:
+            return pattern
+        return self._codec.decode(pattern)
+
+    def _patternsStreamed(self):
+        """
+        :return: True if the patterns of the last mining run went to a sink that does not keep them
+        :rtype: bool
+        """
+        return self._sink is not None and not self._sink.inMemory
+
+    def _openSink(self):
+        """
+        Called at the start of mine(). It returns the container the miner stores its patterns into, i.e. a new
+        PatternTrie or the opened sink.
+        """
+        self._mined = False
+        if self._sink is None:
+            return _PatternTrie()
+        self._sink.open(self._decodePattern)
+        return self._sink
+
+    def _closeSink(self):
+        """
+        Called at the end of mine() to flush the sink and record that the run completed, even if it found no pattern
+        """
+        if self._sink is not None:
+            self._sink.close()
+        self._mined = True
+
+    def getPatternTrie(self):
+        """
+        Complete set of patterns in a PatternTrie keyed by item names. For miners that already store their patterns in
+        a PatternTrie no copy is made.
+
+        :return: the patterns
+        :rtype: PatternTrie
+        """
+        if self._patternsStreamed():
+            return self._decodedPatterns()
+        if isinstance(self._finalPatterns, _PatternTrie):
+            if self._codec is None:
+                return self._finalPatterns
+            return self._finalPatterns.withLabels(self._codec.items)
+        return _PatternTrie(self.getPatterns())
+
+    def getProfile(self):
+        """
+        Profile of the last mining run: the seconds spent in every phase (e.g. firstScan, build, mine, output and save),
+        the candidate, pruning and conditional tree counters, the peak RSS sampled during the run and the number of
+        patterns.
+
+        :return: the profile
+        :rtype: dict
+        """
+        profile = self._profiler.getProfile()
+        profile['patterns'] = len(self._finalPatterns)
+        return profile
+
+    def saveProfile(self, oFile):
+        """
+        Writes the profile of the last mining run and the timeline of its phases as a JSON trace
+
+        :param oFile: name of the output file
+        :type oFile: str
+        """
+        iFile = self._iFile if isinstance(self._iFile, str) else type(self._iFile).__name__
+        self._profiler.save(oFile, {'algorithm': type(self).__name__, 'iFile': iFile, 'minSup': self._minSup,
+                                    'maxPer': self._maxPer, 'patterns': len(self._finalPatterns)})
+
+    def iterPatterns(self):
+        """
+        Generator over the patterns as (tuple of items, value) pairs. If the patterns were already mined into memory they
+        are read from there. Otherwise mine() runs in a background thread and every pattern is yielded as soon as it is
+        found, so the complete set of patterns is never held in memory.
+
+        :return: generator of patterns
+        :rtype: Iterator
+        """
+        # miners that do not go through _openSink() and _closeSink() leave the flag unset and are read from memory
+        # whenever they hold patterns
+        mined = self._mined if self._mined is not None else len(self._finalPatterns) > 0
+        if mined and not self._patternsStreamed():
+            yield from self._decodedPatterns().items()
+            return
+        previous = self._sink
+        self._sink = _GeneratorSink()
+        try:
+            yield from self._sink.iterate(self.mine)
+        finally:
+            self._sink = previous
+            self._finalPatterns = {}
+            self._mined = None
 
     @_abstractmethod
     def startMine(self):
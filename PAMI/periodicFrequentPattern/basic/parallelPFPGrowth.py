@@ -54,7 +54,7 @@ __copyright__ = """
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 # from PAMI.periodicFrequentPattern.basic
 import abstract as _ab
@@ -454,6 +454,7 @@ class parallelPFPGrowth(_ab._periodicFrequentPatterns):
     """
     __startTime = float()
     __endTime = float()
+    _cacheState = None
     _minSup = str()
     _maxPer = str()
     _numWorkers = str()
@@ -55,7 +55,7 @@ __copyright__ = """
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 from PAMI.periodicFrequentPattern.closed import abstract as _ab
 
@@ -234,7 +234,7 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
         :return:   Returns the 1-length periodic-frequent items
         """
         Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             ts, data = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -249,7 +249,7 @@ class CPFPMiner(_ab._periodicFrequentPatterns):
                 Database.append(tr)
 
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
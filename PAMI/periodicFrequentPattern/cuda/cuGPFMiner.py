@@ -55,7 +55,7 @@ __copyright__ = """
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 import abstract as _ab
 
@@ -309,7 +309,7 @@ class cuGPFMiner(_ab._periodicFrequentPatterns):
         """
         plist = []
         Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             ts, data = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -323,7 +323,7 @@ class cuGPFMiner(_ab._periodicFrequentPatterns):
                 tr = tr + data[i]
                 Database.append(tr)
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -47,16 +47,15 @@ import csv
 import time
 import psutil
 import numpy as np
-import pycuda.autoinit
-import pycuda.driver as cuda
-from pycuda.compiler import SourceModule
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
+from PAMI.extras.backend.bitmapDevice import selectBackend as _selectBackend, unpackWords as _unpackWords, \
+    gaps as _gaps
 
 
-supportAndPeriod = SourceModule(r"""
+_supportAndPeriodSource = r"""
 
 __global__ void supportAndPeriod(unsigned long long int *bitArray, // containing transactions
                                 unsigned long long int *support, // for support
@@ -116,20 +115,19 @@ __global__ void supportAndPeriod(unsigned long long int *bitArray, // containing
                 }
                 if (numbersCounter == maxTimeStamp){
                     support[threadIDX] = supportCounter;
-                    period[threadIDX] = periodCounter;
+                    if (periodCounter > period[threadIDX]) period[threadIDX] = periodCounter;
                     return;
                 }
             }
 
         }
         support[threadIDX] = supportCounter;
-        period[threadIDX] = periodCounter;
+        if (periodCounter > period[threadIDX]) period[threadIDX] = periodCounter;
         return;
 
     }
 
 """
-                                )
 
 
 class gPFMinerBit:
@@ -154,6 +152,8 @@ class gPFMinerBit:
 
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  backend: str :
+                   'cuda' runs the supportAndPeriod kernel on the GPU with pycuda, 'cpu' computes the same support and period with NumPy. The default 'auto' uses the GPU when pycuda finds one.
 
 
     :Attributes:
@@ -230,10 +230,9 @@ class gPFMinerBit:
         
     """
 
-    # supportAndPeriod = supportAndPeriod.get_function("supportAndPeriod")
-
-    def __init__(self, filePath, minSup, maxPeriod, sep="\t"):
+    def __init__(self, filePath, minSup, maxPeriod, sep="\t", backend='auto'):
         self.filePath = filePath
+        self.backend = _selectBackend(backend, 'pycuda')
         self.sep = sep
         self.minSup = minSup
         self.Patterns = {}
@@ -351,8 +350,10 @@ class gPFMinerBit:
         # print(bitValues[0][0:10])
         bitValues = np.array(bitValues, dtype=np.uint64)
         # print(bitValues[0:10])
-        gpuBitArray = cuda.mem_alloc(bitValues.nbytes)
         self.bvnb = bitValues.nbytes
+        if self.backend == 'cpu':
+            return bitValues, index2id
+        gpuBitArray = cuda.mem_alloc(bitValues.nbytes)
         cuda.memcpy_htod(gpuBitArray, bitValues)
         return gpuBitArray, index2id
 
@@ -361,26 +362,18 @@ class gPFMinerBit:
         """
         Start the mining process
         """
-        startTime = time.time()
-        data = self.__readFile()
-        bitValues, index2id = self.__generateBitArray(data)
-
-        keys = [[i] for i in range(len(index2id))]
-
-        if len(keys) > 1:
-            self.__eclat(bitValues, keys, index2id)
+        self.mine()
 
-        print(
-            "Periodic-Frequent patterns were generated successfully using gPFMinerBit"
-        )
-        self.__time = time.time() - startTime
-        self.__memRSS = psutil.Process(os.getpid()).memory_info().rss
-        self.__memUSS = psutil.Process(os.getpid()).memory_full_info().uss
-
-    def Mine(self):
+    def mine(self):
         """
         Start the mining process
         """
+        if self.backend == 'cuda':
+            global cuda
+            import pycuda.autoinit
+            import pycuda.driver as cuda
+            from pycuda.compiler import SourceModule
+            self.supportAndPeriod = SourceModule(_supportAndPeriodSource).get_function("supportAndPeriod")
         startTime = time.time()
         data = self.__readFile()
         bitValues, index2id = self.__generateBitArray(data)
@@ -397,6 +390,8 @@ class gPFMinerBit:
         self.__memRSS = psutil.Process(os.getpid()).memory_info().rss
         self.__memUSS = psutil.Process(os.getpid()).memory_full_info().uss
 
+    Mine = mine
+
     def __eclat(self, bitValues, keys, index2id):
         """
         Recursive Eclat
@@ -427,40 +422,43 @@ class gPFMinerBit:
         period = np.zeros(len(newKeys), dtype=np.uint64)
 
         if len(locations) > 1:
-            totalMemory = support.nbytes + period.nbytes + \
-                newKeys.nbytes + locations.nbytes + self.bvnb
-            if totalMemory > self.__GPU_MEM:
-                self.__GPU_MEM = totalMemory - self.__baseGPUMem
-
-            gpuSupport = cuda.mem_alloc(support.nbytes)
-            gpuPeriod = cuda.mem_alloc(period.nbytes)
-            gpuNewKeys = cuda.mem_alloc(newKeys.nbytes)
-            gpuLocations = cuda.mem_alloc(locations.nbytes)
-
-            cuda.memcpy_htod(gpuSupport, support)
-            cuda.memcpy_htod(gpuPeriod, period)
-            cuda.memcpy_htod(gpuNewKeys, newKeys)
-            cuda.memcpy_htod(gpuLocations, locations)
-
-            # print("Number of New Keys: " + str(len(newKeys)))
-
-            self.supportAndPeriod(bitValues, gpuSupport, gpuPeriod,
-                                  gpuNewKeys, gpuLocations, np.uint64(
-                                      len(locations)),
-                                  np.uint64(self.numberOfBits), np.uint64(
-                                      self.lengthOfArray),
-                                  np.uint64(self.maxPeriod), np.uint64(
-                                      self.maxTimeStamp),
-                                  block=(32, 1, 1), grid=(len(locations)//32+1, 1, 1))
-
-            cuda.memcpy_dtoh(support, gpuSupport)
-            cuda.memcpy_dtoh(period, gpuPeriod)
-
-            # free
-            gpuSupport.free()
-            gpuPeriod.free()
-            gpuNewKeys.free()
-            gpuLocations.free()
+            if self.backend == 'cpu':
+                support, period = self.__supportAndPeriod(bitValues, newKeys, locations)
+            else:
+                totalMemory = support.nbytes + period.nbytes + \
+                    newKeys.nbytes + locations.nbytes + self.bvnb
+                if totalMemory > self.__GPU_MEM:
+                    self.__GPU_MEM = totalMemory - self.__baseGPUMem
+
+                gpuSupport = cuda.mem_alloc(support.nbytes)
+                gpuPeriod = cuda.mem_alloc(period.nbytes)
+                gpuNewKeys = cuda.mem_alloc(newKeys.nbytes)
+                gpuLocations = cuda.mem_alloc(locations.nbytes)
+
+                cuda.memcpy_htod(gpuSupport, support)
+                cuda.memcpy_htod(gpuPeriod, period)
+                cuda.memcpy_htod(gpuNewKeys, newKeys)
+                cuda.memcpy_htod(gpuLocations, locations)
+
+                # print("Number of New Keys: " + str(len(newKeys)))
+
+                self.supportAndPeriod(bitValues, gpuSupport, gpuPeriod,
+                                      gpuNewKeys, gpuLocations, np.uint64(
+                                          len(locations)),
+                                      np.uint64(self.numberOfBits), np.uint64(
+                                          self.lengthOfArray),
+                                      np.uint64(self.maxPeriod), np.uint64(
+                                          self.maxTimeStamp),
+                                      block=(32, 1, 1), grid=(len(locations)//32+1, 1, 1))
+
+                cuda.memcpy_dtoh(support, gpuSupport)
+                cuda.memcpy_dtoh(period, gpuPeriod)
+
+                # free
+                gpuSupport.free()
+                gpuPeriod.free()
+                gpuNewKeys.free()
+                gpuLocations.free()
 
             keys = newKeys
             newKeys = []
@@ -489,6 +487,28 @@ class gPFMinerBit:
             if len(keys) > 0:
                 self.__eclat(bitValues, keys, index2id)
 
+    def __supportAndPeriod(self, bitValues, keys, locations):
+        """
+        NumPy twin of the supportAndPeriod kernel: the support and the maximum period of every candidate
+
+        :param bitValues (numpy.ndarray): bit array of the items
+        :param keys (numpy.ndarray): items of the candidates, one after the other
+        :param locations (numpy.ndarray): start of every candidate in keys
+        :return: numpy.ndarray, numpy.ndarray: support and maximum period of every candidate
+        """
+        candidates = keys.reshape(-1, int(locations[1]))
+        support = np.zeros(len(candidates), dtype=np.uint64)
+        period = np.zeros(len(candidates), dtype=np.uint64)
+        # bound the size of the unpacked bitmaps
+        step = max(1, (1 << 22) // max(1, self.maxTimeStamp))
+        for start in range(0, len(candidates), step):
+            words = np.bitwise_and.reduce(bitValues[candidates[start:start + step].astype(np.intp)], axis=1)
+            bits = _unpackWords(words, self.maxTimeStamp)
+            periods, trailing = _gaps(bits)
+            support[start:start + step] = bits.sum(axis=1)
+            period[start:start + step] = np.maximum(periods.max(axis=1), trailing)
+        return support, period
+
     def getRuntime(self):
         return self.__time
 
@@ -1,17 +1,18 @@
 from abc import ABC as _ABC, abstractmethod as _abstractmethod
 import time as _time
 import csv as _csv
-import pandas as _pd
+from PAMI.extras.lazyImport import lazyModule as _lazyModule, isDataFrame as _isDataFrame, isURL as _isURL
+_pd = _lazyModule('pandas')
 from collections import defaultdict as _defaultdict
 from itertools import combinations as _c
 import os as _os
 import os.path as _ospath
-import psutil as _psutil
+_psutil = _lazyModule('psutil')
 import sys as _sys
-import validators as _validators
-from urllib.request import urlopen as _urlopen
+_validators = _lazyModule('validators')
+from PAMI.extras.lazyImport import urlopen as _urlopen
 import functools as _functools
-from pyspark import SparkContext, SparkConf
+from PAMI.extras.backend.ProcessContext import createContext as _createContext, BACKENDS as _BACKENDS
 
 class _periodicFrequentPatterns(_ABC):
     """
@@ -29,6 +30,8 @@ class _periodicFrequentPatterns(_ABC):
         sep : str
             This variable is used to distinguish items from one another in a transaction. The default seperator is tab space or \t.
             However, the users can override their default separator
+        backend : str
+            'spark' (default) to run on Spark, 'process' to run the same plan on a local pool of processes
         startTime:float
             To record the start time of the algorithm
         endTime:float
@@ -57,7 +60,7 @@ class _periodicFrequentPatterns(_ABC):
             This function outputs the total runtime of a mining algorithm
     """
 
-    def __init__(self, iFile, minSup, maxPer, numWorkers=1, sep='\t'):
+    def __init__(self, iFile, minSup, maxPer, numWorkers=1, sep='\t', backend='spark'):
         """
         :param iFile: Input file name or path of the input file
         :type iFile: str or DataFrame
@@ -70,12 +73,17 @@ class _periodicFrequentPatterns(_ABC):
         :type numWorkers: int
         :param sep: separator used to distinguish items from each other. The default separator is tab space. However, users can override the default separator
         :type sep: str
+        :param backend: 'spark' runs the plan on a SparkContext, 'process' on a ProcessContext, i.e. a local pool of numWorkers processes without Spark
+        :type backend: str
         """
 
+        if backend not in _BACKENDS:
+            raise ValueError("backend should be one of " + ", ".join(_BACKENDS))
         self._iFile = iFile
         self._minSup = minSup
         self._maxPer = maxPer
         self._numWorkers = numWorkers
+        self._backend = backend
         self._sep = sep
         self._finalPatterns = {}
         self._oFile = str()
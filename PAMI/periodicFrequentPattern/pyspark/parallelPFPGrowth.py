@@ -51,11 +51,7 @@ __copyright__ = """
 """
 
 from PAMI.periodicFrequentPattern.pyspark import abstract as _ab
-from pyspark import SparkContext, SparkConf
-
-from PAMI.periodicFrequentPattern.basic import abstract as _ab
-import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 _maxPer = float()
 _minSup = float()
@@ -329,6 +325,8 @@ class parallelPFPGrowth(_ab._periodicFrequentPatterns):
 
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  backend: str :
+                   'spark' (default) runs the plan on a SparkContext. 'process' runs the same plan on a local pool of numWorker processes, without starting a JVM.
 
     :Attributes:
 
@@ -469,8 +467,8 @@ class parallelPFPGrowth(_ab._periodicFrequentPatterns):
     _numTrans = str()
     __tarunpat = {}
 
-    def __init__(self, iFile, minSup, maxPer, numWorker, sep='\t'):
-        super().__init__(iFile, minSup, maxPer, numWorker, sep)
+    def __init__(self, iFile, minSup, maxPer, numWorker, sep='\t', backend='spark'):
+        super().__init__(iFile, minSup, maxPer, numWorker, sep, backend)
 
     def func1(self, ps1, tid):
         """
@@ -612,11 +610,11 @@ class parallelPFPGrowth(_ab._periodicFrequentPatterns):
         if type(value) is int:
             value = int(value)
         if type(value) is float:
-            value = (len(self.__Database) * value)
+            value = (self.__lno * value)
         if type(value) is str:
             if '.' in value:
                 value = float(value)
-                value = (len(self.__Database) * value)
+                value = (self.__lno * value)
             else:
                 value = int(value)
         return value
@@ -627,34 +625,9 @@ class parallelPFPGrowth(_ab._periodicFrequentPatterns):
         Start the mining process
 
         """
-        self.__startTime = _ab._time.time()
-
-        APP_NAME = "parallelPFPGrowth"
-        conf = _ab.SparkConf().setAppName(APP_NAME)
-        # conf = conf.setMaster("local[*]")
-        sc = _ab.SparkContext(conf=conf).getOrCreate()
-        # sc = SparkContext.getOrCreate();
-        data = sc.textFile(self._iFile, minPartitions=self._numWorkers).map(
-            lambda x: [int(y) for y in x.strip().split(self._sep)])
-        # data = sc.textFile(finput).map(lambda x: [int(y) for y in x.strip().split(' ')])
-        data.cache()
-        # minSupport = data.count() * threshold/100
-        # maxPer = data.count() * periodicity_threshold/100
-        self._minSup = self.__convert(self._minSup)
-        self._maxPer = self.__convert(self._maxPer)
-        self._numTrans = sc.broadcast(data.count())
-        self._perFreqItems = self.getFrequentItems(data)
-        freqItemsets = self.getFrequentItemsets(data, self._perFreqItems)
-        self.__finalPatterns = self.__tarunpat
-        sc.stop()
-        self.__endTime = _ab._time.time()
-        self.__memoryUSS = float()
-        self.__memoryRSS = float()
-        process = _ab._psutil.Process(_ab._os.getpid())
-        self.__memoryUSS = process.memory_full_info().uss
-        self.__memoryRSS = process.memory_info().rss
+        self.mine()
 
-    def Mine(self):
+    def mine(self):
         """
         Start the mining process
 
@@ -662,19 +635,18 @@ class parallelPFPGrowth(_ab._periodicFrequentPatterns):
         self.__startTime = _ab._time.time()
 
         APP_NAME = "parallelPFPGrowth"
-        conf = _ab.SparkConf().setAppName(APP_NAME)
-        # conf = conf.setMaster("local[*]")
-        sc = _ab.SparkContext(conf=conf).getOrCreate()
-        # sc = SparkContext.getOrCreate();
+        sc = _ab._createContext(self._backend, APP_NAME, None, self._numWorkers)
         data = sc.textFile(self._iFile, minPartitions=self._numWorkers).map(
             lambda x: [int(y) for y in x.strip().split(self._sep)])
         # data = sc.textFile(finput).map(lambda x: [int(y) for y in x.strip().split(' ')])
         data.cache()
         # minSupport = data.count() * threshold/100
         # maxPer = data.count() * periodicity_threshold/100
+        self.__lno = data.count()
         self._minSup = self.__convert(self._minSup)
         self._maxPer = self.__convert(self._maxPer)
-        self._numTrans = sc.broadcast(data.count())
+        self._numTrans = sc.broadcast(self.__lno)
+        self.__tarunpat = {}
         self._perFreqItems = self.getFrequentItems(data)
         freqItemsets = self.getFrequentItemsets(data, self._perFreqItems)
         self.__finalPatterns = self.__tarunpat
@@ -686,6 +658,7 @@ class parallelPFPGrowth(_ab._periodicFrequentPatterns):
         self.__memoryUSS = process.memory_full_info().uss
         self.__memoryRSS = process.memory_info().rss
 
+    Mine = mine
 
     def getMemoryUSS(self):
         """Total amount of USS memory consumed by the mining process will be retrieved from this function
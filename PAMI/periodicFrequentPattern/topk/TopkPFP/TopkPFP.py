@@ -52,7 +52,7 @@ __copyright__ = """
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 class TopkPFPGrowth(_ab._periodicFrequentPatterns):
@@ -191,7 +191,7 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
 
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             data, ts = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -207,7 +207,7 @@ class TopkPFPGrowth(_ab._periodicFrequentPatterns):
                 tr = tr + data[i]
                 self._Database.append(tr)
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
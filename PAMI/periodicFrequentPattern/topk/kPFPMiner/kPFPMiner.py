@@ -52,7 +52,6 @@ __copyright__ = """
 
 from PAMI.periodicFrequentPattern.basic import abstract as _ab
 import pandas as pd
-from deprecated import deprecated
 
 from PAMI.periodicFrequentPattern.topk.kPFPMiner import abstract as _ab
 
@@ -191,7 +190,7 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
         """
 
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -200,7 +199,7 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
 
             # print(self.Database)
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -257,16 +256,20 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
                     self._tidList[si].append(n)
         for x, y in self._mapSupport.items():
             self._mapSupport[x][1] = max(self._mapSupport[x][1], abs(n - self._mapSupport[x][2]))
+        self._finalPatterns = {}
+        self._topK = _ab._TopKCollector(self._k, largest=False)
         plist = [key for key, value in sorted(self._mapSupport.items(), key=lambda x: x[1], reverse=True)]
-        for i in plist:
-            if len(self._finalPatterns) >= self._k:
-                break
-            else:
-                self._finalPatterns[i] = self._mapSupport[i][1]
-        self._maximum = max([self._finalPatterns[i] for i in self._finalPatterns.keys()])
-        plist = list(self._finalPatterns.keys())
+        for i in plist[:self._k]:
+            self._topK.push(i, self._mapSupport[i][1])
+        self._lowerMaximum()
+        plist = self._topK.patterns()
         return plist
 
+    def _lowerMaximum(self):
+        """
+        Once k patterns are held, a pattern needs at most the periodicity of the worst of them to enter the top-k
+        """
+        self._maximum = self._topK.threshold if self._topK.isFull() else self.lno
 
     def _save(self, prefix, suffix, tidSetI):
         """Saves the patterns that satisfy the periodic frequent property.
@@ -287,21 +290,8 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
         sample = str()
         for i in prefix:
             sample = sample + i + " "
-        if len(self._finalPatterns) < self._k:
-            if val < self._maximum:
-                self._finalPatterns[sample] = val
-                self._finalPatterns = {k: v for k, v in sorted(self._finalPatterns.items(), key=lambda item: item[1], reverse=True)}
-                self._maximum = max([i for i in self._finalPatterns.values()])
-        else:
-            for x, y in sorted(self._finalPatterns.items(), key=lambda x: x[1], reverse=True):
-                if val < y:
-                    del self._finalPatterns[x]
-                    self._finalPatterns[sample] = val
-                    self._finalPatterns = {k: v for k, v in
-                                              sorted(self._finalPatterns.items(), key=lambda item: item[1],
-                                                     reverse=True)}
-                    self._maximum = max([i for i in self._finalPatterns.values()])
-                    return
+        if self._topK.push(sample, val):
+            self._lowerMaximum()
 
     def _Generation(self, prefix, itemSets, tidSets):
         """Equivalence class is followed  and checks for the patterns generated for periodic-frequent patterns.
@@ -324,6 +314,9 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
             if itemI is None:
                 continue
             tidSetI = tidSets[i]
+            if self.getPer_Sup(tidSetI) > self._maximum:
+                # the maximum was lowered since the class was built
+                continue
             classItemSets = []
             classTidSets = []
             itemSetX = [itemI]
@@ -373,6 +366,8 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
         for i in range(len(plist)):
             itemI = plist[i]
             tidSetI = self._tidList[itemI]
+            if self.getPer_Sup(tidSetI) > self._maximum:
+                continue
             itemSetX = [itemI]
             itemSets = []
             tidSets = []
@@ -384,6 +379,7 @@ class kPFPMiner(_ab._periodicFrequentPatterns):
                     itemSets.append(itemJ)
                     tidSets.append(y1)
             self._Generation(itemSetX, itemSets, tidSets)
+        self._finalPatterns = self._topK.toDict()
         print("kPFPMiner has successfully generated top-k frequent patterns")
         self._endTime = _ab._time.time()
         self._memoryUSS = float()
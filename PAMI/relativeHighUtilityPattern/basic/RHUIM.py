@@ -54,7 +54,6 @@ __copyright__ = """
 """
 
 import pandas as pd
-from deprecated import deprecated
 from PAMI.relativeHighUtilityPattern.basic import abstract as _ab
 
 
@@ -210,7 +209,7 @@ class _Dataset:
         """
         self.transactions = []
         itemsets, utilities, utilityValues = [], [], []
-        if isinstance(datasetPath, _ab._pd.DataFrame):
+        if _ab._isDataFrame(datasetPath):
             utilities, data, utilityValues = [], [], []
             if datasetPath.empty:
                 print("its empty..")
@@ -224,7 +223,7 @@ class _Dataset:
             for k in range(len(itemsets)):
                 self.transactions.append(self.createTransaction(itemsets[k], utilities[k], utilityValues[k]))
         if isinstance(datasetPath, str):
-            if _ab._validators.url(datasetPath):
+            if _ab._isURL(datasetPath):
                 data = _ab._urlopen(datasetPath)
                 for line in data:
                     line = line.decode("utf-8")
@@ -780,7 +779,7 @@ class RHUIM(_ab._utilityPatterns):
                 else:
                     self._utilityBinArrayLU[item] = transaction.transactionUtility
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """Storing final patterns in a dataframe
 
         :return: returning patterns in a dataframe
@@ -63,7 +63,7 @@ import numpy as np
 
 from PAMI.relativeHighUtilitytPattern.basic import abstract as _ab
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 searchGPU = cp.RawKernel(r'''
 
@@ -62,7 +62,7 @@ from PAMI.relativeHighUtilityPattern.basic import abstract as _ab
 
 from PAMI.relativeHighUtilitytPattern.basic import abstract as _ab
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 class efimParallel(_ab._utilityPatterns):
     """
@@ -141,7 +141,7 @@ class PrefixSpan(_ab._sequentialPatterns):
         """
         self._Database = []
 
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             temp = []
             if self._iFile.empty:
                 print("its empty..")
@@ -152,7 +152,7 @@ class PrefixSpan(_ab._sequentialPatterns):
             for k in temp:
                 self._Database.append(set(k))
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -55,7 +55,6 @@ __copyright__ = """
 
 
 import pandas as pd
-from deprecated import deprecated
 
 from PAMI.sequentialPattern.basic import abstract as _ab
 _ab._sys.setrecursionlimit(10000)
@@ -211,7 +210,7 @@ class SPAM(_ab._sequentialPatterns):
         """
         self._Database = []
 
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             temp = []
             if self._iFile.empty:
                 print("its empty..")
@@ -231,7 +230,7 @@ class SPAM(_ab._sequentialPatterns):
                     addList.append(temp[k+1])
             self._Database.append(addList)
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
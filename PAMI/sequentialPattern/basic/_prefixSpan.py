@@ -54,7 +54,7 @@ __copyright__ = """
 """
 
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 from PAMI.sequentialPatternMining.basic import abstract as _ab
 import copy
@@ -142,7 +142,7 @@ class PrefixSpan(_ab._sequentialSpatialPatterns):
             A function to map items to their Neighbours
         """
         self._NeighboursMap = {}
-        if isinstance(self._nFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._nFile):
             data, items = [], []
             if self._nFile.empty:
                 print("its empty..")
@@ -155,7 +155,7 @@ class PrefixSpan(_ab._sequentialSpatialPatterns):
                 self._NeighboursMap[items[k]] = data[k]
             # print(self.Database)
         if isinstance(self._nFile, str):
-            if _ab._validators.url(self._nFile):
+            if _ab._isURL(self._nFile):
                 data = _ab._urlopen(self._nFile)
                 for line in data:
                     line.strip()
@@ -181,7 +181,7 @@ class PrefixSpan(_ab._sequentialSpatialPatterns):
         """
         self._Database = []
 
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             temp = []
             if self._iFile.empty:
                 print("its empty..")
@@ -192,7 +192,7 @@ class PrefixSpan(_ab._sequentialSpatialPatterns):
             for k in temp:
                 self._Database.append(set(k))
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
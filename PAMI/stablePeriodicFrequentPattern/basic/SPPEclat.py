@@ -54,7 +54,7 @@ __copyright__ = """
 
 """
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 from PAMI.stablePeriodicFrequentPattern.basic import abstract as _ab
 
@@ -236,7 +236,7 @@ class SPPEclat(_ab._stablePeriodicFrequentPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -245,7 +245,7 @@ class SPPEclat(_ab._stablePeriodicFrequentPatterns):
             if 'Patterns' in i:
                 self._Database = self._iFile['Patterns'].tolist()
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
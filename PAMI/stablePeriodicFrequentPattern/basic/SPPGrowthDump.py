@@ -52,7 +52,7 @@ __copyright__ = """
 
 from PAMI.stableperiodicFrequentPattern.basic import abstract as _ab
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 from urllib.request import urlopen
 import validators
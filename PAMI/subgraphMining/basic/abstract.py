@@ -9,7 +9,8 @@ from .sparseTriangularMatrix import SparseTriangularMatrix
 import time
 import math
 import matplotlib.pyplot as plt
-import psutil as _psutil
+from PAMI.extras.lazyImport import lazyModule as _lazyModule, isDataFrame as _isDataFrame, isURL as _isURL
+_psutil = _lazyModule('psutil')
 import os as _os
 
 
@@ -36,6 +36,7 @@ class DfsThread(threading.Thread):
             """
         while not self.candidates.empty():
             _, candidate = self.candidates.get()
-            if len(candidate.setOfGraphsIds) < self.minSup:
+            # the instance raises its minimum support as its top-k collector fills up
+            if len(candidate.setOfGraphsIds) < max(self.minSup, self.tkgInstance.minSup):
                 break
             self.tkgInstance.gspanDynamicDFS(candidate.dfsCode, self.graphDb, candidate.setOfGraphsIds)
@@ -8,10 +8,13 @@ from .edge import Edge
 from .extendedEdge import ExtendedEdge
 from .sparseTriangularMatrix import SparseTriangularMatrix
 from queue import PriorityQueue
+from threading import Lock
+from PAMI.extras.patternStore.TopKCollector import TopKCollector
 import time
 import math
 import matplotlib.pyplot as plt
-import psutil as _psutil
+from PAMI.extras.lazyImport import lazyModule as _lazyModule, isDataFrame as _isDataFrame, isURL as _isURL
+_psutil = _lazyModule('psutil')
 import os as _os
 import time
 
@@ -63,7 +63,8 @@ class TKG(_ab._TKG):
         if self.maxNumberOfEdges <= 0:
             return
 
-        self.kSubgraphs = _ab.PriorityQueue()
+        self.kSubgraphs = _ab.TopKCollector(self.k, unique=False)
+        self.kSubgraphsLock = _ab.Lock()
         self.candidates = _ab.PriorityQueue()
         
         self.runtime = 0
@@ -76,7 +77,7 @@ class TKG(_ab._TKG):
 
         t2 = _ab.time.time()
         self.runtime = t2 - t1
-        self.patternCount = self.getQueueSize(self.kSubgraphs)
+        self.patternCount = len(self.kSubgraphs)
 
         process = _ab._psutil.Process(_ab._os.getpid())
 
@@ -163,16 +164,12 @@ class TKG(_ab._TKG):
                 bw.write("".join(sb))
 
 
-    def savePattern(self, subgraph):        
-        # previousMinSup = self.minSup
-
-        self.kSubgraphs.put(subgraph)
-        if self.kSubgraphs.qsize() > self.k:
-            while self.kSubgraphs.qsize() > self.k:
-                lower = self.kSubgraphs.get()
-
-                if lower.support > self.minSup:
-                    self.minSup = lower.support
+    def savePattern(self, subgraph):
+        with self.kSubgraphsLock:
+            full, lower = self.kSubgraphs.isFull(), self.kSubgraphs.threshold
+            # the minimum support is raised to the support of the subgraph the new one evicts
+            if self.kSubgraphs.push(subgraph, subgraph.support) and full and lower > self.minSup:
+                self.minSup = lower
 
 
     def getQueueSize(self, queue):
@@ -540,10 +537,8 @@ class TKG(_ab._TKG):
 
 
     def getSubgraphsList(self):
-        """Creates a copy of the queue's contents without emptying the original queue."""
-        subgraphsList = list(self.kSubgraphs.queue)
-        subgraphsList.sort(key=lambda sg: sg.support, reverse=True)
-        return subgraphsList
+        """Returns the subgraphs held by the top-k collector, highest support first."""
+        return self.kSubgraphs.patterns()
 
 
     
@@ -57,7 +57,7 @@ __copyright__ = """
 """
 
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 import numpy as _np
 from PAMI.faultTolerantFrequentPattern.basic import abstract as _ab
@@ -201,7 +201,7 @@ class VBFTMine(_ab._faultTolerantFrequentPatterns):
         Storing the complete transactions of the database/input file in a database variable
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             temp = []
             if self._iFile.empty:
                 print("its empty..")
@@ -212,7 +212,7 @@ class VBFTMine(_ab._faultTolerantFrequentPatterns):
             for k in temp:
                 self._Database.append(set(k))
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -52,7 +52,7 @@ __copyright__ = """
 """
 
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 from PAMI.uncertainFrequentPattern.basic import abstract as _ab
 from typing import List, Tuple
@@ -506,7 +506,7 @@ class CUFPTree(_ab._frequentPatterns):
         :return: None
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             uncertain, data = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -524,7 +524,7 @@ class CUFPTree(_ab._frequentPatterns):
 
             # print(self.Database)
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -759,7 +759,7 @@ class CUFPTree(_ab._frequentPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
 
         Storing final frequent patterns in a dataframe
@@ -52,7 +52,7 @@ __copyright__ = """
 
 from PAMI.uncertainFrequentPattern.basic import abstract as _ab
 from typing import List, Tuple
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 _minSup = str()
 _ab._sys.setrecursionlimit(20000)
@@ -478,7 +478,7 @@ class PUFGrowth(_ab._frequentPatterns):
         Scans the uncertain transactional dataset
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             uncertain, data = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -496,7 +496,7 @@ class PUFGrowth(_ab._frequentPatterns):
 
             # print(self.Database)
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line = line.strip()
@@ -722,7 +722,7 @@ class PUFGrowth(_ab._frequentPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_ab._pd.DataFrame':
         """
 
         Storing final frequent patterns in a dataframe
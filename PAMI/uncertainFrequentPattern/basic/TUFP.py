@@ -54,7 +54,7 @@ __copyright__ = """
 from PAMI.uncertainFrequentPattern.basic import abstract as _ab
 from typing import List, Dict, Union
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 _minSup = float()
 _finalPatterns = {}
@@ -246,7 +246,7 @@ class TUFP(_ab._frequentPatterns):
         Scans the dataset
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             uncertain, data = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -264,7 +264,7 @@ class TUFP(_ab._frequentPatterns):
 
             # print(self.Database)
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -523,7 +523,7 @@ class TubeS(_fp._frequentPatterns):
         Scans the databases and stores the transactions into Database variable
         """
         self._Database = []
-        if isinstance(self._iFile, _fp._pd.DataFrame):
+        if _fp._isDataFrame(self._iFile):
             uncertain, data = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -542,7 +542,7 @@ class TubeS(_fp._frequentPatterns):
 
             # print(self.Database)
         if isinstance(self._iFile, str):
-            if _fp._validators.url(self._iFile):
+            if _fp._isURL(self._iFile):
                 data = _fp._urlopen(self._iFile)
                 for line in data:
                     line = line.strip()
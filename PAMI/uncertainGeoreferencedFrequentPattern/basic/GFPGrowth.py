@@ -54,7 +54,7 @@ __copyright__ = """
 
 from PAMI.uncertainGeoreferencedFrequentPattern.basic import abstract as _ab
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 _minSup = str()
 _neighbourList = {}
@@ -509,7 +509,7 @@ class GFPGrowth(_ab._frequentPatterns):
         Scans the uncertain transactional dataset
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             uncertain, data = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -527,7 +527,7 @@ class GFPGrowth(_ab._frequentPatterns):
 
             # print(self.Database)
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     temp1 = line.strip()
@@ -566,7 +566,7 @@ class GFPGrowth(_ab._frequentPatterns):
         """
         global _neighbourList
         _neighbourList = {}
-        if isinstance(self._nFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._nFile):
             uncertain, data = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -584,7 +584,7 @@ class GFPGrowth(_ab._frequentPatterns):
 
             # print(self.Database)
         if isinstance(self._nFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -57,7 +57,7 @@ __copyright__ = """
 
 
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 from PAMI.uncertainPeriodicFrequentPattern.basic import abstract as _ab
 from typing import List, Dict, Tuple, Union
 
@@ -568,7 +568,7 @@ class UPFPGrowth(_ab._periodicFrequentPatterns):
         :return: None
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             uncertain, data, ts = [], [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -589,7 +589,7 @@ class UPFPGrowth(_ab._periodicFrequentPatterns):
 
             # print(self.Database)
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line = line.decode("utf-8")
@@ -56,7 +56,7 @@ __copyright__ = """
 
 from PAMI.uncertainPeriodicFrequentPattern.basic import abstract as _ab
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 from PAMI.uncertainPeriodicFrequentPattern.basic import abstract as _ab
 
@@ -592,7 +592,7 @@ class UPFPGrowthPlus(_ab._periodicFrequentPatterns):
         """
 
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             uncertain, data, ts = [], [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -613,7 +613,7 @@ class UPFPGrowthPlus(_ab._periodicFrequentPatterns):
 
             # print(self.Database)
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line = line.decode("utf-8")
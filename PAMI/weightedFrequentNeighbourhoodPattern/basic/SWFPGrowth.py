@@ -53,7 +53,7 @@ __copyright__ = """
 
 from PAMI.weightedFrequentNeighbourhoodPattern.basic import abstract as _fp
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 from typing import List, Dict, Tuple, Union, Iterable
 
 _minWS = str()
@@ -497,7 +497,7 @@ class SWFPGrowth(_fp._weightedFrequentSpatialPatterns):
     __rank = {}
     __rankDup = {}
 
-    def __init__(self, iFile: Union[str, _fp._pd.DataFrame], nFile: Union[str, _fp._pd.DataFrame], minWS: Union[int, float, str], sep='\t') -> None:
+    def __init__(self, iFile: 'Union[str, _fp._pd.DataFrame]', nFile: 'Union[str, _fp._pd.DataFrame]', minWS: Union[int, float, str], sep='\t') -> None:
         super().__init__(iFile, nFile, minWS, sep)
 
     def __creatingItemSets(self) -> None:
@@ -507,7 +507,7 @@ class SWFPGrowth(_fp._weightedFrequentSpatialPatterns):
         :return: None
         """
         self._Database = []
-        if isinstance(self._iFile, _fp._pd.DataFrame):
+        if _fp._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -515,7 +515,7 @@ class SWFPGrowth(_fp._weightedFrequentSpatialPatterns):
                 self._Database = self._iFile['Transactions'].tolist()
             # print(self.Database)
         if isinstance(self._iFile, str):
-            if _fp._validators.url(self._iFile):
+            if _fp._isURL(self._iFile):
                 data = _fp._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -547,7 +547,7 @@ class SWFPGrowth(_fp._weightedFrequentSpatialPatterns):
         :return: None
         """
         self._neighbourList = {}
-        if isinstance(self._nFile, _fp._pd.DataFrame):
+        if _fp._isDataFrame(self._nFile):
             data, items = [], []
             if self._nFile.empty:
                 print("its empty..")
@@ -560,7 +560,7 @@ class SWFPGrowth(_fp._weightedFrequentSpatialPatterns):
                 self._neighbourList[items[k][0]] = data[k]
             # print(self.Database)
         if isinstance(self._nFile, str):
-            if _fp._validators.url(self._nFile):
+            if _fp._isURL(self._nFile):
                 data = _fp._urlopen(self._nFile)
                 for line in data:
                     line.strip()
@@ -751,7 +751,7 @@ class SWFPGrowth(_fp._weightedFrequentSpatialPatterns):
 
         return self.__endTime - self.__startTime
 
-    def getPatternsAsDataFrame(self) -> _fp._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_fp._pd.DataFrame':
         """
 
         Storing final frequent patterns in a dataframe
@@ -55,7 +55,7 @@ __copyright__ = """
 from PAMI.weightedFrequentPattern.basic import abstract as _fp
 from typing import List, Dict, Tuple, Union, Generator
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 
 _minSup = str()
@@ -421,7 +421,7 @@ class WFIM(_fp._weightedFrequentPatterns):
         :return: None
         """
         self.__Database = []
-        if isinstance(self._iFile, _fp._pd.DataFrame):
+        if _fp._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
@@ -430,7 +430,7 @@ class WFIM(_fp._weightedFrequentPatterns):
 
             # print(self.Database)
         if isinstance(self._iFile, str):
-            if _fp._validators.url(self._iFile):
+            if _fp._isURL(self._iFile):
                 data = _fp._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -459,7 +459,7 @@ class WFIM(_fp._weightedFrequentPatterns):
         """
         global _weights
         _weights = {}
-        if isinstance(self._wFile, _fp._pd.DataFrame):
+        if _fp._isDataFrame(self._wFile):
             items, weights = [], []
             if self._wFile.empty:
                 print("its empty..")
@@ -473,7 +473,7 @@ class WFIM(_fp._weightedFrequentPatterns):
 
             # print(self.Database)
         if isinstance(self._wFile, str):
-            if _fp._validators.url(self._wFile):
+            if _fp._isURL(self._wFile):
                 data = _fp._urlopen(self._wFile)
                 for line in data:
                     line.strip()
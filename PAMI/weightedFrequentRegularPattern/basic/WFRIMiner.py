@@ -53,7 +53,7 @@ __copyright__ = """
 
 from PAMI.weightedFrequentRegularPattern.basic import abstract as _fp
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 from typing import List, Dict
 
 
@@ -511,14 +511,14 @@ class WFRIMiner(_fp._weightedFrequentRegularPatterns):
         """
         self._Database = []
         self._weight = {}
-        if isinstance(self._iFile, _fp._pd.DataFrame):
+        if _fp._isDataFrame(self._iFile):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
             if 'Transactions' in i:
                 self._Database = self._iFile['Transactions'].tolist()
 
-        if isinstance(self._wFile, _fp._pd.DataFrame):
+        if _fp._isDataFrame(self._wFile):
             _items, _weights = [], []
             if self._wFile.empty:
                 print("its empty..")
@@ -532,7 +532,7 @@ class WFRIMiner(_fp._weightedFrequentRegularPatterns):
 
             # print(self.Database)
         if isinstance(self._iFile, str):
-            if _fp._validators.url(self._iFile):
+            if _fp._isURL(self._iFile):
                 data = _fp._urlopen(self._iFile)
                 for line in data:
                     line.strip()
@@ -553,7 +553,7 @@ class WFRIMiner(_fp._weightedFrequentRegularPatterns):
                     quit()
 
         if isinstance(self._wFile, str):
-            if _fp._validators.url(self._wFile):
+            if _fp._isURL(self._wFile):
                 data = _fp._urlopen(self._wFile)
                 for line in data:
                     line.strip()
@@ -759,7 +759,7 @@ class WFRIMiner(_fp._weightedFrequentRegularPatterns):
 
         return self._endTime - self._startTime
 
-    def getPatternsAsDataFrame(self) -> _fp._pd.DataFrame:
+    def getPatternsAsDataFrame(self) -> '_fp._pd.DataFrame':
         """
 
         Storing final frequent patterns in a dataframe
@@ -53,7 +53,7 @@ __copyright__ = """
 
 from PAMI.weightedUncertainFrequentPattern.basic import abstract as _ab
 import pandas as pd
-from deprecated import deprecated
+from PAMI.extras.lazyImport import deprecated
 
 _expSup = str()
 _expWSup = str()
@@ -499,7 +499,7 @@ class WUFIM(_ab._weightedFrequentPatterns):
         :return: None
         """
         self._Database = []
-        if isinstance(self._iFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._iFile):
             uncertain, data = [], []
             if self._iFile.empty:
                 print("its empty..")
@@ -517,7 +517,7 @@ class WUFIM(_ab._weightedFrequentPatterns):
 
             # print(self.Database)
         if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
+            if _ab._isURL(self._iFile):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line = line.decode("utf-8")
@@ -561,7 +561,7 @@ class WUFIM(_ab._weightedFrequentPatterns):
         :return: None
         """
         self._weights = {}
-        if isinstance(self._wFile, _ab._pd.DataFrame):
+        if _ab._isDataFrame(self._wFile):
             weights, data = [], []
             if self._wFile.empty:
                 print("its empty..")
@@ -575,7 +575,7 @@ class WUFIM(_ab._weightedFrequentPatterns):
 
             # print(self.Database)
         if isinstance(self._wFile, str):
-            if _ab._validators.url(self._wFile):
+            if _ab._isURL(self._wFile):
                 data = _ab._urlopen(self._wFile)
                 for line in data:
                     line.strip()
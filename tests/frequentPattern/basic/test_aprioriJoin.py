@@ -0,0 +1,57 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_aprioriJoin.py
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from PAMI.frequentPattern.basic.Apriori import Apriori
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+
+
+class TestAprioriJoin(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(7)
+        self.tmp = tempfile.mkdtemp()
+        self.iFile = os.path.join(self.tmp, "sample.txt")
+        # ten frequent items and many rare ones, so most joins have an infrequent subset
+        with open(self.iFile, 'w') as f:
+            for _ in range(3000):
+                transaction = [str(i) for i in range(40) if random.random() < (0.6 if i < 10 else 0.05)]
+                f.write("\t".join(transaction or ['0']) + "\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_engines(self):
+        eclat = ECLAT(self.iFile, 0.01)
+        eclat.mine()
+        results = []
+        for engine in ('set', 'numpy'):
+            for memorySaver in (True, False):
+                apriori = Apriori(self.iFile, 0.01, engine=engine)
+                apriori.mine(memorySaver)
+                results.append((list(apriori.getPatterns().items()), apriori.getProfile()['counters']))
+        self.assertEqual(dict(results[0][0]), eclat.getPatterns())
+        for result in results[1:]:
+            self.assertEqual(result, results[0])
+        counters = results[0][1]
+        self.assertGreater(counters['subsetPruned'], 0)
+        self.assertLessEqual(counters['subsetPruned'], counters['pruned'])
+
+    def test_join(self):
+        apriori = Apriori(self.iFile, 1)
+        cands = [(0, 1), (0, 2), (0, 3), (1, 2), (2, 3)]
+        joins = [(cands[i], [cands[j] for j in joined], siblings) for i, joined, siblings in apriori._join(cands)]
+        # (0, 1, 3) is dropped since (1, 3) is not frequent, (1, 2) and (2, 3) have no sibling
+        self.assertEqual(joins, [((0, 1), [(0, 2)], 2), ((0, 2), [(0, 3)], 1)])
+
+    def test_engine(self):
+        with self.assertRaises(ValueError):
+            Apriori(self.iFile, 0.01, engine='gpu')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_arrayFPTree.py
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from PAMI.extras.fpTree.ArrayFPTree import ArrayFPTree
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+
+
+class TestArrayFPTree(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(17)
+        self.tmp = tempfile.mkdtemp()
+        probabilities = [random.uniform(0.2, 0.9) for _ in range(14)]
+        self.transactions = [["item-{}".format(i) for i, p in enumerate(probabilities) if random.random() < p] or ["item-0"]
+                             for _ in range(400)]
+        self.iFile = os.path.join(self.tmp, "sample.txt")
+        with open(self.iFile, 'w') as f:
+            f.write("\n".join("\t".join(t) for t in self.transactions))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_tree(self):
+        tree = ArrayFPTree()
+        tree.insert([0, 1, 2])
+        tree.insert([0, 2], count=2)
+        tree.insert([1, 2])
+        self.assertEqual(len(tree), 6)
+        self.assertEqual(tree.support, {0: 3, 1: 2, 2: 4})
+        self.assertEqual(sorted((sorted(path), count) for path, count in tree.prefixPaths(2)),
+                         [([0], 2), ([0, 1], 1), ([1], 1)])
+        conditional, candidates = tree.conditionalTree(2, 2)
+        self.assertEqual(candidates, 2)
+        self.assertEqual(conditional.support, {0: 3, 1: 2})
+        self.assertIsNone(conditional.singlePath())
+        conditional, candidates = tree.conditionalTree(2, 3)
+        self.assertEqual(conditional.singlePath(), [(0, 3)])
+        self.assertIsNone(tree.conditionalTree(0, 1)[0])
+
+    def test_wideNode(self):
+        tree = ArrayFPTree()
+        for item in range(40):
+            tree.insert([item, 100])
+            tree.insert([item])
+        self.assertEqual(len(tree), 80)
+        self.assertEqual(tree.support[100], 40)
+        self.assertTrue(all(tree.count[node] == 2 for node in range(1, len(tree) + 1) if tree.item[node] != 100))
+
+    def test_sameAsNodeEngine(self):
+        for minSup in [0.1, 0.3, 120]:
+            node = FPGrowth(self.iFile, minSup, engine='node')
+            node.mine()
+            array = FPGrowth(self.iFile, minSup)
+            array.mine()
+            self.assertEqual(array.getPatterns(), node.getPatterns(), minSup)
+            self.assertEqual(array.getProfile()['counters'], node.getProfile()['counters'])
+        self.assertRaises(ValueError, FPGrowth, self.iFile, 0.1, engine='tree')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_autoFrequentPatternMiner.py
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+import pandas as pd
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+from PAMI.frequentPattern.basic.AutoFrequentPatternMiner import AutoFrequentPatternMiner
+
+
+class TestAutoFrequentPatternMiner(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(17)
+        self.tmp = tempfile.mkdtemp()
+        probabilities = [random.uniform(0.05, 0.6) for _ in range(15)]
+        self.transactions = [["item-{}".format(i) for i, p in enumerate(probabilities) if random.random() < p]
+                             or ["item-0"] for _ in range(1500)]
+        self.iFile = os.path.join(self.tmp, "sample.txt")
+        with open(self.iFile, 'w') as f:
+            f.write("\n".join("\t".join(t) for t in self.transactions))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _expected(self, minSup):
+        fpGrowth = FPGrowth(self.iFile, minSup)
+        fpGrowth.mine()
+        return fpGrowth.getPatterns()
+
+    def test_rules(self):
+        for minSup in (30, 0.1):
+            auto = AutoFrequentPatternMiner(self.iFile, minSup)
+            auto.mine()
+            self.assertEqual(auto.getPatterns(), self._expected(minSup))
+            report = auto.getReport()
+            self.assertEqual(report['engine'], 'ECLATbitset')
+            self.assertEqual(report['statistics']['transactions'], 1500)
+            self.assertEqual(report['statistics']['items'], 15)
+            self.assertEqual(len(report['reasons']), 3)
+        auto = AutoFrequentPatternMiner(self.iFile, 0.99)
+        auto.mine()
+        self.assertEqual(auto.getReport()['engine'], 'Apriori')
+        self.assertEqual(auto.getPatterns(), self._expected(0.99))
+        auto = AutoFrequentPatternMiner(self.iFile, 30, memoryLimit=100)
+        auto.mine()
+        self.assertEqual(auto.getReport()['engine'], 'FPGrowth')
+        self.assertIn("memoryLimit=100", auto.getReport()['reasons'][-1])
+
+    def test_sample(self):
+        auto = AutoFrequentPatternMiner(self.iFile, 0.1, sampleSize=500, candidates=['ECLAT', 'Apriori'], seed=1)
+        auto.mine()
+        report = auto.getReport()
+        self.assertEqual(sorted(report['timings']), ['Apriori', 'ECLAT'])
+        self.assertEqual(report['engine'], min(report['timings'], key=report['timings'].get))
+        self.assertEqual(auto.getProfile()['counters']['timedEngines'], 2)
+        self.assertEqual(auto.getPatterns(), self._expected(0.1))
+
+    def test_sweepAndDataFrame(self):
+        auto = AutoFrequentPatternMiner(self.iFile, [0.1, 0.2])
+        auto.mine()
+        self.assertEqual(auto.getSweepPatterns()[0.2], self._expected(0.2))
+        frame = pd.DataFrame({'Transactions': ["\t".join(t) for t in self.transactions]})
+        auto = AutoFrequentPatternMiner(frame, 0.1)
+        auto.mine()
+        self.assertEqual(auto.getReport()['statistics']['transactions'], 1500)
+        self.assertEqual(auto.getPatterns(), self._expected(0.1))
+
+    def test_parameters(self):
+        self.assertRaises(ValueError, AutoFrequentPatternMiner, self.iFile, 0.1, sampleSize=-1)
+        self.assertRaises(ValueError, AutoFrequentPatternMiner, self.iFile, 0.1, candidates=['LCM'])
+        self.assertRaises(ValueError, AutoFrequentPatternMiner, self.iFile, 0.1, workers=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
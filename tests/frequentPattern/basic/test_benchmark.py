@@ -0,0 +1,81 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_benchmark.py
+
+import json
+import os
+import random
+import shutil
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from PAMI.extras.benchmark.Benchmark import Benchmark
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.datasets = [{'databaseSize': 200, 'avgItemsPerTransaction': 5, 'numItems': 15}]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_frequentFamily(self):
+        bench = Benchmark('frequent', self.datasets, [0.1, 25], workDir=self.tmp)
+        results = bench.run()
+        self.assertEqual(len(results), 14)
+        self.assertTrue(all(row['agrees'] for row in results))
+        self.assertTrue(all(row['error'] is None for row in results))
+        self.assertTrue(all(row['peakRSS'] > 0 and row['patterns'] > 0 for row in results))
+        self.assertTrue(bench.getMismatches().empty)
+        oFile = os.path.join(self.tmp, "report.csv")
+        bench.save(oFile)
+        self.assertTrue(bench.compare(oFile, runtimeTolerance=1000).empty)
+        baseline = pd.read_csv(oFile)
+        baseline.loc[0, 'patterns'] += 1
+        regressed = bench.compare(baseline, runtimeTolerance=1000)
+        self.assertEqual(list(regressed['algorithm']), [results[0]['algorithm']])
+
+    def test_sameInputs(self):
+        first = Benchmark('frequent', self.datasets, [0.1], algorithms=['ECLAT'], workDir=self.tmp)
+        iFile = first.generate(self.datasets[0])
+        with open(iFile) as f:
+            content = f.read()
+        os.remove(iFile)
+        self.assertEqual(open(first.generate(self.datasets[0])).read(), content)
+
+    def test_randomStateAndWorkDir(self):
+        # generating a database leaves the random states of the caller as they were
+        random.seed(3)
+        np.random.seed(3)
+        expected = random.random(), np.random.random()
+        random.seed(3)
+        np.random.seed(3)
+        with Benchmark('frequent', self.datasets, [0.1], algorithms=['ECLAT']) as bench:
+            workDir = os.path.dirname(bench.generate(self.datasets[0]))
+            self.assertEqual((random.random(), np.random.random()), expected)
+        self.assertFalse(os.path.exists(workDir))
+        bench = Benchmark('frequent', self.datasets, [0.1], algorithms=['ECLAT'], workDir=self.tmp)
+        bench.generate(self.datasets[0])
+        bench.close()
+        self.assertTrue(os.listdir(self.tmp))
+
+    def test_periodicFamilyAndJSON(self):
+        bench = Benchmark('periodic', self.datasets, [[20, 40]], algorithms=['PFPGrowth', 'PFECLAT'], workDir=self.tmp)
+        bench.run()
+        self.assertTrue(bench.getMismatches().empty)
+        oFile = os.path.join(self.tmp, "report.json")
+        bench.save(oFile)
+        with open(oFile) as f:
+            self.assertEqual([row['algorithm'] for row in json.load(f)], ['PFPGrowth', 'PFECLAT'])
+
+    def test_unknownAlgorithm(self):
+        bench = Benchmark('frequent', self.datasets, [0.1], algorithms=['ECLAT', 'NoSuchMiner'], workDir=self.tmp)
+        bench.run()
+        mismatches = bench.getMismatches()
+        self.assertEqual(list(mismatches['algorithm']), ['NoSuchMiner'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_eclatHybrid.py
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+from PAMI.frequentPattern.basic.ECLATHybrid import ECLATHybrid
+
+
+class TestECLATHybrid(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(5)
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _write(self, name, size, transaction):
+        iFile = os.path.join(self.tmp, name + ".txt")
+        with open(iFile, 'w') as f:
+            for n in range(size):
+                f.write("\t".join(transaction(n) or ['0']) + "\n")
+        return iFile
+
+    def _assertSameAsECLAT(self, iFile, minSup):
+        eclat = ECLAT(iFile, minSup)
+        eclat.mine()
+        hybrid = ECLATHybrid(iFile, minSup)
+        hybrid.mine()
+        self.assertEqual(list(hybrid.getPatterns().items()), list(eclat.getPatterns().items()))
+        return hybrid.getProfile()['counters']
+
+    def test_sparse(self):
+        iFile = self._write("sparse", 2000, lambda n: [str(i) for i in range(60) if random.random() < 0.05])
+        self._assertSameAsECLAT(iFile, 0.02)
+
+    def test_dense(self):
+        iFile = self._write("dense", 2000, lambda n: [str(i) for i in range(12) if random.random() < 0.8])
+        self._assertSameAsECLAT(iFile, 0.02)
+
+    def test_mixed(self):
+        # half of the transactions hold a dense block of items, the other half a sparse one, so the classes under the
+        # dense items become diffsets and the classes under the sparse items tidsets
+        def transaction(n):
+            if n % 2:
+                return [str(i) for i in range(40, 50) if random.random() < 0.3]
+            return [str(i) for i in range(40) if random.random() < (0.9 if i < 6 else 0.01)]
+
+        counters = self._assertSameAsECLAT(self._write("mixed", 20000, transaction), 0.0005)
+        for kind in ('bitset', 'tidset', 'diffset'):
+            self.assertGreater(counters.get(kind + 'Classes', 0), 0, kind)
+
+    def test_choose(self):
+        hybrid = ECLATHybrid("unused.txt", 1)
+        hybrid._bytes = 8 * 1000
+        self.assertEqual(hybrid._choose('bitset', 64000, 0.5), 'bitset')
+        self.assertEqual(hybrid._choose('bitset', 100, 0.1), 'tidset')
+        self.assertEqual(hybrid._choose('tidset', 64000, 0.99), 'diffset')
+        self.assertEqual(hybrid._choose('diffset', 64000, 0.01), 'diffset')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_explicitStack.py
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+from PAMI.frequentPattern.basic.ECLATbitset import ECLATbitset
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+from PAMI.frequentPattern.closed.CHARM import CHARM
+from PAMI.periodicFrequentPattern.basic.PFPGrowth import PFPGrowth
+
+
+def _maxDepth(miner):
+    """
+    Mines with miner and returns the largest number of nested PAMI frames seen in the current thread
+    """
+    deepest = [0]
+    package = os.path.dirname(os.path.dirname(sys.modules[type(miner).__module__].__file__))
+
+    def profile(frame, event, arg):
+        if event == 'call':
+            depth = 0
+            while frame is not None:
+                depth += frame.f_code.co_filename.startswith(package)
+                frame = frame.f_back
+            deepest[0] = max(deepest[0], depth)
+
+    sys.setprofile(profile)
+    try:
+        miner.mine()
+    finally:
+        sys.setprofile(None)
+    return deepest[0]
+
+
+def _longest(miner):
+    """
+    Number of items of the longest pattern of miner, whose patterns are tuples or tab separated strings
+    """
+    return max(len(p) if isinstance(p, tuple) else len(p.strip("\t").split("\t")) for p in miner.getPatterns())
+
+
+class TestExplicitStack(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(13)
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _write(self, size, temporal=False):
+        """
+        Writes 60 transactions of size items, each missing one random item, so the longest frequent pattern has
+        size - 1 items and the FP-tree is not a single path
+        """
+        iFile = os.path.join(self.tmp, "{}-{}.txt".format(size, temporal))
+        with open(iFile, 'w') as f:
+            for ts in range(1, 61):
+                missing = random.randrange(size)
+                transaction = [str(i) for i in range(size) if i != missing]
+                f.write("\t".join(([str(ts)] if temporal else []) + transaction) + "\n")
+        return iFile
+
+    def _assertFlat(self, build):
+        short, long = build(self._write(4)), build(self._write(10))
+        shallow, deep = _maxDepth(short), _maxDepth(long)
+        self.assertEqual(_longest(long), 9)
+        self.assertEqual(deep, shallow)
+
+    def test_fpGrowthArray(self):
+        self._assertFlat(lambda iFile: FPGrowth(iFile, 3))
+
+    def test_fpGrowthNode(self):
+        self._assertFlat(lambda iFile: FPGrowth(iFile, 3, engine='node'))
+
+    def test_eclatBitset(self):
+        self._assertFlat(lambda iFile: ECLATbitset(iFile, 3))
+
+    def test_charm(self):
+        self._assertFlat(lambda iFile: CHARM(iFile, 3))
+
+    def test_pfpGrowth(self):
+        short, long = PFPGrowth(self._write(4, True), 3, 60), PFPGrowth(self._write(10, True), 3, 60)
+        self.assertEqual(_maxDepth(long), _maxDepth(short))
+        self.assertEqual(_longest(long), 9)
+
+
+if __name__ == '__main__':
+    unittest.main()
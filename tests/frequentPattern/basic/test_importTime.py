@@ -0,0 +1,62 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_importTime.py
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+#: Seconds allowed for importing a miner in a fresh interpreter (about 0.06s once pandas and psutil are deferred,
+#: 0.4s when they are imported eagerly)
+_BUDGET = 0.25
+
+_SCRIPT = """
+import json, sys, time, types
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = [name for name in ('pandas', 'numpy', 'psutil', 'validators', 'urllib.request', 'deprecated')
+          if name in sys.modules]
+print(json.dumps({{'elapsed': elapsed, 'loaded': loaded}}))
+"""
+
+
+def _importInFreshInterpreter(module):
+    env = dict(os.environ, PYTHONPATH=_ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    output = subprocess.check_output([sys.executable, '-c', _SCRIPT.format(module=module)], env=env, cwd=_ROOT)
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_heavyModulesAreDeferred(self):
+        for module in ['PAMI.frequentPattern.basic.FPGrowth', 'PAMI.frequentPattern.basic.ECLAT',
+                       'PAMI.periodicFrequentPattern.basic.PFPGrowth']:
+            self.assertEqual(_importInFreshInterpreter(module)['loaded'], [], module)
+
+    def test_budget(self):
+        elapsed = min(_importInFreshInterpreter('PAMI.frequentPattern.basic.FPGrowth')['elapsed'] for _ in range(3))
+        self.assertLess(elapsed, _BUDGET)
+
+    def test_loadedOnUse(self):
+        tmp = tempfile.mkdtemp()
+        try:
+            iFile = os.path.join(tmp, "sample.txt")
+            with open(iFile, 'w') as f:
+                f.write("a\tb\nb\tc\na\tb\tc")
+            script = ("import sys, types\nfrom PAMI.frequentPattern.basic.FPGrowth import FPGrowth\n"
+                      "obj = FPGrowth({!r}, 1)\nobj.mine()\nobj.getPatternsAsDataFrame()\n"
+                      "print([m for m in ('pandas', 'psutil') if type(sys.modules[m]) is types.ModuleType])").format(iFile)
+            output = subprocess.check_output([sys.executable, '-c', script], cwd=_ROOT,
+                                             env=dict(os.environ, PYTHONPATH=_ROOT))
+        finally:
+            shutil.rmtree(tmp)
+        self.assertEqual(output.decode().strip().splitlines()[-1], "['pandas', 'psutil']")
+
+if __name__ == '__main__':
+    unittest.main()
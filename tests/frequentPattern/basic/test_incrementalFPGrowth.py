@@ -0,0 +1,73 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_incrementalFPGrowth.py
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+
+
+class TestIncrementalFPGrowth(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(41)
+        self.tmp = tempfile.mkdtemp()
+        probabilities = [random.uniform(0.05, 0.5) for _ in range(14)]
+        self.transactions = [["item-{}".format(i) for i, p in enumerate(probabilities) if random.random() < p]
+                             or ["item-0"] for _ in range(400)]
+        # the appended batches only hold the last items, some of them never seen before, so the patterns of the first
+        # items are kept
+        self.batches = [[["item-{}".format(i) for i in random.sample(range(8, 17), random.randint(1, 5))]
+                         for _ in range(size)] for size in (60, 1, 150)]
+        self.iFile = self._write("sample.txt", self.transactions)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _write(self, name, transactions):
+        path = os.path.join(self.tmp, name)
+        with open(path, 'w') as f:
+            f.write("\n".join("\t".join(t) for t in transactions))
+        return path
+
+    @staticmethod
+    def _patterns(miner):
+        return {frozenset(pattern): support for pattern, support in miner.getPatterns().items()}
+
+    def _remine(self, transactions, minSup):
+        fpGrowth = FPGrowth(self._write("full.txt", transactions), minSup)
+        fpGrowth.mine()
+        return self._patterns(fpGrowth)
+
+    def test_update(self):
+        for minSup in (25, 0.06):
+            incremental = FPGrowth(self.iFile, minSup, incremental=True)
+            incremental.mine()
+            transactions = list(self.transactions)
+            self.assertEqual(self._patterns(incremental), self._remine(transactions, minSup))
+            for batch in self.batches:
+                incremental.update(batch)
+                transactions += batch
+                self.assertEqual(self._patterns(incremental), self._remine(transactions, minSup))
+            counters = incremental.getProfile()['counters']
+            self.assertEqual(counters['newTransactions'], 150)
+            self.assertGreater(counters['keptPatterns'], 0)
+
+    def test_updateFromFile(self):
+        incremental = FPGrowth(self.iFile, 20, incremental=True)
+        incremental.mine()
+        incremental.update(self._write("batch.txt", self.batches[0]))
+        self.assertEqual(self._patterns(incremental), self._remine(self.transactions + self.batches[0], 20))
+
+    def test_parameters(self):
+        self.assertRaises(ValueError, FPGrowth, self.iFile, 20, engine='node', incremental=True)
+        self.assertRaises(ValueError, FPGrowth, self.iFile, 20, workers=2, incremental=True)
+        fpGrowth = FPGrowth(self.iFile, 20)
+        fpGrowth.mine()
+        self.assertRaises(Exception, fpGrowth.update, self.batches[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
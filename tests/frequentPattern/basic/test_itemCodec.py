@@ -0,0 +1,81 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_itemCodec.py
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from itertools import combinations
+from PAMI.extras.transactionStore.itemCodec import ItemCodec
+from PAMI.frequentPattern.basic.Apriori import Apriori
+from PAMI.frequentPattern.basic.Aprioribitset import Aprioribitset
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+from PAMI.frequentPattern.basic.ECLATbitset import ECLATbitset
+from PAMI.frequentPattern.basic.ECLATDiffset import ECLATDiffset
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+from PAMI.periodicFrequentPattern.basic.PFPGrowth import PFPGrowth
+from PAMI.periodicFrequentPattern.basic.PFECLAT import PFECLAT
+
+
+class TestItemCodec(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(3)
+        self.tmp = tempfile.mkdtemp()
+        self.items = ["item-{}".format(i) for i in range(1, 11)]
+        self.transactions = [random.sample(self.items, random.randint(1, 6)) for _ in range(200)]
+        self.iFile = os.path.join(self.tmp, "sample.txt")
+        with open(self.iFile, 'w') as f:
+            f.write("\n".join("\t".join(t) for t in self.transactions))
+        self.tFile = os.path.join(self.tmp, "temporal.txt")
+        with open(self.tFile, 'w') as f:
+            f.write("\n".join(str(i + 1) + "\t" + "\t".join(t) for i, t in enumerate(self.transactions)))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _bruteForce(self, minSup):
+        patterns = {}
+        for length in range(1, 7):
+            for pattern in combinations(sorted(self.items), length):
+                support = sum(1 for t in self.transactions if set(pattern) <= set(t))
+                if support >= minSup:
+                    patterns[pattern] = support
+        return patterns
+
+    def test_codec(self):
+        codec = ItemCodec({'a': 5, 'b': 9, 'c': 1, 'd': 5}, minSup=2)
+        self.assertEqual(codec.items, ['b', 'a', 'd'])
+        self.assertEqual(codec.encode(['d', 'c', 'b', 'd']), [0, 2])
+        self.assertEqual(codec.decode((2, 0)), ('d', 'b'))
+        self.assertNotIn('c', codec)
+        self.assertEqual(codec.decodePatterns({(0, 1): 4}, '\t'), {'b\ta': 4})
+
+    def test_frequentMinersDecodePatterns(self):
+        expected = self._bruteForce(20)
+        for alg in [Apriori, Aprioribitset, ECLAT, ECLATbitset, ECLATDiffset, FPGrowth]:
+            obj = alg(self.iFile, 20)
+            obj.mine()
+            patterns = {tuple(sorted(k)): v for k, v in obj.getPatterns().items()}
+            self.assertEqual(patterns, expected, alg.__name__)
+            df = obj.getPatternsAsDataFrame()
+            self.assertEqual(len(df), len(expected))
+            self.assertTrue(all(isinstance(p, str) for p in df['Patterns']))
+
+    def test_periodicMinersDecodePatterns(self):
+        growth = PFPGrowth(self.tFile, 20, 30)
+        growth.mine()
+        eclat = PFECLAT(self.tFile, 20, 30)
+        eclat.mine()
+        self.assertTrue(all(isinstance(k, str) for k in growth.getPatterns()))
+        normalise = lambda patterns: {tuple(sorted(k.split('\t'))): (v[0], v[1]) for k, v in patterns.items()}
+        self.assertEqual(normalise(growth.getPatterns()), normalise(eclat.getPatterns()))
+        oFile = os.path.join(self.tmp, "patterns.txt")
+        growth.save(oFile)
+        with open(oFile) as f:
+            self.assertEqual(len(f.readlines()), len(growth.getPatterns()))
+
+
+if __name__ == '__main__':
+    unittest.main()
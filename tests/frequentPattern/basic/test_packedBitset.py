@@ -0,0 +1,87 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_packedBitset.py
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from PAMI.coveragePattern.basic.CMine import CMine
+from PAMI.extras.bitset import packedBitset
+from PAMI.frequentPattern.basic.Aprioribitset import Aprioribitset
+from PAMI.frequentPattern.basic.ECLATbitset import ECLATbitset
+
+
+class TestPackedBitset(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(31)
+        self.tmp = tempfile.mkdtemp()
+        self.iFile = os.path.join(self.tmp, "sample.txt")
+        # items 0-7 occur in bursts, so many blocks of their tidsets are empty
+        with open(self.iFile, 'w') as f:
+            for ts in range(1, 3001):
+                burst = ts * 8 // 3001
+                transaction = [str(i) for i in range(20) if i == burst and random.random() < 0.9
+                               or i >= 8 and random.random() < 0.25]
+                f.write("\t".join([str(ts)] + transaction) + "\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_intersect(self):
+        tidLists = [sorted(random.sample(range(5000), random.randint(0, 300))) for _ in range(6)]
+        tidLists[0] = list(range(100)) + list(range(4000, 4100))
+        rows = packedBitset.pack(tidLists, 5000)
+        self.assertEqual(rows.shape[1] % packedBitset._BLOCK, 0)
+        self.assertEqual(packedBitset.popcount(rows).tolist(), [len(t) for t in tidLists])
+        words, intersections, counts = packedBitset.intersect(rows[0], rows, select=[1, 2, 3])
+        self.assertIsNotNone(words)
+        self.assertEqual(counts.tolist(), [len(set(tidLists[0]) & set(tidLists[j])) for j in (1, 2, 3)])
+        # a restricted intersection is intersected again through its words
+        _, _, counts = packedBitset.intersect(intersections[0], rows, select=[4, 5], words=words)
+        self.assertEqual(counts.tolist(), [len(set(tidLists[0]) & set(tidLists[1]) & set(tidLists[j])) for j in (4, 5)])
+
+    def test_reverse(self):
+        rows = packedBitset.pack([[0, 3, 70]], 100, reverse=True)
+        self.assertEqual(int.from_bytes(rows[0].astype('<u8').tobytes(), 'little'), (1 << 99) | (1 << 96) | (1 << 29))
+
+    def test_eclat(self):
+        for memorySaver in (True, False):
+            serial = ECLATbitset(self.iFile, 0.02)
+            serial.mine(memorySaver)
+            packed = ECLATbitset(self.iFile, 0.02, engine='numpy')
+            packed.mine(memorySaver)
+            self.assertEqual(list(packed.getPatterns().items()), list(serial.getPatterns().items()))
+            self.assertEqual(packed.getProfile()['counters'], serial.getProfile()['counters'])
+
+    def test_apriori(self):
+        serial = Aprioribitset(self.iFile, 0.02)
+        serial.mine()
+        packed = Aprioribitset(self.iFile, 0.02, engine='numpy')
+        packed.mine()
+        self.assertEqual(list(packed.getPatterns().items()), list(serial.getPatterns().items()))
+        self.assertEqual(packed.getProfile()['counters'], serial.getProfile()['counters'])
+
+    def test_cmine(self):
+        cwd = os.getcwd()
+        os.chdir(self.tmp)
+        try:
+            serial = CMine(self.iFile, 0.05, 0.3, 0.6)
+            serial.mine()
+            packed = CMine(self.iFile, 0.05, 0.3, 0.6, engine='numpy')
+            packed.mine()
+        finally:
+            os.chdir(cwd)
+        self.assertGreater(len(serial.getPatterns()), 20)
+        self.assertEqual(list(packed.getPatterns().items()), list(serial.getPatterns().items()))
+
+    def test_engine(self):
+        with self.assertRaises(ValueError):
+            ECLATbitset(self.iFile, 0.02, engine='gpu')
+        with self.assertRaises(ValueError):
+            CMine(self.iFile, 0.05, 0.3, 0.6, engine='gpu')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_parallelFPGrowth.py
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from PAMI.extras.patternStore.patternSinks import FileSink
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+
+
+class TestParallelFPGrowth(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(23)
+        self.tmp = tempfile.mkdtemp()
+        probabilities = [random.uniform(0.2, 0.8) for _ in range(15)]
+        self.transactions = [["item-{}".format(i) for i, p in enumerate(probabilities) if random.random() < p] or ["item-0"]
+                             for _ in range(500)]
+        self.iFile = os.path.join(self.tmp, "sample.txt")
+        with open(self.iFile, 'w') as f:
+            f.write("\n".join("\t".join(t) for t in self.transactions))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_sameAsSerial(self):
+        serial = FPGrowth(self.iFile, 0.1)
+        serial.mine()
+        parallel = FPGrowth(self.iFile, 0.1, workers=2)
+        parallel.mine()
+        self.assertEqual(parallel.getPatterns(), serial.getPatterns())
+        self.assertEqual(parallel.getProfile()['counters'], serial.getProfile()['counters'])
+
+    def test_sink(self):
+        serial = FPGrowth(self.iFile, 0.2)
+        serial.mine()
+        oFile = os.path.join(self.tmp, "patterns.txt")
+        parallel = FPGrowth(self.iFile, 0.2, workers=3)
+        parallel.setPatternSink(FileSink(oFile))
+        parallel.mine()
+        with open(oFile) as f:
+            self.assertEqual(len(f.readlines()), len(serial.getPatterns()))
+
+    def test_parameters(self):
+        self.assertRaises(ValueError, FPGrowth, self.iFile, 0.1, engine='node', workers=2)
+        self.assertRaises(ValueError, FPGrowth, self.iFile, 0.1, workers=0)
+        self.assertGreaterEqual(FPGrowth(self.iFile, 0.1, workers=None)._workers, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_patternSinks.py
+
+import importlib.util
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from PAMI.extras.patternStore import patternSinks as ps
+from PAMI.frequentPattern.basic.Apriori import Apriori
+from PAMI.frequentPattern.basic.ECLATbitset import ECLATbitset
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+from PAMI.periodicFrequentPattern.basic.PFPGrowth import PFPGrowth
+
+
+def _patternSet(patterns):
+    return {tuple(sorted(k)): v for k, v in patterns}
+
+
+def _readPatterns(oFile):
+    patterns = {}
+    with open(oFile) as f:
+        for line in f:
+            pattern, value = line.rstrip('\n').split(':', 1)
+            patterns[tuple(sorted(pattern.split('\t')))] = value
+    return patterns
+
+
+class TestPatternSinks(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(5)
+        self.tmp = tempfile.mkdtemp()
+        items = ["item-{}".format(i) for i in range(1, 11)]
+        self.transactions = [random.sample(items, random.randint(1, 6)) for _ in range(200)]
+        self.iFile = os.path.join(self.tmp, "sample.txt")
+        with open(self.iFile, 'w') as f:
+            f.write("\n".join("\t".join(t) for t in self.transactions))
+        self.tFile = os.path.join(self.tmp, "temporal.txt")
+        with open(self.tFile, 'w') as f:
+            f.write("\n".join(str(i + 1) + "\t" + "\t".join(t) for i, t in enumerate(self.transactions)))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_fileSink(self):
+        for alg in [Apriori, ECLATbitset, FPGrowth]:
+            expected = alg(self.iFile, 20)
+            expected.mine()
+            oFile = os.path.join(self.tmp, alg.__name__ + ".txt")
+            streamed = alg(self.iFile, 20)
+            streamed.setPatternSink(ps.FileSink(oFile, bufferSize=7))
+            streamed.mine()
+            self.assertEqual(len(streamed._finalPatterns), len(expected.getPatterns()))
+            self.assertEqual(_readPatterns(oFile), {k: str(v) for k, v in _patternSet(expected.getPatterns().items()).items()})
+            streamed.save(os.path.join(self.tmp, "unused.txt"))
+            self.assertFalse(os.path.exists(os.path.join(self.tmp, "unused.txt")))
+            with self.assertRaises(Exception):
+                streamed.getPatterns()
+
+    def test_callbackAndMemorySinks(self):
+        expected = FPGrowth(self.iFile, 20)
+        expected.mine()
+        received = []
+        obj = FPGrowth(self.iFile, 20)
+        obj.setPatternSink(ps.CallbackSink(lambda pattern, support: received.append((pattern, support))))
+        obj.mine()
+        self.assertEqual(_patternSet(received), _patternSet(expected.getPatterns().items()))
+        obj.setPatternSink(ps.MemorySink())
+        obj.mine()
+        self.assertEqual(_patternSet(obj.getPatterns().items()), _patternSet(expected.getPatterns().items()))
+
+    def test_iterPatterns(self):
+        expected = FPGrowth(self.iFile, 20)
+        expected.mine()
+        self.assertEqual(_patternSet(FPGrowth(self.iFile, 20).iterPatterns()), _patternSet(expected.getPatterns().items()))
+        self.assertEqual(_patternSet(expected.iterPatterns()), _patternSet(expected.getPatterns().items()))
+        generator = FPGrowth(self.iFile, 20).iterPatterns()
+        first = next(generator)
+        self.assertIsInstance(first[0], tuple)
+        generator.close()
+
+    def test_iterPatternsAfterEmptyRun(self):
+        # a run that found no pattern is read from memory instead of being mined again
+        obj = FPGrowth(self.iFile, 1000)
+        obj.mine()
+        self.assertEqual(len(obj.getPatterns()), 0)
+        calls = []
+        obj.mine = lambda: calls.append(1)
+        self.assertEqual(list(obj.iterPatterns()), [])
+        self.assertEqual(calls, [])
+
+    def test_sweepWithFileSink(self):
+        obj = FPGrowth(self.iFile, [20, 40])
+        obj.setPatternSink(ps.FileSink(os.path.join(self.tmp, "sweep.txt")))
+        obj.mine()
+        with self.assertRaisesRegex(Exception, "FileSink"):
+            obj.getSweepPatterns()
+        periodic = PFPGrowth(self.tFile, [20, 40], 30)
+        periodic.setPatternSink(ps.FileSink(os.path.join(self.tmp, "periodicSweep.txt")))
+        periodic.mine()
+        with self.assertRaisesRegex(Exception, "FileSink"):
+            periodic.getSweepPatterns()
+
+    def test_periodicFileSink(self):
+        expected = PFPGrowth(self.tFile, 20, 30)
+        expected.mine()
+        oFile = os.path.join(self.tmp, "periodic.txt")
+        streamed = PFPGrowth(self.tFile, 20, 30)
+        streamed.setPatternSink(ps.FileSink(oFile))
+        streamed.mine()
+        patterns = {tuple(sorted(k.split('\t'))): "{}:{}".format(v[0], v[1]) for k, v in expected.getPatterns().items()}
+        self.assertEqual(_readPatterns(oFile), patterns)
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow is not installed")
+    def test_parquetSink(self):
+        import pandas as pd
+        expected = FPGrowth(self.iFile, 20)
+        expected.mine()
+        oFile = os.path.join(self.tmp, "patterns.parquet")
+        streamed = FPGrowth(self.iFile, 20)
+        streamed.setPatternSink(ps.ParquetSink(oFile, batchSize=10))
+        streamed.mine()
+        df = pd.read_parquet(oFile)
+        self.assertEqual(list(df.columns), ['Patterns', 'Support'])
+        self.assertEqual(len(df), len(expected.getPatterns()))
+
+
+if __name__ == '__main__':
+    unittest.main()
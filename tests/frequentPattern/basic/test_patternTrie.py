@@ -0,0 +1,95 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_patternTrie.py
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from PAMI.extras.patternStore.PatternTrie import PatternTrie
+from PAMI.AssociationRules.basic.confidence import confidence
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+from PAMI.frequentPattern.basic.ECLATbitset import ECLATbitset
+from PAMI.periodicFrequentPattern.basic.PFPGrowth import PFPGrowth
+
+
+class TestPatternTrie(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(7)
+        self.tmp = tempfile.mkdtemp()
+        items = ["item-{}".format(i) for i in range(1, 11)]
+        self.transactions = [random.sample(items, random.randint(1, 6)) for _ in range(200)]
+        self.iFile = os.path.join(self.tmp, "sample.txt")
+        with open(self.iFile, 'w') as f:
+            f.write("\n".join("\t".join(t) for t in self.transactions))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_mapping(self):
+        expected = {}
+        trie = PatternTrie()
+        for i in range(2000):
+            key = tuple(random.sample(range(40), random.randint(1, 5)))
+            trie[key] = i
+            expected[tuple(sorted(key))] = i
+        self.assertEqual(len(trie), len(expected))
+        self.assertEqual(dict(trie.items()), expected)
+        key = next(iter(expected))
+        self.assertEqual(trie[tuple(reversed(key))], expected[key])
+        self.assertIn(key, trie)
+        self.assertNotIn((41,), trie)
+        del trie[key]
+        self.assertNotIn(key, trie)
+        self.assertEqual(len(trie), len(expected) - 1)
+        with self.assertRaises(KeyError):
+            trie[key]
+
+    def test_namesValuesAndFilter(self):
+        trie = PatternTrie({'b\ta': 4, 'a': 9, 'c\ta\tb': [2, 3]})
+        self.assertEqual(trie[('a', 'b')], 4)
+        self.assertEqual(trie[('a', 'b', 'c')], [2, 3])
+        self.assertEqual(set(trie.filter(minLength=2)), {('a', 'b'), ('a', 'b', 'c')})
+        self.assertEqual(dict(trie.filter(minSup=4).items()), {('a',): 9, ('a', 'b'): 4})
+        self.assertEqual(set(trie.filter(maxLength=1)), {('a',)})
+        df = trie.filter(maxLength=2).toDataFrame()
+        self.assertEqual(sorted(df['Patterns']), ['a', 'a b'])
+
+    def test_minerTrie(self):
+        expected = ECLATbitset(self.iFile, 15)
+        expected.mine()
+        obj = FPGrowth(self.iFile, 15)
+        obj.mine()
+        self.assertIsInstance(obj._finalPatterns, PatternTrie)
+        trie = obj.getPatternTrie()
+        self.assertEqual({tuple(sorted(k)): v for k, v in trie.items()},
+                         {tuple(sorted(k)): v for k, v in expected.getPatterns().items()})
+        pattern = max(expected.getPatterns(), key=len)
+        self.assertEqual(trie[pattern[::-1]], expected.getPatterns()[pattern])
+
+    def test_associationRules(self):
+        obj = FPGrowth(self.iFile, 15)
+        obj.mine()
+        oFile = os.path.join(self.tmp, "patterns.txt")
+        obj.save(oFile)
+        fromFile = confidence(oFile, 0.3, '\t')
+        fromFile.mine()
+        fromTrie = confidence(obj.getPatternTrie(), 0.3, '\t')
+        fromTrie.mine()
+        self.assertEqual(fromTrie.getAssociationRules(), fromFile.getAssociationRules())
+
+    def test_periodicTrie(self):
+        tFile = os.path.join(self.tmp, "temporal.txt")
+        with open(tFile, 'w') as f:
+            f.write("\n".join(str(i + 1) + "\t" + "\t".join(t) for i, t in enumerate(self.transactions)))
+        obj = PFPGrowth(tFile, 15, 30)
+        obj.mine()
+        trie = obj.getPatternTrie()
+        self.assertEqual({tuple(sorted(k.split('\t'))): v for k, v in obj.getPatterns().items()},
+                         {tuple(sorted(k)): v for k, v in trie.items()})
+        self.assertEqual(list(trie.toDataFrame().columns), ['Patterns', 'Support', 'Periodicity'])
+
+
+if __name__ == '__main__':
+    unittest.main()
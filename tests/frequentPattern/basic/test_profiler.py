@@ -0,0 +1,83 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_profiler.py
+
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+import unittest
+import psutil
+from PAMI.extras.profiler.Profiler import Profiler
+from PAMI.frequentPattern.basic.Apriori import Apriori
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+from PAMI.periodicFrequentPattern.basic.PFPGrowth import PFPGrowth
+
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(13)
+        self.tmp = tempfile.mkdtemp()
+        items = ["item-{}".format(i) for i in range(1, 11)]
+        self.transactions = [random.sample(items, random.randint(1, 6)) for _ in range(200)]
+        self.iFile = os.path.join(self.tmp, "sample.txt")
+        with open(self.iFile, 'w') as f:
+            f.write("\n".join("\t".join(t) for t in self.transactions))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_phases(self):
+        profiler = Profiler(interval=0.001)
+        baseline = psutil.Process(os.getpid()).memory_info().rss
+        profiler.start()
+        profiler.phase('a')
+        time.sleep(0.01)
+        profiler.phase('b')
+        data = b'x' * (20 * 1024 * 1024)
+        time.sleep(0.01)
+        profiler.phase('a')
+        profiler.count('candidates', 3)
+        profiler.count('candidates')
+        profiler.stop()
+        del data
+        profile = profiler.getProfile()
+        self.assertEqual(set(profile['phases']), {'a', 'b'})
+        self.assertGreaterEqual(profile['phases']['a'], 0.01)
+        self.assertEqual(profile['counters'], {'candidates': 4})
+        self.assertGreater(profile['peakRSS'], baseline + 15 * 1024 * 1024)
+        self.assertEqual([e['phase'] for e in profiler.events], ['a', 'b', 'a'])
+
+    def test_minerProfiles(self):
+        for alg in [Apriori, ECLAT, FPGrowth]:
+            obj = alg(self.iFile, 15)
+            obj.mine()
+            obj.save(os.path.join(self.tmp, "patterns.txt"))
+            profile = obj.getProfile()
+            self.assertTrue({'mine', 'output', 'save'} <= set(profile['phases']), alg.__name__)
+            self.assertEqual(profile['patterns'], len(obj.getPatterns()))
+            self.assertGreater(profile['counters']['candidates'], profile['counters']['pruned'])
+            self.assertGreater(profile['peakRSS'], 0)
+            self.assertLessEqual(sum(profile['phases'].values()) - profile['phases']['save'], profile['runtime'] + 1e-3)
+
+    def test_trace(self):
+        tFile = os.path.join(self.tmp, "temporal.txt")
+        with open(tFile, 'w') as f:
+            f.write("\n".join(str(i + 1) + "\t" + "\t".join(t) for i, t in enumerate(self.transactions)))
+        obj = PFPGrowth(tFile, 15, 30)
+        obj.mine()
+        oFile = os.path.join(self.tmp, "trace.json")
+        obj.saveProfile(oFile)
+        with open(oFile) as f:
+            trace = json.load(f)
+        self.assertEqual(trace['algorithm'], 'PFPGrowth')
+        self.assertEqual(trace['patterns'], len(obj.getPatterns()))
+        self.assertEqual([e['phase'] for e in trace['events']], ['firstScan', 'build', 'mine', 'output'])
+        self.assertIn('conditionalTrees', trace['counters'])
+
+
+if __name__ == '__main__':
+    unittest.main()
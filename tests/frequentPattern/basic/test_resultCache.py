@@ -0,0 +1,128 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_resultCache.py
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+import pandas as pd
+from PAMI.extras.resultCache.ResultCache import ResultCache
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+from PAMI.frequentPattern.closed.CHARM import CHARM
+from PAMI.frequentPattern.maximal.MaxFPGrowth import MaxFPGrowth
+from PAMI.faultTolerantFrequentPattern.basic.FTFPGrowth import FTFPGrowth
+from PAMI.periodicFrequentPattern.basic.PFPGrowth import PFPGrowth
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(11)
+        self.tmp = tempfile.mkdtemp()
+        items = ["item-{}".format(i) for i in range(1, 13)]
+        self.transactions = [random.sample(items, random.randint(1, 6)) for _ in range(400)]
+        self.iFile = os.path.join(self.tmp, "sample.txt")
+        with open(self.iFile, 'w') as f:
+            f.write("\n".join("\t".join(t) for t in self.transactions))
+        self.cache = ResultCache(os.path.join(self.tmp, "cache"))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _mined(self, alg, *args):
+        obj = alg(*args)
+        obj.mine()
+        return obj.getPatterns()
+
+    def test_repeatedRun(self):
+        self.assertFalse(self.cache.mine(FPGrowth(self.iFile, 0.05)))
+        obj = FPGrowth(self.iFile, 0.05)
+        self.assertTrue(self.cache.mine(obj))
+        self.assertEqual(obj.getPatterns(), self._mined(FPGrowth, self.iFile, 0.05))
+        self.assertFalse(self.cache.mine(ECLAT(self.iFile, 0.05)))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+        self.assertTrue(ResultCache(os.path.join(self.tmp, "cache")).mine(FPGrowth(self.iFile, 0.05)))
+
+    def test_higherThreshold(self):
+        self.cache.mine(FPGrowth(self.iFile, 0.02))
+        for minSup in [0.1, 60, '0.2']:
+            obj = FPGrowth(self.iFile, minSup)
+            self.assertTrue(self.cache.mine(obj))
+            self.assertEqual(obj.getPatterns(), self._mined(FPGrowth, self.iFile, minSup), minSup)
+        self.assertFalse(self.cache.mine(FPGrowth(self.iFile, 5)))
+        self.assertEqual(self.cache.filtered, 3)
+
+    def test_periodicParameters(self):
+        tFile = os.path.join(self.tmp, "temporal.txt")
+        with open(tFile, 'w') as f:
+            f.write("\n".join(str(i + 1) + "\t" + "\t".join(t) for i, t in enumerate(self.transactions)))
+        self.cache.mine(PFPGrowth(tFile, 20, 40))
+        self.assertTrue(self.cache.mine(PFPGrowth(tFile, 20, 40)))
+        # periodic-frequent runs are only answered by a run with the same thresholds
+        obj = PFPGrowth(tFile, 40, 40)
+        self.assertFalse(self.cache.mine(obj))
+        self.assertEqual(obj.getPatterns(), self._mined(PFPGrowth, tFile, 40, 40))
+        self.assertFalse(self.cache.mine(PFPGrowth(tFile, 40, 30)))
+        self.assertEqual(self.cache.filtered, 0)
+
+    def test_notDownwardClosed(self):
+        # the maximal and closed patterns at a higher minSup are not a subset of those at a lower one
+        for alg in (MaxFPGrowth, CHARM):
+            self.cache.mine(alg(self.iFile, 10))
+            obj = alg(self.iFile, 25)
+            self.assertFalse(self.cache.mine(obj), alg.__name__)
+            self.assertEqual(obj.getPatterns(), self._mined(alg, self.iFile, 25), alg.__name__)
+            obj = alg(self.iFile, 25)
+            self.assertTrue(self.cache.mine(obj), alg.__name__)
+            self.assertEqual(obj.getPatterns(), self._mined(alg, self.iFile, 25), alg.__name__)
+        self.assertEqual(self.cache.filtered, 0)
+
+    def test_undeclaredState(self):
+        self.assertRaises(TypeError, self.cache.mine, FTFPGrowth(self.iFile, 10, 0.05, 2, 1))
+        self.assertEqual(self.cache.getSize(), 0)
+
+    def test_uncachedInputs(self):
+        # the content behind a URL may change and a missing path has no content yet, so their runs are not stored
+        missing = os.path.join(self.tmp, "later.txt")
+        calls = []
+        for iFile in [missing, missing, "https://example.com/transactions.txt"]:
+            obj = FPGrowth(iFile, 10)
+            obj.mine = lambda: calls.append(1)
+            self.assertFalse(self.cache.mine(obj))
+        self.assertEqual((len(calls), self.cache.misses, self.cache.getSize()), (3, 3, 0))
+        shutil.copy(self.iFile, missing)
+        obj = FPGrowth(missing, 10)
+        self.assertFalse(self.cache.mine(obj))
+        self.assertEqual(obj.getPatterns(), self._mined(FPGrowth, self.iFile, 10))
+
+    def test_changedInput(self):
+        self.cache.mine(FPGrowth(self.iFile, 0.05))
+        with open(self.iFile, 'a') as f:
+            f.write("\nitem-1\titem-2")
+        obj = FPGrowth(self.iFile, 0.05)
+        self.assertFalse(self.cache.mine(obj))
+        self.assertEqual(obj.getPatterns(), self._mined(FPGrowth, self.iFile, 0.05))
+
+    def test_dataFrame(self):
+        df = pd.DataFrame({'Transactions': ["\t".join(t) for t in self.transactions]})
+        self.cache.mine(FPGrowth(df, 0.05))
+        self.assertTrue(self.cache.mine(FPGrowth(df.copy(), 0.05)))
+        df.loc[0, 'Transactions'] = 'item-1'
+        self.assertFalse(self.cache.mine(FPGrowth(df, 0.05)))
+
+    def test_eviction(self):
+        self.cache.mine(FPGrowth(self.iFile, 0.02))
+        size = self.cache.getSize()
+        cache = ResultCache(os.path.join(self.tmp, "cache"), maxBytes=int(size * 1.5))
+        cache.mine(ECLAT(self.iFile, 0.02))
+        self.assertLessEqual(cache.getSize(), size * 1.5)
+        self.assertTrue(cache.mine(ECLAT(self.iFile, 0.02)))
+        self.assertFalse(cache.mine(FPGrowth(self.iFile, 0.02)))
+        cache.clear()
+        self.assertEqual(cache.getSize(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_son.py
+
+import contextlib
+import io
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+from PAMI.frequentPattern.basic.SON import SON
+
+
+class TestSON(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(29)
+        self.tmp = tempfile.mkdtemp()
+        probabilities = [random.uniform(0.05, 0.6) for _ in range(15)]
+        # the first half of the database is denser than the second, so the partitions disagree on what is frequent
+        self.transactions = [["item-{}".format(i) for i, p in enumerate(probabilities)
+                              if random.random() < (p if n < 300 else p / 2)] or ["item-0"] for n in range(600)]
+        self.iFile = os.path.join(self.tmp, "sample.txt")
+        with open(self.iFile, 'w') as f:
+            f.write("\n".join("\t".join(t) for t in self.transactions))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _expected(self, minSup):
+        eclat = ECLAT(self.iFile, minSup)
+        eclat.mine()
+        return {frozenset(pattern): support for pattern, support in eclat.getPatterns().items()}
+
+    def test_exact(self):
+        for minSup in (0.05, 40):
+            expected = self._expected(minSup)
+            for miner in ('FPGrowth', 'Apriori'):
+                for partitionSize in (70, 250, 1000):
+                    son = SON(self.iFile, minSup, miner=miner, partitionSize=partitionSize)
+                    son.mine()
+                    patterns = {frozenset(pattern): support for pattern, support in son.getPatterns().items()}
+                    self.assertEqual(patterns, expected)
+                    counters = son.getProfile()['counters']
+                    self.assertEqual(counters['partitions'], -(-600 // partitionSize))
+                    self.assertEqual(counters['candidates'] - counters.get('falsePositives', 0), len(expected))
+
+    def test_workers(self):
+        serial = SON(self.iFile, 0.05, partitionSize=100)
+        serial.mine()
+        parallel = SON(self.iFile, 0.05, partitionSize=100, workers=2)
+        parallel.mine()
+        self.assertEqual(dict(parallel.getPatterns()), dict(serial.getPatterns()))
+
+    def test_output(self):
+        # the partition miners do not announce their runs, only SON does
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            SON(self.iFile, 0.05, partitionSize=100).mine()
+        self.assertEqual(output.getvalue(), "Frequent patterns were generated successfully using SON algorithm\n")
+
+    def test_parameters(self):
+        self.assertRaises(ValueError, SON, self.iFile, 0.1, partitionSize=0)
+        self.assertRaises(ValueError, SON, self.iFile, 0.1, workers=0)
+        self.assertRaises(ModuleNotFoundError, SON, self.iFile, 0.1, miner='Unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
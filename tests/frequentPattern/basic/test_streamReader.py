@@ -0,0 +1,72 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_streamReader.py
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+import pandas as pd
+from PAMI.extras.transactionStore import streamReader as sr
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+from PAMI.periodicFrequentPattern.basic.PFPGrowth import PFPGrowth
+from PAMI.periodicFrequentPattern.basic.PFECLAT import PFECLAT
+
+
+def _patternSet(patterns):
+    return {tuple(sorted(k.split('\t') if isinstance(k, str) else k)): v for k, v in patterns.items()}
+
+
+class TestStreamReader(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(11)
+        self.tmp = tempfile.mkdtemp()
+        items = ["item-{}".format(i) for i in range(1, 13)]
+        self.transactions = [random.sample(items, random.randint(1, 7)) for _ in range(250)]
+        self.iFile = os.path.join(self.tmp, "sample.txt")
+        with open(self.iFile, 'w') as f:
+            f.write("\n".join("\t".join(t) for t in self.transactions))
+        self.tFile = os.path.join(self.tmp, "temporal.txt")
+        with open(self.tFile, 'w') as f:
+            f.write("\n".join(str(i + 1) + "\t" + "\t".join(t) for i, t in enumerate(self.transactions)))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_chunks(self):
+        chunks = list(sr.readChunks(self.iFile, '\t', chunkSize=100))
+        self.assertEqual([len(c) for c in chunks], [100, 100, 50])
+        self.assertEqual([t for c in chunks for t in c], self.transactions)
+        self.assertEqual(list(sr.streamTransactions(self.iFile, '\t', 7)), self.transactions)
+        with self.assertRaises(ValueError):
+            list(sr.readChunks(self.iFile, '\t', chunkSize=0))
+
+    def test_dataFrame(self):
+        df = pd.DataFrame({'TS': range(1, len(self.transactions) + 1),
+                           'Transactions': [",".join(t) for t in self.transactions]})
+        self.assertEqual(list(sr.readTransactions(df, ',')), self.transactions)
+        temporal = list(sr.readTransactions(df, ',', temporal=True))
+        self.assertEqual(temporal[3], ["4"] + self.transactions[3])
+
+    def test_streamedFPGrowth(self):
+        expected = ECLAT(self.iFile, 25)
+        expected.mine()
+        streamed = FPGrowth(self.iFile, 25)
+        streamed._chunkSize = 16
+        streamed.mine()
+        self.assertEqual(_patternSet(expected.getPatterns()), _patternSet(streamed.getPatterns()))
+
+    def test_streamedPFPGrowth(self):
+        expected = PFECLAT(self.tFile, 25, 40)
+        expected.mine()
+        streamed = PFPGrowth(self.tFile, 25, 40)
+        streamed._chunkSize = 16
+        streamed.mine()
+        self.assertEqual({k: v[0] for k, v in _patternSet(expected.getPatterns()).items()},
+                         {k: v[0] for k, v in _patternSet(streamed.getPatterns()).items()})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_thresholdSweep.py
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from PAMI.frequentPattern.basic.Apriori import Apriori
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+from PAMI.periodicFrequentPattern.basic.PFPGrowth import PFPGrowth
+
+
+class TestThresholdSweep(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(5)
+        self.tmp = tempfile.mkdtemp()
+        items = ["item-{}".format(i) for i in range(1, 11)]
+        self.transactions = [random.sample(items, random.randint(1, 6)) for _ in range(300)]
+        self.iFile = os.path.join(self.tmp, "sample.txt")
+        with open(self.iFile, 'w') as f:
+            f.write("\n".join("\t".join(t) for t in self.transactions))
+        self.tFile = os.path.join(self.tmp, "temporal.txt")
+        with open(self.tFile, 'w') as f:
+            f.write("\n".join(str(i + 1) + "\t" + "\t".join(t) for i, t in enumerate(self.transactions)))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_frequentSweep(self):
+        thresholds = [0.05, 30, '0.2']
+        for alg in [Apriori, ECLAT, FPGrowth]:
+            obj = alg(self.iFile, thresholds)
+            obj.mine()
+            sweep = obj.getSweepPatterns()
+            self.assertEqual(list(sweep), thresholds)
+            self.assertEqual(obj.getPatterns(), sweep[0.05])
+            for threshold in thresholds:
+                single = alg(self.iFile, threshold)
+                single.mine()
+                self.assertEqual(sweep[threshold], single.getPatterns(), (alg.__name__, threshold))
+
+    def test_periodicSweep(self):
+        obj = PFPGrowth(self.tFile, [0.1, 60], [0.05, 20])
+        obj.mine()
+        sweep = obj.getSweepPatterns()
+        self.assertEqual(set(sweep), {(0.1, 0.05), (0.1, 20), (60, 0.05), (60, 20)})
+        for (minSup, maxPer), patterns in sweep.items():
+            single = PFPGrowth(self.tFile, minSup, maxPer)
+            single.mine()
+            self.assertEqual(patterns, single.getPatterns())
+
+    def test_noSweep(self):
+        obj = FPGrowth(self.iFile, 0.1)
+        obj.mine()
+        self.assertRaises(Exception, obj.getSweepPatterns)
+
+
+if __name__ == '__main__':
+    unittest.main()
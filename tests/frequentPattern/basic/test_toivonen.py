@@ -0,0 +1,87 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_toivonen.py
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+from PAMI.frequentPattern.basic.Toivonen import Toivonen, negativeBorder, sampleSize
+
+
+class TestToivonen(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(31)
+        self.tmp = tempfile.mkdtemp()
+        probabilities = [random.uniform(0.02, 0.5) for _ in range(12)]
+        self.transactions = [["item-{}".format(i) for i, p in enumerate(probabilities) if random.random() < p] or ["item-0"]
+                             for _ in range(3000)]
+        self.iFile = os.path.join(self.tmp, "sample.txt")
+        with open(self.iFile, 'w') as f:
+            f.write("\n".join("\t".join(t) for t in self.transactions))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _mine(self, minSup):
+        eclat = ECLAT(self.iFile, minSup)
+        eclat.mine()
+        return {frozenset(pattern): support for pattern, support in eclat.getPatterns().items()}
+
+    @staticmethod
+    def _read(patterns):
+        return {frozenset(pattern): support for pattern, support in patterns.items()}
+
+    def test_negativeBorder(self):
+        frequent = {frozenset(p) for p in [('a',), ('b',), ('c',), ('a', 'b'), ('b', 'c')]}
+        self.assertEqual(sorted(negativeBorder(frequent, ['a', 'b', 'c', 'd'])), [('a', 'c'), ('d',)])
+        self.assertEqual(sampleSize(0.01, 0.05), 18445)
+
+    def test_verify(self):
+        expected = self._mine(0.05)
+        toivonen = Toivonen(self.iFile, 0.05, epsilon=0.03, verify=True, seed=3)
+        toivonen.mine()
+        self.assertEqual(self._read(toivonen.getPatterns()), expected)
+        for pattern, (low, high) in toivonen.getConfidenceIntervals().items():
+            self.assertEqual(low, expected[frozenset(pattern)])
+            self.assertEqual(high, low)
+
+    def test_borderFailures(self):
+        expected = self._mine(0.05)
+        toivonen = Toivonen(self.iFile, 0.05, verify=True)
+        toivonen._lno, toivonen._minSup = 3000, 150
+        # starting from the single items, the frequent patterns are found one level per pass
+        singles = {pattern for pattern in expected if len(pattern) == 1}
+        items = {item for t in self.transactions for item in t}
+        self.assertEqual(toivonen._verifyPatterns(singles, items), expected)
+        self.assertGreater(toivonen.getProfile()['counters']['borderFailures'], 0)
+
+    def test_approximate(self):
+        everything = self._mine(1)
+        expected = self._mine(0.05)
+        toivonen = Toivonen(self.iFile, 0.05, epsilon=0.03, seed=3)
+        toivonen.mine()
+        patterns = self._read(toivonen.getPatterns())
+        self.assertEqual(toivonen.getProfile()['counters']['sample'], sampleSize(0.03, 0.05))
+        self.assertTrue(all(support >= 150 for support in patterns.values()))
+        candidates = self._read(toivonen.getCandidates())
+        self.assertTrue(set(expected) <= set(candidates))
+        self.assertTrue(set(patterns) < set(candidates))
+        intervals = toivonen.getConfidenceIntervals()
+        self.assertEqual(set(intervals), set(toivonen.getCandidates()))
+        for pattern, support in candidates.items():
+            low, high = intervals[tuple(sorted(pattern))]
+            self.assertLessEqual(low, support)
+            self.assertLessEqual(support, high)
+            self.assertLessEqual(low, everything[pattern])
+            self.assertLessEqual(everything[pattern], high)
+
+    def test_parameters(self):
+        self.assertRaises(ValueError, Toivonen, self.iFile, 0.1, epsilon=0)
+        self.assertRaises(ValueError, Toivonen, self.iFile, 0.1, delta=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/basic/test_transactionStore.py
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from PAMI.extras.transactionStore.TransactionStore import TransactionStore
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+from PAMI.frequentPattern.basic.Apriori import Apriori
+from PAMI.frequentPattern.basic.Aprioribitset import Aprioribitset
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+from PAMI.frequentPattern.basic.ECLATbitset import ECLATbitset
+from PAMI.frequentPattern.basic.ECLATDiffset import ECLATDiffset
+from PAMI.frequentPattern.basic.ECLATHybrid import ECLATHybrid
+from PAMI.frequentPattern.closed.CHARM import CHARM
+from PAMI.periodicFrequentPattern.basic.PFECLAT import PFECLAT
+from PAMI.periodicFrequentPattern.basic.PFPGrowth import PFPGrowth
+
+
+def _patternSet(patterns):
+    return {tuple(sorted(k.split('\t') if isinstance(k, str) else k)): v for k, v in patterns.items()}
+
+
+class TestTransactionStore(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(7)
+        self.tmp = tempfile.mkdtemp()
+        items = ["item-{}".format(i) for i in range(1, 16)]
+        self.transactions = [random.sample(items, random.randint(1, 8)) for _ in range(300)]
+        self.iFile = os.path.join(self.tmp, "sample.txt")
+        with open(self.iFile, 'w') as f:
+            f.write("\n".join("\t".join(t) for t in self.transactions))
+        self.tFile = os.path.join(self.tmp, "temporal.txt")
+        with open(self.tFile, 'w') as f:
+            f.write("\n".join(str(i + 1) + "\t" + "\t".join(t) for i, t in enumerate(self.transactions)))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_roundTrip(self):
+        store = TransactionStore.compile(self.iFile, os.path.join(self.tmp, "db.store"), chunkSize=16)
+        self.assertTrue(TransactionStore.isStore(os.path.join(self.tmp, "db.store")))
+        self.assertFalse(TransactionStore.isStore(self.iFile))
+        self.assertEqual(len(store), len(self.transactions))
+        self.assertEqual(list(store), self.transactions)
+        self.assertEqual(store[-1], self.transactions[-1])
+        supports = store.getItemSupports()
+        self.assertEqual(supports["item-1"], sum("item-1" in t for t in self.transactions))
+
+    def test_temporalRoundTrip(self):
+        store = TransactionStore.compile(self.tFile, os.path.join(self.tmp, "ts.store"), temporal=True)
+        self.assertTrue(store.isTemporal())
+        reopened = TransactionStore(os.path.join(self.tmp, "ts.store"), temporal=True)
+        self.assertEqual(reopened[4], ["5"] + self.transactions[4])
+
+    def test_minersAcceptStore(self):
+        storePath = os.path.join(self.tmp, "db.store")
+        TransactionStore.compile(self.iFile, storePath)
+        for alg in [FPGrowth, Apriori, Aprioribitset, ECLAT, ECLATbitset, ECLATDiffset, ECLATHybrid, CHARM]:
+            for minSup in [30, 0.1]:
+                fromText = alg(self.iFile, minSup)
+                fromText.mine()
+                fromStore = alg(storePath, minSup)
+                fromStore.mine()
+                self.assertEqual(_patternSet(fromText.getPatterns()), _patternSet(fromStore.getPatterns()), alg.__name__)
+
+    def test_idLevelAccess(self):
+        store = TransactionStore.compile(self.tFile, os.path.join(self.tmp, "ts.store"), temporal=True)
+        codec = store.getCodec(30)
+        supports = store.getItemSupports()
+        self.assertEqual(codec.items, sorted([i for i in supports if supports[i] >= 30], key=lambda i: (-supports[i], i)))
+        tidLists = store.getTidLists(codec)
+        for key, item in enumerate(codec.items):
+            self.assertEqual(tidLists[key].tolist(), [i for i, t in enumerate(self.transactions) if item in t])
+        expected = [[i + 1] + codec.encode(t) for i, t in enumerate(self.transactions)]
+        self.assertEqual(list(store.iterEncoded(codec, chunkSize=7)), expected)
+        plain = TransactionStore(os.path.join(self.tmp, "ts.store"))
+        self.assertEqual(list(plain.iterEncoded(codec)), [line[1:] for line in expected])
+
+    def test_storeIsNotDecoded(self):
+        # the codec-based miners read a store through its item ids, never through the decoded transactions
+        storePath = os.path.join(self.tmp, "db.store")
+        TransactionStore.compile(self.iFile, storePath)
+        tsPath = os.path.join(self.tmp, "ts.store")
+        TransactionStore.compile(self.tFile, tsPath, temporal=True)
+        decode, iterate = TransactionStore.__getitem__, TransactionStore.__iter__
+
+        def refuse(*args):
+            raise AssertionError("a transaction of the store was decoded")
+        TransactionStore.__getitem__ = TransactionStore.__iter__ = refuse
+        try:
+            for alg in [FPGrowth, Apriori, Aprioribitset, ECLAT, ECLATbitset, ECLATDiffset, ECLATHybrid]:
+                alg(storePath, 30).mine()
+            PFPGrowth(tsPath, 30, 40).mine()
+            PFECLAT(tsPath, 30, 40).mine()
+        finally:
+            TransactionStore.__getitem__, TransactionStore.__iter__ = decode, iterate
+
+    def test_temporalMinerAcceptsStore(self):
+        storePath = os.path.join(self.tmp, "ts.store")
+        TransactionStore.compile(self.tFile, storePath, temporal=True)
+        for alg in [PFPGrowth, PFECLAT]:
+            fromText = alg(self.tFile, 30, 40)
+            fromText.mine()
+            fromStore = alg(storePath, 30, 40)
+            fromStore.mine()
+            self.assertEqual(_patternSet(fromText.getPatterns()), _patternSet(fromStore.getPatterns()), alg.__name__)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/closed/test_subsumptionIndex.py
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from PAMI.extras.patternStore.SubsumptionIndex import SubsumptionIndex
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+from PAMI.frequentPattern.closed.CHARM import CHARM
+from PAMI.frequentPattern.maximal.MaxFPGrowth import MaxFPGrowth
+
+
+class TestSubsumptionIndex(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(7)
+        self.tmp = tempfile.mkdtemp()
+        items = ["item-{}".format(i) for i in range(1, 13)]
+        self.iFile = os.path.join(self.tmp, "sample.txt")
+        with open(self.iFile, 'w') as f:
+            f.write("\n".join("\t".join(random.sample(items, random.randint(1, 8))) for _ in range(300)))
+        eclat = ECLAT(self.iFile, 10)
+        eclat.mine()
+        self.frequent = {frozenset(pattern): support for pattern, support in eclat.getPatterns().items()}
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    @staticmethod
+    def _read(patterns):
+        return {frozenset(pattern.strip("\t").split("\t")): support for pattern, support in patterns.items()}
+
+    def test_index(self):
+        index = SubsumptionIndex()
+        index.add(['a', 'b', 'c'], key=3)
+        index.add(['c', 'd'], key=3)
+        self.assertTrue(index.hasSuperset(['c', 'a'], key=3))
+        self.assertTrue(index.hasSuperset(['d'], key=3))
+        self.assertFalse(index.hasSuperset(['a', 'd'], key=3))
+        self.assertFalse(index.hasSuperset(['a'], key=2))
+        self.assertFalse(index.hasSuperset(['e'], key=3))
+        self.assertEqual(len(index), 2)
+
+    def test_charm(self):
+        charm = CHARM(self.iFile, 10)
+        charm.mine()
+        patterns = self._read(charm.getPatterns())
+        self.assertGreater(len(patterns), 0)
+        # no pattern is kept when a superset with the same support was already found
+        for pattern, support in patterns.items():
+            self.assertFalse(any(pattern < other and support == value for other, value in patterns.items()))
+
+    def test_charmDropsNonClosedPattern(self):
+        # CHARM used to report i2 i4 i5:5 on this input, although i2 i4 i5 i7 has the same support
+        transactions = [['i4', 'i2'], ['i2', 'i5', 'i4', 'i3', 'i7'], ['i5', 'i3'], ['i3', 'i2', 'i5', 'i4', 'i7', 'i6'],
+                        ['i7', 'i2', 'i4', 'i5', 'i3', 'i1'], ['i5', 'i7', 'i6', 'i4', 'i1', 'i2', 'i3'],
+                        ['i7', 'i5', 'i1', 'i4', 'i3', 'i6'], ['i3'], ['i5', 'i4', 'i6'], ['i1', 'i6', 'i7'],
+                        ['i5', 'i7', 'i6', 'i2', 'i3', 'i1'], ['i1', 'i3', 'i2'], ['i7', 'i6', 'i5', 'i4', 'i2'],
+                        ['i6', 'i2', 'i5'], ['i2', 'i4'], ['i6', 'i7', 'i5', 'i3']]
+        iFile = os.path.join(self.tmp, "closed.txt")
+        with open(iFile, 'w') as f:
+            f.write("\n".join("\t".join(t) for t in transactions))
+        charm = CHARM(iFile, 2)
+        charm.mine()
+        self.assertEqual(sum({'i2', 'i4', 'i5', 'i7'} <= set(t) for t in transactions), 5)
+        self.assertNotIn(frozenset(['i2', 'i4', 'i5']), self._read(charm.getPatterns()))
+
+    def test_maxFPGrowth(self):
+        maximal = {pattern: support for pattern, support in self.frequent.items()
+                   if not any(pattern < other for other in self.frequent)}
+        maxFPGrowth = MaxFPGrowth(self.iFile, 10)
+        maxFPGrowth.mine()
+        self.assertEqual(self._read(maxFPGrowth.getPatterns()), maximal)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/cuda/test_cpuBackend.py
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+from PAMI.frequentPattern.cuda.cuApriori import cuApriori
+from PAMI.frequentPattern.cuda.cuAprioriBit import cuAprioriBit
+from PAMI.frequentPattern.cuda.cuEclat import cuEclat
+from PAMI.frequentPattern.cuda.cuEclatBit import cuEclatBit
+from PAMI.frequentPattern.cuda.cudaAprioriGCT import cudaAprioriGCT
+from PAMI.frequentPattern.cuda.cudaAprioriTID import cudaAprioriTID
+from PAMI.frequentPattern.cuda.cudaEclatGCT import cudaEclatGCT
+from PAMI.periodicFrequentPattern.basic.PFPGrowth import PFPGrowth
+from PAMI.periodicFrequentPattern.cuda.gPFMinerBit import gPFMinerBit
+from PAMI.partialPeriodicPattern.cuda.gPPMiner import gPPMiner
+
+
+class TestCpuBackend(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(17)
+        self.tmp = tempfile.mkdtemp()
+        # the GCT and TID miners only accept integer items
+        self.transactions = [[str(i) for i in range(10) if random.random() < 0.2 + 0.06 * i] or ["0"]
+                             for _ in range(300)]
+        self.iFile = os.path.join(self.tmp, "sample.txt")
+        with open(self.iFile, 'w') as f:
+            f.write("\n".join("\t".join(t) for t in self.transactions))
+        self.tFile = os.path.join(self.tmp, "temporal.txt")
+        with open(self.tFile, 'w') as f:
+            f.write("\n".join("\t".join([str(ts)] + t) for ts, t in enumerate(self.transactions, 1)))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    @staticmethod
+    def _patterns(patterns):
+        return {frozenset(pattern.split() if isinstance(pattern, str) else pattern):
+                [int(x) for x in value] if isinstance(value, list) else int(value)
+                for pattern, value in patterns.items()}
+
+    def test_frequentPatterns(self):
+        for minSup in (60, 0.2):
+            fpGrowth = FPGrowth(self.iFile, minSup)
+            fpGrowth.mine()
+            expected = self._patterns(fpGrowth.getPatterns())
+            for miner in (cuApriori, cuAprioriBit, cuEclat, cuEclatBit, cudaAprioriGCT, cudaAprioriTID, cudaEclatGCT):
+                cpu = miner(self.iFile, minSup, backend='cpu')
+                cpu.mine()
+                self.assertEqual(self._patterns(cpu.getPatterns()), expected, miner.__name__)
+
+    def test_periodicFrequentPatterns(self):
+        for minSup, maxPer in ((40, 12), (20, 25)):
+            pfpGrowth = PFPGrowth(self.tFile, minSup, maxPer)
+            pfpGrowth.mine()
+            cpu = gPFMinerBit(self.tFile, minSup, maxPer, backend='cpu')
+            cpu.mine()
+            self.assertEqual(self._patterns(cpu.getPatterns()), self._patterns(pfpGrowth.getPatterns()))
+
+    def test_partialPeriodicPatterns(self):
+        cpu = gPPMiner(self.tFile, 60, 3, backend='cpu')
+        cpu.mine()
+        patterns = self._patterns(cpu.getPatterns())
+        self.assertTrue(any(len(pattern) > 1 for pattern in patterns))
+        for pattern, periodicSupport in patterns.items():
+            if len(pattern) > 1:
+                # the kernel counts the timestamps that come at most period after the previous one, or after 0
+                timestamps = [ts for ts, t in enumerate(self.transactions, 1) if pattern <= set(t)]
+                gaps = [b - a for a, b in zip([0] + timestamps, timestamps)]
+                self.assertEqual(periodicSupport, sum(gap <= 3 for gap in gaps))
+
+    def test_parameters(self):
+        self.assertRaises(ValueError, cuEclatBit, self.iFile, 60, backend='gpu')
+        self.assertRaises(ValueError, gPFMinerBit, self.tFile, 40, 12, backend='gpu')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/pyspark/test_processBackend.py
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from PAMI.extras.backend.ProcessContext import ProcessContext
+from PAMI.frequentPattern.basic.FPGrowth import FPGrowth
+from PAMI.frequentPattern.pyspark.parallelApriori import parallelApriori
+from PAMI.frequentPattern.pyspark.parallelECLAT import parallelECLAT
+from PAMI.frequentPattern.pyspark.parallelFPGrowth import parallelFPGrowth
+from PAMI.periodicFrequentPattern.basic.PFPGrowth import PFPGrowth
+from PAMI.periodicFrequentPattern.pyspark.parallelPFPGrowth import parallelPFPGrowth
+from PAMI.partialPeriodicPattern.basic.PPPGrowth import PPPGrowth
+from PAMI.partialPeriodicPattern.pyspark.parallel3PGrowth import parallel3PGrowth
+
+
+class TestProcessBackend(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(13)
+        self.tmp = tempfile.mkdtemp()
+        probabilities = [0.2 + 0.05 * i for i in range(10)]
+        transactions = [[str(i) for i, p in enumerate(probabilities) if random.random() < p] or ["0"]
+                        for _ in range(300)]
+        self.iFile = os.path.join(self.tmp, "sample.txt")
+        with open(self.iFile, 'w') as f:
+            f.write("\n".join("\t".join(t) for t in transactions))
+        self.tFile = os.path.join(self.tmp, "temporal.txt")
+        with open(self.tFile, 'w') as f:
+            f.write("\n".join("\t".join([str(ts)] + t) for ts, t in enumerate(transactions, 1)))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    @staticmethod
+    def _patterns(miner):
+        # the miners key their patterns by a string, a tuple or a single int item, and some also keep the periodicity
+        patterns = {}
+        for pattern, value in miner.getPatterns().items():
+            if isinstance(pattern, str):
+                pattern = pattern.split()
+            elif not isinstance(pattern, (tuple, list)):
+                pattern = [pattern]
+            patterns[frozenset(str(item) for item in pattern)] = value[0] if isinstance(value, list) else value
+        return patterns
+
+    def test_context(self):
+        sc = ProcessContext(3)
+        words = sc.parallelize(["a b", "b c", "c", "a c", ""], 4).flatMap(lambda x: x.split())
+        self.assertEqual(sorted(words.map(lambda x: (x, 1)).reduceByKey(lambda a, b: a + b).collect()),
+                         [('a', 2), ('b', 2), ('c', 3)])
+        grouped = words.map(lambda x: (x, len(x))).groupByKey(2).mapValues(sorted)
+        self.assertEqual(sorted(grouped.collect()), [('a', [1, 1]), ('b', [1, 1]), ('c', [1, 1, 1])])
+        self.assertEqual(words.count(), 7)
+        self.assertEqual(sc.broadcast([1, 2]).value, [1, 2])
+        sc.stop()
+
+    def test_shuffleStages(self):
+        # every stage runs once: the source partitions, the map side of each shuffle and its reduce side
+        sc = ProcessContext(1)
+        run = sc._run
+        calls = []
+        sc._run = lambda function, partitions: calls.append(function) or run(function, partitions)
+        pairs = sc.parallelize(range(200), 8).map(lambda x: (x % 10, x))
+        grouped = pairs.groupByKey().map(lambda kv: (kv[0] % 3, len(kv[1]))).foldByKey(0, lambda a, b: a + b)
+        self.assertEqual(sorted(grouped.collect()), [(0, 80), (1, 60), (2, 60)])
+        self.assertEqual(len(calls), 3)
+        sc.stop()
+
+    def test_frequentPatterns(self):
+        for minSup in (60, 0.3):
+            fpGrowth = FPGrowth(self.iFile, minSup)
+            fpGrowth.mine()
+            expected = self._patterns(fpGrowth)
+            for miner in (parallelFPGrowth, parallelApriori, parallelECLAT):
+                parallel = miner(self.iFile, minSup, 3, backend='process')
+                parallel.mine()
+                self.assertEqual(self._patterns(parallel), expected, miner.__name__)
+
+    def test_periodicFrequentPatterns(self):
+        pfpGrowth = PFPGrowth(self.tFile, 40, 12)
+        pfpGrowth.mine()
+        parallel = parallelPFPGrowth(self.tFile, 40, 12, 2, backend='process')
+        parallel.mine()
+        self.assertEqual(self._patterns(parallel), self._patterns(pfpGrowth))
+
+    def test_partialPeriodicPatterns(self):
+        pppGrowth = PPPGrowth(self.tFile, 60, 3)
+        pppGrowth.mine()
+        parallel = parallel3PGrowth(self.tFile, 60, 3, numWorkers=2, backend='process')
+        parallel.mine()
+        self.assertEqual(self._patterns(parallel), self._patterns(pppGrowth))
+
+    def test_parameters(self):
+        self.assertRaises(ValueError, parallelFPGrowth, self.iFile, 60, 2, backend='dask')
+        self.assertRaises(ValueError, parallelPFPGrowth, self.tFile, 40, 12, 2, backend='dask')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/frequentPattern/topk/test_topKCollector.py
+
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from PAMI.extras.patternStore.TopKCollector import TopKCollector
+from PAMI.frequentPattern.basic.ECLAT import ECLAT
+from PAMI.frequentPattern.topk.FAE import FAE
+
+
+class TestTopKCollector(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(7)
+        self.tmp = tempfile.mkdtemp()
+        items = ["item-{}".format(i) for i in range(1, 13)]
+        self.iFile = os.path.join(self.tmp, "sample.txt")
+        with open(self.iFile, 'w') as f:
+            f.write("\n".join("\t".join(random.sample(items, random.randint(1, 7))) for _ in range(300)))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_largest(self):
+        topK = TopKCollector(3)
+        for pattern, value in [('a', 5), ('b', 3), ('c', 4), ('d', 3), ('e', 6), ('a', 9)]:
+            topK.push(pattern, value)
+        self.assertTrue(topK.isFull())
+        self.assertEqual(topK.threshold, 4)
+        self.assertEqual(topK.items(), [('e', 6), ('a', 5), ('c', 4)])
+        # a pattern equal to the threshold does not replace the worst one
+        self.assertFalse(topK.push('f', 4))
+        self.assertTrue(topK.push('g', 5))
+        self.assertEqual(topK.toDict(), {'e': 6, 'a': 5, 'g': 5})
+        self.assertNotIn('c', topK)
+
+    def test_smallest(self):
+        topK = TopKCollector(2, largest=False)
+        for pattern, value in [('a', 5), ('b', 3), ('c', 4)]:
+            topK.push(pattern, value)
+        self.assertEqual(topK.threshold, 4)
+        self.assertEqual(topK.patterns(), ['b', 'c'])
+
+    def test_fae(self):
+        eclat = ECLAT(self.iFile, 1)
+        eclat.mine()
+        expected = {frozenset(pattern): support for pattern, support in eclat.getPatterns().items()}
+        supports = sorted(expected.values(), reverse=True)
+        for k in (1, 10, 60):
+            fae = FAE(self.iFile, k)
+            fae.mine()
+            patterns = fae.getPatterns()
+            self.assertEqual(sorted(patterns.values(), reverse=True), supports[:k])
+            for pattern, support in patterns.items():
+                self.assertEqual(expected[frozenset(pattern.split("\t"))], support)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/periodicFrequentPattern/basic/test_timestampArrays.py
+
+import itertools
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from PAMI.periodicFrequentPattern.basic.PFPGrowth import PFPGrowth
+
+
+class TestTimestampArrays(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(23)
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def _write(self, lines):
+        path = os.path.join(self.tmp, "sample.txt")
+        with open(path, 'w') as f:
+            f.write("\n".join("\t".join([str(ts)] + items) for ts, items in lines))
+        return path
+
+    @staticmethod
+    def _bruteForce(lines, minSup, maxPer):
+        # the periodicity is measured from 0 to the number of transactions, as PFPGrowth does
+        items = sorted({item for ts, t in lines for item in t})
+        patterns = {}
+        for size in range(1, len(items) + 1):
+            for pattern in itertools.combinations(items, size):
+                stamps = sorted(ts for ts, t in lines if set(pattern) <= set(t))
+                if len(stamps) < minSup:
+                    continue
+                bounds = sorted(stamps + [0, len(lines)])
+                period = max(b - a for a, b in zip(bounds, bounds[1:]))
+                if period <= maxPer:
+                    patterns[frozenset(pattern)] = (len(stamps), period)
+        return patterns
+
+    def _check(self, lines, minSup, maxPer):
+        pfpGrowth = PFPGrowth(self._write(lines), minSup, maxPer)
+        pfpGrowth.mine()
+        patterns = {frozenset(k.split("\t")): (v[0], v[1]) for k, v in pfpGrowth.getPatterns().items()}
+        self.assertEqual(patterns, self._bruteForce(lines, minSup, maxPer))
+        return patterns, pfpGrowth.getProfile()['counters']
+
+    def test_sorted(self):
+        probabilities = [random.uniform(0.2, 0.9) for _ in range(8)]
+        lines = [(ts, ["i{}".format(i) for i, p in enumerate(probabilities) if random.random() < p] or ["i0"])
+                 for ts in range(1, 301)]
+        patterns, counters = self._check(lines, 30, 12)
+        self.assertGreater(len(patterns), 20)
+        # in order timestamps are covered by the running counts of the first scan
+        self.assertNotIn('unorderedItems', counters)
+
+    def test_unsortedAndSparseTimestamps(self):
+        # shuffled lines, repeated timestamps and timestamps past the number of transactions
+        probabilities = [random.uniform(0.2, 0.9) for _ in range(7)]
+        lines = [(random.randint(1, 400), ["i{}".format(i) for i, p in enumerate(probabilities) if random.random() < p]
+                  or ["i0"]) for _ in range(250)]
+        patterns, counters = self._check(lines, 25, 40)
+        self.assertGreater(len(patterns), 10)
+        self.assertGreater(counters['unorderedItems'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()